@@ -0,0 +1,49 @@
+from time import perf_counter
+
+from pysmad.bodies import Earth
+from pysmad.coordinates.states import HCW
+from pysmad.estimation.filtering import RelativeKalman
+from pysmad.math.linalg import Matrix3D, Matrix6D, SymmetricMatrix6D, Vector3D, Vector6D
+from pysmad.propagators.relative import Hill
+from pysmad.time import Epoch
+
+# Number of observations in the simulated stream
+UPDATES: int = 20000
+
+
+class InverseKalman(RelativeKalman):
+    """filter that forms the explicit inverse of the innovation covariance and multiplies full 6x6 matrices"""
+
+    def predict_covariance(self) -> None:
+        p00: Matrix6D = self.p00.to_matrix()
+        q: Matrix6D = self.q.to_matrix()
+        self.p10 = self.f.multiply_matrix(p00.multiply_matrix(self.f.transpose())).plus(q)
+
+    def gain(self) -> None:
+        hph: Matrix3D = self.H.multiply_matrix_6by3(self.p10.multiply_matrix_6by3(self.HT))
+        self.k = self.p10.multiply_matrix_6by3(self.HT.multiply(hph.plus(self.r).inverse()))
+
+    def update_covariance(self) -> None:
+        m1: Matrix6D = self.I.minus(self.k.multiply_matrix3by6(self.H))
+        m2: Matrix6D = self.k.multiply_matrix3by6(self.r.multiply_matrix3by6(self.k.transpose()))
+        self.p00 = SymmetricMatrix6D.from_matrix(m1.multiply_matrix(self.p10.multiply_matrix(m1.transpose())).plus(m2))
+
+
+def updates_per_second(kalman_type: type) -> float:
+    """time a filter processing a stream of position measurements taken once a minute"""
+    state: HCW = HCW.from_state_vector(Vector6D(-11, 0.5, 0.2, 0, -0.001, 0))
+    kalman: RelativeKalman = kalman_type(Epoch(59933), Hill(state, Earth.RADIUS + 500))
+    kalman.r = Matrix3D(Vector3D(0.01, 0, 0), Vector3D(0, 0.01, 0), Vector3D(0, 0, 0.01))
+    start: float = perf_counter()
+    for i in range(UPDATES):
+        kalman.z = kalman.propagator.state.position.plus(Vector3D(0.01, -0.01, 0.005))
+        kalman.predict(60)
+        kalman.update()
+    return UPDATES / (perf_counter() - start)
+
+
+# Print the throughput of the explicit inverse and cholesky updates
+before: float = updates_per_second(InverseKalman)
+after: float = updates_per_second(RelativeKalman)
+print(f"explicit inverse {before:10.0f} updates/s")
+print(f"cholesky         {after:10.0f} updates/s   speedup {after / before:5.2f}")
@@ -0,0 +1,74 @@
+import os
+import subprocess
+import sys
+from timeit import timeit
+
+# Backends compared by the benchmark
+BACKENDS = ["python", "numpy"]
+
+# Number of repetitions of each path
+LOOPS: int = 3
+
+
+def relative_filter() -> float:
+    """time a chase vehicle tracking a target with the relative Kalman filter for six hours"""
+    from pysmad.bodies._satellite import Satellite
+    from pysmad.coordinates.states import GCRF, HCW, StateConvert
+    from pysmad.math.linalg import Vector3D, Vector6D
+    from pysmad.time import Epoch
+
+    start_epoch: Epoch = Epoch.from_datetime_components(2022, 12, 20, 0, 0, 0)
+    target_state: GCRF = GCRF(start_epoch, Vector3D(42164, 0, 0), Vector3D(0, 3.075, 0))
+    chase_state: GCRF = StateConvert.hcw.to_gcrf(HCW.from_state_vector(Vector6D(-11, 0, 0, 0, 0, 0)), target_state)
+    seed: GCRF = GCRF(start_epoch, Vector3D(42164.5, 0.5, 0.5), Vector3D(0, 3.075, 0))
+    end_epoch: Epoch = start_epoch.plus_days(0.25)
+
+    def track():
+        chase: Satellite = Satellite(chase_state.copy())
+        target: Satellite = Satellite(target_state.copy())
+        chase.acquire(Satellite(seed.copy()))
+        while chase.current_epoch().utc < end_epoch.utc:
+            chase.step()
+            target.step_to_epoch(chase.current_epoch())
+            chase.track_state(target)
+            chase.process_wfov(target)
+
+    return timeit(track, number=LOOPS)
+
+
+def rk4_propagation() -> float:
+    """time a one day RK4 propagation of a geosynchronous state"""
+    from pysmad.coordinates.states import GCRF
+    from pysmad.math.linalg import Vector3D
+    from pysmad.propagators.inertial import RK4
+    from pysmad.time import Epoch
+
+    start_epoch: Epoch = Epoch.from_datetime_components(2022, 12, 20, 0, 0, 0)
+    state: GCRF = GCRF(start_epoch, Vector3D(42164, 0, 0), Vector3D(0, 3.075, 0))
+    end_epoch: Epoch = start_epoch.plus_days(1)
+    return timeit(lambda: RK4(state.copy()).step_to_epoch(end_epoch), number=LOOPS)
+
+
+if len(sys.argv) > 1:
+
+    # Time the paths with the backend selected by the parent process
+    import pysmad.bodies  # noqa: F401
+
+    print(relative_filter(), rk4_propagation())
+
+else:
+
+    # Run each backend in its own interpreter since the backend is selected when pysmad is imported
+    times = {}
+    for backend in BACKENDS:
+        env = dict(os.environ, PYSMAD_LINALG=backend)
+        output = subprocess.run(
+            [sys.executable, __file__, "child"], env=env, capture_output=True, text=True, check=True
+        )
+        times[backend] = [float(value) for value in output.stdout.split()]
+
+    # Print the time each backend needs for each path
+    for i, name in enumerate(["relative filter", "rk4 propagation"]):
+        pure: float = times["python"][i]
+        fast: float = times["numpy"][i]
+        print(f"{name:<16} python {pure:8.3f} s   numpy {fast:8.3f} s   ratio {pure / fast:6.2f}")
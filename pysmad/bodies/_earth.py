@@ -52,6 +52,12 @@ class Earth:
     #: the number of zonal and tesseral terms to be used in the gravity calculation
     DEGREE_AND_ORDER: int = len(S)
 
+    #: second zonal harmonic (unitless)
+    J2: float = -C[2][0]
+
+    #: third zonal harmonic (unitless)
+    J3: float = -C[3][0]
+
     #: G*M given in km^3/s^2
     MU: float = 398600.4418
 
@@ -9,7 +9,9 @@ from pysmad.estimation.obs import LiveOpticalObservation, LiveOpticalSet, SpaceO
 from pysmad.hardware.payloads import Camera
 from pysmad.math.functions import EquationsOfMotion
 from pysmad.math.linalg import Vector3D
-from pysmad.propagators.inertial import RK4
+from pysmad.math.noise import NoiseGenerator
+from pysmad.propagators.checkpoints import CheckpointStore
+from pysmad.propagators.inertial import RK4, Encke, Kepler
 from pysmad.propagators.relative import Hill
 from pysmad.time import Epoch
 
@@ -101,7 +103,7 @@ class Satellite:
         self.initial_state.srp_scalar = self.srp_scalar()
 
         #: Used to solve the state of the spacecraft at various times in the orbit
-        self.propagator: RK4 = RK4(self.initial_state)
+        self.propagator: RK4 | Encke | Kepler = Satellite.create_propagator(self.initial_state)
 
         #: Alphanumeric string that acts as a unique identifier for satellites
         self.sat_id: str | None = None
@@ -109,8 +111,46 @@ class Satellite:
         #: collection of optical observations of the calling satellite
         self.optical_observations: LiveOpticalSet | None = None
 
+        #: states kept along the trajectory so queries can restart near the requested epoch
+        self.checkpoints: CheckpointStore | None = None
+
+        #: generator used to apply noise to simulated observations
+        self.noise: NoiseGenerator = NoiseGenerator()
+
         self.update_attitude()
 
+    def enable_checkpoints(
+        self,
+        interval: int = CheckpointStore.DEFAULT_INTERVAL,
+        capacity: int = CheckpointStore.DEFAULT_CAPACITY,
+        spill_path: str | None = None,
+    ) -> None:
+        """keep checkpoints along the trajectory so later queries start from the nearest one in either direction
+
+        :param interval: number of integration steps between checkpoints, defaults to CheckpointStore.DEFAULT_INTERVAL
+        :type interval: int, optional
+        :param capacity: largest number of checkpoints held in memory, defaults to CheckpointStore.DEFAULT_CAPACITY
+        :type capacity: int, optional
+        :param spill_path: file used to hold checkpoints that no longer fit in memory, defaults to None
+        :type spill_path: str | None, optional
+        """
+        self.checkpoints = CheckpointStore(interval, capacity, spill_path)
+
+    @staticmethod
+    def create_propagator(state: GCRF) -> RK4 | Kepler:
+        """select the propagator for a state based on its force model
+
+        States without perturbations are solved analytically while all others are numerically integrated.
+
+        :param state: inertial state to be propagated
+        :type state: GCRF
+        :return: propagator initialized with the argument state
+        :rtype: RK4 | Kepler
+        """
+        if state.use_perturbations:
+            return RK4(state)
+        return Kepler(state)
+
     def get_clos(self, ob: LiveOpticalObservation) -> float:
         self.step_to_epoch(ob.epoch)
         return ob.get_clos(self.current_state())
@@ -145,9 +185,12 @@ class Satellite:
         :param ric_burn: burn vector with components of radial, in-track, and cross-track (km/s)
         :type ric_burn: Vector3D
         """
-        self.propagator = RK4(
-            StateConvert.hcw.to_gcrf(HCW(self.current_epoch(), Vector3D(0, 0, 0), ric_burn), self.current_state())
-        )
+        state: GCRF = self.current_state()
+        burned: GCRF = StateConvert.hcw.to_gcrf(HCW(state.epoch, Vector3D(0, 0, 0), ric_burn), state)
+        burned.match_force_model(state)
+        self.propagator = Satellite.create_propagator(burned)
+        if self.checkpoints is not None:
+            self.checkpoints.clear()
 
     def finite_maneuver(self, ric_dv: Vector3D) -> None:
         """perform a maneuver using ric acceleration accross a specified time
@@ -167,6 +210,8 @@ class Satellite:
         m_spec: float = self.m_dot / self.total_mass()
         dt: float = (-1 / m_spec) * (1 - e ** (m_spec * gcrf_thrust.magnitude() / (-self.isp * m_spec * SEA_LEVEL_G)))
         self.propellant_mass -= self.m_dot * dt
+        if self.checkpoints is not None:
+            self.checkpoints.clear()
 
     def sma(self) -> float:
         """calculate the semi-major axis of the calling spacecraft
@@ -188,6 +233,19 @@ class Satellite:
         )
         self.track_state(seed)
 
+    def seed_noise(self, seed: int, trial: int = 0) -> None:
+        """make the observation noise of the satellite reproducible for a monte carlo trial
+
+        The stream is derived from the seed, the sat_id, and the trial so satellites and trials sharing a seed draw
+        independent noise.
+
+        :param seed: base seed of the simulation
+        :type seed: int
+        :param trial: monte carlo trial number, defaults to 0
+        :type trial: int, optional
+        """
+        self.noise = NoiseGenerator.from_keys(seed, self.sat_id, trial)
+
     def observe_wfov(self, target: "Satellite") -> SpaceObservation:
         """produce a simulated observation from the wfov
 
@@ -201,7 +259,7 @@ class Satellite:
         range_error: float = self.wfov.range_error(truth_range, target.body_radius * 2)
         return SpaceObservation(
             self.current_state(),
-            truth_vector.with_noise(range_error, self.pointing_accuracy),
+            truth_vector.with_noise(range_error, self.pointing_accuracy, self.noise),
             range_error,
             self.pointing_accuracy,
         )
@@ -219,7 +277,7 @@ class Satellite:
         range_error: float = self.nfov.range_error(truth_range, target.body_radius * 2)
         return SpaceObservation(
             self.current_state(),
-            truth_vector.with_noise(range_error, self.pointing_accuracy),
+            truth_vector.with_noise(range_error, self.pointing_accuracy, self.noise),
             range_error,
             self.pointing_accuracy,
         )
@@ -432,7 +490,10 @@ class Satellite:
         :param epoch: desired time at which the vehicle's state should be solved
         :type epoch: Epoch
         """
-        self.propagator.step_to_epoch(epoch)
+        if self.checkpoints is None:
+            self.propagator.step_to_epoch(epoch)
+        else:
+            self.propagator = self.checkpoints.step_to_epoch(self.propagator, epoch)
         self.update_attitude()
 
     def sun_vector(self) -> Vector3D:
@@ -27,6 +27,9 @@ class Sun:
     #: Distance to earth in km
     AU = 149597870.691
 
+    #: Mean radius in km
+    RADIUS = 696000.0
+
     @staticmethod
     def get_position(epoch: Epoch) -> Vector3D:
         """calculate the ECI position at a given epoch
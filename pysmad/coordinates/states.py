@@ -11,9 +11,14 @@ from pysmad.time import Epoch
 
 
 class State:
+
+    __slots__ = ("epoch", "position", "velocity")
+
     def __init__(self, epoch: Epoch, r: Vector3D, v: Vector3D) -> None:
         """class used to perform operations for time-dependent states
 
+        The arguments are copied, so the state owns its vectors and they can be advanced in place.
+
         :param epoch: time for which the position and velocity are valid
         :type epoch: Epoch
         :param r: position of the state
@@ -30,8 +35,10 @@ class State:
         #: velocity of the state
         self.velocity: Vector3D = v.copy()
 
-        #: state vector whose elements are equal to that of the position and velocity unpacked
-        self.vector = Vector6D.from_position_and_velocity(self.position, self.velocity)
+    @property
+    def vector(self) -> Vector6D:
+        """state vector whose elements are equal to that of the position and velocity unpacked"""
+        return Vector6D.from_position_and_velocity(self.position, self.velocity)
 
     def copy(self):
         """create a duplicate of the calling state"""
@@ -51,14 +58,16 @@ class State:
 
 
 class LiveVector(State):
+
+    __slots__ = ("reference_frame", "srp_coefficient", "covariance", "sat_id")
+
     def __init__(self, vec_dict: dict) -> None:
         self.epoch: Epoch = Epoch.from_iso_string(vec_dict["epoch"])
         self.position: Vector3D = Vector3D(vec_dict["xpos"], vec_dict["ypos"], vec_dict["zpos"])
         self.velocity = Vector3D(vec_dict["xvel"], vec_dict["yvel"], vec_dict["zvel"])
-        self.vector = Vector6D.from_position_and_velocity(self.position, self.velocity)
         self.reference_frame: str = vec_dict.get("referenceFrame", "J2000")
-        self.srp_coefficient: float = vec_dict.get("solarRadPressCoeff", None)
-        self.covariance: list[float] = vec_dict.get("cov", None)
+        self.srp_coefficient: float | None = vec_dict.get("solarRadPressCoeff", None)
+        self.covariance: list[float] | None = vec_dict.get("cov", None)
         self.sat_id: str = vec_dict.get("origObjectId", vec_dict.get("idOnOrbit", "UNKNOWN"))
 
     def get_gcrf_state(self) -> "GCRF":
@@ -98,15 +107,14 @@ class LiveVectorSet:
         with open(filename, write_mode) as f:
             if write_header:
                 f.write(State.csv_headers() + "\n")
-            for state in self.list:
-                f.write("".join([state.to_csv_format(), "\n"]))
+            f.writelines("".join([state.to_csv_format(), "\n"]) for state in self.list)
 
     def process_vector(self, state: LiveVector) -> None:
         self.list.append(state)
         self.total += 1
         if self.targets.get(state.sat_id) is None:
             self.targets[state.sat_id] = state
-        elif self.targets[state.sat_id].epoch.value < state.epoch.utc:
+        elif self.targets[state.sat_id].epoch.utc < state.epoch.utc:
             self.targets[state.sat_id] = state
 
     def get_latest(self, scc: str) -> LiveVector:
@@ -114,6 +122,9 @@ class LiveVectorSet:
 
 
 class ITRF(State):
+
+    __slots__ = ()
+
     def __init__(self, epoch: Epoch, r: Vector3D, v: Vector3D) -> None:
         """class used to perform operations and modeling in the International Terrestrial Reference Frame
 
@@ -141,6 +152,9 @@ class ITRF(State):
 
 
 class HCW(State):
+
+    __slots__ = ()
+
     def __init__(self, epoch: Epoch, r: Vector3D, v: Vector3D) -> None:
         """class used to perform operations and modeling in the HCW Frame
 
@@ -184,6 +198,9 @@ class HCW(State):
 
 
 class GCRF(State):
+
+    __slots__ = ("thrust", "srp_scalar", "use_perturbations")
+
     def __init__(self, epoch: Epoch, r: Vector3D, v: Vector3D) -> None:
         """class used to perform operations and modeling in the Geocentric Celestial Reference Frame
 
@@ -205,6 +222,26 @@ class GCRF(State):
         #: boolean to determine if perturbations are modeled during propagation
         self.use_perturbations: bool = True
 
+    def copy(self) -> "GCRF":
+        """create a duplicate of the calling state including its force model settings
+
+        :return: state with properties that match that of the calling state
+        :rtype: GCRF
+        """
+        state: GCRF = GCRF(self.epoch, self.position, self.velocity)
+        state.thrust = self.thrust.copy()
+        state.match_force_model(self)
+        return state
+
+    def match_force_model(self, state: "GCRF") -> None:
+        """apply the srp scalar and perturbation setting of the argument state to the calling state
+
+        :param state: state whose force model settings will be used
+        :type state: GCRF
+        """
+        self.srp_scalar = state.srp_scalar
+        self.use_perturbations = state.use_perturbations
+
     def acceleration_from_gravity(self) -> Vector3D:
         """calculates the gravity due to a nonspherical earth
 
@@ -272,6 +309,42 @@ class GCRF(State):
 
         return self.position.scaled(-Earth.MU / (r_mag * r_mag * r_mag))
 
+    def gravity_gradient(self) -> Matrix3D:
+        """calculate the partial derivatives of the earth's gravity with respect to position
+
+        The two-body term is always included and the J2 term is added when perturbations are used.  Other forces are
+        omitted since their partials are small compared to these terms for near-earth orbits.
+
+        :return: matrix whose rows are the partials of the x, y, and z acceleration (1/s^2)
+        :rtype: Matrix3D
+        """
+        x: float = self.position.x
+        y: float = self.position.y
+        z: float = self.position.z
+        r2: float = x * x + y * y + z * z
+        r: float = sqrt(r2)
+        r5: float = r2 * r2 * r
+        mu_r5: float = Earth.MU / r5
+
+        xx: float = mu_r5 * (3 * x * x - r2)
+        yy: float = mu_r5 * (3 * y * y - r2)
+        zz: float = mu_r5 * (3 * z * z - r2)
+        xy: float = mu_r5 * 3 * x * y
+        xz: float = mu_r5 * 3 * x * z
+        yz: float = mu_r5 * 3 * y * z
+
+        if self.use_perturbations:
+            k: float = -1.5 * Earth.J2 * Earth.MU * Earth.RADIUS * Earth.RADIUS / r5
+            z2: float = z * z / r2
+            xx += k * (1 - 5 * (x * x + z * z) / r2 + 35 * x * x * z2 / r2)
+            yy += k * (1 - 5 * (y * y + z * z) / r2 + 35 * y * y * z2 / r2)
+            zz += k * (3 - 30 * z2 + 35 * z2 * z2)
+            xy += k * (-5 + 35 * z2) * x * y / r2
+            xz += k * (-15 + 35 * z2) * x * z / r2
+            yz += k * (-15 + 35 * z2) * y * z / r2
+
+        return Matrix3D(Vector3D(xx, xy, xz), Vector3D(xy, yy, yz), Vector3D(xz, yz, zz))
+
     def acceleration_from_moon(self) -> Vector3D:
         """calculate the acceleration on the state due to the moon
 
@@ -324,14 +397,21 @@ class GCRF(State):
         :return: list of velocity and acceleration
         :rtype: List[Vector3D]
         """
+        return [self.velocity.copy(), self.acceleration_from_earth().plus(self.perturbing_acceleration())]
+
+    def perturbing_acceleration(self) -> Vector3D:
+        """calculate every modeled acceleration other than the two-body attraction of the earth
+
+        :return: sum of the thrust and, when perturbations are used, third-body, srp, and geopotential accelerations
+        :rtype: Vector3D
+        """
         net_a: Vector3D = self.acceleration_from_thrust()
-        net_a = net_a.plus(self.acceleration_from_earth())
         if self.use_perturbations:
             net_a = net_a.plus(self.acceleration_from_moon())
             net_a = net_a.plus(self.acceleration_from_sun())
             net_a = net_a.plus(self.acceleration_from_srp())
             net_a = net_a.plus(self.acceleration_from_gravity())
-        return [self.velocity.copy(), net_a]
+        return net_a
 
     def sun_vector(self) -> Vector3D:
         """create a vector pointing from the calling state to the sun
@@ -351,6 +431,9 @@ class GCRF(State):
 
 
 class IJK(State):
+
+    __slots__ = ()
+
     def __init__(self, epoch: Epoch, r: Vector3D, v: Vector3D) -> None:
         """class used to perform operations and modeling in the Geocentric Equatorial Coordinate System
 
@@ -364,6 +447,58 @@ class IJK(State):
         super().__init__(epoch, r, v)
 
 
+class TEME(State):
+
+    __slots__ = ()
+
+    def __init__(self, epoch: Epoch, r: Vector3D, v: Vector3D) -> None:
+        """class used to represent states in the true equator, mean equinox frame produced by SGP4
+
+        :param epoch: time for which the position and velocity are valid
+        :type epoch: Epoch
+        :param r: position of the state
+        :type r: Vector3D
+        :param v: velocity of the state
+        :type v: Vector3D
+        """
+        super().__init__(epoch, r, v)
+
+    @staticmethod
+    def gcrf_matrix(epoch: Epoch) -> Matrix3D:
+        """create a matrix that transforms a TEME vector to GCRF
+
+        TEME differs from the earth-fixed frame by the mean sidereal angle only, so the vector is rotated to the
+        earth-fixed frame and then converted with the same precession, nutation, and rotation models used
+        elsewhere in the package.
+
+        :param epoch: valid time of the state
+        :type epoch: Epoch
+        :return: transformation matrix
+        :rtype: Matrix3D
+        """
+        to_fixed: Matrix3D = Vector3D.rotation_matrix(Vector3D(0, 0, 1), -epoch.greenwich_hour_angle())
+        x: Vector3D = PositionConvert.itrf.to_gcrf(to_fixed.column_1(), epoch)
+        y: Vector3D = PositionConvert.itrf.to_gcrf(to_fixed.column_2(), epoch)
+        z: Vector3D = PositionConvert.itrf.to_gcrf(to_fixed.column_3(), epoch)
+        return Matrix3D(Vector3D(x.x, y.x, z.x), Vector3D(x.y, y.y, z.y), Vector3D(x.z, y.z, z.z))
+
+
+class _StateConvertTEME:
+    """class used to perform state conversions from TEME"""
+
+    @staticmethod
+    def to_gcrf(state: TEME) -> GCRF:
+        """create an inertial state for the calling state
+
+        :param state: state produced by SGP4
+        :type state: TEME
+        :return: GCRF state
+        :rtype: GCRF
+        """
+        rot: Matrix3D = TEME.gcrf_matrix(state.epoch)
+        return GCRF(state.epoch, rot.multiply_vector(state.position), rot.multiply_vector(state.velocity))
+
+
 class _StateConvertGCRF:
     """class used to perform state conversions from GCRF"""
 
@@ -471,3 +606,6 @@ class StateConvert:
 
     #: used to convert from GCRF to other frames
     gcrf = _StateConvertGCRF
+
+    #: used to convert from TEME to other frames
+    teme = _StateConvertTEME
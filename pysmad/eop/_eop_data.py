@@ -1,5 +1,6 @@
 from pathlib import Path
 
+from pysmad import RESOURCE_DIR
 from pysmad.eop._eop_record import EOPRecord
 from pysmad.eop._leap_second_data import LeapSecondData
 from pysmad.eop._nutation_delta_record import NutationDeltaRecord
@@ -11,13 +12,22 @@ class EOPData:
 
     MINIMUM_FINALS_LINE_LENGTH = 134
 
+    #: finals file parsed on first use when no other data has been loaded
+    DEFAULT_FINALS_PATH: Path = RESOURCE_DIR / "finals.all"
+
+    #: leap second file parsed on first use when no other data has been loaded
+    DEFAULT_TAI_UTC_PATH: Path = RESOURCE_DIR / "tai-utc.dat"
+
     _records: dict[int | float, EOPRecord] = {}
+    _defaults_pending: bool = True
     records_start: int | float | None = None
     records_end: int | float | None = None
 
     @staticmethod
     def load_files(finals_path: Path | str, tai_utc_path: Path | str) -> None:
 
+        EOPData._defaults_pending = False
+
         leap_seconds = LeapSecondData(tai_utc_path)
         with open(finals_path, "r") as f:
             lines = f.readlines()
@@ -31,6 +41,31 @@ class EOPData:
         EOPData.records_start = min(EOPData._records.keys())
         EOPData.records_end = max(EOPData._records.keys())
 
+    @staticmethod
+    def get_records() -> dict[int | float, EOPRecord]:
+        """get the loaded records so they can be shared with another process
+
+        :return: records keyed by modified julian day
+        """
+        if EOPData._defaults_pending:
+            EOPData.load_files(EOPData.DEFAULT_FINALS_PATH, EOPData.DEFAULT_TAI_UTC_PATH)
+        return EOPData._records
+
+    @staticmethod
+    def set_records(records: dict[int | float, EOPRecord]) -> None:
+        """replace the loaded data with records that have already been parsed
+
+        :param records: records keyed by modified julian day
+        """
+        EOPData._defaults_pending = False
+        EOPData._records = records
+        if records:
+            EOPData.records_start = min(records.keys())
+            EOPData.records_end = max(records.keys())
+        else:
+            EOPData.records_start = None
+            EOPData.records_end = None
+
     @staticmethod
     def get_record(mjd: float) -> EOPRecord:
         """get a record from the data
@@ -39,6 +74,9 @@ class EOPData:
         :return: record from the data
         """
 
+        if EOPData._defaults_pending:
+            EOPData.load_files(EOPData.DEFAULT_FINALS_PATH, EOPData.DEFAULT_TAI_UTC_PATH)
+
         if EOPData.records_start is None or EOPData.records_end is None:
             record = EOPRecord.empty_record(0)
         elif mjd < EOPData.records_start:
@@ -0,0 +1,407 @@
+import csv
+import sys
+from array import array
+from json import dumps, loads
+from math import nan
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from struct import Struct
+from typing import Dict, List, Literal, Tuple
+
+from pysmad.coordinates.states import LiveVectorSet, State
+from pysmad.estimation.obs import Column, ColumnarOpticalSet, LiveOpticalObservation, LiveOpticalSet
+from pysmad.estimation.vectors import COVARIANCE_WIDTH, ColumnarVectorSet
+from pysmad.time import Epoch
+
+#: first bytes of every columnar file
+MAGIC: bytes = b"PYSMADC1"
+
+#: kind recorded in the header of optical observation files
+OPTICAL_KIND: bytes = b"OBS "
+
+#: kind recorded in the header of state vector files
+VECTOR_KIND: bytes = b"VEC "
+
+#: magic, kind, row count, and block count
+HEADER: Struct = Struct("<8s4sQI4x")
+
+#: name, type code, byte offset, and byte size of a block
+ENTRY: Struct = Struct("<24s1s7xQQ")
+
+#: byte boundary every block starts on so it can be cast in place
+ALIGNMENT: int = 8
+
+#: type code of blocks that hold a JSON list of identifiers
+TABLE_CODE: str = "j"
+
+#: type code of each typed block that can be cast in place keyed by the code stored in the block directory
+CAST_CODES: Dict[str, Literal["d", "i"]] = {"d": "d", "i": "i"}
+
+#: data mode assigned to observations read from CSV files, which do not record it
+CSV_MODE: str = "NOT PROVIDED"
+
+
+def write_columns(path: str | Path, kind: bytes, rows: int, blocks: List[Tuple[str, Column | List[str]]]) -> None:
+    """write a header, a block directory, and aligned little-endian blocks to a file
+
+    :param path: destination file
+    :type path: str | Path
+    :param kind: four-byte label of the stored set
+    :type kind: bytes
+    :param rows: number of rows in the stored set
+    :type rows: int
+    :param blocks: name and contents of each block (typed columns or lists of identifiers)
+    :type blocks: List[Tuple[str, Column | List[str]]]
+    """
+    payloads: List[Tuple[str, str, bytes]] = []
+    for name, values in blocks:
+        if isinstance(values, list):
+            payloads.append((name, TABLE_CODE, dumps(values).encode()))
+        else:
+            # memory-mapped columns and columns that are byte swapped in place are copied first
+            if not isinstance(values, array):
+                values = array(values.format, values)
+            elif sys.byteorder == "big":
+                values = array(values.typecode, values)
+            if sys.byteorder == "big":
+                values.byteswap()
+            payloads.append((name, values.typecode, values.tobytes()))
+
+    offset: int = HEADER.size + ENTRY.size * len(payloads)
+    entries: List[bytes] = []
+    offsets: List[int] = []
+    for name, typecode, payload in payloads:
+        offset += -offset % ALIGNMENT
+        offsets.append(offset)
+        entries.append(ENTRY.pack(name.encode(), typecode.encode(), offset, len(payload)))
+        offset += len(payload)
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, kind, rows, len(payloads)))
+        f.writelines(entries)
+        for start, (_, _, payload) in zip(offsets, payloads):
+            f.write(b"\0" * (start - f.tell()))
+            f.write(payload)
+
+
+def read_columns(path: str | Path, copy: bool = False) -> Tuple[bytes, int, Dict[str, Column], Dict[str, List[str]]]:
+    """read the blocks of a columnar file
+
+    Without copy the typed blocks are read-only views of a memory map of the file, so nothing is loaded until a value
+    is accessed.
+
+    :param path: columnar file
+    :type path: str | Path
+    :param copy: flag to load the typed blocks into arrays, defaults to False
+    :type copy: bool, optional
+    :return: kind of the stored set, number of rows, and each typed block and identifier table keyed by name
+    :rtype: Tuple[bytes, int, Dict[str, Column], Dict[str, List[str]]]
+    """
+    with open(path, "rb") as f:
+        data: mmap = mmap(f.fileno(), 0, access=ACCESS_READ)
+    view: memoryview = memoryview(data)
+    magic, kind, rows, count = HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise ValueError("file is not a pysmad columnar file")
+
+    columns: Dict[str, Column] = {}
+    tables: Dict[str, List[str]] = {}
+    for i in range(count):
+        name, code, offset, size = ENTRY.unpack_from(view, HEADER.size + i * ENTRY.size)
+        key: str = name.rstrip(b"\0").decode()
+        end: int = offset + size
+        if code.decode() == TABLE_CODE:
+            tables[key] = loads(bytes(view[offset:end]))
+            continue
+        typecode: Literal["d", "i"] | None = CAST_CODES.get(code.decode())
+        if typecode is None:
+            raise ValueError(f"block {key} has unsupported type code {code.decode()}")
+        if copy or sys.byteorder == "big":
+            values: array = array(typecode)
+            values.frombytes(view[offset:end])
+            if sys.byteorder == "big":
+                values.byteswap()
+            columns[key] = values
+        else:
+            columns[key] = view[offset:end].cast(typecode)
+    return kind, rows, columns, tables
+
+
+def read_kind(path: str | Path, kind: bytes, copy: bool) -> Tuple[Dict[str, Column], Dict[str, List[str]]]:
+    """read the blocks of a columnar file that must hold a specific kind of set
+
+    :param path: columnar file
+    :type path: str | Path
+    :param kind: expected four-byte label of the stored set
+    :type kind: bytes
+    :param copy: flag to load the typed blocks into arrays
+    :type copy: bool
+    :return: each typed block and identifier table keyed by name
+    :rtype: Tuple[Dict[str, Column], Dict[str, List[str]]]
+    """
+    stored, _, columns, tables = read_columns(path, copy)
+    if stored != kind:
+        raise ValueError(f"file holds {stored.decode().strip()} records instead of {kind.decode().strip()}")
+    return columns, tables
+
+
+def write_optical_set(path: str | Path, optical_set: LiveOpticalSet | ColumnarOpticalSet) -> None:
+    """write the observations of a set to a columnar file
+
+    :param path: destination file
+    :type path: str | Path
+    :param optical_set: observations to be written
+    :type optical_set: LiveOpticalSet | ColumnarOpticalSet
+    """
+    if not isinstance(optical_set, ColumnarOpticalSet):
+        columnar: ColumnarOpticalSet = ColumnarOpticalSet()
+        for ob in optical_set.list:
+            columnar.process_observation(ob)
+        optical_set = columnar
+    blocks: List[Tuple[str, Column | List[str]]] = [(name, optical_set.columns[name]) for name in optical_set.COLUMNS]
+    for name in optical_set.KEYS:
+        blocks.append((f"codes.{name}", optical_set.codes[name]))
+        blocks.append((f"tables.{name}", optical_set.tables[name].values))
+    write_columns(path, OPTICAL_KIND, len(optical_set), blocks)
+
+
+def read_optical_set(path: str | Path, copy: bool = False) -> ColumnarOpticalSet:
+    """read the observations of a columnar file
+
+    :param path: columnar file written by write_optical_set
+    :type path: str | Path
+    :param copy: flag to load the columns into arrays so the set can be extended, defaults to False
+    :type copy: bool, optional
+    :return: set over the stored columns
+    :rtype: ColumnarOpticalSet
+    """
+    columns, tables = read_kind(path, OPTICAL_KIND, copy)
+    return ColumnarOpticalSet.from_columns(
+        {name: columns[name] for name in ColumnarOpticalSet.COLUMNS},
+        {name: columns[f"codes.{name}"] for name in ColumnarOpticalSet.KEYS},
+        {name: tables[f"tables.{name}"] for name in ColumnarOpticalSet.KEYS},
+    )
+
+
+def write_vector_set(path: str | Path, vector_set: LiveVectorSet | ColumnarVectorSet) -> None:
+    """write the vectors of a set to a columnar file
+
+    :param path: destination file
+    :type path: str | Path
+    :param vector_set: vectors to be written
+    :type vector_set: LiveVectorSet | ColumnarVectorSet
+    """
+    if not isinstance(vector_set, ColumnarVectorSet):
+        columnar: ColumnarVectorSet = ColumnarVectorSet()
+        for state in vector_set.list:
+            columnar.process_vector(state)
+        vector_set = columnar
+    blocks: List[Tuple[str, Column | List[str]]] = [(name, vector_set.columns[name]) for name in vector_set.COLUMNS]
+    blocks.append(("covariances", vector_set.covariances))
+    for name in vector_set.KEYS:
+        blocks.append((f"codes.{name}", vector_set.codes[name]))
+        blocks.append((f"tables.{name}", vector_set.tables[name].values))
+    write_columns(path, VECTOR_KIND, len(vector_set), blocks)
+
+
+def read_vector_set(path: str | Path, copy: bool = False) -> ColumnarVectorSet:
+    """read the vectors of a columnar file
+
+    :param path: columnar file written by write_vector_set
+    :type path: str | Path
+    :param copy: flag to load the columns into arrays so the set can be extended, defaults to False
+    :type copy: bool, optional
+    :return: set over the stored columns
+    :rtype: ColumnarVectorSet
+    """
+    columns, tables = read_kind(path, VECTOR_KIND, copy)
+    return ColumnarVectorSet.from_columns(
+        {name: columns[name] for name in ColumnarVectorSet.COLUMNS},
+        columns["covariances"],
+        {name: columns[f"codes.{name}"] for name in ColumnarVectorSet.KEYS},
+        {name: tables[f"tables.{name}"] for name in ColumnarVectorSet.KEYS},
+    )
+
+
+def decode(optical_set: ColumnarOpticalSet | ColumnarVectorSet, name: str) -> List[str]:
+    """expand a dictionary-encoded identifier column
+
+    :param optical_set: set that holds the column
+    :type optical_set: ColumnarOpticalSet | ColumnarVectorSet
+    :param name: identifier name in the KEYS of the set
+    :type name: str
+    :return: identifier of each row
+    :rtype: List[str]
+    """
+    values: List[str] = optical_set.tables[name].values
+    return [values[code] for code in optical_set.codes[name]]
+
+
+def write_rows(path: str | Path, write_mode: str, header: List[str] | None, columns: List[List[str] | Column]) -> None:
+    """write columns to a CSV file by formatting each column in bulk and joining the rows
+
+    Identifiers are written without quoting to match the layout of the row-by-row publishers.
+
+    :param path: destination file
+    :type path: str | Path
+    :param write_mode: mode used to open the file
+    :type write_mode: str
+    :param header: names written as the first row or None to skip the header
+    :type header: List[str] | None
+    :param columns: text or float value of each row for every column
+    :type columns: List[List[str] | Column]
+    """
+    text: List[List[str]] = [column if isinstance(column, list) else list(map(repr, column)) for column in columns]
+    with open(path, write_mode) as f:
+        if header is not None:
+            f.write(",".join(header) + "\n")
+        f.writelines(map("{}\n".format, map(",".join, zip(*text))))
+
+
+def write_optical_csv(
+    path: str | Path, optical_set: LiveOpticalSet | ColumnarOpticalSet, write_mode: str = "w", header: bool = True
+) -> None:
+    """write the observations of a set to a CSV file in the layout of LiveOpticalObservation.to_csv_format
+
+    Rows are assembled column by column and written in bulk instead of one formatted string at a time.
+
+    :param path: destination file
+    :type path: str | Path
+    :param optical_set: observations to be written
+    :type optical_set: LiveOpticalSet | ColumnarOpticalSet
+    :param write_mode: mode used to open the file, defaults to "w"
+    :type write_mode: str, optional
+    :param header: flag to write LiveOpticalObservation.csv_headers as the first row, defaults to True
+    :type header: bool, optional
+    """
+    if not isinstance(optical_set, ColumnarOpticalSet):
+        columnar: ColumnarOpticalSet = ColumnarOpticalSet()
+        for ob in optical_set.list:
+            columnar.process_observation(ob)
+        optical_set = columnar
+    c: Dict[str, Column] = optical_set.columns
+    write_rows(
+        path,
+        write_mode,
+        LiveOpticalObservation.csv_headers().split(",") if header else None,
+        [
+            [Epoch(utc).iso_string for utc in c["epoch"]],
+            decode(optical_set, "source"),
+            decode(optical_set, "sat_id"),
+            c["azimuth"],
+            c["elevation"],
+            c["right_ascension"],
+            c["declination"],
+            c["equatorial_phase_angle"],
+            c["solar_declination_angle"],
+            c["visual_magnitude"],
+            decode(optical_set, "observer_id"),
+            c["latitude"],
+            c["longitude"],
+            c["altitude"],
+        ],
+    )
+
+
+def read_optical_csv(path: str | Path) -> ColumnarOpticalSet:
+    """read the observations of a CSV file in the layout of LiveOpticalObservation.to_csv_format
+
+    Files with or without the header row are accepted.  The data mode and sensor position are not part of the layout,
+    so every observation is given CSV_MODE and a nan sensor position.
+
+    :param path: CSV file
+    :type path: str | Path
+    :return: set of the stored observations
+    :rtype: ColumnarOpticalSet
+    """
+    optical_set: ColumnarOpticalSet = ColumnarOpticalSet()
+    first: str = LiveOpticalObservation.csv_headers().split(",")[0]
+    with open(path, newline="") as f:
+        for row in csv.reader(f):
+            if not row or row[0] == first:
+                continue
+            epoch, source, sat_id, az, el, ra, dec, eq_phase, dec_phase, mag, sensor_id, lat, lon, alt = row
+            optical_set.append(
+                (
+                    Epoch.from_iso_string(epoch).utc,
+                    float(az),
+                    float(el),
+                    float(ra),
+                    float(dec),
+                    float(mag),
+                    float(lat),
+                    float(lon),
+                    float(alt),
+                    nan,
+                    nan,
+                    nan,
+                    float(eq_phase),
+                    float(dec_phase),
+                ),
+                sat_id,
+                sensor_id,
+                source,
+                CSV_MODE,
+            )
+    return optical_set
+
+
+def write_vector_csv(
+    path: str | Path, vector_set: LiveVectorSet | ColumnarVectorSet, write_mode: str = "w", header: bool = True
+) -> None:
+    """write the vectors of a set to a CSV file in the layout of LiveVector.to_csv_format
+
+    :param path: destination file
+    :type path: str | Path
+    :param vector_set: vectors to be written
+    :type vector_set: LiveVectorSet | ColumnarVectorSet
+    :param write_mode: mode used to open the file, defaults to "w"
+    :type write_mode: str, optional
+    :param header: flag to write State.csv_headers as the first row, defaults to True
+    :type header: bool, optional
+    """
+    if not isinstance(vector_set, ColumnarVectorSet):
+        columnar: ColumnarVectorSet = ColumnarVectorSet()
+        for state in vector_set.list:
+            columnar.process_vector(state)
+        vector_set = columnar
+    c: Dict[str, Column] = vector_set.columns
+    write_rows(
+        path,
+        write_mode,
+        State.csv_headers().split(",") if header else None,
+        [
+            decode(vector_set, "sat_id"),
+            [Epoch(utc).iso_string for utc in c["epoch"]],
+            decode(vector_set, "reference_frame"),
+            c["x"],
+            c["y"],
+            c["z"],
+            c["vx"],
+            c["vy"],
+            c["vz"],
+        ],
+    )
+
+
+def read_vector_csv(path: str | Path) -> ColumnarVectorSet:
+    """read the vectors of a CSV file in the layout of LiveVector.to_csv_format
+
+    Files with or without the header row are accepted.  Solar radiation pressure coefficients and covariances are not
+    part of the layout and are read as None.
+
+    :param path: CSV file
+    :type path: str | Path
+    :return: set of the stored vectors
+    :rtype: ColumnarVectorSet
+    """
+    vector_set: ColumnarVectorSet = ColumnarVectorSet()
+    first: str = State.csv_headers().split(",")[0]
+    with open(path, newline="") as f:
+        for row in csv.reader(f):
+            if not row or row[0] == first:
+                continue
+            sat_id, epoch, frame, x, y, z, vx, vy, vz = row
+            values: Tuple[float, ...] = (Epoch.from_iso_string(epoch).utc, *map(float, (x, y, z, vx, vy, vz)), nan)
+            vector_set.append(values, [nan] * COVARIANCE_WIDTH, sat_id, frame)
+    return vector_set
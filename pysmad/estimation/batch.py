@@ -0,0 +1,338 @@
+from array import array
+from math import sqrt
+from multiprocessing import get_context
+from operator import mul
+from os import cpu_count
+from typing import Dict, List, Tuple
+
+from pysmad.coordinates.elements import ClassicalElements
+from pysmad.coordinates.states import GCRF, IJK, TEME, LiveVector, StateConvert
+from pysmad.eop import EOPData, EOPRecord
+from pysmad.estimation.filtering import InertialMeasurement
+from pysmad.estimation.iod import Gauss
+from pysmad.estimation.obs import LiveOpticalSet, Observation
+from pysmad.math.linalg import Cholesky, Matrix3D, SymmetricMatrix6D, Vector3D
+from pysmad.propagators.inertial import RK4
+from pysmad.time import Epoch
+
+#: number of estimated parameters (x, y, z, vx, vy, vz)
+STATE_WIDTH: int = 6
+
+
+class OrbitSolution:
+    def __init__(
+        self,
+        sat_id: str,
+        state: GCRF,
+        covariance: SymmetricMatrix6D,
+        rms: float,
+        iterations: int,
+        converged: bool,
+        residuals: array,
+    ) -> None:
+        """class used to store the result of a batch orbit determination
+
+        :param sat_id: identifier of the fitted object
+        :type sat_id: str
+        :param state: estimated state at the epoch of the seed
+        :type state: GCRF
+        :param covariance: formal covariance of the estimated state
+        :type covariance: SymmetricMatrix6D
+        :param rms: weighted root-mean-square of the final residuals
+        :type rms: float
+        :param iterations: number of differential corrections performed
+        :type iterations: int
+        :param converged: flag indicating the corrections fell below the tolerance
+        :type converged: bool
+        :param residuals: measured minus computed values of the final pass in observation order
+        :type residuals: array
+        """
+        #: identifier of the fitted object
+        self.sat_id: str = sat_id
+
+        #: estimated state at the epoch of the seed
+        self.state: GCRF = state
+
+        #: formal covariance of the estimated state
+        self.covariance: SymmetricMatrix6D = covariance
+
+        #: weighted root-mean-square of the final residuals
+        self.rms: float = rms
+
+        #: number of differential corrections performed
+        self.iterations: int = iterations
+
+        #: flag indicating the corrections fell below the tolerance
+        self.converged: bool = converged
+
+        #: measured minus computed values of the final pass in observation order
+        self.residuals: array = residuals
+
+
+class BatchLeastSquares:
+
+    #: Largest number of differential corrections
+    MAX_ITERATIONS: int = 10
+
+    #: Position correction in km below which the solution is considered converged
+    TOLERANCE: float = 1e-6
+
+    #: One-sigma angular error in radians assumed for live optical observations (one arcsecond)
+    DEFAULT_ANGULAR_ERROR: float = 4.84813681109536e-06
+
+    def __init__(self, seed: GCRF, measurements: List[InertialMeasurement]) -> None:
+        """class used to fit an orbit to a set of measurements with weighted least squares
+
+        Each iteration makes a single pass of an RK4 propagation with the state transition matrix enabled, so the
+        partials of every measurement with respect to the seed state come from the same integration as the residuals.
+
+        :param seed: initial guess of the state
+        :type seed: GCRF
+        :param measurements: measurements of the object in any order
+        :type measurements: List[InertialMeasurement]
+        """
+        #: current estimate of the state at the seed epoch
+        self.state: GCRF = seed.copy()
+
+        #: measurements sorted by epoch
+        self.measurements: List[InertialMeasurement] = sorted(measurements, key=lambda m: m.epoch.utc)
+
+    @staticmethod
+    def seed_from_elements(elements: ClassicalElements) -> GCRF:
+        """create a GCRF seed from orbital elements expressed in the IJK frame
+
+        :param elements: orbital elements such as those produced by :meth:`Gauss.coes_from_positions`
+        :type elements: ClassicalElements
+        :return: state in the GCRF frame
+        :rtype: GCRF
+        """
+        ijk: IJK = elements.to_ijk()
+        return StateConvert.teme.to_gcrf(TEME(ijk.epoch, ijk.position, ijk.velocity))
+
+    @staticmethod
+    def seed_from_gauss(ob1: Observation, ob2: Observation) -> GCRF:
+        """create a GCRF seed from two positional observations with the gauss method
+
+        :param ob1: first observation
+        :type ob1: Observation
+        :param ob2: second observation
+        :type ob2: Observation
+        :return: state at the epoch of the first observation
+        :rtype: GCRF
+        """
+        return BatchLeastSquares.seed_from_elements(Gauss.coes_from_positions(ob1, ob2))
+
+    @staticmethod
+    def seed_from_vector(vector: LiveVector) -> GCRF:
+        """create a GCRF seed from a live state vector
+
+        :param vector: state vector of the object
+        :type vector: LiveVector
+        :return: state in the GCRF frame
+        :rtype: GCRF
+        """
+        return GCRF(vector.epoch, vector.position, vector.velocity)
+
+    def linearize(self) -> Tuple[List[List[float]], List[float], List[float]]:
+        """propagate the current estimate through every measurement and collect the linearized system
+
+        :return: columns of the partials with respect to the seed state, residuals, and weights of every component
+        :rtype: Tuple[List[List[float]], List[float], List[float]]
+        """
+        propagator: RK4 = RK4(self.state)
+        propagator.enable_stm()
+        columns: List[List[float]] = [[] for _ in range(STATE_WIDTH)]
+        residuals: List[float] = []
+        weights: List[float] = []
+        for measurement in self.measurements:
+            propagator.step_to_epoch(measurement.epoch)
+            predicted, h = measurement.predict(propagator.state)
+            phi: List[float] | None = propagator.stm
+            if phi is None:
+                raise ValueError("state transition matrix was not enabled")
+            for row in h:
+                # only the position partials of the measurement are non-zero
+                for j in range(STATE_WIDTH):
+                    columns[j].append(row[0] * phi[j] + row[1] * phi[j + 6] + row[2] * phi[j + 12])
+            residuals.extend(measurement.residuals(predicted))
+            weights.extend(1 / variance for variance in measurement.variances)
+        return columns, residuals, weights
+
+    @staticmethod
+    def normal_equations(
+        columns: List[List[float]], residuals: List[float], weights: List[float]
+    ) -> Tuple[List[List[float]], List[float]]:
+        """accumulate A^T * W * A and A^T * W * y over every observation at once
+
+        :param columns: partials of every component with respect to each state element
+        :type columns: List[List[float]]
+        :param residuals: measured minus computed value of every component
+        :type residuals: List[float]
+        :param weights: inverse variance of every component
+        :type weights: List[float]
+        :return: normal matrix as a list of rows and the right-hand side
+        :rtype: Tuple[List[List[float]], List[float]]
+        """
+        weighted: List[List[float]] = [list(map(mul, weights, column)) for column in columns]
+        normal: List[List[float]] = [[0.0] * STATE_WIDTH for _ in range(STATE_WIDTH)]
+        for i in range(STATE_WIDTH):
+            for j in range(i, STATE_WIDTH):
+                normal[i][j] = normal[j][i] = sum(map(mul, weighted[i], columns[j]))
+        rhs: List[float] = [sum(map(mul, column, residuals)) for column in weighted]
+        return normal, rhs
+
+    def solve(self, sat_id: str = "UNKNOWN") -> OrbitSolution:
+        """iterate differential corrections until the position correction falls below the tolerance
+
+        :param sat_id: identifier of the fitted object, defaults to "UNKNOWN"
+        :type sat_id: str, optional
+        :return: estimated state and its statistics
+        :rtype: OrbitSolution
+        """
+        iterations: int = 0
+        converged: bool = False
+        while iterations < BatchLeastSquares.MAX_ITERATIONS and not converged:
+            columns, residuals, weights = self.linearize()
+            normal, rhs = BatchLeastSquares.normal_equations(columns, residuals, weights)
+            factor: List[List[float]] = Cholesky.factor(normal)
+            dx: List[float] = Cholesky.solve(factor, rhs)
+
+            state: GCRF = GCRF(
+                self.state.epoch,
+                self.state.position.plus(Vector3D(dx[0], dx[1], dx[2])),
+                self.state.velocity.plus(Vector3D(dx[3], dx[4], dx[5])),
+            )
+            state.match_force_model(self.state)
+            self.state = state
+            iterations += 1
+            converged = sqrt(dx[0] * dx[0] + dx[1] * dx[1] + dx[2] * dx[2]) < BatchLeastSquares.TOLERANCE
+
+        # statistics of the final estimate
+        columns, residuals, weights = self.linearize()
+        normal, _ = BatchLeastSquares.normal_equations(columns, residuals, weights)
+        factor = Cholesky.factor(normal)
+        inverse: List[List[float]] = [
+            Cholesky.solve(factor, [1.0 if i == j else 0.0 for j in range(STATE_WIDTH)]) for i in range(STATE_WIDTH)
+        ]
+        rms: float = sqrt(sum(w * y * y for w, y in zip(weights, residuals)) / max(len(residuals), 1))
+        return OrbitSolution(
+            sat_id,
+            self.state,
+            SymmetricMatrix6D.from_rows(inverse),
+            rms,
+            iterations,
+            converged,
+            array("d", residuals),
+        )
+
+
+def _initialize_worker(eop_records: dict[int | float, EOPRecord] | None) -> None:
+    """load the parent's EOP records into a worker that did not inherit them
+
+    :param eop_records: records parsed by the parent or None if the worker inherited them
+    :type eop_records: dict[int | float, EOPRecord] | None
+    """
+    if eop_records is not None:
+        EOPData.set_records(eop_records)
+
+
+def _fit_target(task: Tuple[str, Tuple[float, ...], List[Tuple[float, ...]]]) -> Tuple:
+    """fit one target from packed values so only floats travel through the pool's pipes
+
+    :param task: sat_id, packed seed, and packed right ascension/declination measurements of the target
+    :type task: Tuple[str, Tuple[float, ...], List[Tuple[float, ...]]]
+    :return: sat_id, packed state, covariance values, rms, iterations, convergence flag, and residuals
+    :rtype: Tuple
+    """
+    sat_id, (utc, x, y, z, vx, vy, vz, srp_scalar, use_perturbations), packed = task
+    seed: GCRF = GCRF(Epoch(utc), Vector3D(x, y, z), Vector3D(vx, vy, vz))
+    seed.srp_scalar = srp_scalar
+    seed.use_perturbations = bool(use_perturbations)
+
+    rotation: Matrix3D = Matrix3D(Vector3D(1, 0, 0), Vector3D(0, 1, 0), Vector3D(0, 0, 1))
+    measurements: List[InertialMeasurement] = [
+        InertialMeasurement(
+            Epoch(ob_utc), Vector3D(ox, oy, oz), rotation, InertialMeasurement.RADEC, [ra, dec, 0], [sigma, sigma, 0]
+        )
+        for ob_utc, ox, oy, oz, ra, dec, sigma in packed
+    ]
+    solution: OrbitSolution = BatchLeastSquares(seed, measurements).solve(sat_id)
+    r: Vector3D = solution.state.position
+    v: Vector3D = solution.state.velocity
+    return (
+        sat_id,
+        (r.x, r.y, r.z, v.x, v.y, v.z),
+        solution.covariance.values,
+        solution.rms,
+        solution.iterations,
+        solution.converged,
+        solution.residuals,
+    )
+
+
+def fit_targets(
+    optical_set: LiveOpticalSet,
+    seeds: Dict[str, GCRF],
+    ang_error: float = BatchLeastSquares.DEFAULT_ANGULAR_ERROR,
+    workers: int | None = None,
+    start_method: str | None = None,
+) -> Dict[str, OrbitSolution]:
+    """fit an orbit to the observations of every seeded target in an optical set across a process pool
+
+    The measurement geometry is computed in the parent and each worker receives only packed floats, so workers
+    need the parent's EOP records only when they are started from a fresh interpreter.
+
+    :param optical_set: observations grouped by target
+    :type optical_set: LiveOpticalSet
+    :param seeds: initial state of each target to be fitted keyed by sat_id
+    :type seeds: Dict[str, GCRF]
+    :param ang_error: one-sigma angular error of the observations in radians, defaults to DEFAULT_ANGULAR_ERROR
+    :type ang_error: float, optional
+    :param workers: number of processes in the pool, defaults to the cpu count
+    :type workers: int | None, optional
+    :param start_method: multiprocessing start method ("fork", "spawn", "forkserver"), defaults to the platform
+    :type start_method: str | None, optional
+    :return: solution of each fitted target keyed by sat_id
+    :rtype: Dict[str, OrbitSolution]
+    """
+    tasks: List[Tuple[str, Tuple[float, ...], List[Tuple[float, ...]]]] = []
+    for sat_id, seed in seeds.items():
+        packed: List[Tuple[float, ...]] = []
+        for ob in optical_set.targets.get(sat_id, []):
+            measurement: InertialMeasurement = InertialMeasurement.from_live_optical_observation(ob, ang_error)
+            o: Vector3D = measurement.observer
+            ra, dec = measurement.values
+            packed.append((ob.epoch.utc, o.x, o.y, o.z, ra, dec, ang_error))
+        if not packed:
+            continue
+        r: Vector3D = seed.position
+        v: Vector3D = seed.velocity
+        packed_seed = (seed.epoch.utc, r.x, r.y, r.z, v.x, v.y, v.z, seed.srp_scalar, seed.use_perturbations)
+        tasks.append((sat_id, packed_seed, packed))
+
+    solutions: Dict[str, OrbitSolution] = {}
+    if not tasks:
+        return solutions
+
+    if workers is None:
+        workers = cpu_count() or 1
+    workers = max(1, min(workers, len(tasks)))
+    context = get_context(start_method)
+
+    # EOP records are parsed lazily, so load them before the pool starts; forked workers then inherit the parsed
+    # records and they are only shipped to fresh interpreters
+    eop_records: dict[int | float, EOPRecord] | None = EOPData.get_records()
+    if context.get_start_method() == "fork":
+        eop_records = None
+
+    with context.Pool(workers, _initialize_worker, (eop_records,)) as pool:
+        for sat_id, (x, y, z, vx, vy, vz), covariance, rms, iterations, converged, residuals in pool.imap_unordered(
+            _fit_target, tasks
+        ):
+            template: GCRF = seeds[sat_id]
+            state: GCRF = GCRF(template.epoch, Vector3D(x, y, z), Vector3D(vx, vy, vz))
+            state.match_force_model(template)
+            solutions[sat_id] = OrbitSolution(
+                sat_id, state, SymmetricMatrix6D(covariance), rms, iterations, converged, residuals
+            )
+    return solutions
@@ -0,0 +1,287 @@
+from bisect import bisect_left
+from math import cos, floor, log2, pi, sin, sqrt
+from typing import Dict, List, Tuple
+
+from pysmad.constants import DAYS_TO_SECONDS, SECONDS_IN_SIDEREAL_DAY
+from pysmad.coordinates.positions import LLA, PositionConvert
+from pysmad.estimation.obs import LiveOpticalObservation
+from pysmad.math.linalg import Vector3D
+from pysmad.math.spatial import KDTree, SphereGrid, acos_clamped
+from pysmad.propagators.catalog import STATE_WIDTH, CatalogEphemeris
+from pysmad.time import Epoch
+
+
+class RangeShell:
+    def __init__(self, indices: List[int], grid: SphereGrid, closest: float, fastest: float) -> None:
+        """class used to hold the directions of the catalog objects that fall within a band of range from a site
+
+        :param indices: catalog index of each direction in the grid
+        :type indices: List[int]
+        :param grid: indexed directions from the site
+        :type grid: SphereGrid
+        :param closest: smallest range of the shell in km
+        :type closest: float
+        :param fastest: largest object speed plus site speed in km/s
+        :type fastest: float
+        """
+        #: catalog index of each direction in the grid
+        self.indices: List[int] = indices
+
+        #: indexed directions from the site
+        self.grid: SphereGrid = grid
+
+        #: smallest range of the shell in km
+        self.range: float = closest
+
+        #: largest object speed plus site speed in km/s
+        self.speed: float = fastest
+
+
+class CorrelationEngine:
+
+    #: Default angular size of the sphere grid cells in radians
+    DEFAULT_CELL_SIZE: float = SphereGrid.DEFAULT_CELL_SIZE
+
+    #: Upper range in km of the closest shell of objects seen from a ground site
+    SHELL_RANGE: float = 1000
+
+    def __init__(
+        self, ephemeris: CatalogEphemeris, sat_ids: List[str] | None = None, cell_size: float = DEFAULT_CELL_SIZE
+    ) -> None:
+        """class used to find the catalog objects near a position or observation without checking every object
+
+        A k-d tree of positions and a sphere grid of directions from each observing site are built lazily for each
+        ephemeris grid epoch.  Queries search the index of the nearest grid epoch with a radius padded by the
+        largest motion possible over the time offset, then refine the candidates with interpolated positions.
+
+        :param ephemeris: precomputed catalog states on a shared epoch grid
+        :type ephemeris: CatalogEphemeris
+        :param sat_ids: identifier of each catalog object, defaults to the object index as a string
+        :type sat_ids: List[str] | None, optional
+        :param cell_size: angular size of the sphere grid cells in radians, defaults to DEFAULT_CELL_SIZE
+        :type cell_size: float, optional
+        """
+        #: precomputed catalog states on a shared epoch grid
+        self.ephemeris: CatalogEphemeris = ephemeris
+
+        #: identifier of each catalog object
+        self.sat_ids: List[str] = sat_ids if sat_ids is not None else [str(i) for i in range(ephemeris.count)]
+        if len(self.sat_ids) != ephemeris.count:
+            raise ValueError("one identifier is required for each catalog object")
+
+        #: angular size of the sphere grid cells in radians
+        self.cell_size: float = cell_size
+
+        #: utc epochs of the ephemeris grid
+        self.grid: List[float] = [epoch.utc for epoch in ephemeris.epochs]
+
+        #: k-d tree of the catalog positions built for each grid index
+        self.trees: Dict[int, KDTree] = {}
+
+        #: largest catalog speed in km/s at each grid index
+        self.speeds: Dict[int, float] = {}
+
+        #: range shells of catalog directions for each (site, grid index) pair
+        self.grids: Dict[Tuple[float, float, float, int], List[RangeShell]] = {}
+
+    def nearest_node(self, epoch: Epoch) -> int:
+        """find the grid epoch closest to the argument epoch
+
+        :param epoch: time of interest
+        :type epoch: Epoch
+        :return: index of the closest grid epoch
+        :rtype: int
+        """
+        utc: float = epoch.utc
+        i: int = bisect_left(self.grid, utc)
+        if i == len(self.grid):
+            return i - 1
+        if i > 0 and utc - self.grid[i - 1] <= self.grid[i] - utc:
+            return i - 1
+        return i
+
+    def node_vector(self, object_index: int, node: int) -> Tuple[float, float, float, float, float, float]:
+        """retrieve the stored state of an object at a grid epoch
+
+        :param object_index: position of the object in the catalog
+        :type object_index: int
+        :param node: index of the grid epoch
+        :type node: int
+        :return: x, y, z, vx, vy, vz in km and km/s
+        :rtype: Tuple[float, float, float, float, float, float]
+        """
+        start: int = self.ephemeris.offset(object_index, node)
+        end: int = start + STATE_WIDTH
+        return tuple(self.ephemeris.values[start:end])
+
+    def position(self, object_index: int, epoch: Epoch) -> Vector3D:
+        """interpolate the position of an object with a cubic that matches the bracketing grid states
+
+        :param object_index: position of the object in the catalog
+        :type object_index: int
+        :param epoch: time of interest
+        :type epoch: Epoch
+        :return: GCRF position in km
+        :rtype: Vector3D
+        """
+        utc: float = epoch.utc
+        grid: List[float] = self.grid
+        if not grid or utc < grid[0] or utc > grid[-1]:
+            raise ValueError("epoch falls outside the ephemeris grid")
+        i: int = min(max(bisect_left(grid, utc), 1), len(grid) - 1)
+        if len(grid) == 1:
+            x, y, z = self.node_vector(object_index, 0)[:3]
+            return Vector3D(x, y, z)
+
+        x0, y0, z0, vx0, vy0, vz0 = self.node_vector(object_index, i - 1)
+        x1, y1, z1, vx1, vy1, vz1 = self.node_vector(object_index, i)
+        h: float = (grid[i] - grid[i - 1]) * DAYS_TO_SECONDS
+        s: float = (utc - grid[i - 1]) * DAYS_TO_SECONDS / h
+        s2: float = s * s
+        s3: float = s2 * s
+        h00: float = 2 * s3 - 3 * s2 + 1
+        h10: float = (s3 - 2 * s2 + s) * h
+        h01: float = -2 * s3 + 3 * s2
+        h11: float = (s3 - s2) * h
+        return Vector3D(
+            h00 * x0 + h10 * vx0 + h01 * x1 + h11 * vx1,
+            h00 * y0 + h10 * vy0 + h01 * y1 + h11 * vy1,
+            h00 * z0 + h10 * vz0 + h01 * z1 + h11 * vz1,
+        )
+
+    def tree(self, node: int) -> KDTree:
+        """retrieve the k-d tree of the catalog positions at a grid epoch, building it on first use
+
+        :param node: index of the grid epoch
+        :type node: int
+        :return: tree indexed by catalog object
+        :rtype: KDTree
+        """
+        if node not in self.trees:
+            positions: List[Vector3D] = []
+            fastest: float = 0
+            for i in range(self.ephemeris.count):
+                x, y, z, vx, vy, vz = self.node_vector(i, node)
+                positions.append(Vector3D(x, y, z))
+                fastest = max(fastest, sqrt(vx * vx + vy * vy + vz * vz))
+            self.trees[node] = KDTree(positions)
+            self.speeds[node] = fastest
+        return self.trees[node]
+
+    def sphere_grids(self, site: LLA, node: int) -> List[RangeShell]:
+        """retrieve the directions of the catalog from a ground site at a grid epoch, building them on first use
+
+        Objects are split into shells whose range doubles from SHELL_RANGE so the padding applied for the time offset
+        of a query is set by the closest object of each shell instead of the closest object of the whole catalog.
+
+        :param site: geodetic location of the observer
+        :type site: LLA
+        :param node: index of the grid epoch
+        :type node: int
+        :return: indexed directions of each occupied range shell
+        :rtype: List[RangeShell]
+        """
+        key: Tuple[float, float, float, int] = (site.latitude, site.longitude, site.altitude, node)
+        if key not in self.grids:
+            itrf: Vector3D = PositionConvert.lla.to_itrf(site)
+            observer: Vector3D = PositionConvert.itrf.to_gcrf(itrf, self.ephemeris.epochs[node])
+            site_speed: float = 2 * pi * itrf.magnitude() / SECONDS_IN_SIDEREAL_DAY
+            members: Dict[int, List[Tuple[int, Vector3D, float]]] = {}
+            for i in range(self.ephemeris.count):
+                x, y, z, vx, vy, vz = self.node_vector(i, node)
+                los: Vector3D = Vector3D(x - observer.x, y - observer.y, z - observer.z)
+                shell: int = max(0, floor(log2(max(los.magnitude(), 1e-9) / CorrelationEngine.SHELL_RANGE)))
+                members.setdefault(shell, []).append((i, los, sqrt(vx * vx + vy * vy + vz * vz) + site_speed))
+            self.grids[key] = [
+                RangeShell(
+                    [i for i, _, _ in shell],
+                    SphereGrid([los for _, los, _ in shell], self.cell_size),
+                    min(los.magnitude() for _, los, _ in shell),
+                    max(speed for _, _, speed in shell),
+                )
+                for shell in members.values()
+            ]
+        return self.grids[key]
+
+    def within_distance(self, position: Vector3D, epoch: Epoch, radius: float) -> List[Tuple[str, float]]:
+        """find the catalog objects within a distance of an inertial position
+
+        :param position: GCRF position of interest in km
+        :type position: Vector3D
+        :param epoch: time of the position
+        :type epoch: Epoch
+        :param radius: largest distance in km
+        :type radius: float
+        :return: identifier and distance of each matching object sorted by distance
+        :rtype: List[Tuple[str, float]]
+        """
+        node: int = self.nearest_node(epoch)
+        tree: KDTree = self.tree(node)
+        pad: float = self.speeds[node] * abs(epoch.utc - self.grid[node]) * DAYS_TO_SECONDS
+
+        matches: List[Tuple[str, float]] = []
+        for i in tree.query_radius(position, radius + pad):
+            distance: float = self.position(i, epoch).minus(position).magnitude()
+            if distance <= radius:
+                matches.append((self.sat_ids[i], distance))
+        return sorted(matches, key=lambda match: match[1])
+
+    def within_angle(self, site: LLA, direction: Vector3D, epoch: Epoch, radius: float) -> List[Tuple[str, float]]:
+        """find the catalog objects within an angle of a line of sight from a ground site
+
+        :param site: geodetic location of the observer
+        :type site: LLA
+        :param direction: GCRF line of sight from the observer
+        :type direction: Vector3D
+        :param epoch: time of the line of sight
+        :type epoch: Epoch
+        :param radius: largest angle from the line of sight in radians
+        :type radius: float
+        :return: identifier and angle in radians of each matching object sorted by angle
+        :rtype: List[Tuple[str, float]]
+        """
+        node: int = self.nearest_node(epoch)
+        seconds: float = abs(epoch.utc - self.grid[node]) * DAYS_TO_SECONDS
+        observer: Vector3D = PositionConvert.itrf.to_gcrf(PositionConvert.lla.to_itrf(site), epoch)
+        unit: Vector3D = direction.normalized()
+        limit: float = cos(radius)
+        matches: List[Tuple[str, float]] = []
+        for shell in self.sphere_grids(site, node):
+
+            # the direction to an object at range r moves by at most d / (r - d) radians for a relative displacement d
+            displacement: float = shell.speed * seconds
+            pad: float = pi if displacement >= shell.range else displacement / (shell.range - displacement)
+
+            for j, _ in shell.grid.query_angle(direction, min(pi, radius + pad)):
+                i: int = shell.indices[j]
+                cosine: float = unit.dot(self.position(i, epoch).minus(observer).normalized())
+                if cosine >= limit:
+                    matches.append((self.sat_ids[i], acos_clamped(cosine)))
+        return sorted(matches, key=lambda match: match[1])
+
+    def correlate(self, ob: LiveOpticalObservation, radius: float) -> List[Tuple[str, float]]:
+        """find the catalog objects within an angle of the line of sight of a ground optical observation
+
+        :param ob: observation with topocentric right ascension and declination
+        :type ob: LiveOpticalObservation
+        :param radius: largest angle from the line of sight in radians
+        :type radius: float
+        :return: identifier and angle in radians of each matching object sorted by angle
+        :rtype: List[Tuple[str, float]]
+        """
+        ra: float = ob.right_ascension
+        dec: float = ob.declination
+        direction: Vector3D = Vector3D(cos(dec) * cos(ra), cos(dec) * sin(ra), sin(dec))
+        return self.within_angle(ob.observer_lla, direction, ob.epoch, radius)
+
+    def correlate_all(self, obs: List[LiveOpticalObservation], radius: float) -> List[List[Tuple[str, float]]]:
+        """find the catalog objects near each of a list of ground optical observations
+
+        :param obs: observations with topocentric right ascension and declination
+        :type obs: List[LiveOpticalObservation]
+        :param radius: largest angle from each line of sight in radians
+        :type radius: float
+        :return: matches of each observation in the argument order
+        :rtype: List[List[Tuple[str, float]]]
+        """
+        return [self.correlate(ob, radius) for ob in obs]
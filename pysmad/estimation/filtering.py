@@ -1,9 +1,27 @@
+from array import array
+from math import asin, atan2, pi, sqrt
+from multiprocessing import get_context
+from multiprocessing.pool import Pool
+from typing import List, Tuple
+
+from pysmad.bodies import Earth
 from pysmad.constants import DAYS_TO_SECONDS
-from pysmad.coordinates.positions import SphericalPosition
-from pysmad.coordinates.states import GCRF, HCW, StateConvert
-from pysmad.estimation.obs import SpaceObservation
-from pysmad.math.linalg import Matrix3by6, Matrix3D, Matrix6by3, Matrix6D, Vector3D, Vector6D
-from pysmad.propagators.relative import Hill
+from pysmad.coordinates.positions import ENZ, LLA, PositionConvert, SphericalPosition
+from pysmad.coordinates.states import GCRF, HCW
+from pysmad.eop import EOPData, EOPRecord
+from pysmad.estimation.obs import GroundObservation, LiveOpticalObservation, SpaceObservation
+from pysmad.math.linalg import (
+    Cholesky,
+    Matrix3by6,
+    Matrix3D,
+    Matrix6by3,
+    Matrix6D,
+    SymmetricMatrix6D,
+    Vector3D,
+    Vector6D,
+)
+from pysmad.propagators.inertial import RK4, Kepler
+from pysmad.propagators.relative import STATE_WIDTH, Hill
 from pysmad.time import Epoch
 
 
@@ -62,14 +80,14 @@ class RelativeKalman:
         #: predicted state of the filter
         self.x10: Vector6D
 
-        #: current covariance of the state
-        self.p00: Matrix6D = RelativeKalman.DEFAULT_COVARIANCE
+        #: current covariance of the state stored by its upper triangle
+        self.p00: SymmetricMatrix6D = SymmetricMatrix6D.from_matrix(RelativeKalman.DEFAULT_COVARIANCE)
 
-        #: predicted covariance of the state
-        self.p10: Matrix6D
+        #: predicted covariance of the state stored by its upper triangle
+        self.p10: SymmetricMatrix6D
 
-        #: processing noise of the filter
-        self.q: Matrix6D = RelativeKalman.DEFAULT_NOISE
+        #: processing noise of the filter stored by its upper triangle
+        self.q: SymmetricMatrix6D = SymmetricMatrix6D.from_matrix(RelativeKalman.DEFAULT_NOISE)
 
         #: state transition matrix for the filter state
         self.f: Matrix6D = self.propagator.system_matrix(0)
@@ -91,12 +109,20 @@ class RelativeKalman:
 
     def predict_covariance(self) -> None:
         """calculate the next covariance"""
-        self.p10 = self.f.multiply_matrix(self.p00.multiply_matrix(self.f.transpose())).plus(self.q)
+        self.p10 = self.p00.congruence(self.f).plus(self.q)
 
     def gain(self) -> None:
-        """calculate the gain of the system"""
-        hph: Matrix3D = self.H.multiply_matrix_6by3(self.p10.multiply_matrix_6by3(self.HT))
-        self.k = self.p10.multiply_matrix_6by3(self.HT.multiply(hph.plus(self.r).inverse()))
+        """calculate the gain of the system
+
+        H selects the position, so H * P * H^T is the upper-left block of P and P * H^T is its first three columns.
+        Each row of the gain is found by solving against the cholesky factor of the innovation covariance instead of
+        forming its inverse.
+        """
+        p: List[List[float]] = self.p10.rows()
+        r: List[Vector3D] = [self.r.row1, self.r.row2, self.r.row3]
+        innovation: List[List[float]] = [[p[i][0] + r[i].x, p[i][1] + r[i].y, p[i][2] + r[i].z] for i in range(3)]
+        factor: List[List[float]] = Cholesky.factor(innovation)
+        self.k = Matrix6by3(*[Vector3D(*Cholesky.solve(factor, row[:3])) for row in p])
 
     def predict_state(self, dt: float) -> None:
         """calculate the expected future state of the system
@@ -113,10 +139,34 @@ class RelativeKalman:
         self.propagator.state = HCW.from_state_vector(self.x00)
 
     def update_covariance(self) -> None:
-        """correct predicted covariance and store as current covariance"""
-        m1: Matrix6D = self.I.minus(self.k.multiply_matrix3by6(self.H))
-        m2: Matrix6D = self.k.multiply_matrix3by6(self.r.multiply_matrix3by6(self.k.transpose()))
-        self.p00 = m1.multiply_matrix(self.p10.multiply_matrix(m1.transpose())).plus(m2)
+        """correct predicted covariance and store as current covariance
+
+        The joseph form (I - K * H) * P * (I - K * H)^T + K * R * K^T is evaluated in one pass over the upper triangle
+        using the position-only structure of H.
+        """
+        p: List[List[float]] = self.p10.rows()
+        k: List[List[float]] = [
+            [row.x, row.y, row.z]
+            for row in (self.k.row1, self.k.row2, self.k.row3, self.k.row4, self.k.row5, self.k.row6)
+        ]
+        r: List[List[float]] = [[row.x, row.y, row.z] for row in (self.r.row1, self.r.row2, self.r.row3)]
+
+        # rows of (I - K * H) * P and K * R
+        ap: List[List[float]] = [
+            [p[i][c] - ki[0] * p[0][c] - ki[1] * p[1][c] - ki[2] * p[2][c] for c in range(6)] for i, ki in enumerate(k)
+        ]
+        kr: List[List[float]] = [[ki[0] * r[0][b] + ki[1] * r[1][b] + ki[2] * r[2][b] for b in range(3)] for ki in k]
+
+        values: List[float] = []
+        for i in range(6):
+            api: List[float] = ap[i]
+            kri: List[float] = kr[i]
+            for j in range(i, 6):
+                kj: List[float] = k[j]
+                values.append(
+                    api[j] + (kri[0] - api[0]) * kj[0] + (kri[1] - api[1]) * kj[1] + (kri[2] - api[2]) * kj[2]
+                )
+        self.p00 = SymmetricMatrix6D(values)
 
     def predict(self, dt: float) -> None:
         """calculate predicted state and covariance"""
@@ -137,36 +187,697 @@ class RelativeKalman:
         """
         dt: float = (ob.observer_state.epoch.utc - self.epoch.utc) * DAYS_TO_SECONDS
         self.epoch = ob.observer_state.epoch.copy()
-        gcrf_ob: GCRF = GCRF(
-            self.epoch, ob.observer_state.position.plus(ob.observed_direction), ob.observer_state.velocity
-        )
-        self.z = StateConvert.gcrf.to_hcw(ob.observer_state, gcrf_ob).position
+        self.z, self.r = RelativeKalman.measurement(ob)
+        self.range_error = ob.range_error
+        self.angular_error = ob.angular_error
+        self.predict(dt)
+        self.update()
+
+    def process_batch(self, observations: List[SpaceObservation]) -> Tuple[array, array, array]:
+        """include many observations into the estimation in chronological order
+
+        The measurement vectors and uncertainty matrices are computed for every observation before the sequential
+        update loop, and the filter solution after each update is written to preallocated buffers.
+
+        :param observations: observations to be added into the system in any order
+        :type observations: List[SpaceObservation]
+        :return: utc epochs, states (observation, 6), and packed upper-triangle covariances (observation, 21)
+        :rtype: Tuple[array, array, array]
+        """
+        obs: List[SpaceObservation] = sorted(observations, key=lambda ob: ob.observer_state.epoch.utc)
+        measurements: List[Tuple[Vector3D, Matrix3D]] = [RelativeKalman.measurement(ob) for ob in obs]
+
+        size: int = SymmetricMatrix6D.SIZE
+        epochs: array = array("d", bytes(8 * len(obs)))
+        states: array = array("d", bytes(8 * len(obs) * STATE_WIDTH))
+        covariances: array = array("d", bytes(8 * len(obs) * size))
+
+        for i, (ob, (z, r)) in enumerate(zip(obs, measurements)):
+            epoch: Epoch = ob.observer_state.epoch
+            dt: float = (epoch.utc - self.epoch.utc) * DAYS_TO_SECONDS
+            self.epoch = epoch.copy()
+            self.z, self.r = z, r
+            self.range_error = ob.range_error
+            self.angular_error = ob.angular_error
+            self.predict(dt)
+            self.update()
+
+            x: Vector6D = self.x00
+            epochs[i] = epoch.utc
+            start: int = i * STATE_WIDTH
+            end: int = start + STATE_WIDTH
+            states[start:end] = array("d", (x.x, x.y, x.z, x.vx, x.vy, x.vz))
+            start = i * size
+            end = start + size
+            covariances[start:end] = array("d", self.p00.values)
+
+        return epochs, states, covariances
+
+    @staticmethod
+    def hill_position(origin: GCRF, rotation: Matrix3D, position: Vector3D) -> Vector3D:
+        """calculate the curvilinear Hill position of an inertial position
+
+        This matches the position of :meth:`StateConvert.gcrf.to_hcw` without converting the velocity.
+
+        :param origin: state which represents the origin of the relative frame
+        :type origin: GCRF
+        :param rotation: matrix that rotates GCRF vectors into the RSW frame of the origin
+        :type rotation: Matrix3D
+        :param position: GCRF position to be converted
+        :type position: Vector3D
+        :return: position in the Hill frame
+        :rtype: Vector3D
+        """
+        magrtgt: float = origin.position.magnitude()
+        magrint: float = position.magnitude()
+        rsw: Vector3D = rotation.multiply_vector(position)
+        return Vector3D(magrint - magrtgt, atan2(rsw.y, rsw.x) * magrtgt, asin(rsw.z / magrint) * magrtgt)
+
+    @staticmethod
+    def measurement(ob: SpaceObservation) -> Tuple[Vector3D, Matrix3D]:
+        """calculate the Hill measurement and measurement uncertainty matrix of an observation
+
+        :param ob: observation to be converted
+        :type ob: SpaceObservation
+        :return: measured Hill position and diagonal uncertainty matrix
+        :rtype: Tuple[Vector3D, Matrix3D]
+        """
+        origin: GCRF = ob.observer_state
+        rotation: Matrix3D = HCW.frame_matrix(origin)
+        z: Vector3D = RelativeKalman.hill_position(origin, rotation, origin.position.plus(ob.observed_direction))
 
         spherical_ob = SphericalPosition(
             ob.range + ob.range_error, ob.right_ascension + ob.angular_error, ob.declination + ob.angular_error
         )
         errors: Vector3D = spherical_ob.to_cartesian().minus(ob.observed_direction)
-        gcrf_errors: GCRF = GCRF(self.epoch, ob.observer_state.position.plus(errors), ob.observer_state.velocity)
-        hill_errors: Vector3D = StateConvert.gcrf.to_hcw(ob.observer_state, gcrf_errors).position
-
-        self.r = Matrix3D(
-            Vector3D(
-                hill_errors.x * hill_errors.x,
-                0,
-                0,
-            ),
-            Vector3D(
-                0,
-                hill_errors.y * hill_errors.y,
-                0,
-            ),
-            Vector3D(
-                0,
-                0,
-                hill_errors.z * hill_errors.z,
-            ),
+        hill_errors: Vector3D = RelativeKalman.hill_position(origin, rotation, origin.position.plus(errors))
+
+        r: Matrix3D = Matrix3D(
+            Vector3D(hill_errors.x * hill_errors.x, 0, 0),
+            Vector3D(0, hill_errors.y * hill_errors.y, 0),
+            Vector3D(0, 0, hill_errors.z * hill_errors.z),
         )
-        self.range_error = ob.range_error
-        self.angular_error = ob.angular_error
-        self.predict(dt)
-        self.update()
+        return z, r
+
+
+class InertialMeasurement:
+
+    #: Measurement type that uses right ascension and declination
+    RADEC: str = "radec"
+
+    #: Measurement type that uses azimuth and elevation
+    AZEL: str = "azel"
+
+    def __init__(
+        self,
+        epoch: Epoch,
+        observer: Vector3D,
+        rotation: Matrix3D,
+        kind: str,
+        values: List[float],
+        sigmas: List[float],
+        use_angles: bool = True,
+        use_range: bool = False,
+    ) -> None:
+        """class used to model angle and range measurements of a GCRF state for an extended kalman filter
+
+        The line of sight is rotated into a frame where the first angle is measured from the x-axis toward the y-axis
+        and the second angle is measured from the xy-plane, so right ascension/declination and azimuth/elevation share
+        the same partial derivatives.
+
+        :param epoch: time the measurement was taken
+        :type epoch: Epoch
+        :param observer: GCRF position of the observer
+        :type observer: Vector3D
+        :param rotation: matrix that rotates GCRF vectors into the measurement frame
+        :type rotation: Matrix3D
+        :param kind: RADEC or AZEL
+        :type kind: str
+        :param values: first angle, second angle, and range of the measurement
+        :type values: List[float]
+        :param sigmas: one-sigma errors of the first angle, second angle, and range
+        :type sigmas: List[float]
+        :param use_angles: flag to include the angles in the update, defaults to True
+        :type use_angles: bool, optional
+        :param use_range: flag to include the range in the update, defaults to False
+        :type use_range: bool, optional
+        """
+        if not use_angles and not use_range:
+            raise ValueError("measurement must use angles, range, or both")
+
+        #: time the measurement was taken
+        self.epoch: Epoch = epoch
+
+        #: GCRF position of the observer
+        self.observer: Vector3D = observer
+
+        #: matrix that rotates GCRF vectors into the measurement frame
+        self.rotation: Matrix3D = rotation
+
+        #: RADEC or AZEL
+        self.kind: str = kind
+
+        #: indices of the first angle (0), second angle (1), and range (2) used in the update
+        self.components: List[int] = ([0, 1] if use_angles else []) + ([2] if use_range else [])
+
+        #: measured values of the used components
+        self.values: List[float] = [values[i] for i in self.components]
+
+        #: variances of the used components
+        self.variances: List[float] = [sigmas[i] * sigmas[i] for i in self.components]
+
+    @classmethod
+    def from_space_observation(
+        cls, ob: SpaceObservation, use_angles: bool = True, use_range: bool = False
+    ) -> "InertialMeasurement":
+        """create a right ascension/declination measurement from a space-based observation
+
+        :param ob: observation taken by a space asset
+        :type ob: SpaceObservation
+        :param use_angles: flag to include the angles in the update, defaults to True
+        :type use_angles: bool, optional
+        :param use_range: flag to include the range in the update, defaults to False
+        :type use_range: bool, optional
+        :return: measurement in the GCRF frame
+        :rtype: InertialMeasurement
+        """
+        return cls(
+            ob.epoch(),
+            ob.observer_state.position,
+            Matrix3D(Vector3D(1, 0, 0), Vector3D(0, 1, 0), Vector3D(0, 0, 1)),
+            InertialMeasurement.RADEC,
+            [ob.right_ascension, ob.declination, ob.range],
+            [ob.angular_error, ob.angular_error, ob.range_error],
+            use_angles,
+            use_range,
+        )
+
+    @classmethod
+    def from_ground_observation(
+        cls, ob: GroundObservation, use_angles: bool = True, use_range: bool = False
+    ) -> "InertialMeasurement":
+        """create an azimuth/elevation measurement from a terrestrial observation
+
+        :param ob: observation taken from a ground site
+        :type ob: GroundObservation
+        :param use_angles: flag to include the angles in the update, defaults to True
+        :type use_angles: bool, optional
+        :param use_range: flag to include the range in the update, defaults to False
+        :type use_range: bool, optional
+        :return: measurement in the north-east-zenith frame of the site
+        :rtype: InertialMeasurement
+        """
+        epoch: Epoch = ob.epoch()
+        site: Vector3D = ob.observer_state.position
+        lla: LLA = PositionConvert.itrf.to_lla(site)
+        enz: Matrix3D = ENZ.matrix(lla.longitude, lla.latitude)
+        gcrf_to_itrf: Matrix3D = Earth.rotation(epoch).multiply_matrix(
+            Earth.nutation(epoch).multiply_matrix(Earth.precession(epoch))
+        )
+        return cls(
+            epoch,
+            PositionConvert.itrf.to_gcrf(site, epoch),
+            Matrix3D(enz.row2, enz.row1, enz.row3).multiply_matrix(gcrf_to_itrf),
+            InertialMeasurement.AZEL,
+            [ob.azimuth, ob.elevation, ob.range],
+            [ob.angular_error, ob.angular_error, ob.range_error],
+            use_angles,
+            use_range,
+        )
+
+    @classmethod
+    def from_live_optical_observation(cls, ob: LiveOpticalObservation, ang_error: float) -> "InertialMeasurement":
+        """create a right ascension/declination measurement from a live optical observation of a ground sensor
+
+        :param ob: observation taken by a ground sensor
+        :type ob: LiveOpticalObservation
+        :param ang_error: one-sigma error of the angles in radians
+        :type ang_error: float
+        :return: measurement in the GCRF frame
+        :rtype: InertialMeasurement
+        """
+        return cls(
+            ob.epoch,
+            PositionConvert.itrf.to_gcrf(PositionConvert.lla.to_itrf(ob.observer_lla), ob.epoch),
+            Matrix3D(Vector3D(1, 0, 0), Vector3D(0, 1, 0), Vector3D(0, 0, 1)),
+            InertialMeasurement.RADEC,
+            [ob.right_ascension, ob.declination, 0],
+            [ang_error, ang_error, 0],
+        )
+
+    def predict(self, state: GCRF) -> Tuple[List[float], List[List[float]]]:
+        """calculate the expected measurement of a state and its partials with respect to the state
+
+        :param state: estimated GCRF state of the observed object
+        :type state: GCRF
+        :return: expected values of the used components and a row of 6 partials for each
+        :rtype: Tuple[List[float], List[List[float]]]
+        """
+        los: Vector3D = self.rotation.multiply_vector(state.position.minus(self.observer))
+        x, y, z = los.x, los.y, los.z
+        xy2: float = x * x + y * y
+        xy: float = sqrt(xy2)
+        rho: float = los.magnitude()
+        rho2: float = rho * rho
+
+        values: List[float] = [atan2(y, x) % (2 * pi), asin(z / rho), rho]
+        frame_partials: List[Vector3D] = [
+            Vector3D(-y / xy2, x / xy2, 0),
+            Vector3D(-x * z / (rho2 * xy), -y * z / (rho2 * xy), xy / rho2),
+            Vector3D(x / rho, y / rho, z / rho),
+        ]
+
+        # rotate the partials back to GCRF (the measurements do not depend on the velocity)
+        transposed: Matrix3D = self.rotation.transpose()
+        partials: List[List[float]] = []
+        for i in self.components:
+            p: Vector3D = transposed.multiply_vector(frame_partials[i])
+            partials.append([p.x, p.y, p.z, 0.0, 0.0, 0.0])
+        return [values[i] for i in self.components], partials
+
+    def residuals(self, predicted: List[float]) -> List[float]:
+        """calculate the measured minus predicted values with the first angle wrapped to [-pi, pi]
+
+        :param predicted: expected values of the used components
+        :type predicted: List[float]
+        :return: residuals of the used components
+        :rtype: List[float]
+        """
+        residuals: List[float] = [a - b for a, b in zip(self.values, predicted)]
+        if self.components[0] == 0:
+            residuals[0] = (residuals[0] + pi) % (2 * pi) - pi
+        return residuals
+
+
+class InertialKalman:
+
+    #: Covariance matrix to be used when the filter is initialized (km and km/s)
+    DEFAULT_COVARIANCE = Matrix6D(
+        Vector6D(1, 0, 0, 0, 0, 0),
+        Vector6D(0, 1, 0, 0, 0, 0),
+        Vector6D(0, 0, 1, 0, 0, 0),
+        Vector6D(0, 0, 0, 1e-6, 0, 0),
+        Vector6D(0, 0, 0, 0, 1e-6, 0),
+        Vector6D(0, 0, 0, 0, 0, 1e-6),
+    )
+
+    #: Processing noise added at each prediction
+    DEFAULT_NOISE = Matrix6D(
+        Vector6D(1e-12, 0, 0, 0, 0, 0),
+        Vector6D(0, 1e-12, 0, 0, 0, 0),
+        Vector6D(0, 0, 1e-12, 0, 0, 0),
+        Vector6D(0, 0, 0, 1e-16, 0, 0),
+        Vector6D(0, 0, 0, 0, 1e-16, 0),
+        Vector6D(0, 0, 0, 0, 0, 1e-16),
+    )
+
+    def __init__(self, propagator: RK4) -> None:
+        """class used to act as an extended kalman filter for an inertial state
+
+        The state transition matrix is integrated with the state, so each observation costs a single propagation
+        segment from the previous observation and the measurement partials are analytic.
+
+        :param propagator: propagator holding the estimated GCRF state of the observed object
+        :type propagator: RK4
+        """
+        #: propagator used to estimate the state of the observed object
+        self.propagator: RK4 = propagator
+
+        #: current covariance of the state stored by its upper triangle
+        self.p00: SymmetricMatrix6D = SymmetricMatrix6D.from_matrix(InertialKalman.DEFAULT_COVARIANCE)
+
+        #: predicted covariance of the state stored by its upper triangle
+        self.p10: SymmetricMatrix6D
+
+        #: processing noise of the filter stored by its upper triangle
+        self.q: SymmetricMatrix6D = SymmetricMatrix6D.from_matrix(InertialKalman.DEFAULT_NOISE)
+
+        #: residuals of the most recent measurement before the update
+        self.residuals: List[float] = []
+
+    def state(self) -> GCRF:
+        """retrieve the current estimated state
+
+        :return: estimated GCRF state
+        :rtype: GCRF
+        """
+        return self.propagator.state
+
+    def predict(self, epoch: Epoch) -> None:
+        """propagate the state and covariance to the argument epoch
+
+        :param epoch: time of the next measurement
+        :type epoch: Epoch
+        """
+        self.propagator.enable_stm()
+        self.propagator.step_to_epoch(epoch)
+        self.p10 = self.p00.congruence(self.propagator.transition_matrix()).plus(self.q)
+
+    def update(self, measurement: InertialMeasurement) -> None:
+        """correct the predicted state and covariance using a measurement valid at the current epoch
+
+        :param measurement: measurement of the observed object
+        :type measurement: InertialMeasurement
+        """
+        predicted, h = measurement.predict(self.propagator.state)
+        self.residuals = measurement.residuals(predicted)
+        p: List[List[float]] = self.p10.rows()
+        m: int = len(h)
+
+        # P * H^T and the innovation covariance H * P * H^T + R
+        pht: List[List[float]] = [[sum(a * b for a, b in zip(row, hj)) for hj in h] for row in p]
+        innovation: List[List[float]] = [
+            [sum(h[i][c] * pht[c][j] for c in range(6)) for j in range(m)] for i in range(m)
+        ]
+        for i, variance in enumerate(measurement.variances):
+            innovation[i][i] += variance
+
+        # each row of the gain solves innovation * k = (P * H^T) row
+        factor: List[List[float]] = Cholesky.factor(innovation)
+        k: List[List[float]] = [Cholesky.solve(factor, row) for row in pht]
+
+        dx: List[float] = [sum(a * b for a, b in zip(row, self.residuals)) for row in k]
+        state: GCRF = self.propagator.state
+        corrected: GCRF = GCRF(
+            state.epoch,
+            Vector3D(state.position.x + dx[0], state.position.y + dx[1], state.position.z + dx[2]),
+            Vector3D(state.velocity.x + dx[3], state.velocity.y + dx[4], state.velocity.z + dx[5]),
+        )
+        corrected.match_force_model(state)
+        self.propagator.state = corrected
+
+        # joseph form (I - K * H) * P * (I - K * H)^T + K * R * K^T over the upper triangle
+        a: List[List[float]] = [
+            [(1.0 if i == j else 0.0) - sum(k[i][c] * h[c][j] for c in range(m)) for j in range(6)] for i in range(6)
+        ]
+        ap: List[List[float]] = [[sum(a[i][c] * p[c][j] for c in range(6)) for j in range(6)] for i in range(6)]
+        values: List[float] = []
+        for i in range(6):
+            for j in range(i, 6):
+                values.append(
+                    sum(x * y for x, y in zip(ap[i], a[j]))
+                    + sum(k[i][c] * measurement.variances[c] * k[j][c] for c in range(m))
+                )
+        self.p00 = SymmetricMatrix6D(values)
+
+    def process(self, measurement: InertialMeasurement) -> None:
+        """include a new measurement into the current estimation
+
+        :param measurement: measurement of the observed object
+        :type measurement: InertialMeasurement
+        """
+        self.predict(measurement.epoch)
+        self.update(measurement)
+
+
+class UnscentedKalman:
+
+    #: Spread of the sigma points about the mean
+    ALPHA: float = 1.0
+
+    #: Prior knowledge of the distribution (2 is optimal for gaussian)
+    BETA: float = 2.0
+
+    #: Secondary scaling of the sigma points
+    KAPPA: float = 0.0
+
+    def __init__(self, state: GCRF, workers: int = 1, start_method: str | None = None) -> None:
+        """class used to act as an unscented kalman filter for an inertial state
+
+        The 13 sigma points are propagated together by the batched two-body solution when perturbations are disabled.
+        Perturbed points are integrated in this process unless more than one worker is requested, in which case they
+        are spread across a process pool that is started on the first prediction and reused until :meth:`close` is
+        called or the filter leaves a with block.  Measurements use the same models as :class:`InertialKalman`.
+
+        :param state: estimated GCRF state of the observed object
+        :type state: GCRF
+        :param workers: number of processes used to propagate perturbed sigma points, defaults to 1 to propagate in
+            this process
+        :type workers: int, optional
+        :param start_method: multiprocessing start method ("fork", "spawn", "forkserver"), defaults to the platform
+        :type start_method: str | None, optional
+        """
+        #: current estimated state of the observed object
+        self.state: GCRF = state.copy()
+
+        #: number of processes used to propagate perturbed sigma points
+        self.workers: int = workers
+
+        #: multiprocessing start method of the pool
+        self.start_method: str | None = start_method
+
+        #: worker processes kept for the life of the filter once perturbed points are first propagated
+        self.pool: Pool | None = None
+
+        #: current covariance of the state stored by its upper triangle
+        self.p00: SymmetricMatrix6D = SymmetricMatrix6D.from_matrix(InertialKalman.DEFAULT_COVARIANCE)
+
+        #: processing noise of the filter stored by its upper triangle
+        self.q: SymmetricMatrix6D = SymmetricMatrix6D.from_matrix(InertialKalman.DEFAULT_NOISE)
+
+        #: propagated sigma points of the most recent prediction (point, 6)
+        self.points: List[List[float]] = []
+
+        #: residuals of the most recent measurement before the update
+        self.residuals: List[float] = []
+
+        n: int = STATE_WIDTH
+        lamb: float = UnscentedKalman.ALPHA**2 * (n + UnscentedKalman.KAPPA) - n
+
+        #: scale applied to the covariance before taking its square root
+        self.spread: float = n + lamb
+
+        #: weights used to form the mean of the sigma points
+        self.mean_weights: List[float] = [lamb / self.spread] + [0.5 / self.spread] * (2 * n)
+
+        #: weights used to form the covariance of the sigma points
+        self.covariance_weights: List[float] = [
+            lamb / self.spread + 1 - UnscentedKalman.ALPHA**2 + UnscentedKalman.BETA
+        ] + [0.5 / self.spread] * (2 * n)
+
+    def sigma_points(self) -> List[GCRF]:
+        """create the sigma points of the current state and covariance
+
+        :return: states at the mean followed by the positive and negative offsets along each axis
+        :rtype: List[GCRF]
+        """
+        r: Vector3D = self.state.position
+        v: Vector3D = self.state.velocity
+        mean: List[float] = [r.x, r.y, r.z, v.x, v.y, v.z]
+        scaled: List[List[float]] = [[self.spread * value for value in row] for row in self.p00.rows()]
+        factor: List[List[float]] = Cholesky.factor(scaled)
+
+        vectors: List[List[float]] = [mean]
+        for sign in (1, -1):
+            for j in range(STATE_WIDTH):
+                vectors.append([mean[i] + sign * factor[i][j] for i in range(STATE_WIDTH)])
+
+        points: List[GCRF] = []
+        for x, y, z, vx, vy, vz in vectors:
+            point: GCRF = GCRF(self.state.epoch, Vector3D(x, y, z), Vector3D(vx, vy, vz))
+            point.match_force_model(self.state)
+            points.append(point)
+        return points
+
+    def propagate(self, points: List[GCRF], epoch: Epoch) -> List[List[float]]:
+        """advance every sigma point to an epoch in a single batch
+
+        :param points: sigma points at the current epoch
+        :type points: List[GCRF]
+        :param epoch: time the points are propagated to
+        :type epoch: Epoch
+        :return: propagated x, y, z, vx, vy, vz of each point
+        :rtype: List[List[float]]
+        """
+        if not self.state.use_perturbations:
+            values: array = Kepler.solve_grid(points, [epoch])
+        elif self.workers > 1:
+            tasks: List[Tuple[Tuple[float, ...], float]] = [(_pack(point), epoch.utc) for point in points]
+            values = array("d")
+            for state in self.open_pool().map(_propagate_point, tasks):
+                values.extend(state)
+        else:
+            values = array("d")
+            for point in points:
+                propagator: RK4 = RK4(point)
+                propagator.step_to_epoch(epoch)
+                r: Vector3D = propagator.state.position
+                v: Vector3D = propagator.state.velocity
+                values.extend((r.x, r.y, r.z, v.x, v.y, v.z))
+        propagated: List[List[float]] = []
+        for i in range(len(points)):
+            start: int = i * STATE_WIDTH
+            end: int = start + STATE_WIDTH
+            propagated.append(list(values[start:end]))
+        return propagated
+
+    def open_pool(self) -> Pool:
+        """retrieve the worker pool, starting it on first use
+
+        The workers receive the EOP records and gravity model of this process when the pool starts.
+
+        :return: pool used to propagate perturbed sigma points
+        :rtype: Pool
+        """
+        if self.pool is None:
+            context = get_context(self.start_method)
+
+            # EOP records are parsed lazily, so load them before the pool starts; forked workers then inherit the
+            # parsed records and they are only shipped to fresh interpreters
+            eop_records: dict[int | float, EOPRecord] | None = EOPData.get_records()
+            if context.get_start_method() == "fork":
+                eop_records = None
+            self.pool = context.Pool(
+                self.workers, _initialize_worker, (eop_records, Earth.C, Earth.S, Earth.DEGREE_AND_ORDER)
+            )
+        return self.pool
+
+    def close(self) -> None:
+        """stop the worker pool if one was started"""
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+    def __enter__(self) -> "UnscentedKalman":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def predict(self, epoch: Epoch) -> None:
+        """propagate the sigma points and form the predicted state and covariance
+
+        :param epoch: time of the next measurement
+        :type epoch: Epoch
+        """
+        self.points = self.propagate(self.sigma_points(), epoch)
+        mean: List[float] = [
+            sum(w * point[i] for w, point in zip(self.mean_weights, self.points)) for i in range(STATE_WIDTH)
+        ]
+        deviations: List[List[float]] = [[a - b for a, b in zip(point, mean)] for point in self.points]
+        values: List[float] = [
+            sum(w * d[i] * d[j] for w, d in zip(self.covariance_weights, deviations))
+            for i in range(STATE_WIDTH)
+            for j in range(i, STATE_WIDTH)
+        ]
+        self.p00 = SymmetricMatrix6D(values).plus(self.q)
+
+        state: GCRF = GCRF(epoch, Vector3D(*mean[:3]), Vector3D(*mean[3:]))
+        state.match_force_model(self.state)
+        self.state = state
+
+    def update(self, measurement: InertialMeasurement) -> None:
+        """correct the predicted state and covariance using the propagated sigma points and a measurement
+
+        :param measurement: measurement of the observed object
+        :type measurement: InertialMeasurement
+        """
+        # residuals of each point keep the angle wrapping of the measurement model
+        point_residuals: List[List[float]] = []
+        for x, y, z, vx, vy, vz in self.points:
+            predicted, _ = measurement.predict(GCRF(self.state.epoch, Vector3D(x, y, z), Vector3D(vx, vy, vz)))
+            point_residuals.append(measurement.residuals(predicted))
+        m: int = len(measurement.values)
+        innovation: List[float] = [
+            sum(w * res[i] for w, res in zip(self.mean_weights, point_residuals)) for i in range(m)
+        ]
+        self.residuals = innovation
+
+        r: Vector3D = self.state.position
+        v: Vector3D = self.state.velocity
+        mean: List[float] = [r.x, r.y, r.z, v.x, v.y, v.z]
+        dx: List[List[float]] = [[a - b for a, b in zip(point, mean)] for point in self.points]
+        dz: List[List[float]] = [[a - b for a, b in zip(innovation, res)] for res in point_residuals]
+
+        s: List[List[float]] = [
+            [sum(w * d[i] * d[j] for w, d in zip(self.covariance_weights, dz)) for j in range(m)] for i in range(m)
+        ]
+        for i, variance in enumerate(measurement.variances):
+            s[i][i] += variance
+        pxz: List[List[float]] = [
+            [sum(w * a[i] * b[j] for w, a, b in zip(self.covariance_weights, dx, dz)) for j in range(m)]
+            for i in range(STATE_WIDTH)
+        ]
+
+        factor: List[List[float]] = Cholesky.factor(s)
+        k: List[List[float]] = [Cholesky.solve(factor, row) for row in pxz]
+        corrected: List[float] = [x + sum(a * b for a, b in zip(row, innovation)) for x, row in zip(mean, k)]
+        state: GCRF = GCRF(self.state.epoch, Vector3D(*corrected[:3]), Vector3D(*corrected[3:]))
+        state.match_force_model(self.state)
+        self.state = state
+
+        # P - K * S * K^T where K * S = Pxz
+        p: List[float] = self.p00.values
+        values: List[float] = []
+        n: int = 0
+        for i in range(STATE_WIDTH):
+            for j in range(i, STATE_WIDTH):
+                values.append(p[n] - sum(a * b for a, b in zip(k[i], pxz[j])))
+                n += 1
+        self.p00 = SymmetricMatrix6D(values)
+
+    def process(self, measurement: InertialMeasurement) -> None:
+        """include a new measurement into the current estimation
+
+        :param measurement: measurement of the observed object
+        :type measurement: InertialMeasurement
+        """
+        self.predict(measurement.epoch)
+        self.update(measurement)
+
+
+def _pack(state: GCRF) -> Tuple[float, ...]:
+    """flatten a state so only floats travel through the pool's pipes
+
+    :param state: state to be packed
+    :type state: GCRF
+    :return: utc epoch, position, velocity, srp scalar, and perturbation flag
+    :rtype: Tuple[float, ...]
+    """
+    r: Vector3D = state.position
+    v: Vector3D = state.velocity
+    return (state.epoch.utc, r.x, r.y, r.z, v.x, v.y, v.z, state.srp_scalar, state.use_perturbations)
+
+
+def _initialize_worker(
+    eop_records: dict[int | float, EOPRecord] | None,
+    c: list[list[float]],
+    s: list[list[float]],
+    degree_and_order: int,
+) -> None:
+    """install the parent's earth model in a pool worker
+
+    :param eop_records: records parsed by the parent or None if the worker inherited them
+    :type eop_records: dict[int | float, EOPRecord] | None
+    :param c: normalized c coefficients used for geopotential calculation
+    :type c: list[list[float]]
+    :param s: normalized s coefficients used for geopotential calculation
+    :type s: list[list[float]]
+    :param degree_and_order: the number of zonal and tesseral terms used in the gravity calculation
+    :type degree_and_order: int
+    """
+    if eop_records is not None:
+        EOPData.set_records(eop_records)
+    Earth.C = c
+    Earth.S = s
+    Earth.DEGREE_AND_ORDER = degree_and_order
+
+
+def _propagate_point(task: Tuple[Tuple[float, ...], float]) -> Tuple[float, ...]:
+    """integrate one packed sigma point to an epoch
+
+    :param task: packed state and utc epoch of the output
+    :type task: Tuple[Tuple[float, ...], float]
+    :return: x, y, z, vx, vy, vz at the epoch
+    :rtype: Tuple[float, ...]
+    """
+    (utc, x, y, z, vx, vy, vz, srp_scalar, use_perturbations), end = task
+    state: GCRF = GCRF(Epoch(utc), Vector3D(x, y, z), Vector3D(vx, vy, vz))
+    state.srp_scalar = srp_scalar
+    state.use_perturbations = bool(use_perturbations)
+    propagator: RK4 = RK4(state)
+    propagator.step_to_epoch(Epoch(end))
+    r: Vector3D = propagator.state.position
+    v: Vector3D = propagator.state.velocity
+    return (r.x, r.y, r.z, v.x, v.y, v.z)
@@ -1,10 +1,29 @@
-from math import radians
+from array import array
+from itertools import accumulate
+from math import cos, nan, radians, sin
+from typing import Any, Dict, Iterator, List, Tuple, Union
 
 from pysmad.coordinates.positions import ENZ, LLA, PositionConvert, SphericalPosition
 from pysmad.coordinates.states import GCRF, ITRF
-from pysmad.math.linalg import Vector3D
+from pysmad.math.linalg import Matrix3D, Vector3D
 from pysmad.time import Epoch
 
+#: column of a columnar set, an array that can be extended or a read-only view of a memory-mapped file
+Column = Union[array, "memoryview[Any]"]
+
+
+def extendable(column: Column) -> array:
+    """narrow a column to an array that can be extended
+
+    :param column: column of a columnar set
+    :type column: Column
+    :return: the argument column
+    :rtype: array
+    """
+    if not isinstance(column, array):
+        raise ValueError("columns read from a memory-mapped file cannot be extended")
+    return column
+
 
 class Observation:
     """super class used for space-based and ground-based observations"""
@@ -196,17 +215,39 @@ class LiveOpticalObservation:
     def get_observer_itrf(self) -> ITRF:
         return ITRF.from_fixed(self.epoch, PositionConvert.lla.to_itrf(self.observer_lla))
 
+    def site_geometry(self) -> Tuple[Vector3D, Matrix3D]:
+        """calculate the ITRF position and ITRF-to-ENZ matrix of the sensor
+
+        :return: ITRF position of the sensor in km and the matrix used to go from ITRF to ENZ
+        :rtype: Tuple[Vector3D, Matrix3D]
+        """
+        lla: LLA = self.observer_lla
+        return PositionConvert.lla.to_itrf(lla), ENZ.matrix(lla.longitude, lla.latitude)
+
+    def observed_enz(self) -> Vector3D:
+        """calculate the ENZ unit vector of the observed azimuth and elevation
+
+        :return: direction of the object from the sensor in the ENZ frame
+        :rtype: Vector3D
+        """
+        ce: float = cos(self.elevation)
+        return Vector3D(ce * sin(self.azimuth), ce * cos(self.azimuth), sin(self.elevation))
+
     def get_clos(self, tgt_gcrf: GCRF) -> float:
-        observed = GroundObservation.from_angles_and_range(
-            self.get_observer_itrf(), self.azimuth, self.elevation, 1, 0, 0
-        )
-        observed.observed_direction
-        mat = ENZ.matrix(self.observer_lla.longitude, self.observer_lla.latitude)
-        tgt_itrf = PositionConvert.gcrf.to_itrf(tgt_gcrf.position, tgt_gcrf.epoch)
-        expected = mat.multiply_vector(tgt_itrf.minus(self.get_observer_itrf().position))
-        return expected.magnitude() * expected.angle(observed.observed_direction)
+        """calculate the cross line of sight error between the observation and an expected state
 
-    def csv_headers(self) -> str:
+        :param tgt_gcrf: expected inertial state of the observed object
+        :type tgt_gcrf: GCRF
+        :return: distance in km between the expected position and the observed line of sight at the same range
+        :rtype: float
+        """
+        site, mat = self.site_geometry()
+        tgt_itrf: Vector3D = PositionConvert.gcrf.to_itrf(tgt_gcrf.position, tgt_gcrf.epoch)
+        expected: Vector3D = mat.multiply_vector(tgt_itrf.minus(site))
+        return expected.magnitude() * expected.angle(self.observed_enz())
+
+    @staticmethod
+    def csv_headers() -> str:
         return ",".join(
             [
                 "UTC_EPOCH",
@@ -259,8 +300,7 @@ class LiveOpticalSet:
     def publish_set(self, filename: str, write_mode: str) -> None:
 
         with open(filename, write_mode) as f:
-            for ob in self.list:
-                f.write("".join([ob.to_csv_format(), "\n"]))
+            f.writelines("".join([ob.to_csv_format(), "\n"]) for ob in self.list)
 
     def process_observation(self, ob: LiveOpticalObservation) -> None:
         self.list.append(ob)
@@ -287,3 +327,353 @@ class LiveOpticalSet:
 
     def get_sources(self):
         return self.sources.keys()
+
+
+class CodeTable:
+    def __init__(self) -> None:
+        """class used to dictionary-encode repeated identifiers as small integers"""
+        #: code assigned to each identifier
+        self.codes: Dict[str, int] = {}
+
+        #: identifier of each code
+        self.values: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @classmethod
+    def from_values(cls, values: List[str]) -> "CodeTable":
+        """create a table whose codes are the positions of the identifiers in a list
+
+        :param values: identifier of each code
+        :type values: List[str]
+        :return: table that encodes the identifiers
+        :rtype: CodeTable
+        """
+        table: CodeTable = cls()
+        for value in values:
+            table.encode(value)
+        return table
+
+    def encode(self, value: str) -> int:
+        """retrieve the code of an identifier, assigning the next code to new identifiers
+
+        :param value: identifier to be encoded
+        :type value: str
+        :return: code of the identifier
+        :rtype: int
+        """
+        code: int | None = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+
+class OpticalView:
+    def __init__(self, optical_set: "ColumnarOpticalSet", rows: array) -> None:
+        """class used to access a selection of the rows of a columnar set without materializing them
+
+        Observations are created only when an item is indexed or iterated.
+
+        :param optical_set: set that owns the rows
+        :type optical_set: ColumnarOpticalSet
+        :param rows: row numbers in the order they are returned
+        :type rows: array
+        """
+        #: set that owns the rows
+        self.optical_set: ColumnarOpticalSet = optical_set
+
+        #: row numbers in the order they are returned
+        self.rows: array = rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index: int | slice) -> "LiveOpticalObservation | OpticalView":
+        if isinstance(index, slice):
+            return OpticalView(self.optical_set, self.rows[index])
+        return self.optical_set.observation(self.rows[index])
+
+    def __iter__(self) -> Iterator[LiveOpticalObservation]:
+        for row in self.rows:
+            yield self.optical_set.observation(row)
+
+    def column(self, name: str) -> array:
+        """gather the values of a float column for the selected rows
+
+        :param name: key of the column in ColumnarOpticalSet.COLUMNS
+        :type name: str
+        :return: value of each selected row in order
+        :rtype: array
+        """
+        values: Column = self.optical_set.columns[name]
+        return array("d", [values[row] for row in self.rows])
+
+
+class ColumnarOpticalSet:
+
+    #: Names of the float columns stored for each observation
+    COLUMNS: Tuple[str, ...] = (
+        "epoch",
+        "azimuth",
+        "elevation",
+        "right_ascension",
+        "declination",
+        "visual_magnitude",
+        "latitude",
+        "longitude",
+        "altitude",
+        "sensor_x",
+        "sensor_y",
+        "sensor_z",
+        "equatorial_phase_angle",
+        "solar_declination_angle",
+    )
+
+    #: Names of the dictionary-encoded identifier columns
+    KEYS: Tuple[str, ...] = ("sat_id", "observer_id", "source", "mode")
+
+    def __init__(self) -> None:
+        """struct-of-arrays replacement for LiveOpticalSet with the same indexes and no per-observation objects
+
+        Observations are split into float columns and integer codes for the identifiers.  The target, sensor, source,
+        and mode indexes are row numbers sorted by code and then epoch, built on first use after each change along
+        with the views returned by the targets, sensors, sources, and modes properties.
+        """
+        #: float value of each observation keyed by column name
+        self.columns: Dict[str, Column] = {name: array("d") for name in ColumnarOpticalSet.COLUMNS}
+
+        #: identifier code of each observation keyed by identifier name
+        self.codes: Dict[str, Column] = {name: array("i") for name in ColumnarOpticalSet.KEYS}
+
+        #: identifier encoding keyed by identifier name
+        self.tables: Dict[str, CodeTable] = {name: CodeTable() for name in ColumnarOpticalSet.KEYS}
+
+        #: sorted rows and the first position of each code keyed by identifier name
+        self.indexes: Dict[str, Tuple[array, array]] = {}
+
+        #: observations of every identifier value keyed by identifier name
+        self.groups: Dict[str, Dict[str, OpticalView]] = {}
+
+    def __len__(self) -> int:
+        return len(self.columns["epoch"])
+
+    @classmethod
+    def from_columns(
+        cls, columns: Dict[str, Column], codes: Dict[str, Column], tables: Dict[str, List[str]]
+    ) -> "ColumnarOpticalSet":
+        """create a set that uses existing columns without copying them
+
+        Sets built on read-only memoryviews can be queried but not extended.
+
+        :param columns: float value of each observation keyed by every name in COLUMNS
+        :type columns: Dict[str, Column]
+        :param codes: identifier code of each observation keyed by every name in KEYS
+        :type codes: Dict[str, Column]
+        :param tables: identifier of each code keyed by every name in KEYS
+        :type tables: Dict[str, List[str]]
+        :return: set over the argument columns
+        :rtype: ColumnarOpticalSet
+        """
+        optical_set: ColumnarOpticalSet = cls()
+        optical_set.columns = {name: columns[name] for name in ColumnarOpticalSet.COLUMNS}
+        optical_set.codes = {name: codes[name] for name in ColumnarOpticalSet.KEYS}
+        optical_set.tables = {name: CodeTable.from_values(tables[name]) for name in ColumnarOpticalSet.KEYS}
+        return optical_set
+
+    def __iter__(self) -> Iterator[LiveOpticalObservation]:
+        for row in range(len(self)):
+            yield self.observation(row)
+
+    @property
+    def total(self) -> int:
+        return len(self)
+
+    @property
+    def list(self) -> OpticalView:
+        return OpticalView(self, array("l", range(len(self))))
+
+    @property
+    def targets(self) -> Dict[str, OpticalView]:
+        return self.views("sat_id")
+
+    @property
+    def sensors(self) -> Dict[str, OpticalView]:
+        return self.views("observer_id")
+
+    @property
+    def sources(self) -> Dict[str, OpticalView]:
+        return self.views("source")
+
+    @property
+    def modes(self) -> Dict[str, OpticalView]:
+        return self.views("mode")
+
+    def append(
+        self,
+        values: Tuple[float, ...],
+        sat_id: str,
+        observer_id: str,
+        source: str,
+        mode: str,
+    ) -> None:
+        """add a row from its float values and identifiers
+
+        :param values: float value of each column in the order of COLUMNS
+        :type values: Tuple[float, ...]
+        :param sat_id: identifier of the observed object
+        :type sat_id: str
+        :param observer_id: identifier of the sensor
+        :type observer_id: str
+        :param source: provider of the observation
+        :type source: str
+        :param mode: data mode of the observation
+        :type mode: str
+        """
+        for name, value in zip(ColumnarOpticalSet.COLUMNS, values):
+            extendable(self.columns[name]).append(value)
+        for name, key in zip(ColumnarOpticalSet.KEYS, (sat_id, observer_id, source, mode)):
+            extendable(self.codes[name]).append(self.tables[name].encode(key))
+        self.indexes.clear()
+        self.groups.clear()
+
+    def process_observation(self, ob: LiveOpticalObservation) -> None:
+        """add an observation to the set
+
+        :param ob: observation to be stored
+        :type ob: LiveOpticalObservation
+        """
+        lla: LLA = ob.observer_lla
+        eci: Vector3D = ob.observer_eci
+        self.append(
+            (
+                ob.epoch.utc,
+                ob.azimuth,
+                ob.elevation,
+                ob.right_ascension,
+                ob.declination,
+                ob.visual_magnitude,
+                lla.latitude,
+                lla.longitude,
+                lla.altitude,
+                nan if eci.x is None else eci.x,
+                nan if eci.y is None else eci.y,
+                nan if eci.z is None else eci.z,
+                ob.equatorial_phase_angle,
+                ob.solar_declination_angle,
+            ),
+            ob.sat_id,
+            ob.observer_id,
+            ob.source,
+            ob.mode,
+        )
+
+    def observation(self, row: int) -> LiveOpticalObservation:
+        """materialize a stored row as an observation
+
+        :param row: position of the observation in the order it was added
+        :type row: int
+        :return: observation equal to the one that was stored (missing sensor positions become nan)
+        :rtype: LiveOpticalObservation
+        """
+        c: Dict[str, Column] = self.columns
+        ob: LiveOpticalObservation = LiveOpticalObservation.__new__(LiveOpticalObservation)
+        ob.epoch = Epoch(c["epoch"][row])
+        ob.sat_id = self.tables["sat_id"].values[self.codes["sat_id"][row]]
+        ob.observer_id = self.tables["observer_id"].values[self.codes["observer_id"][row]]
+        ob.azimuth = c["azimuth"][row]
+        ob.elevation = c["elevation"][row]
+        ob.observer_lla = LLA(c["latitude"][row], c["longitude"][row], c["altitude"][row])
+        ob.observer_eci = Vector3D(c["sensor_x"][row], c["sensor_y"][row], c["sensor_z"][row])
+        ob.right_ascension = c["right_ascension"][row]
+        ob.declination = c["declination"][row]
+        ob.visual_magnitude = c["visual_magnitude"][row]
+        ob.source = self.tables["source"].values[self.codes["source"][row]]
+        ob.mode = self.tables["mode"].values[self.codes["mode"][row]]
+        ob.equatorial_phase_angle = c["equatorial_phase_angle"][row]
+        ob.solar_declination_angle = c["solar_declination_angle"][row]
+        return ob
+
+    def index(self, name: str) -> Tuple[array, array]:
+        """retrieve the rows sorted by an identifier and then epoch, building them on first use
+
+        :param name: identifier name in KEYS
+        :type name: str
+        :return: sorted rows and the first position of each code in them (with the row count appended)
+        :rtype: Tuple[array, array]
+        """
+        if name not in self.indexes:
+            codes: Column = self.codes[name]
+            epochs: Column = self.columns["epoch"]
+            rows: array = array("l", sorted(range(len(codes)), key=lambda row: (codes[row], epochs[row])))
+            counts: List[int] = [0] * (len(self.tables[name]) + 1)
+            for code in codes:
+                counts[code + 1] += 1
+            starts: array = array("l", accumulate(counts))
+            self.indexes[name] = (rows, starts)
+        return self.indexes[name]
+
+    def select(self, name: str, key: str) -> OpticalView:
+        """access the observations that share an identifier in epoch order
+
+        :param name: identifier name in KEYS
+        :type name: str
+        :param key: identifier value
+        :type key: str
+        :return: matching observations (empty when the identifier is unknown)
+        :rtype: OpticalView
+        """
+        code: int | None = self.tables[name].codes.get(key)
+        if code is None:
+            return OpticalView(self, array("l"))
+        rows, starts = self.index(name)
+        start: int = starts[code]
+        end: int = starts[code + 1]
+        return OpticalView(self, rows[start:end])
+
+    def views(self, name: str) -> Dict[str, OpticalView]:
+        """access the observations of every value of an identifier, building them on first use after each change
+
+        :param name: identifier name in KEYS
+        :type name: str
+        :return: observations in epoch order keyed by identifier value
+        :rtype: Dict[str, OpticalView]
+        """
+        if name not in self.groups:
+            self.groups[name] = {key: self.select(name, key) for key in self.tables[name].values}
+        return self.groups[name]
+
+    def target(self, sat_id: str) -> OpticalView:
+        """access the observations of an object in epoch order
+
+        :param sat_id: identifier of the observed object
+        :type sat_id: str
+        :return: observations of the object
+        :rtype: OpticalView
+        """
+        return self.select("sat_id", sat_id)
+
+    def sensor(self, observer_id: str) -> OpticalView:
+        """access the observations of a sensor in epoch order
+
+        :param observer_id: identifier of the sensor
+        :type observer_id: str
+        :return: observations of the sensor
+        :rtype: OpticalView
+        """
+        return self.select("observer_id", observer_id)
+
+    def publish_set(self, filename: str, write_mode: str) -> None:
+        with open(filename, write_mode) as f:
+            f.writelines("".join([ob.to_csv_format(), "\n"]) for ob in self)
+
+    def get_observers(self):
+        return self.tables["observer_id"].codes.keys()
+
+    def get_targets(self):
+        return self.tables["sat_id"].codes.keys()
+
+    def get_sources(self):
+        return self.tables["source"].codes.keys()
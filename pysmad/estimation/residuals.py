@@ -0,0 +1,133 @@
+from array import array
+from math import ceil, sqrt
+from typing import Dict, List, Tuple
+
+from pysmad.bodies import Satellite
+from pysmad.constants import DAYS_TO_SECONDS
+from pysmad.coordinates.positions import LLA, PositionConvert
+from pysmad.coordinates.states import GCRF
+from pysmad.estimation.obs import LiveOpticalObservation, LiveOpticalSet
+from pysmad.math.linalg import Matrix3D, Vector3D
+from pysmad.propagators.events import HermiteSegment
+from pysmad.propagators.inertial import RK4, Kepler
+from pysmad.time import Epoch
+
+
+class ResidualTable:
+    def __init__(self, sensor_id: str) -> None:
+        """class used to hold the cross line of sight residuals of the observations taken by one sensor
+
+        :param sensor_id: identifier of the sensor that took the observations
+        :type sensor_id: str
+        """
+        #: identifier of the sensor that took the observations
+        self.sensor_id: str = sensor_id
+
+        #: utc epochs of the observations in ascending order
+        self.epochs: array = array("d")
+
+        #: identifier of the object reported by each observation
+        self.sat_ids: List[str] = []
+
+        #: cross line of sight residual of each observation in km
+        self.residuals: array = array("d")
+
+    def __len__(self) -> int:
+        return len(self.residuals)
+
+    def rms(self) -> float:
+        """calculate the root mean square of the residuals
+
+        :return: root mean square in km (0 for an empty table)
+        :rtype: float
+        """
+        if not self.residuals:
+            return 0
+        return sqrt(sum(r * r for r in self.residuals) / len(self.residuals))
+
+
+def ephemeris(state: GCRF, epochs: List[Epoch]) -> List[Vector3D]:
+    """solve the positions of a state at sorted epochs with a single pass through the span
+
+    Numerically integrated states are stepped forward at the propagator's largest step and every epoch that falls
+    inside a step is interpolated from that step instead of shortening it.
+
+    :param state: starting inertial state
+    :type state: GCRF
+    :param epochs: times of interest in ascending order
+    :type epochs: List[Epoch]
+    :return: GCRF position at each epoch in km
+    :rtype: List[Vector3D]
+    """
+    propagator: RK4 | Kepler = Satellite.create_propagator(state.copy())
+    if isinstance(propagator, Kepler):
+        positions: List[Vector3D] = []
+        for epoch in epochs:
+            propagator.step_to_epoch(epoch)
+            positions.append(propagator.state.position.copy())
+        return positions
+
+    propagator.step_to_epoch(epochs[0])
+    days: float = propagator.MAX_STEP / DAYS_TO_SECONDS
+    positions = [propagator.state.position.copy()]
+    start: GCRF = propagator.state.copy()
+    segment: HermiteSegment | None = None
+    for epoch in epochs[1:]:
+        if epoch.utc > start.epoch.utc:
+            count: int = ceil((epoch.utc - start.epoch.utc) / days)
+            if count > 1:
+                propagator.step_to_epoch(start.epoch.plus_days((count - 1) * days))
+                start = propagator.state.copy()
+            propagator.step_to_epoch(start.epoch.plus_days(days))
+            end: GCRF = propagator.state.copy()
+            segment = HermiteSegment(start, end)
+            start = end
+        if segment is None:
+            positions.append(positions[-1].copy())
+        else:
+            seconds: float = (epoch.utc - segment.start.epoch.utc) * DAYS_TO_SECONDS
+            positions.append(segment.state(seconds).position)
+    return positions
+
+
+def compute_residuals(satellite: Satellite, optical_set: LiveOpticalSet) -> Dict[str, ResidualTable]:
+    """calculate the cross line of sight residuals of an observation set against the trajectory of a satellite
+
+    Observations are sorted by epoch so the trajectory is solved in one pass from the current state of the satellite,
+    which is left unchanged, and the sensor geometry is computed once per site.
+
+    :param satellite: satellite expected to be the observed object
+    :type satellite: Satellite
+    :param optical_set: observations of the satellite
+    :type optical_set: LiveOpticalSet
+    :return: residual table of each sensor keyed by sensor identifier
+    :rtype: Dict[str, ResidualTable]
+    """
+    obs: List[LiveOpticalObservation] = sorted(optical_set.list, key=lambda ob: ob.epoch.utc)
+    tables: Dict[str, ResidualTable] = {}
+    if not obs:
+        return tables
+
+    positions: List[Vector3D] = ephemeris(satellite.current_state(), [ob.epoch for ob in obs])
+    sensors: Dict[str, List[int]] = {}
+    for i, ob in enumerate(obs):
+        sensors.setdefault(ob.observer_id, []).append(i)
+
+    # the geometry of each site is only kept for this call so long running processes do not accumulate sites
+    sites: Dict[Tuple[float, float, float], Tuple[Vector3D, Matrix3D]] = {}
+    for sensor_id, indices in sensors.items():
+        table: ResidualTable = ResidualTable(sensor_id)
+        for i in indices:
+            observation: LiveOpticalObservation = obs[i]
+            lla: LLA = observation.observer_lla
+            key: Tuple[float, float, float] = (lla.latitude, lla.longitude, lla.altitude)
+            if key not in sites:
+                sites[key] = observation.site_geometry()
+            site, rotation = sites[key]
+            itrf: Vector3D = PositionConvert.gcrf.to_itrf(positions[i], observation.epoch)
+            expected: Vector3D = rotation.multiply_vector(itrf.minus(site))
+            table.epochs.append(observation.epoch.utc)
+            table.sat_ids.append(observation.sat_id)
+            table.residuals.append(expected.magnitude() * expected.angle(observation.observed_enz()))
+        tables[sensor_id] = table
+    return tables
@@ -0,0 +1,302 @@
+from codecs import IncrementalDecoder, getincrementaldecoder
+from json import JSONDecodeError, JSONDecoder
+from pathlib import Path
+from typing import IO, Iterator, List, Set, Tuple
+
+from pysmad.coordinates.states import LiveVector, LiveVectorSet
+from pysmad.estimation.obs import ColumnarOpticalSet, LiveOpticalObservation, LiveOpticalSet
+
+#: characters skipped between the records of a stream
+SEPARATORS: str = " \t\r\n,"
+
+
+class JSONStream:
+
+    #: Default number of bytes or characters read from the source at a time
+    DEFAULT_READ_SIZE: int = 1 << 16
+
+    #: Default largest number of characters of unparsed text held while waiting for the end of a record
+    DEFAULT_MAX_RECORD_SIZE: int = 1 << 24
+
+    #: Default number of records yielded together by chunks
+    DEFAULT_CHUNK_SIZE: int = 1000
+
+    def __init__(
+        self,
+        source: str | Path | IO,
+        read_size: int = DEFAULT_READ_SIZE,
+        max_record_size: int = DEFAULT_MAX_RECORD_SIZE,
+    ) -> None:
+        """class used to parse the records of a JSON array or JSON-lines dump without loading the whole document
+
+        Records are decoded one at a time from a rolling buffer that only holds the text of the record being parsed,
+        so memory does not grow with the size of the source.  Text that still fails to decode once it is longer than
+        max_record_size is reported as malformed instead of being extended to the end of the source.
+
+        :param source: path to the dump or an open binary or text stream positioned at its start
+        :type source: str | Path | IO
+        :param read_size: number of bytes or characters read at a time, defaults to DEFAULT_READ_SIZE
+        :type read_size: int, optional
+        :param max_record_size: largest number of characters of a single record, defaults to DEFAULT_MAX_RECORD_SIZE
+        :type max_record_size: int, optional
+        """
+        #: path to the dump or an open binary or text stream positioned at its start
+        self.source: str | Path | IO = source
+
+        #: number of bytes or characters read at a time
+        self.read_size: int = read_size
+
+        #: largest number of characters of a single record
+        self.max_record_size: int = max_record_size
+
+    def __iter__(self) -> Iterator[dict]:
+        return self.records()
+
+    def records(self) -> Iterator[dict]:
+        """decode the records of the source in order
+
+        A source that starts with [ is read as a single array of records and any other source is read as a sequence
+        of whitespace-separated records (JSON-lines).
+
+        :return: each decoded record
+        :rtype: Iterator[dict]
+        """
+        if isinstance(self.source, (str, Path)):
+            with open(self.source, "rb") as f:
+                yield from self.decode(f)
+        else:
+            yield from self.decode(self.source)
+
+    def decode(self, stream: IO) -> Iterator[dict]:
+        """decode the records of an open stream
+
+        :param stream: binary or text stream positioned at the start of the dump
+        :type stream: IO
+        :return: each decoded record
+        :rtype: Iterator[dict]
+        """
+        decoder: JSONDecoder = JSONDecoder()
+        text: IncrementalDecoder = getincrementaldecoder("utf-8-sig")()
+        buffer: str = ""
+        position: int = 0
+        eof: bool = False
+        in_array: bool | None = None
+
+        while True:
+            while position < len(buffer) and buffer[position] in SEPARATORS:
+                position += 1
+
+            if position == len(buffer) and not eof:
+                buffer, eof = self.extend(stream, text, buffer[position:])
+                position = 0
+                continue
+
+            if in_array is None:
+                if position == len(buffer):
+                    return
+                in_array = buffer[position] == "["
+                if in_array:
+                    position += 1
+                continue
+
+            if position == len(buffer) or (in_array and buffer[position] == "]"):
+                return
+
+            try:
+                record, end = decoder.raw_decode(buffer, position)
+            except JSONDecodeError:
+                # a malformed record would otherwise pull the rest of the source into the buffer
+                if eof or len(buffer) - position > self.max_record_size:
+                    raise
+                buffer, eof = self.extend(stream, text, buffer[position:])
+                position = 0
+                continue
+
+            # a value that stops at the end of the buffer may continue in the next read
+            if end == len(buffer) and not eof:
+                buffer, eof = self.extend(stream, text, buffer[position:])
+                position = 0
+                continue
+
+            yield record
+            position = end
+            if position > self.read_size:
+                buffer = buffer[position:]
+                position = 0
+
+    def extend(self, stream: IO, text: IncrementalDecoder, buffer: str) -> Tuple[str, bool]:
+        """append the next read of a stream to the unparsed text
+
+        :param stream: binary or text stream being decoded
+        :type stream: IO
+        :param text: decoder used to convert the reads of a binary stream
+        :type text: IncrementalDecoder
+        :param buffer: unparsed text
+        :type buffer: str
+        :return: extended text and a flag set at the end of the stream
+        :rtype: Tuple[str, bool]
+        """
+        data: bytes | str = stream.read(self.read_size)
+        if isinstance(data, bytes):
+            return buffer + text.decode(data, final=not data), not data
+        return buffer + data, not data
+
+    def chunks(self, size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[dict]]:
+        """group the decoded records into lists of bounded size
+
+        :param size: largest number of records in a chunk, defaults to DEFAULT_CHUNK_SIZE
+        :type size: int, optional
+        :return: each chunk of records in order
+        :rtype: Iterator[List[dict]]
+        """
+        chunk: List[dict] = []
+        for record in self.records():
+            chunk.append(record)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def matches(record: dict, sensors: Set[str] | None, targets: Set[str] | None, modes: Set[str] | None) -> bool:
+    """check a raw record against the requested sensors, targets, and data modes before it is converted
+
+    :param record: single return from a query
+    :type record: dict
+    :param sensors: sensor identifiers to keep or None to keep every sensor
+    :type sensors: Set[str] | None
+    :param targets: target identifiers to keep or None to keep every target
+    :type targets: Set[str] | None
+    :param modes: data modes to keep or None to keep every mode
+    :type modes: Set[str] | None
+    :return: flag set when the record passes every filter
+    :rtype: bool
+    """
+    if sensors is not None and record.get("origSensorId", record.get("sensorId", "NOT PROVIDED")) not in sensors:
+        return False
+    if targets is not None and record.get("origObjectId", record.get("idOnOrbit", "UNKNOWN")) not in targets:
+        return False
+    if modes is not None and record.get("dataMode") not in modes:
+        return False
+    return True
+
+
+def stream_observations(
+    source: str | Path | IO,
+    sensors: Set[str] | None = None,
+    targets: Set[str] | None = None,
+    modes: Set[str] | None = None,
+    chunk_size: int = JSONStream.DEFAULT_CHUNK_SIZE,
+) -> Iterator[List[LiveOpticalObservation]]:
+    """parse the optical observations of a dump in chunks of bounded size
+
+    :param source: path to the dump or an open binary or text stream
+    :type source: str | Path | IO
+    :param sensors: sensor identifiers to keep, defaults to None for every sensor
+    :type sensors: Set[str] | None, optional
+    :param targets: target identifiers to keep, defaults to None for every target
+    :type targets: Set[str] | None, optional
+    :param modes: data modes to keep, defaults to None for every mode
+    :type modes: Set[str] | None, optional
+    :param chunk_size: largest number of observations in a chunk, defaults to JSONStream.DEFAULT_CHUNK_SIZE
+    :type chunk_size: int, optional
+    :return: each chunk of observations in the order of the dump
+    :rtype: Iterator[List[LiveOpticalObservation]]
+    """
+    chunk: List[LiveOpticalObservation] = []
+    for record in JSONStream(source).records():
+        if matches(record, sensors, targets, modes):
+            chunk.append(LiveOpticalObservation(record))
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def stream_vectors(
+    source: str | Path | IO,
+    targets: Set[str] | None = None,
+    modes: Set[str] | None = None,
+    chunk_size: int = JSONStream.DEFAULT_CHUNK_SIZE,
+) -> Iterator[List[LiveVector]]:
+    """parse the state vectors of a dump in chunks of bounded size
+
+    :param source: path to the dump or an open binary or text stream
+    :type source: str | Path | IO
+    :param targets: target identifiers to keep, defaults to None for every target
+    :type targets: Set[str] | None, optional
+    :param modes: data modes to keep, defaults to None for every mode
+    :type modes: Set[str] | None, optional
+    :param chunk_size: largest number of vectors in a chunk, defaults to JSONStream.DEFAULT_CHUNK_SIZE
+    :type chunk_size: int, optional
+    :return: each chunk of vectors in the order of the dump
+    :rtype: Iterator[List[LiveVector]]
+    """
+    chunk: List[LiveVector] = []
+    for record in JSONStream(source).records():
+        if matches(record, None, targets, modes):
+            chunk.append(LiveVector(record))
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def load_optical_set(
+    source: str | Path | IO,
+    optical_set: LiveOpticalSet | ColumnarOpticalSet | None = None,
+    sensors: Set[str] | None = None,
+    targets: Set[str] | None = None,
+    modes: Set[str] | None = None,
+) -> LiveOpticalSet | ColumnarOpticalSet:
+    """feed the optical observations of a dump into a set while it is parsed
+
+    :param source: path to the dump or an open binary or text stream
+    :type source: str | Path | IO
+    :param optical_set: set that receives the observations, defaults to None for a new LiveOpticalSet
+    :type optical_set: LiveOpticalSet | ColumnarOpticalSet | None, optional
+    :param sensors: sensor identifiers to keep, defaults to None for every sensor
+    :type sensors: Set[str] | None, optional
+    :param targets: target identifiers to keep, defaults to None for every target
+    :type targets: Set[str] | None, optional
+    :param modes: data modes to keep, defaults to None for every mode
+    :type modes: Set[str] | None, optional
+    :return: set that received the observations
+    :rtype: LiveOpticalSet | ColumnarOpticalSet
+    """
+    if optical_set is None:
+        optical_set = LiveOpticalSet()
+    for chunk in stream_observations(source, sensors, targets, modes):
+        for ob in chunk:
+            optical_set.process_observation(ob)
+    return optical_set
+
+
+def load_vector_set(
+    source: str | Path | IO,
+    vector_set: LiveVectorSet | None = None,
+    targets: Set[str] | None = None,
+    modes: Set[str] | None = None,
+) -> LiveVectorSet:
+    """feed the state vectors of a dump into a set while it is parsed
+
+    :param source: path to the dump or an open binary or text stream
+    :type source: str | Path | IO
+    :param vector_set: set that receives the vectors, defaults to None for a new set
+    :type vector_set: LiveVectorSet | None, optional
+    :param targets: target identifiers to keep, defaults to None for every target
+    :type targets: Set[str] | None, optional
+    :param modes: data modes to keep, defaults to None for every mode
+    :type modes: Set[str] | None, optional
+    :return: set that received the vectors
+    :rtype: LiveVectorSet
+    """
+    if vector_set is None:
+        vector_set = LiveVectorSet()
+    for chunk in stream_vectors(source, targets, modes):
+        for vector in chunk:
+            vector_set.process_vector(vector)
+    return vector_set
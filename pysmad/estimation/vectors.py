@@ -0,0 +1,377 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from math import isnan, nan
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from pysmad.bodies import Satellite
+from pysmad.constants import DAYS_TO_SECONDS
+from pysmad.coordinates.states import GCRF, LiveVector, State
+from pysmad.estimation.obs import CodeTable, Column, extendable
+from pysmad.math.linalg import Vector3D
+from pysmad.propagators.catalog import CatalogEphemeris, propagate_catalog
+from pysmad.propagators.events import HermiteSegment
+from pysmad.propagators.inertial import RK4, Kepler
+from pysmad.time import Epoch
+
+#: number of floats stored for the lower triangle of a 6x6 covariance
+COVARIANCE_WIDTH: int = 21
+
+
+class ColumnarVectorSet:
+
+    #: Names of the float columns stored for each vector
+    COLUMNS: Tuple[str, ...] = ("epoch", "x", "y", "z", "vx", "vy", "vz", "srp_coefficient")
+
+    #: Names of the dictionary-encoded identifier columns
+    KEYS: Tuple[str, ...] = ("sat_id", "reference_frame")
+
+    def __init__(self) -> None:
+        """struct-of-arrays replacement for LiveVectorSet with no per-vector objects
+
+        Missing solar radiation pressure coefficients and covariances are stored as nan and restored as None.
+        """
+        #: float value of each vector keyed by column name
+        self.columns: Dict[str, Column] = {name: array("d") for name in ColumnarVectorSet.COLUMNS}
+
+        #: flat buffer of the COVARIANCE_WIDTH covariance terms of each vector
+        self.covariances: Column = array("d")
+
+        #: identifier code of each vector keyed by identifier name
+        self.codes: Dict[str, Column] = {name: array("i") for name in ColumnarVectorSet.KEYS}
+
+        #: identifier encoding keyed by identifier name
+        self.tables: Dict[str, CodeTable] = {name: CodeTable() for name in ColumnarVectorSet.KEYS}
+
+        #: row of the latest vector of each target
+        self.latest: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.columns["epoch"])
+
+    def __iter__(self) -> Iterator[LiveVector]:
+        for row in range(len(self)):
+            yield self.vector(row)
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: Dict[str, Column],
+        covariances: Column,
+        codes: Dict[str, Column],
+        tables: Dict[str, List[str]],
+    ) -> "ColumnarVectorSet":
+        """create a set that uses existing columns without copying them
+
+        Sets built on read-only memoryviews can be queried but not extended.
+
+        :param columns: float value of each vector keyed by every name in COLUMNS
+        :type columns: Dict[str, Column]
+        :param covariances: flat buffer of the covariance terms of each vector
+        :type covariances: Column
+        :param codes: identifier code of each vector keyed by every name in KEYS
+        :type codes: Dict[str, Column]
+        :param tables: identifier of each code keyed by every name in KEYS
+        :type tables: Dict[str, List[str]]
+        :return: set over the argument columns
+        :rtype: ColumnarVectorSet
+        """
+        vector_set: ColumnarVectorSet = cls()
+        vector_set.columns = {name: columns[name] for name in ColumnarVectorSet.COLUMNS}
+        vector_set.covariances = covariances
+        vector_set.codes = {name: codes[name] for name in ColumnarVectorSet.KEYS}
+        vector_set.tables = {name: CodeTable.from_values(tables[name]) for name in ColumnarVectorSet.KEYS}
+        sat_ids: List[str] = vector_set.tables["sat_id"].values
+        epochs: Column = vector_set.columns["epoch"]
+        for row, code in enumerate(vector_set.codes["sat_id"]):
+            vector_set.update_latest(sat_ids[code], row, epochs)
+        return vector_set
+
+    @property
+    def total(self) -> int:
+        return len(self)
+
+    @property
+    def list(self) -> List[LiveVector]:
+        return list(self)
+
+    @property
+    def targets(self) -> Dict[str, LiveVector]:
+        return {sat_id: self.vector(row) for sat_id, row in self.latest.items()}
+
+    def update_latest(self, sat_id: str, row: int, epochs: Column) -> None:
+        """keep a row as the latest vector of its target when it is newer than the current one
+
+        :param sat_id: identifier of the target
+        :type sat_id: str
+        :param row: position of the vector in the order it was added
+        :type row: int
+        :param epochs: epoch column of the set
+        :type epochs: Column
+        """
+        current: int | None = self.latest.get(sat_id)
+        if current is None or epochs[current] < epochs[row]:
+            self.latest[sat_id] = row
+
+    def append(self, values: Tuple[float, ...], covariance: List[float], sat_id: str, reference_frame: str) -> None:
+        """add a row from its float values and identifiers
+
+        :param values: float value of each column in the order of COLUMNS
+        :type values: Tuple[float, ...]
+        :param covariance: COVARIANCE_WIDTH covariance terms (nan when unknown)
+        :type covariance: List[float]
+        :param sat_id: identifier of the target
+        :type sat_id: str
+        :param reference_frame: frame of the position and velocity
+        :type reference_frame: str
+        """
+        if len(covariance) != COVARIANCE_WIDTH:
+            raise ValueError(f"covariance must have {COVARIANCE_WIDTH} terms")
+        for name, value in zip(ColumnarVectorSet.COLUMNS, values):
+            extendable(self.columns[name]).append(value)
+        extendable(self.covariances).extend(covariance)
+        for name, key in zip(ColumnarVectorSet.KEYS, (sat_id, reference_frame)):
+            extendable(self.codes[name]).append(self.tables[name].encode(key))
+        self.update_latest(sat_id, len(self) - 1, self.columns["epoch"])
+
+    def process_vector(self, state: LiveVector) -> None:
+        """add a vector to the set
+
+        :param state: vector to be stored
+        :type state: LiveVector
+        """
+        r: Vector3D = state.position
+        v: Vector3D = state.velocity
+        srp: float = nan if state.srp_coefficient is None else state.srp_coefficient
+        self.append(
+            (state.epoch.utc, r.x, r.y, r.z, v.x, v.y, v.z, srp),
+            [nan] * COVARIANCE_WIDTH if state.covariance is None else state.covariance,
+            state.sat_id,
+            state.reference_frame,
+        )
+
+    def vector(self, row: int) -> LiveVector:
+        """materialize a stored row as a vector
+
+        :param row: position of the vector in the order it was added
+        :type row: int
+        :return: vector equal to the one that was stored
+        :rtype: LiveVector
+        """
+        c: Dict[str, Column] = self.columns
+        state: LiveVector = LiveVector.__new__(LiveVector)
+        State.__init__(
+            state,
+            Epoch(c["epoch"][row]),
+            Vector3D(c["x"][row], c["y"][row], c["z"][row]),
+            Vector3D(c["vx"][row], c["vy"][row], c["vz"][row]),
+        )
+        srp: float = c["srp_coefficient"][row]
+        start: int = row * COVARIANCE_WIDTH
+        end: int = start + COVARIANCE_WIDTH
+        covariance: List[float] = list(self.covariances[start:end])
+        state.reference_frame = self.tables["reference_frame"].values[self.codes["reference_frame"][row]]
+        state.srp_coefficient = None if isnan(srp) else srp
+        state.covariance = None if all(isnan(term) for term in covariance) else covariance
+        state.sat_id = self.tables["sat_id"].values[self.codes["sat_id"][row]]
+        return state
+
+    def get_latest(self, scc: str) -> GCRF:
+        """create the inertial state of the most recent vector of a target
+
+        :param scc: identifier of the target
+        :type scc: str
+        :return: latest state of the target
+        :rtype: GCRF
+        """
+        return self.vector(self.latest[scc]).get_gcrf_state()
+
+    def publish_set(self, filename: str, write_mode: str) -> None:
+        with open(filename, write_mode) as f:
+            f.writelines("".join([state.to_csv_format(), "\n"]) for state in self)
+
+
+class VectorStore:
+
+    #: Default largest span in seconds between bracketing vectors that are interpolated instead of propagated
+    DEFAULT_MAX_GAP: float = 600
+
+    def __init__(self, vector_set: ColumnarVectorSet) -> None:
+        """class used to look up the vectors of each object by time
+
+        The rows of each object are sorted by epoch once so nearest, bracketing, and interpolated states are found
+        with a binary search instead of a scan of every vector.
+
+        :param vector_set: vectors to be indexed
+        :type vector_set: ColumnarVectorSet
+        """
+        #: vectors being indexed
+        self.vector_set: ColumnarVectorSet = vector_set
+
+        #: sorted utc epochs of the vectors of each object
+        self.epochs: Dict[str, array] = {}
+
+        #: row in the vector set of each sorted epoch of each object
+        self.rows: Dict[str, array] = {}
+
+        codes: Column = vector_set.codes["sat_id"]
+        epochs: Column = vector_set.columns["epoch"]
+        for row in sorted(range(len(vector_set)), key=lambda row: (codes[row], epochs[row])):
+            sat_id: str = vector_set.tables["sat_id"].values[codes[row]]
+            if sat_id not in self.rows:
+                self.rows[sat_id] = array("l")
+                self.epochs[sat_id] = array("d")
+            self.rows[sat_id].append(row)
+            self.epochs[sat_id].append(epochs[row])
+
+    @classmethod
+    def from_vectors(cls, vectors: Iterable[LiveVector]) -> "VectorStore":
+        """index a collection of vectors such as the list of a LiveVectorSet
+
+        :param vectors: vectors to be indexed
+        :type vectors: Iterable[LiveVector]
+        :return: store of the vectors
+        :rtype: VectorStore
+        """
+        vector_set: ColumnarVectorSet = ColumnarVectorSet()
+        for state in vectors:
+            vector_set.process_vector(state)
+        return cls(vector_set)
+
+    def sat_ids(self) -> List[str]:
+        """list the objects that have at least one vector
+
+        :return: identifier of each object
+        :rtype: List[str]
+        """
+        return list(self.rows)
+
+    def history(self, sat_id: str) -> array:
+        """retrieve the sorted epochs of the vectors of an object
+
+        :param sat_id: identifier of the object
+        :type sat_id: str
+        :return: utc epochs in ascending order
+        :rtype: array
+        """
+        if sat_id not in self.epochs:
+            raise ValueError(f"no vectors are stored for {sat_id}")
+        return self.epochs[sat_id]
+
+    def nearest(self, sat_id: str, epoch: Epoch) -> LiveVector:
+        """find the vector of an object closest in time to an epoch
+
+        :param sat_id: identifier of the object
+        :type sat_id: str
+        :param epoch: time of interest
+        :type epoch: Epoch
+        :return: vector with the smallest time offset from the epoch
+        :rtype: LiveVector
+        """
+        epochs: array = self.history(sat_id)
+        utc: float = epoch.utc
+        i: int = bisect_left(epochs, utc)
+        if i == len(epochs) or (i > 0 and utc - epochs[i - 1] <= epochs[i] - utc):
+            i -= 1
+        return self.vector_set.vector(self.rows[sat_id][i])
+
+    def bracket(self, sat_id: str, epoch: Epoch) -> Tuple[LiveVector | None, LiveVector | None]:
+        """find the vectors of an object on either side of an epoch
+
+        :param sat_id: identifier of the object
+        :type sat_id: str
+        :param epoch: time of interest
+        :type epoch: Epoch
+        :return: latest vector at or before the epoch and earliest vector at or after it (None when there is none)
+        :rtype: Tuple[LiveVector | None, LiveVector | None]
+        """
+        epochs: array = self.history(sat_id)
+        rows: array = self.rows[sat_id]
+        before: int = bisect_right(epochs, epoch.utc) - 1
+        after: int = bisect_left(epochs, epoch.utc)
+        return (
+            self.vector_set.vector(rows[before]) if before >= 0 else None,
+            self.vector_set.vector(rows[after]) if after < len(epochs) else None,
+        )
+
+    def interpolate(self, sat_id: str, epoch: Epoch, max_gap: float = DEFAULT_MAX_GAP) -> GCRF | None:
+        """interpolate the state of an object between the vectors that bracket an epoch
+
+        :param sat_id: identifier of the object
+        :type sat_id: str
+        :param epoch: time of interest
+        :type epoch: Epoch
+        :param max_gap: largest span in seconds between the bracketing vectors, defaults to DEFAULT_MAX_GAP
+        :type max_gap: float, optional
+        :return: interpolated state or None when the epoch is not bracketed within the largest span
+        :rtype: GCRF | None
+        """
+        before, after = self.bracket(sat_id, epoch)
+        if before is None or after is None:
+            return None
+        start: GCRF = before.get_gcrf_state()
+        if after.epoch.utc == before.epoch.utc:
+            return start
+        if (after.epoch.utc - before.epoch.utc) * DAYS_TO_SECONDS > max_gap:
+            return None
+        segment: HermiteSegment = HermiteSegment(start, after.get_gcrf_state())
+        return segment.state((epoch.utc - before.epoch.utc) * DAYS_TO_SECONDS)
+
+    def state(self, sat_id: str, epoch: Epoch, max_gap: float = DEFAULT_MAX_GAP) -> GCRF:
+        """solve the state of an object at an epoch by interpolating a short arc or propagating the nearest vector
+
+        :param sat_id: identifier of the object
+        :type sat_id: str
+        :param epoch: time of interest
+        :type epoch: Epoch
+        :param max_gap: largest span in seconds between interpolated vectors, defaults to DEFAULT_MAX_GAP
+        :type max_gap: float, optional
+        :return: state of the object at the epoch
+        :rtype: GCRF
+        """
+        state: GCRF | None = self.interpolate(sat_id, epoch, max_gap)
+        if state is None:
+            propagator: RK4 | Kepler = Satellite.create_propagator(self.nearest(sat_id, epoch).get_gcrf_state())
+            propagator.step_to_epoch(epoch)
+            state = propagator.state
+        return state
+
+    def snapshot(
+        self, epoch: Epoch, sat_ids: List[str] | None = None, max_gap: float = DEFAULT_MAX_GAP, workers: int = 1
+    ) -> Dict[str, GCRF]:
+        """solve the states of many objects at one epoch
+
+        Objects bracketed by a short arc are interpolated and the nearest vectors of all others are propagated
+        together, across a process pool when more than one worker is requested.
+
+        :param epoch: time of interest
+        :type epoch: Epoch
+        :param sat_ids: objects to be solved, defaults to None for every stored object
+        :type sat_ids: List[str] | None, optional
+        :param max_gap: largest span in seconds between interpolated vectors, defaults to DEFAULT_MAX_GAP
+        :type max_gap: float, optional
+        :param workers: number of processes used for propagation, defaults to 1 to propagate in this process
+        :type workers: int, optional
+        :return: state of each object keyed by identifier
+        :rtype: Dict[str, GCRF]
+        """
+        states: Dict[str, GCRF] = {}
+        pending: List[str] = []
+        seeds: List[GCRF] = []
+        for sat_id in self.sat_ids() if sat_ids is None else sat_ids:
+            state: GCRF | None = self.interpolate(sat_id, epoch, max_gap)
+            if state is None:
+                pending.append(sat_id)
+                seeds.append(self.nearest(sat_id, epoch).get_gcrf_state())
+            else:
+                states[sat_id] = state
+
+        if workers > 1 and seeds:
+            ephemeris: CatalogEphemeris = propagate_catalog(seeds, [epoch], workers)
+            for i, sat_id in enumerate(pending):
+                states[sat_id] = ephemeris.state(i, 0)
+        else:
+            for sat_id, seed in zip(pending, seeds):
+                propagator: RK4 | Kepler = Satellite.create_propagator(seed)
+                propagator.step_to_epoch(epoch)
+                states[sat_id] = propagator.state
+        return states
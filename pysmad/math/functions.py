@@ -1,4 +1,4 @@
-from math import atan2, cos, pi, radians, sin, sqrt
+from math import atan2, cos, cosh, pi, radians, sin, sinh, sqrt
 from typing import List
 
 from pysmad.constants import DAYS_TO_SECONDS, HOURS_IN_DAY, MINUTES_IN_DAY, MINUTES_IN_HOUR, SECONDS_IN_HOUR
@@ -877,6 +877,59 @@ class MeanAnomaly:
         return ma
 
 
+class Stumpff:
+    r"""static class used to solve the Stumpff functions of the universal-variable formulation
+
+    .. note::
+
+       the functions will commonly be referenced as :math:`c_2` and :math:`c_3` in documentation with
+       :math:`\psi = \chi^2\alpha`
+    """
+
+    #: magnitude of psi below which the series expansions are used
+    SERIES_LIMIT: float = 1e-3
+
+    @staticmethod
+    def c2(psi: float) -> float:
+        r"""calculate the second Stumpff function using algorithm 1 in :ref:`vallado`
+
+        .. math::
+
+           c_2 = \frac{1 - \cos{\sqrt{\psi}}}{\psi}
+
+        :param psi: universal variable squared times the reciprocal of the semi-major axis
+        :type psi: float
+        :return: second Stumpff function
+        :rtype: float
+        """
+        if psi > Stumpff.SERIES_LIMIT:
+            return (1 - cos(sqrt(psi))) / psi
+        elif psi < -Stumpff.SERIES_LIMIT:
+            return (1 - cosh(sqrt(-psi))) / psi
+        return 1 / 2 - psi / 24 + psi * psi / 720 - psi * psi * psi / 40320
+
+    @staticmethod
+    def c3(psi: float) -> float:
+        r"""calculate the third Stumpff function using algorithm 1 in :ref:`vallado`
+
+        .. math::
+
+           c_3 = \frac{\sqrt{\psi} - \sin{\sqrt{\psi}}}{\sqrt{\psi^3}}
+
+        :param psi: universal variable squared times the reciprocal of the semi-major axis
+        :type psi: float
+        :return: third Stumpff function
+        :rtype: float
+        """
+        if psi > Stumpff.SERIES_LIMIT:
+            root: float = sqrt(psi)
+            return (root - sin(root)) / (psi * root)
+        elif psi < -Stumpff.SERIES_LIMIT:
+            root = sqrt(-psi)
+            return (sinh(root) - root) / (-psi * root)
+        return 1 / 6 - psi / 120 + psi * psi / 5040 - psi * psi * psi / 362880
+
+
 class EquationsOfMotion:
     """class used to solve equations of motion"""
 
@@ -930,3 +983,6 @@ class EquationsOfMotion:
 
     #: used to solve mean anomaly :math:`M`
     MA = MeanAnomaly
+
+    #: used to solve the Stumpff functions :math:`c_2` and :math:`c_3`
+    C = Stumpff
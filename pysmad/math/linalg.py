@@ -1,8 +1,13 @@
+import os
 from math import acos, cos, pi, sin, sqrt
-from random import gauss, uniform
+from random import Random, gauss, uniform
+from typing import List
 
 
 class Vector6D:
+
+    __slots__ = ("x", "y", "z", "vx", "vy", "vz")
+
     def __init__(self, x: float, y: float, z: float, vx: float, vy: float, vz: float) -> None:
         """class used to perform operations on a vector that has 6 components
 
@@ -109,8 +114,77 @@ class Vector6D:
             self.vz - vec.vz,
         )
 
+    def scaled(self, scalar: float) -> "Vector6D":
+        """create a vector whose elements are the calling vector's elements multiplied by the argument
+
+        :param scalar: value used to scale the vector
+        :type scalar: float
+        :return: scaled vector
+        :rtype: Vector6D
+        """
+        return Vector6D(
+            self.x * scalar,
+            self.y * scalar,
+            self.z * scalar,
+            self.vx * scalar,
+            self.vy * scalar,
+            self.vz * scalar,
+        )
+
+    def iadd_scaled(self, vec: "Vector6D", scalar: float) -> None:
+        """add a scaled copy of the argument vector to the calling vector in place
+
+        Only vectors owned by the caller should be modified, such as a fresh copy or the vectors of a newly built state.
+
+        :param vec: vector to be scaled and added
+        :type vec: Vector6D
+        :param scalar: value used to scale the argument vector
+        :type scalar: float
+        """
+        self.x += vec.x * scalar
+        self.y += vec.y * scalar
+        self.z += vec.z * scalar
+        self.vx += vec.vx * scalar
+        self.vy += vec.vy * scalar
+        self.vz += vec.vz * scalar
+
+    def set_from(self, vec: "Vector6D") -> None:
+        """overwrite the elements of the calling vector with those of the argument vector
+
+        :param vec: vector whose elements will be copied
+        :type vec: Vector6D
+        """
+        self.x, self.y, self.z = vec.x, vec.y, vec.z
+        self.vx, self.vy, self.vz = vec.vx, vec.vy, vec.vz
+
+    def __add__(self, vec: "Vector6D") -> "Vector6D":
+        return self.plus(vec)
+
+    def __sub__(self, vec: "Vector6D") -> "Vector6D":
+        return self.minus(vec)
+
+    def __mul__(self, scalar: float) -> "Vector6D":
+        return self.scaled(scalar)
+
+    def __rmul__(self, scalar: float) -> "Vector6D":
+        return self.scaled(scalar)
+
+    def __neg__(self) -> "Vector6D":
+        return self.scaled(-1)
+
+    def __iadd__(self, vec: "Vector6D") -> "Vector6D":
+        self.iadd_scaled(vec, 1)
+        return self
+
+    def __isub__(self, vec: "Vector6D") -> "Vector6D":
+        self.iadd_scaled(vec, -1)
+        return self
+
 
 class Vector3D:
+
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x: float, y: float, z: float) -> None:
         """class used to perform operations on a 3-dimension vector
 
@@ -130,38 +204,46 @@ class Vector3D:
         #: third component of the vector
         self.z: float = z
 
-    def with_noise(self, range_err: float, ang_err: float) -> "Vector3D":
+    def with_noise(self, range_err: float, ang_err: float, rng: Random | None = None) -> "Vector3D":
         """calculate a new vector with noise applied to magnitude and direction
 
         :param range_err: one-sigma range error in units consistent with the calling vector
         :type range_err: float
         :param ang_err: one-sigma anglular error in radians
         :type ang_err: float
+        :param rng: generator used to draw the noise (the global random module when None), defaults to None
+        :type rng: Random | None, optional
         :return: new vector with gaussian noise applied
         :rtype: Vector3D
         """
-        return self.with_magnitude_noise(range_err).with_angular_noise(ang_err)
+        return self.with_magnitude_noise(range_err, rng).with_angular_noise(ang_err, rng)
 
-    def with_magnitude_noise(self, range_err: float) -> "Vector3D":
+    def with_magnitude_noise(self, range_err: float, rng: Random | None = None) -> "Vector3D":
         """calculate a new vector with noise applied to the magnitude
 
         :param range_err: one-sigma range error in units consistent with the calling vector
         :type range_err: float
+        :param rng: generator used to draw the noise (the global random module when None), defaults to None
+        :type rng: Random | None, optional
         :return: new vector with the magnitude adjusted by gaussian distribution
         :rtype: Vector3D
         """
-        return self.normalized().scaled(gauss(self.magnitude(), range_err))
+        sample = gauss if rng is None else rng.gauss
+        return self.normalized().scaled(sample(self.magnitude(), range_err))
 
-    def with_angular_noise(self, ang_err: float) -> "Vector3D":
+    def with_angular_noise(self, ang_err: float, rng: Random | None = None) -> "Vector3D":
         """calculate a new vector with angular noise applied
 
         :param ang_err: one-sigma anglular error in radians
         :type ang_err: float
+        :param rng: generator used to draw the noise (the global random module when None), defaults to None
+        :type rng: Random | None, optional
         :return: new vector offset using gaussian distribution for the angle
         :rtype: Vector3D
         """
-        return self.rotation_about_axis(self.cross(Vector3D(0, 0, 1)), gauss(0, ang_err)).rotation_about_axis(
-            self, uniform(0, 2 * pi)
+        sample, spin = (gauss, uniform) if rng is None else (rng.gauss, rng.uniform)
+        return self.rotation_about_axis(self.cross(Vector3D(0, 0, 1)), sample(0, ang_err)).rotation_about_axis(
+            self, spin(0, 2 * pi)
         )
 
     def copy(self) -> "Vector3D":
@@ -308,8 +390,65 @@ class Vector3D:
         """
         return Vector3D.rotation_matrix(axis, theta).multiply_vector(self.copy())
 
+    def iadd_scaled(self, vec: "Vector3D", scalar: float) -> None:
+        """add a scaled copy of the argument vector to the calling vector in place
+
+        Only vectors owned by the caller should be modified, such as a fresh copy or the vectors of a newly built state.
+
+        :param vec: vector to be scaled and added
+        :type vec: Vector3D
+        :param scalar: value used to scale the argument vector
+        :type scalar: float
+        """
+        self.x += vec.x * scalar
+        self.y += vec.y * scalar
+        self.z += vec.z * scalar
+
+    def set_from(self, vec: "Vector3D") -> None:
+        """overwrite the components of the calling vector with those of the argument vector
+
+        :param vec: vector whose components will be copied
+        :type vec: Vector3D
+        """
+        self.x, self.y, self.z = vec.x, vec.y, vec.z
+
+    def __add__(self, vec: "Vector3D") -> "Vector3D":
+        return self.plus(vec)
+
+    def __sub__(self, vec: "Vector3D") -> "Vector3D":
+        return self.minus(vec)
+
+    def __mul__(self, scalar: float) -> "Vector3D":
+        return self.scaled(scalar)
+
+    def __rmul__(self, scalar: float) -> "Vector3D":
+        return self.scaled(scalar)
+
+    def __truediv__(self, scalar: float) -> "Vector3D":
+        return self.scaled(1 / scalar)
+
+    def __neg__(self) -> "Vector3D":
+        return self.scaled(-1)
+
+    def __iadd__(self, vec: "Vector3D") -> "Vector3D":
+        self.iadd_scaled(vec, 1)
+        return self
+
+    def __isub__(self, vec: "Vector3D") -> "Vector3D":
+        self.iadd_scaled(vec, -1)
+        return self
+
+    def __imul__(self, scalar: float) -> "Vector3D":
+        self.x *= scalar
+        self.y *= scalar
+        self.z *= scalar
+        return self
+
 
 class Matrix3D:
+
+    __slots__ = ("row1", "row2", "row3")
+
     def __init__(self, row1: Vector3D, row2: Vector3D, row3: Vector3D) -> None:
         """used to perform operations on a 3x3 matrix
 
@@ -493,8 +632,44 @@ class Matrix3D:
             ),
         )
 
+    def multiply_matrix(self, mat: "Matrix3D") -> "Matrix3D":
+        """create a matrix that is the product of the calling and argument matrices
+
+        :param mat: matrix to be used in the product
+        :type mat: Matrix3D
+        :return: product matrix
+        :rtype: Matrix3D
+        """
+        columns: Matrix3D = mat.transpose()
+        return Matrix3D(
+            columns.multiply_vector(self.row1),
+            columns.multiply_vector(self.row2),
+            columns.multiply_vector(self.row3),
+        )
+
+    def __add__(self, mat: "Matrix3D") -> "Matrix3D":
+        return self.plus(mat)
+
+    def __mul__(self, scalar: float) -> "Matrix3D":
+        return self.scaled(scalar)
+
+    def __rmul__(self, scalar: float) -> "Matrix3D":
+        return self.scaled(scalar)
+
+    def __matmul__(self, other: "Vector3D | Matrix3D | Matrix3by6") -> "Vector3D | Matrix3D | Matrix3by6":
+        if isinstance(other, Vector3D):
+            return self.multiply_vector(other)
+        if isinstance(other, Matrix3D):
+            return self.multiply_matrix(other)
+        if isinstance(other, Matrix3by6):
+            return self.multiply_matrix3by6(other)
+        return NotImplemented
+
 
 class Matrix3by6:
+
+    __slots__ = ("row1", "row2", "row3")
+
     def __init__(self, row1: Vector6D, row2: Vector6D, row3: Vector6D) -> None:
         """used to perform operations for a 3x6 matrix
 
@@ -608,8 +783,18 @@ class Matrix3by6:
             ),
         )
 
+    def __matmul__(self, other: "Vector6D | Matrix6by3") -> "Vector3D | Matrix3D":
+        if isinstance(other, Vector6D):
+            return self.multiply_vector(other)
+        if isinstance(other, Matrix6by3):
+            return self.multiply_matrix_6by3(other)
+        return NotImplemented
+
 
 class Matrix6by3:
+
+    __slots__ = ("row1", "row2", "row3", "row4", "row5", "row6")
+
     def __init__(
         self,
         r1: Vector3D,
@@ -801,8 +986,20 @@ class Matrix6by3:
             ),
         )
 
+    def __matmul__(self, other: "Vector3D | Matrix3D | Matrix3by6") -> "Vector6D | Matrix6by3 | Matrix6D":
+        if isinstance(other, Vector3D):
+            return self.multiply_vector(other)
+        if isinstance(other, Matrix3D):
+            return self.multiply(other)
+        if isinstance(other, Matrix3by6):
+            return self.multiply_matrix3by6(other)
+        return NotImplemented
+
 
 class Matrix6D:
+
+    __slots__ = ("row1", "row2", "row3", "row4", "row5", "row6")
+
     def __init__(
         self,
         r1: Vector6D,
@@ -1111,3 +1308,224 @@ class Matrix6D:
             self.row5.minus(mat.row5),
             self.row6.minus(mat.row6),
         )
+
+    def __add__(self, mat: "Matrix6D") -> "Matrix6D":
+        return self.plus(mat)
+
+    def __sub__(self, mat: "Matrix6D") -> "Matrix6D":
+        return self.minus(mat)
+
+    def __matmul__(self, other: "Vector6D | Matrix6D | Matrix6by3") -> "Vector6D | Matrix6D | Matrix6by3":
+        if isinstance(other, Vector6D):
+            return self.multiply_vector(other)
+        if isinstance(other, Matrix6D):
+            return self.multiply_matrix(other)
+        if isinstance(other, Matrix6by3):
+            return self.multiply_matrix_6by3(other)
+        return NotImplemented
+
+
+class SymmetricMatrix6D:
+
+    __slots__ = ("values",)
+
+    #: number of unique elements of a symmetric 6x6 matrix
+    SIZE: int = 21
+
+    def __init__(self, values: List[float]) -> None:
+        """class used to store a symmetric 6x6 matrix (such as a covariance) by its upper triangle
+
+        :param values: row-major elements of the upper triangle including the diagonal
+        :type values: List[float]
+        """
+        if len(values) != SymmetricMatrix6D.SIZE:
+            raise ValueError(f"symmetric matrix requires {SymmetricMatrix6D.SIZE} values")
+
+        #: row-major elements of the upper triangle including the diagonal
+        self.values: List[float] = values
+
+    @staticmethod
+    def index(i: int, j: int) -> int:
+        """find the location of an element in the packed upper triangle
+
+        :param i: row of the element
+        :type i: int
+        :param j: column of the element
+        :type j: int
+        :return: index of the element in values
+        :rtype: int
+        """
+        if i > j:
+            i, j = j, i
+        return 6 * i - i * (i - 1) // 2 + j - i
+
+    @staticmethod
+    def unpack(mat: Matrix6D) -> List[List[float]]:
+        """create nested lists of the elements of a 6x6 matrix
+
+        :param mat: matrix to be unpacked
+        :type mat: Matrix6D
+        :return: list of rows where each row is a list of 6 elements
+        :rtype: List[List[float]]
+        """
+        return [
+            [row.x, row.y, row.z, row.vx, row.vy, row.vz]
+            for row in (mat.row1, mat.row2, mat.row3, mat.row4, mat.row5, mat.row6)
+        ]
+
+    @classmethod
+    def from_matrix(cls, mat: Matrix6D) -> "SymmetricMatrix6D":
+        """create a symmetric matrix from the upper triangle of a full matrix
+
+        :param mat: matrix whose upper triangle will be stored
+        :type mat: Matrix6D
+        :return: packed symmetric matrix
+        :rtype: SymmetricMatrix6D
+        """
+        rows: List[List[float]] = SymmetricMatrix6D.unpack(mat)
+        return cls([rows[i][j] for i in range(6) for j in range(i, 6)])
+
+    @classmethod
+    def from_rows(cls, rows: List[List[float]]) -> "SymmetricMatrix6D":
+        """create a symmetric matrix from the upper triangle of nested lists
+
+        :param rows: list of rows where each row is a list of 6 elements
+        :type rows: List[List[float]]
+        :return: packed symmetric matrix
+        :rtype: SymmetricMatrix6D
+        """
+        return cls([rows[i][j] for i in range(6) for j in range(i, 6)])
+
+    def element(self, i: int, j: int) -> float:
+        """retrieve the element at a row and column
+
+        :param i: row of the element
+        :type i: int
+        :param j: column of the element
+        :type j: int
+        :return: value of the element
+        :rtype: float
+        """
+        return self.values[SymmetricMatrix6D.index(i, j)]
+
+    def rows(self) -> List[List[float]]:
+        """create nested lists holding every element of the matrix
+
+        :return: list of rows where each row is a list of 6 elements
+        :rtype: List[List[float]]
+        """
+        rows: List[List[float]] = [[0.0] * 6 for _ in range(6)]
+        k: int = 0
+        for i in range(6):
+            for j in range(i, 6):
+                rows[i][j] = rows[j][i] = self.values[k]
+                k += 1
+        return rows
+
+    def to_matrix(self) -> Matrix6D:
+        """create a full 6x6 matrix with the elements of the calling matrix
+
+        :return: full matrix
+        :rtype: Matrix6D
+        """
+        return Matrix6D(*[Vector6D(*row) for row in self.rows()])
+
+    def diagonal(self) -> Vector6D:
+        """create a vector whose elements are the diagonal of the matrix
+
+        :return: diagonal of the matrix
+        :rtype: Vector6D
+        """
+        v: List[float] = self.values
+        return Vector6D(v[0], v[6], v[11], v[15], v[18], v[20])
+
+    def plus(self, mat: "SymmetricMatrix6D") -> "SymmetricMatrix6D":
+        """create a matrix whose elements are the sum of the calling and argument matrices
+
+        :param mat: matrix to be used in the sum
+        :type mat: SymmetricMatrix6D
+        :return: sum matrix
+        :rtype: SymmetricMatrix6D
+        """
+        return SymmetricMatrix6D([a + b for a, b in zip(self.values, mat.values)])
+
+    def congruence(self, mat: Matrix6D) -> "SymmetricMatrix6D":
+        """create the symmetric product M * P * M^T of an argument matrix M and the calling matrix P
+
+        Only the upper triangle of the result is computed, which takes 342 multiply-adds instead of the 432 used by
+        two full matrix products.
+
+        :param mat: matrix M used in the product
+        :type mat: Matrix6D
+        :return: product matrix
+        :rtype: SymmetricMatrix6D
+        """
+        m: List[List[float]] = SymmetricMatrix6D.unpack(mat)
+        p: List[List[float]] = self.rows()
+        mp: List[List[float]] = [[sum(a * p[k][c] for k, a in enumerate(m_row)) for c in range(6)] for m_row in m]
+        return SymmetricMatrix6D([sum(a * b for a, b in zip(mp[i], m[j])) for i in range(6) for j in range(i, 6)])
+
+    def __add__(self, mat: "SymmetricMatrix6D") -> "SymmetricMatrix6D":
+        return self.plus(mat)
+
+
+class Cholesky:
+    """class used to solve small symmetric positive-definite systems stored as lists of rows"""
+
+    @staticmethod
+    def factor(matrix: List[List[float]]) -> List[List[float]]:
+        """create the lower triangular factor L of a symmetric positive-definite matrix where A = L * L^T
+
+        :param matrix: square matrix as a list of rows
+        :type matrix: List[List[float]]
+        :return: lower triangular factor as a list of rows
+        :rtype: List[List[float]]
+        """
+        n: int = len(matrix)
+        factor: List[List[float]] = [[0.0] * n for _ in range(n)]
+        for i in range(n):
+            for j in range(i + 1):
+                s: float = matrix[i][j] - sum(factor[i][c] * factor[j][c] for c in range(j))
+                if i == j:
+                    if s <= 0:
+                        raise ValueError("matrix must be positive definite")
+                    factor[i][i] = sqrt(s)
+                else:
+                    factor[i][j] = s / factor[j][j]
+        return factor
+
+    @staticmethod
+    def solve(factor: List[List[float]], rhs: List[float]) -> List[float]:
+        """solve A * x = b using the lower triangular cholesky factor of A
+
+        :param factor: lower triangular factor as a list of rows
+        :type factor: List[List[float]]
+        :param rhs: right-hand side b of the system
+        :type rhs: List[float]
+        :return: solution x of the system
+        :rtype: List[float]
+        """
+        n: int = len(rhs)
+        y: List[float] = [0.0] * n
+        for i in range(n):
+            y[i] = (rhs[i] - sum(factor[i][c] * y[c] for c in range(i))) / factor[i][i]
+        x: List[float] = [0.0] * n
+        for i in reversed(range(n)):
+            x[i] = (y[i] - sum(factor[c][i] * x[c] for c in range(i + 1, n))) / factor[i][i]
+        return x
+
+
+#: linalg backend selected with the PYSMAD_LINALG environment variable before pysmad is imported ("python" or "numpy")
+BACKEND: str = os.environ.get("PYSMAD_LINALG", "python")
+
+if BACKEND == "numpy":
+    from pysmad.math.linalg_numpy import (  # type: ignore[assignment] # noqa: F811
+        Matrix3by6,
+        Matrix3D,
+        Matrix6by3,
+        Matrix6D,
+        Vector3D,
+        Vector6D,
+    )
+elif BACKEND != "python":
+    raise ValueError(f"unknown linalg backend {BACKEND}")
@@ -0,0 +1,953 @@
+"""NumPy-backed versions of the :mod:`pysmad.math.linalg` types
+
+Each type keeps its components in a small contiguous float64 array exposed through ``array`` so callers can move into
+vectorized NumPy code without copying.  The methods mirror :mod:`pysmad.math.linalg` and return new objects, and rows
+and components read from a matrix are views into the matrix's buffer.  NumPy is an optional dependency that can be
+installed with the ``numpy`` extra.
+"""
+
+from math import acos, cos, pi, sin, sqrt
+from random import Random, gauss, uniform
+
+import numpy as np
+
+
+class Vector6D:
+
+    __slots__ = ("array",)
+
+    def __init__(self, x: float, y: float, z: float, vx: float, vy: float, vz: float) -> None:
+        """class used to perform operations on a vector that has 6 components
+
+        :param x: first component of vector
+        :type x: float
+        :param y: second component of vector
+        :type y: float
+        :param z: third component of vector
+        :type z: float
+        :param vx: fourth component of vector
+        :type vx: float
+        :param vy: fifth component of vector
+        :type vy: float
+        :param vz: sixth component of vector
+        :type vz: float
+        """
+        #: contiguous buffer of the components
+        self.array: np.ndarray = np.array((x, y, z, vx, vy, vz), dtype=np.float64)
+
+    @classmethod
+    def from_array(cls, values: np.ndarray) -> "Vector6D":
+        """wrap an existing buffer without copying it
+
+        :param values: float64 array with 6 elements
+        :type values: np.ndarray
+        :return: vector whose components share memory with the argument
+        :rtype: Vector6D
+        """
+        vec: Vector6D = cls.__new__(cls)
+        vec.array = values
+        return vec
+
+    @classmethod
+    def from_position_and_velocity(cls, r: "Vector3D", v: "Vector3D") -> "Vector6D":
+        """create a 6D vector from position and velocity 3D vectors
+
+        :param r: position vector
+        :type r: Vector3D
+        :param v: velocity vector
+        :type v: Vector3D
+        :return: vector with components of x, y, z, vx, vy, vz
+        :rtype: Vector6D
+        """
+        return cls(r.x, r.y, r.z, v.x, v.y, v.z)
+
+    @property
+    def x(self) -> float:
+        return float(self.array[0])
+
+    @property
+    def y(self) -> float:
+        return float(self.array[1])
+
+    @property
+    def z(self) -> float:
+        return float(self.array[2])
+
+    @property
+    def vx(self) -> float:
+        return float(self.array[3])
+
+    @property
+    def vy(self) -> float:
+        return float(self.array[4])
+
+    @property
+    def vz(self) -> float:
+        return float(self.array[5])
+
+    def dot(self, vec_to_dot: "Vector6D") -> float:
+        """calculate the dot product of the calling vector and the argument vector
+
+        :param vec_to_dot: vector to be dotted with the calling vector
+        :type vec_to_dot: Vector6D
+        :return: dot product of the two vectors
+        :rtype: float
+        """
+        return float(self.array @ vec_to_dot.array)
+
+    def copy(self) -> "Vector6D":
+        """create a duplicate of the calling vector
+
+        :return: vector with components that match the calling vector
+        :rtype: Vector6D
+        """
+        return Vector6D.from_array(self.array.copy())
+
+    def plus(self, vec: "Vector6D") -> "Vector6D":
+        """calculate the sum of the calling vector and the argument vector
+
+        :param vec: vector to be added to the calling vector
+        :type vec: Vector6D
+        :return: sum of the two vectors
+        :rtype: Vector6D
+        """
+        return Vector6D.from_array(self.array + vec.array)
+
+    def minus(self, vec: "Vector6D") -> "Vector6D":
+        """calculate the difference of the calling vector and the argument vector
+
+        :param vec: vector to be subtracted from the calling vector
+        :type vec: Vector6D
+        :return: difference of the two vectors
+        :rtype: Vector6D
+        """
+        return Vector6D.from_array(self.array - vec.array)
+
+    def scaled(self, scalar: float) -> "Vector6D":
+        """create a copy of the calling vector with each component multiplied by the argument
+
+        :param scalar: value used to scale the vector
+        :type scalar: float
+        :return: scaled vector
+        :rtype: Vector6D
+        """
+        return Vector6D.from_array(self.array * scalar)
+
+    def iadd_scaled(self, vec: "Vector6D", scalar: float) -> None:
+        """add a scaled copy of the argument vector to the calling vector in place
+
+        Only vectors owned by the caller should be modified, since rows read from a matrix are views of its buffer.
+
+        :param vec: vector to be scaled and added
+        :type vec: Vector6D
+        :param scalar: value used to scale the argument vector
+        :type scalar: float
+        """
+        self.array += vec.array * scalar
+
+    def set_from(self, vec: "Vector6D") -> None:
+        """overwrite the components of the calling vector with those of the argument vector
+
+        :param vec: vector whose components will be copied
+        :type vec: Vector6D
+        """
+        self.array[:] = vec.array
+
+    def __add__(self, vec: "Vector6D") -> "Vector6D":
+        return self.plus(vec)
+
+    def __sub__(self, vec: "Vector6D") -> "Vector6D":
+        return self.minus(vec)
+
+    def __mul__(self, scalar: float) -> "Vector6D":
+        return self.scaled(scalar)
+
+    def __rmul__(self, scalar: float) -> "Vector6D":
+        return self.scaled(scalar)
+
+    def __neg__(self) -> "Vector6D":
+        return self.scaled(-1)
+
+    def __iadd__(self, vec: "Vector6D") -> "Vector6D":
+        self.iadd_scaled(vec, 1)
+        return self
+
+    def __isub__(self, vec: "Vector6D") -> "Vector6D":
+        self.iadd_scaled(vec, -1)
+        return self
+
+
+class Vector3D:
+
+    __slots__ = ("array",)
+
+    def __init__(self, x: float, y: float, z: float) -> None:
+        """class used to perform operations on a vector that has 3 components
+
+        :param x: first component of vector
+        :type x: float
+        :param y: second component of vector
+        :type y: float
+        :param z: third component of vector
+        :type z: float
+        """
+        #: contiguous buffer of the components
+        self.array: np.ndarray = np.array((x, y, z), dtype=np.float64)
+
+    @classmethod
+    def from_array(cls, values: np.ndarray) -> "Vector3D":
+        """wrap an existing buffer without copying it
+
+        :param values: float64 array with 3 elements
+        :type values: np.ndarray
+        :return: vector whose components share memory with the argument
+        :rtype: Vector3D
+        """
+        vec: Vector3D = cls.__new__(cls)
+        vec.array = values
+        return vec
+
+    @property
+    def x(self) -> float:
+        return float(self.array[0])
+
+    @property
+    def y(self) -> float:
+        return float(self.array[1])
+
+    @property
+    def z(self) -> float:
+        return float(self.array[2])
+
+    def with_noise(self, range_err: float, ang_err: float, rng: Random | None = None) -> "Vector3D":
+        """create a copy of the calling vector with random magnitude and angular noise
+
+        :param range_err: standard deviation of the magnitude noise
+        :type range_err: float
+        :param ang_err: standard deviation of the angular noise in radians
+        :type ang_err: float
+        :param rng: generator used to draw the noise (the global random module when None), defaults to None
+        :type rng: Random | None, optional
+        :return: vector with noise applied
+        :rtype: Vector3D
+        """
+        return self.with_magnitude_noise(range_err, rng).with_angular_noise(ang_err, rng)
+
+    def with_magnitude_noise(self, range_err: float, rng: Random | None = None) -> "Vector3D":
+        """create a copy of the calling vector with random magnitude noise
+
+        :param range_err: standard deviation of the magnitude noise
+        :type range_err: float
+        :param rng: generator used to draw the noise (the global random module when None), defaults to None
+        :type rng: Random | None, optional
+        :return: vector with noise applied
+        :rtype: Vector3D
+        """
+        sample = gauss if rng is None else rng.gauss
+        return self.normalized().scaled(sample(self.magnitude(), range_err))
+
+    def with_angular_noise(self, ang_err: float, rng: Random | None = None) -> "Vector3D":
+        """create a copy of the calling vector with random angular noise
+
+        :param ang_err: standard deviation of the angular noise in radians
+        :type ang_err: float
+        :param rng: generator used to draw the noise (the global random module when None), defaults to None
+        :type rng: Random | None, optional
+        :return: vector with noise applied
+        :rtype: Vector3D
+        """
+        sample, spin = (gauss, uniform) if rng is None else (rng.gauss, rng.uniform)
+        return self.rotation_about_axis(self.cross(Vector3D(0, 0, 1)), sample(0, ang_err)).rotation_about_axis(
+            self, spin(0, 2 * pi)
+        )
+
+    def copy(self) -> "Vector3D":
+        """create a duplicate of the calling vector
+
+        :return: vector with components that match the calling vector
+        :rtype: Vector3D
+        """
+        return Vector3D.from_array(self.array.copy())
+
+    def plus(self, vec_to_add: "Vector3D") -> "Vector3D":
+        """calculate the sum of the calling vector and the argument vector
+
+        :param vec_to_add: vector to be added to the calling vector
+        :type vec_to_add: Vector3D
+        :return: sum of the two vectors
+        :rtype: Vector3D
+        """
+        return Vector3D.from_array(self.array + vec_to_add.array)
+
+    def minus(self, vec_to_subtract: "Vector3D") -> "Vector3D":
+        """calculate the difference of the calling vector and the argument vector
+
+        :param vec_to_subtract: vector to be subtracted from the calling vector
+        :type vec_to_subtract: Vector3D
+        :return: difference of the two vectors
+        :rtype: Vector3D
+        """
+        return Vector3D.from_array(self.array - vec_to_subtract.array)
+
+    def dot(self, vec_to_dot: "Vector3D") -> float:
+        """calculate the dot product of the calling vector and the argument vector
+
+        :param vec_to_dot: vector to be dotted with the calling vector
+        :type vec_to_dot: Vector3D
+        :return: dot product of the two vectors
+        :rtype: float
+        """
+        return float(self.array @ vec_to_dot.array)
+
+    def cross(self, vec_to_cross: "Vector3D") -> "Vector3D":
+        """calculate the cross product of the calling vector and the argument vector
+
+        :param vec_to_cross: vector to be crossed with the calling vector
+        :type vec_to_cross: Vector3D
+        :return: cross product of the two vectors
+        :rtype: Vector3D
+        """
+        return Vector3D.from_array(np.cross(self.array, vec_to_cross.array))
+
+    def magnitude(self) -> float:
+        """calculate the magnitude of the calling vector
+
+        :return: euclidean norm of the vector
+        :rtype: float
+        """
+        return sqrt(self.dot(self))
+
+    def scaled(self, scalar: float) -> "Vector3D":
+        """create a copy of the calling vector with each component multiplied by the argument
+
+        :param scalar: value used to scale the vector
+        :type scalar: float
+        :return: scaled vector
+        :rtype: Vector3D
+        """
+        return Vector3D.from_array(self.array * scalar)
+
+    def normalized(self) -> "Vector3D":
+        """create a unit vector in the direction of the calling vector
+
+        :return: vector with a magnitude of 1
+        :rtype: Vector3D
+        """
+        return self.scaled(1 / self.magnitude())
+
+    def angle(self, adj_vec: "Vector3D") -> float:
+        """calculate the angle between the calling vector and the argument vector
+
+        :param adj_vec: vector adjacent to the calling vector
+        :type adj_vec: Vector3D
+        :return: angle in radians
+        :rtype: float
+        """
+        arg: float = self.dot(adj_vec) / (self.magnitude() * adj_vec.magnitude())
+        return acos(min(1.0, max(-1.0, arg)))
+
+    @staticmethod
+    def rotation_matrix(axis: "Vector3D", theta: float) -> "Matrix3D":
+        """create a matrix used to rotate vectors about an axis
+
+        :param axis: axis of rotation
+        :type axis: Vector3D
+        :param theta: angle of rotation in radians
+        :type theta: float
+        :return: rotation matrix
+        :rtype: Matrix3D
+        """
+        x, y, z = axis.normalized().array
+        c: float = cos(theta)
+        s: float = sin(theta)
+        t: float = 1 - c
+        return Matrix3D.from_array(
+            np.array(
+                (
+                    (t * x * x + c, t * x * y - s * z, t * x * z + s * y),
+                    (t * x * y + s * z, t * y * y + c, t * y * z - s * x),
+                    (t * x * z - s * y, t * y * z + s * x, t * z * z + c),
+                ),
+                dtype=np.float64,
+            )
+        )
+
+    def rotation_about_axis(self, axis: "Vector3D", theta: float) -> "Vector3D":
+        """create a copy of the calling vector rotated about an axis
+
+        :param axis: axis of rotation
+        :type axis: Vector3D
+        :param theta: angle of rotation in radians
+        :type theta: float
+        :return: rotated vector
+        :rtype: Vector3D
+        """
+        return Vector3D.rotation_matrix(axis, theta).multiply_vector(self)
+
+    def iadd_scaled(self, vec: "Vector3D", scalar: float) -> None:
+        """add a scaled copy of the argument vector to the calling vector in place
+
+        Only vectors owned by the caller should be modified, since rows read from a matrix are views of its buffer.
+
+        :param vec: vector to be scaled and added
+        :type vec: Vector3D
+        :param scalar: value used to scale the argument vector
+        :type scalar: float
+        """
+        self.array += vec.array * scalar
+
+    def set_from(self, vec: "Vector3D") -> None:
+        """overwrite the components of the calling vector with those of the argument vector
+
+        :param vec: vector whose components will be copied
+        :type vec: Vector3D
+        """
+        self.array[:] = vec.array
+
+    def __add__(self, vec: "Vector3D") -> "Vector3D":
+        return self.plus(vec)
+
+    def __sub__(self, vec: "Vector3D") -> "Vector3D":
+        return self.minus(vec)
+
+    def __mul__(self, scalar: float) -> "Vector3D":
+        return self.scaled(scalar)
+
+    def __rmul__(self, scalar: float) -> "Vector3D":
+        return self.scaled(scalar)
+
+    def __truediv__(self, scalar: float) -> "Vector3D":
+        return self.scaled(1 / scalar)
+
+    def __neg__(self) -> "Vector3D":
+        return self.scaled(-1)
+
+    def __iadd__(self, vec: "Vector3D") -> "Vector3D":
+        self.iadd_scaled(vec, 1)
+        return self
+
+    def __isub__(self, vec: "Vector3D") -> "Vector3D":
+        self.iadd_scaled(vec, -1)
+        return self
+
+    def __imul__(self, scalar: float) -> "Vector3D":
+        self.array *= scalar
+        return self
+
+
+class _Matrix:
+    """shared behavior of the matrix types whose components are stored in a 2D buffer"""
+
+    __slots__ = ("array",)
+
+    #: 2D buffer holding the matrix components
+    array: np.ndarray
+
+    @classmethod
+    def from_array(cls, values: np.ndarray):
+        """wrap an existing buffer without copying it
+
+        :param values: float64 array with the shape of the matrix
+        :type values: np.ndarray
+        :return: matrix whose components share memory with the argument
+        """
+        mat = cls.__new__(cls)
+        mat.array = values
+        return mat
+
+    def _row(self, i: int):
+        values: np.ndarray = self.array[i]
+        if len(values) == 3:
+            return Vector3D.from_array(values)
+        return Vector6D.from_array(values)
+
+    def _column(self, j: int):
+        values: np.ndarray = self.array[:, j].copy()
+        if len(values) == 3:
+            return Vector3D.from_array(values)
+        return Vector6D.from_array(values)
+
+    @property
+    def row1(self):
+        return self._row(0)
+
+    @property
+    def row2(self):
+        return self._row(1)
+
+    @property
+    def row3(self):
+        return self._row(2)
+
+
+class Matrix3D(_Matrix):
+
+    __slots__ = ()
+
+    def __init__(self, row1: Vector3D, row2: Vector3D, row3: Vector3D) -> None:
+        """used to perform operations on a 3x3 matrix
+
+        :param row1: first row of matrix
+        :type row1: Vector3D
+        :param row2: second row of matrix
+        :type row2: Vector3D
+        :param row3: third row of matrix
+        :type row3: Vector3D
+        """
+        #: contiguous row-major buffer of the components
+        self.array: np.ndarray = np.array([[r.x, r.y, r.z] for r in (row1, row2, row3)], dtype=np.float64)
+
+    def diagonal(self) -> Vector3D:
+        """create a vector from the diagonal of the matrix
+
+        :return: vector of the diagonal elements
+        :rtype: Vector3D
+        """
+        return Vector3D.from_array(self.array.diagonal().copy())
+
+    def column_1(self) -> Vector3D:
+        return self._column(0)
+
+    def column_2(self) -> Vector3D:
+        return self._column(1)
+
+    def column_3(self) -> Vector3D:
+        return self._column(2)
+
+    def multiply_vector(self, vec: Vector3D) -> Vector3D:
+        """performs matrix multiplication of the calling matrix and the argument vector
+
+        :param vec: vector to be used in the multiplication
+        :type vec: Vector3D
+        :return: product of the matrix multiplication
+        :rtype: Vector3D
+        """
+        return Vector3D.from_array(self.array @ vec.array)
+
+    def scaled(self, scalar: float) -> "Matrix3D":
+        """creates a matrix whose elements have been scaled by the argument
+
+        :param scalar: value used to scale the matrix
+        :type scalar: float
+        :return: scaled matrix
+        :rtype: Matrix3D
+        """
+        return Matrix3D.from_array(self.array * scalar)
+
+    def transpose(self) -> "Matrix3D":
+        """create the transpose of the calling matrix
+
+        :return: transposed matrix
+        :rtype: Matrix3D
+        """
+        return Matrix3D.from_array(self.array.T.copy())
+
+    def plus(self, mat: "Matrix3D") -> "Matrix3D":
+        """calculate the sum of the calling matrix and the argument matrix
+
+        :param mat: matrix to be added to the calling matrix
+        :type mat: Matrix3D
+        :return: sum of the two matrices
+        :rtype: Matrix3D
+        """
+        return Matrix3D.from_array(self.array + mat.array)
+
+    def determinant(self) -> float:
+        """calculate the determinant of the calling matrix
+
+        :return: determinant of the matrix
+        :rtype: float
+        """
+        return float(np.linalg.det(self.array))
+
+    def cofactor(self) -> "Matrix3D":
+        """create the cofactor matrix of the calling matrix
+
+        :return: cofactor matrix
+        :rtype: Matrix3D
+        """
+        a: np.ndarray = self.array
+        return Matrix3D.from_array(np.cross(a[[1, 2, 0]], a[[2, 0, 1]]))
+
+    def adjugate(self) -> "Matrix3D":
+        """create the adjugate of the calling matrix
+
+        :return: adjugate matrix
+        :rtype: Matrix3D
+        """
+        return self.cofactor().transpose()
+
+    def inverse(self) -> "Matrix3D":
+        """create a matrix that is the inverse of the calling matrix
+
+        :return: inverse matrix
+        :rtype: Matrix3D
+        """
+        return Matrix3D.from_array(np.linalg.inv(self.array))
+
+    def multiply_matrix3by6(self, mat: "Matrix3by6") -> "Matrix3by6":
+        """performs matrix multiplication of the calling matrix and the argument matrix
+
+        :param mat: matrix to be used in the multiplication
+        :type mat: Matrix3by6
+        :return: product of the matrix multiplication
+        :rtype: Matrix3by6
+        """
+        return Matrix3by6.from_array(self.array @ mat.array)
+
+    def multiply_matrix(self, mat: "Matrix3D") -> "Matrix3D":
+        """create a matrix that is the product of the calling and argument matrices
+
+        :param mat: matrix to be used in the product
+        :type mat: Matrix3D
+        :return: product matrix
+        :rtype: Matrix3D
+        """
+        return Matrix3D.from_array(self.array @ mat.array)
+
+    def __add__(self, mat: "Matrix3D") -> "Matrix3D":
+        return self.plus(mat)
+
+    def __mul__(self, scalar: float) -> "Matrix3D":
+        return self.scaled(scalar)
+
+    def __rmul__(self, scalar: float) -> "Matrix3D":
+        return self.scaled(scalar)
+
+    def __matmul__(self, other: "Vector3D | Matrix3D | Matrix3by6") -> "Vector3D | Matrix3D | Matrix3by6":
+        if isinstance(other, Vector3D):
+            return self.multiply_vector(other)
+        if isinstance(other, Matrix3D):
+            return self.multiply_matrix(other)
+        if isinstance(other, Matrix3by6):
+            return self.multiply_matrix3by6(other)
+        return NotImplemented
+
+
+class Matrix3by6(_Matrix):
+
+    __slots__ = ()
+
+    def __init__(self, row1: Vector6D, row2: Vector6D, row3: Vector6D) -> None:
+        """used to perform operations on a 3x6 matrix
+
+        :param row1: first row of the matrix
+        :type row1: Vector6D
+        :param row2: second row of the matrix
+        :type row2: Vector6D
+        :param row3: third row of the matrix
+        :type row3: Vector6D
+        """
+        #: contiguous row-major buffer of the components
+        self.array: np.ndarray = np.array(
+            [[r.x, r.y, r.z, r.vx, r.vy, r.vz] for r in (row1, row2, row3)], dtype=np.float64
+        )
+
+    def column_1(self) -> Vector3D:
+        return self._column(0)
+
+    def column_2(self) -> Vector3D:
+        return self._column(1)
+
+    def column_3(self) -> Vector3D:
+        return self._column(2)
+
+    def column_4(self) -> Vector3D:
+        return self._column(3)
+
+    def column_5(self) -> Vector3D:
+        return self._column(4)
+
+    def column_6(self) -> Vector3D:
+        return self._column(5)
+
+    def multiply_vector(self, vec: Vector6D) -> Vector3D:
+        """performs matrix multiplication of the calling matrix and the argument vector
+
+        :param vec: vector to be used in the multiplication
+        :type vec: Vector6D
+        :return: product of the matrix multiplication
+        :rtype: Vector3D
+        """
+        return Vector3D.from_array(self.array @ vec.array)
+
+    def transpose(self) -> "Matrix6by3":
+        """create the transpose of the calling matrix
+
+        :return: transposed matrix
+        :rtype: Matrix6by3
+        """
+        return Matrix6by3.from_array(self.array.T.copy())
+
+    def multiply_matrix_6by3(self, mat: "Matrix6by3") -> Matrix3D:
+        """performs matrix multiplication of the calling matrix and the argument matrix
+
+        :param mat: matrix to be used in the multiplication
+        :type mat: Matrix6by3
+        :return: product of the matrix multiplication
+        :rtype: Matrix3D
+        """
+        return Matrix3D.from_array(self.array @ mat.array)
+
+    def __matmul__(self, other: "Vector6D | Matrix6by3") -> "Vector3D | Matrix3D":
+        if isinstance(other, Vector6D):
+            return self.multiply_vector(other)
+        if isinstance(other, Matrix6by3):
+            return self.multiply_matrix_6by3(other)
+        return NotImplemented
+
+
+class Matrix6by3(_Matrix):
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        row1: Vector3D,
+        row2: Vector3D,
+        row3: Vector3D,
+        row4: Vector3D,
+        row5: Vector3D,
+        row6: Vector3D,
+    ) -> None:
+        """used to perform operations on a 6x3 matrix
+
+        :param row1: first row of the matrix
+        :type row1: Vector3D
+        :param row2: second row of the matrix
+        :type row2: Vector3D
+        :param row3: third row of the matrix
+        :type row3: Vector3D
+        :param row4: fourth row of the matrix
+        :type row4: Vector3D
+        :param row5: fifth row of the matrix
+        :type row5: Vector3D
+        :param row6: sixth row of the matrix
+        :type row6: Vector3D
+        """
+        #: contiguous row-major buffer of the components
+        self.array: np.ndarray = np.array(
+            [[r.x, r.y, r.z] for r in (row1, row2, row3, row4, row5, row6)], dtype=np.float64
+        )
+
+    @property
+    def row4(self) -> Vector3D:
+        return self._row(3)
+
+    @property
+    def row5(self) -> Vector3D:
+        return self._row(4)
+
+    @property
+    def row6(self) -> Vector3D:
+        return self._row(5)
+
+    def column_1(self) -> Vector6D:
+        return self._column(0)
+
+    def column_2(self) -> Vector6D:
+        return self._column(1)
+
+    def column_3(self) -> Vector6D:
+        return self._column(2)
+
+    def transpose(self) -> Matrix3by6:
+        """create the transpose of the calling matrix
+
+        :return: transposed matrix
+        :rtype: Matrix3by6
+        """
+        return Matrix3by6.from_array(self.array.T.copy())
+
+    def multiply(self, mat: Matrix3D) -> "Matrix6by3":
+        """performs matrix multiplication of the calling matrix and the argument matrix
+
+        :param mat: matrix to be used in the multiplication
+        :type mat: Matrix3D
+        :return: product of the matrix multiplication
+        :rtype: Matrix6by3
+        """
+        return Matrix6by3.from_array(self.array @ mat.array)
+
+    def multiply_vector(self, vec: Vector3D) -> Vector6D:
+        """performs matrix multiplication of the calling matrix and the argument vector
+
+        :param vec: vector to be used in the multiplication
+        :type vec: Vector3D
+        :return: product of the matrix multiplication
+        :rtype: Vector6D
+        """
+        return Vector6D.from_array(self.array @ vec.array)
+
+    def multiply_matrix3by6(self, mat: Matrix3by6) -> "Matrix6D":
+        """performs matrix multiplication of the calling matrix and the argument matrix
+
+        :param mat: matrix to be used in the multiplication
+        :type mat: Matrix3by6
+        :return: product of the matrix multiplication
+        :rtype: Matrix6D
+        """
+        return Matrix6D.from_array(self.array @ mat.array)
+
+    def __matmul__(self, other: "Vector3D | Matrix3D | Matrix3by6") -> "Vector6D | Matrix6by3 | Matrix6D":
+        if isinstance(other, Vector3D):
+            return self.multiply_vector(other)
+        if isinstance(other, Matrix3D):
+            return self.multiply(other)
+        if isinstance(other, Matrix3by6):
+            return self.multiply_matrix3by6(other)
+        return NotImplemented
+
+
+class Matrix6D(_Matrix):
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        r1: Vector6D,
+        r2: Vector6D,
+        r3: Vector6D,
+        r4: Vector6D,
+        r5: Vector6D,
+        r6: Vector6D,
+    ) -> None:
+        """used to perform operations for a 6x6 matrix
+
+        :param r1: first row of the matrix
+        :type r1: Vector6D
+        :param r2: second row of the matrix
+        :type r2: Vector6D
+        :param r3: third row of the matrix
+        :type r3: Vector6D
+        :param r4: fourth row of the matrix
+        :type r4: Vector6D
+        :param r5: fifth row of the matrix
+        :type r5: Vector6D
+        :param r6: sixth row of the matrix
+        :type r6: Vector6D
+        """
+        #: contiguous row-major buffer of the components
+        self.array: np.ndarray = np.array(
+            [[r.x, r.y, r.z, r.vx, r.vy, r.vz] for r in (r1, r2, r3, r4, r5, r6)], dtype=np.float64
+        )
+
+    @classmethod
+    def identity(cls) -> "Matrix6D":
+        """create a 6x6 identity matrix
+
+        :return: matrix with ones on the diagonal
+        :rtype: Matrix6D
+        """
+        return cls.from_array(np.eye(6))
+
+    @property
+    def row4(self) -> Vector6D:
+        return self._row(3)
+
+    @property
+    def row5(self) -> Vector6D:
+        return self._row(4)
+
+    @property
+    def row6(self) -> Vector6D:
+        return self._row(5)
+
+    def diagonal(self) -> Vector6D:
+        """create a vector from the diagonal of the matrix
+
+        :return: vector of the diagonal elements
+        :rtype: Vector6D
+        """
+        return Vector6D.from_array(self.array.diagonal().copy())
+
+    def multiply_vector(self, vec: Vector6D) -> Vector6D:
+        """performs matrix multiplication of the calling matrix and the argument vector
+
+        :param vec: vector to be used in the multiplication
+        :type vec: Vector6D
+        :return: product of the matrix multiplication
+        :rtype: Vector6D
+        """
+        return Vector6D.from_array(self.array @ vec.array)
+
+    def column_1(self) -> Vector6D:
+        return self._column(0)
+
+    def column_2(self) -> Vector6D:
+        return self._column(1)
+
+    def column_3(self) -> Vector6D:
+        return self._column(2)
+
+    def column_4(self) -> Vector6D:
+        return self._column(3)
+
+    def column_5(self) -> Vector6D:
+        return self._column(4)
+
+    def column_6(self) -> Vector6D:
+        return self._column(5)
+
+    def transpose(self) -> "Matrix6D":
+        """create the transpose of the calling matrix
+
+        :return: transposed matrix
+        :rtype: Matrix6D
+        """
+        return Matrix6D.from_array(self.array.T.copy())
+
+    def multiply_matrix_6by3(self, mat: Matrix6by3) -> Matrix6by3:
+        """performs matrix multiplication of the calling matrix and the argument matrix
+
+        :param mat: matrix to be used in the multiplication
+        :type mat: Matrix6by3
+        :return: product of the matrix multiplication
+        :rtype: Matrix6by3
+        """
+        return Matrix6by3.from_array(self.array @ mat.array)
+
+    def multiply_matrix(self, mat: "Matrix6D") -> "Matrix6D":
+        """performs matrix multiplication of the calling matrix and the argument matrix
+
+        :param mat: matrix to be used in the multiplication
+        :type mat: Matrix6D
+        :return: product of the matrix multiplication
+        :rtype: Matrix6D
+        """
+        return Matrix6D.from_array(self.array @ mat.array)
+
+    def plus(self, mat: "Matrix6D") -> "Matrix6D":
+        """calculate the sum of the calling matrix and the argument matrix
+
+        :param mat: matrix to be added to the calling matrix
+        :type mat: Matrix6D
+        :return: sum of the two matrices
+        :rtype: Matrix6D
+        """
+        return Matrix6D.from_array(self.array + mat.array)
+
+    def minus(self, mat: "Matrix6D") -> "Matrix6D":
+        """calculate the difference of the calling matrix and the argument matrix
+
+        :param mat: matrix to be subtracted from the calling matrix
+        :type mat: Matrix6D
+        :return: difference of the two matrices
+        :rtype: Matrix6D
+        """
+        return Matrix6D.from_array(self.array - mat.array)
+
+    def __add__(self, mat: "Matrix6D") -> "Matrix6D":
+        return self.plus(mat)
+
+    def __sub__(self, mat: "Matrix6D") -> "Matrix6D":
+        return self.minus(mat)
+
+    def __matmul__(self, other: "Vector6D | Matrix6D | Matrix6by3") -> "Vector6D | Matrix6D | Matrix6by3":
+        if isinstance(other, Vector6D):
+            return self.multiply_vector(other)
+        if isinstance(other, Matrix6D):
+            return self.multiply_matrix(other)
+        if isinstance(other, Matrix6by3):
+            return self.multiply_matrix_6by3(other)
+        return NotImplemented
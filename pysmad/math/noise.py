@@ -0,0 +1,25 @@
+from hashlib import sha256
+from random import Random
+
+
+class NoiseGenerator(Random):
+    """class used to draw reproducible measurement noise independent of the global random module
+
+    The generator adds no sampling of its own, so it can be passed anywhere a :class:`random.Random` is accepted and
+    draws at the speed of the standard library.
+    """
+
+    @classmethod
+    def from_keys(cls, *keys: object) -> "NoiseGenerator":
+        """create a generator whose seed is derived from a sequence of keys such as a base seed, id, and trial number
+
+        The seed is a hash of the keys so it does not depend on the interpreter's string hashing or on the order in
+        which generators are created.
+
+        :param keys: values that together identify the noise stream
+        :type keys: object
+        :return: generator seeded from the keys
+        :rtype: NoiseGenerator
+        """
+        digest: bytes = sha256("/".join(str(key) for key in keys).encode()).digest()
+        return cls(int.from_bytes(digest[:8], "big"))
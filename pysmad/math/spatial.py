@@ -0,0 +1,195 @@
+from array import array
+from math import asin, atan2, ceil, cos, floor, pi, radians, sin, sqrt
+from typing import Dict, List, Tuple
+
+from pysmad.math.linalg import Vector3D
+
+
+class KDTree:
+
+    #: Number of coordinates of each point
+    DIMENSIONS: int = 3
+
+    def __init__(self, points: List[Vector3D]) -> None:
+        """class used to find the points within a distance of a query point in logarithmic time
+
+        The tree is implicit: the point indices are reordered so the median of every sub-range along the axis of its
+        depth sits in the middle of the range, so no node objects are created.
+
+        :param points: points to be indexed
+        :type points: List[Vector3D]
+        """
+        #: flat buffer of the x, y, z coordinates of every point in the original order
+        self.coordinates: array = array("d")
+        for point in points:
+            self.coordinates.extend((point.x, point.y, point.z))
+
+        #: point indices ordered so that each range median splits its sub-ranges
+        self.order: List[int] = list(range(len(points)))
+
+        self.build(0, len(points), 0)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def build(self, lo: int, hi: int, depth: int) -> None:
+        """arrange a range of point indices around its median along the axis of the depth
+
+        :param lo: first index of the range
+        :type lo: int
+        :param hi: index one past the end of the range
+        :type hi: int
+        :param depth: depth of the range in the tree
+        :type depth: int
+        """
+        if hi - lo <= 1:
+            return
+        axis: int = depth % KDTree.DIMENSIONS
+        c: array = self.coordinates
+        self.order[lo:hi] = sorted(self.order[lo:hi], key=lambda i: c[i * KDTree.DIMENSIONS + axis])
+        mid: int = (lo + hi) // 2
+        self.build(lo, mid, depth + 1)
+        self.build(mid + 1, hi, depth + 1)
+
+    def query_radius(self, point: Vector3D, radius: float) -> List[int]:
+        """find every point within a distance of the argument point
+
+        :param point: center of the search
+        :type point: Vector3D
+        :param radius: largest distance from the center
+        :type radius: float
+        :return: indices of the points in the original order
+        :rtype: List[int]
+        """
+        found: List[int] = []
+        target: Tuple[float, float, float] = (point.x, point.y, point.z)
+        c: array = self.coordinates
+        r2: float = radius * radius
+        stack: List[Tuple[int, int, int]] = [(0, len(self.order), 0)]
+        while stack:
+            lo, hi, depth = stack.pop()
+            if lo >= hi:
+                continue
+            mid: int = (lo + hi) // 2
+            index: int = self.order[mid]
+            start: int = index * KDTree.DIMENSIONS
+            dx: float = c[start] - target[0]
+            dy: float = c[start + 1] - target[1]
+            dz: float = c[start + 2] - target[2]
+            if dx * dx + dy * dy + dz * dz <= r2:
+                found.append(index)
+            axis: int = depth % KDTree.DIMENSIONS
+            split: float = c[start + axis] - target[axis]
+            if split >= -radius:
+                stack.append((lo, mid, depth + 1))
+            if split <= radius:
+                stack.append((mid + 1, hi, depth + 1))
+        return found
+
+
+class SphereGrid:
+
+    #: Default size of the cells in radians
+    DEFAULT_CELL_SIZE: float = radians(1)
+
+    def __init__(self, directions: List[Vector3D], cell_size: float = DEFAULT_CELL_SIZE) -> None:
+        """class used to find the directions within an angle of a query direction by binning them on the unit sphere
+
+        Cells are bands of equal declination split into right ascension bins whose count shrinks toward the poles, so
+        every cell spans roughly the same angle.
+
+        :param directions: directions to be indexed (they do not need to be unit vectors)
+        :type directions: List[Vector3D]
+        :param cell_size: angular size of the cells in radians, defaults to DEFAULT_CELL_SIZE
+        :type cell_size: float, optional
+        """
+        #: angular size of the cells in radians
+        self.cell_size: float = cell_size
+
+        #: number of declination bands
+        self.bands: int = ceil(pi / cell_size)
+
+        #: unit vectors of the indexed directions
+        self.units: List[Vector3D] = [direction.normalized() for direction in directions]
+
+        #: indices of the directions in each occupied (band, bin) cell
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        for i, unit in enumerate(self.units):
+            self.cells.setdefault(self.cell(unit), []).append(i)
+
+    def bins(self, band: int) -> int:
+        """calculate the number of right ascension bins in a declination band
+
+        :param band: index of the band starting at the south pole
+        :type band: int
+        :return: number of bins
+        :rtype: int
+        """
+        low: float = -pi / 2 + band * self.cell_size
+        high: float = low + self.cell_size
+        widest: float = 1.0 if low < 0 < high else max(cos(low), cos(min(high, pi / 2)))
+        return max(1, ceil(2 * pi * widest / self.cell_size))
+
+    def cell(self, unit: Vector3D) -> Tuple[int, int]:
+        """find the cell that contains a unit vector
+
+        :param unit: direction of interest
+        :type unit: Vector3D
+        :return: band and bin of the cell
+        :rtype: Tuple[int, int]
+        """
+        dec: float = asin(max(-1.0, min(1.0, unit.z)))
+        band: int = min(self.bands - 1, int((dec + pi / 2) / self.cell_size))
+        bins: int = self.bins(band)
+        ra: float = atan2(unit.y, unit.x) % (2 * pi)
+        return band, min(bins - 1, int(ra / (2 * pi) * bins))
+
+    def query_angle(self, direction: Vector3D, radius: float) -> List[Tuple[int, float]]:
+        """find every direction within an angle of the argument direction
+
+        :param direction: center of the search
+        :type direction: Vector3D
+        :param radius: largest angle from the center in radians
+        :type radius: float
+        :return: index and angle of each matching direction
+        :rtype: List[Tuple[int, float]]
+        """
+        unit: Vector3D = direction.normalized()
+        dec: float = asin(max(-1.0, min(1.0, unit.z)))
+        ra: float = atan2(unit.y, unit.x) % (2 * pi)
+        first: int = max(0, floor((dec - radius + pi / 2) / self.cell_size))
+        last: int = min(self.bands - 1, floor((dec + radius + pi / 2) / self.cell_size))
+        limit: float = cos(radius)
+
+        # half-width in right ascension of the search cap which is unbounded when the cap reaches a pole
+        span: float | None = None
+        if abs(dec) + radius < pi / 2:
+            span = asin(sin(radius) / cos(dec))
+
+        found: List[Tuple[int, float]] = []
+        for band in range(first, last + 1):
+            bins: int = self.bins(band)
+            columns: range = range(bins)
+            if span is not None:
+                width: float = 2 * pi / bins
+                lo: int = floor((ra - span) / width)
+                hi: int = floor((ra + span) / width)
+                if hi - lo + 1 < bins:
+                    columns = range(lo, hi + 1)
+            for column in columns:
+                for i in self.cells.get((band, column % bins), ()):
+                    cosine: float = unit.dot(self.units[i])
+                    if cosine >= limit:
+                        found.append((i, acos_clamped(cosine)))
+        return found
+
+
+def acos_clamped(cosine: float) -> float:
+    """calculate the arccosine of a value that may fall slightly outside [-1, 1] from rounding
+
+    :param cosine: cosine of the angle
+    :type cosine: float
+    :return: angle in radians
+    :rtype: float
+    """
+    return atan2(sqrt(max(0.0, 1 - cosine * cosine)), cosine)
@@ -1,6 +1,16 @@
-from math import sqrt
+from bisect import insort
+from math import exp, sqrt
+from typing import List
 
-from pysmad.bodies import Earth
+from pysmad.bodies import Earth, Satellite
+from pysmad.constants import DAYS_TO_SECONDS, SEA_LEVEL_G
+from pysmad.coordinates.states import HCW
+from pysmad.math.linalg import Matrix3D, Vector3D
+from pysmad.propagators.inertial import RK4
+from pysmad.time import Epoch
+
+#: tolerance in days used to decide whether a burn has already started or finished
+EPSILON: float = 1e-9
 
 
 class VisViva:
@@ -62,3 +72,200 @@ class Hohmann:
 
         #: magnitude of the second burn in km/s
         self.delta_v_2: float = self.final_velocity - self.transfer_velocity_2
+
+
+class ImpulsiveBurn:
+    def __init__(self, epoch: Epoch, ric_dv: Vector3D) -> None:
+        """class used to schedule an instant velocity change
+
+        :param epoch: time of the burn
+        :type epoch: Epoch
+        :param ric_dv: burn with components of radial, in-track, and cross-track (km/s)
+        :type ric_dv: Vector3D
+        """
+        #: time of the burn
+        self.epoch: Epoch = epoch.copy()
+
+        #: burn with components of radial, in-track, and cross-track (km/s)
+        self.ric_dv: Vector3D = ric_dv.copy()
+
+    def __lt__(self, other: "ImpulsiveBurn") -> bool:
+        return self.epoch.utc < other.epoch.utc
+
+    def duration(self, mass: float, m_dot: float, isp: float) -> float:
+        """calculate the time needed to perform the burn
+
+        :param mass: wet mass at the start of the burn in kg
+        :type mass: float
+        :param m_dot: mass flow rate in kg/s
+        :type m_dot: float
+        :param isp: specific impulse in seconds
+        :type isp: float
+        :return: burn duration in seconds
+        :rtype: float
+        """
+        return 0
+
+    def final_mass(self, mass: float, isp: float) -> float:
+        """calculate the mass remaining after the burn with the rocket equation
+
+        :param mass: wet mass at the start of the burn in kg
+        :type mass: float
+        :param isp: specific impulse in seconds
+        :type isp: float
+        :return: wet mass at the end of the burn in kg
+        :rtype: float
+        """
+        return mass * exp(-self.ric_dv.magnitude() / (isp * SEA_LEVEL_G))
+
+
+class FiniteBurn(ImpulsiveBurn):
+    def __init__(self, epoch: Epoch, ric_dv: Vector3D) -> None:
+        """class used to schedule a constant-thrust burn that holds an inertial direction
+
+        The direction is fixed by the RIC frame at the start of the burn and the burn lasts as long as it takes the
+        thruster to deliver the requested velocity change.
+
+        :param epoch: start of the burn
+        :type epoch: Epoch
+        :param ric_dv: velocity change with components of radial, in-track, and cross-track (km/s)
+        :type ric_dv: Vector3D
+        """
+        super().__init__(epoch, ric_dv)
+
+    def duration(self, mass: float, m_dot: float, isp: float) -> float:
+        return (mass - self.final_mass(mass, isp)) / m_dot
+
+
+class ManeuverPlan:
+    def __init__(self, mass: float, m_dot: float, isp: float) -> None:
+        """class used to hold a timeline of burns that can be executed by a propagator in one pass
+
+        :param mass: wet mass at the start of the plan in kg
+        :type mass: float
+        :param m_dot: mass flow rate of the thruster in kg/s
+        :type m_dot: float
+        :param isp: specific impulse of the propellant in seconds
+        :type isp: float
+        """
+        #: wet mass at the start of the plan in kg
+        self.mass: float = mass
+
+        #: mass flow rate of the thruster in kg/s
+        self.m_dot: float = m_dot
+
+        #: specific impulse of the propellant in seconds
+        self.isp: float = isp
+
+        #: burns ordered by start time
+        self.burns: List[ImpulsiveBurn] = []
+
+    @classmethod
+    def from_satellite(cls, sat: Satellite) -> "ManeuverPlan":
+        """create an empty plan with the mass and propulsion properties of a satellite
+
+        :param sat: satellite that will perform the plan
+        :type sat: Satellite
+        :return: plan without any burns
+        :rtype: ManeuverPlan
+        """
+        return cls(sat.total_mass(), sat.m_dot, sat.isp)
+
+    def add(self, burn: ImpulsiveBurn) -> None:
+        """insert a burn into the timeline
+
+        :param burn: impulsive or finite burn to be performed
+        :type burn: ImpulsiveBurn
+        """
+        insort(self.burns, burn)
+
+    def masses(self) -> List[float]:
+        """calculate the wet mass at the start of every burn
+
+        :return: mass in kg ordered like the burns
+        :rtype: List[float]
+        """
+        masses: List[float] = []
+        mass: float = self.mass
+        stop: float = float("-inf")
+        for burn in self.burns:
+            if burn.epoch.utc < stop - EPSILON:
+                raise ValueError("burn at " + str(burn.epoch.utc) + " starts before the previous burn finishes")
+            masses.append(mass)
+            stop = burn.epoch.utc + burn.duration(mass, self.m_dot, self.isp) / DAYS_TO_SECONDS
+            mass = burn.final_mass(mass, self.isp)
+        return masses
+
+    def mass_at(self, epoch: Epoch) -> float:
+        """calculate the wet mass at any time in the plan
+
+        Impulsive burns deplete their propellant as soon as the epoch is past the burn while finite burns deplete it
+        linearly at the mass flow rate.
+
+        :param epoch: time of interest
+        :type epoch: Epoch
+        :return: mass in kg
+        :rtype: float
+        """
+        mass: float = self.mass
+        for burn, start_mass in zip(self.burns, self.masses()):
+            elapsed: float = (epoch.utc - burn.epoch.utc) * DAYS_TO_SECONDS
+            if elapsed <= 0:
+                break
+            mass = burn.final_mass(start_mass, self.isp)
+            if isinstance(burn, FiniteBurn):
+                mass = max(mass, start_mass - self.m_dot * elapsed)
+        return mass
+
+    def total_dv(self) -> float:
+        """calculate the sum of the burn magnitudes
+
+        :return: velocity change in km/s
+        :rtype: float
+        """
+        return sum(burn.ric_dv.magnitude() for burn in self.burns)
+
+    def execute(self, propagator: RK4, epoch: Epoch) -> None:
+        """advance a propagator to an epoch while performing every burn of the plan that occurs along the way
+
+        Integration steps are split at the start and stop of each burn so thrust never begins or ends mid-step, and
+        the mass is depleted analytically from the rocket equation.  The propagator is updated in place, so a burn
+        still in progress at the requested epoch resumes on the next call.  Impulsive burns are applied when the
+        propagator moves past their epoch, so a state reported at a burn epoch is the state before the burn.
+
+        :param propagator: numerical propagator to be advanced
+        :type propagator: RK4
+        :param epoch: time of state to be calculated
+        :type epoch: Epoch
+        """
+        for burn, mass in zip(self.burns, self.masses()):
+            start: float = burn.epoch.utc
+            if start > epoch.utc - EPSILON:
+                break
+            now: float = propagator.state.epoch.utc
+            duration: float = burn.duration(mass, self.m_dot, self.isp)
+            stop: float = start + duration / DAYS_TO_SECONDS
+
+            if start < now - EPSILON:
+                # only a finite burn that was interrupted by the previous call needs more attention
+                if propagator.m_dot == 0 or stop < now + EPSILON:
+                    continue
+            else:
+                propagator.step_to_epoch(burn.epoch)
+                frame: Matrix3D = HCW.frame_matrix(propagator.state).transpose()
+                gcrf_dv: Vector3D = frame.multiply_vector(burn.ric_dv)
+                if duration == 0:
+                    propagator.state.velocity = propagator.state.velocity.plus(gcrf_dv)
+                    continue
+                propagator.thrust_direction = gcrf_dv.normalized()
+                propagator.m0 = mass
+                propagator.m_dot = self.m_dot
+                propagator.isp = self.isp
+
+            if stop > epoch.utc:
+                break
+            propagator.step_to_epoch(Epoch(stop))
+            propagator.m0 = 0
+            propagator.m_dot = 0
+
+        propagator.step_to_epoch(epoch)
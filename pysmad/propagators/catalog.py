@@ -0,0 +1,305 @@
+from array import array
+from math import ceil
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from os import cpu_count
+from typing import List, Tuple
+
+from pysmad.bodies import Earth
+from pysmad.coordinates.elements import ClassicalElements
+from pysmad.coordinates.states import GCRF
+from pysmad.eop import EOPData, EOPRecord
+from pysmad.math.linalg import Vector3D
+from pysmad.propagators.inertial import RK4, Kepler
+from pysmad.propagators.secular import SecularJ2
+from pysmad.propagators.sgp4 import SGP4, TwoLineElements
+from pysmad.time import Epoch
+
+#: number of floats stored for each ephemeris point (x, y, z, vx, vy, vz)
+STATE_WIDTH: int = 6
+
+#: number of bytes in a stored float
+FLOAT_SIZE: int = array("d").itemsize
+
+#: shared memory block the worker writes to (set once by the pool initializer)
+_worker_memory: SharedMemory | None = None
+
+#: float view of the worker's shared memory block
+_worker_view: "memoryview[float] | None" = None
+
+#: utc epochs of the output grid in the worker
+_worker_grid: List[float] = []
+
+
+class CatalogEphemeris:
+    def __init__(self, epochs: List[Epoch], values: array, count: int) -> None:
+        """class used to access the states produced by a catalog propagation
+
+        :param epochs: output times shared by every object in the catalog
+        :type epochs: List[Epoch]
+        :param values: flat buffer ordered by object, then epoch, then x, y, z, vx, vy, vz
+        :type values: array
+        :param count: number of objects stored in the buffer
+        :type count: int
+        """
+        #: output times shared by every object in the catalog
+        self.epochs: List[Epoch] = [epoch.copy() for epoch in epochs]
+
+        #: flat buffer ordered by object, then epoch, then x, y, z, vx, vy, vz (km and km/s)
+        self.values: array = values
+
+        #: number of objects stored in the buffer
+        self.count: int = count
+
+    @classmethod
+    def from_two_body(cls, states: List[GCRF], epochs: List[Epoch]) -> "CatalogEphemeris":
+        """solve the ephemerides of a catalog analytically while ignoring every perturbation
+
+        :param states: initial states of the catalog objects
+        :type states: List[GCRF]
+        :param epochs: output times
+        :type epochs: List[Epoch]
+        :return: two-body ephemerides of every object at every epoch
+        :rtype: CatalogEphemeris
+        """
+        return cls(epochs, Kepler.solve_grid(states, epochs), len(states))
+
+    @classmethod
+    def from_mean_elements(
+        cls, elements: List[ClassicalElements], epochs: List[Epoch], use_j3: bool = False
+    ) -> "CatalogEphemeris":
+        """solve the ephemerides of a catalog analytically from mean elements with the secular J2 theory
+
+        :param elements: mean elements of the catalog objects
+        :type elements: List[ClassicalElements]
+        :param epochs: output times
+        :type epochs: List[Epoch]
+        :param use_j3: flag to include the long-period motion caused by J3, defaults to False
+        :type use_j3: bool, optional
+        :return: osculating ephemerides of every object at every epoch
+        :rtype: CatalogEphemeris
+        """
+        return cls(epochs, SecularJ2.propagate_grid(elements, epochs, use_j3), len(elements))
+
+    @classmethod
+    def from_tles(cls, tles: List[TwoLineElements], epochs: List[Epoch]) -> "CatalogEphemeris":
+        """solve the ephemerides of a catalog of two-line element sets with SGP4/SDP4
+
+        :param tles: element sets of the catalog objects
+        :type tles: List[TwoLineElements]
+        :param epochs: output times
+        :type epochs: List[Epoch]
+        :return: GCRF ephemerides of every object at every epoch (nan where the theory fails)
+        :rtype: CatalogEphemeris
+        """
+        return cls(epochs, SGP4.propagate_grid(tles, epochs), len(tles))
+
+    def offset(self, object_index: int, epoch_index: int) -> int:
+        """calculate the location of a state in the flat buffer
+
+        :param object_index: position of the object in the propagated list
+        :type object_index: int
+        :param epoch_index: position of the epoch in the output grid
+        :type epoch_index: int
+        :return: index of the x component of the state
+        :rtype: int
+        """
+        return (object_index * len(self.epochs) + epoch_index) * STATE_WIDTH
+
+    def state(self, object_index: int, epoch_index: int) -> GCRF:
+        """create the inertial state of an object at one of the grid epochs
+
+        :param object_index: position of the object in the propagated list
+        :type object_index: int
+        :param epoch_index: position of the epoch in the output grid
+        :type epoch_index: int
+        :return: state of the object at the requested epoch
+        :rtype: GCRF
+        """
+        i: int = self.offset(object_index, epoch_index)
+        v: array = self.values
+        return GCRF(
+            self.epochs[epoch_index],
+            Vector3D(v[i], v[i + 1], v[i + 2]),
+            Vector3D(v[i + 3], v[i + 4], v[i + 5]),
+        )
+
+    def states(self, object_index: int) -> List[GCRF]:
+        """create the inertial states of an object at every grid epoch
+
+        :param object_index: position of the object in the propagated list
+        :type object_index: int
+        :return: states of the object ordered by epoch
+        :rtype: List[GCRF]
+        """
+        return [self.state(object_index, j) for j in range(len(self.epochs))]
+
+
+def _buffer(memory: SharedMemory) -> memoryview:
+    """retrieve the byte buffer of an open shared memory block
+
+    :param memory: block attached to this process
+    :type memory: SharedMemory
+    :return: bytes of the block
+    :rtype: memoryview
+    """
+    if memory.buf is None:
+        raise ValueError(f"shared memory block {memory.name} is closed")
+    return memory.buf
+
+
+def _initialize_worker(
+    memory_name: str,
+    grid: List[float],
+    eop_records: dict[int | float, EOPRecord] | None,
+    c: list[list[float]],
+    s: list[list[float]],
+    degree_and_order: int,
+) -> None:
+    """attach a pool worker to the output block and install the parent's earth model
+
+    :param memory_name: name of the shared memory block holding the ephemerides
+    :type memory_name: str
+    :param grid: utc epochs of the output grid
+    :type grid: List[float]
+    :param eop_records: records parsed by the parent or None if the worker inherited them
+    :type eop_records: dict[int | float, EOPRecord] | None
+    :param c: normalized c coefficients used for geopotential calculation
+    :type c: list[list[float]]
+    :param s: normalized s coefficients used for geopotential calculation
+    :type s: list[list[float]]
+    :param degree_and_order: the number of zonal and tesseral terms used in the gravity calculation
+    :type degree_and_order: int
+    """
+    global _worker_memory, _worker_view, _worker_grid
+
+    if eop_records is not None:
+        EOPData.set_records(eop_records)
+    Earth.C = c
+    Earth.S = s
+    Earth.DEGREE_AND_ORDER = degree_and_order
+
+    memory: SharedMemory = SharedMemory(name=memory_name)
+    _worker_memory = memory
+    _worker_view = _buffer(memory).cast("d")
+    _worker_grid = grid
+
+
+def _propagate_shard(shard: Tuple[int, List[Tuple[float, ...]]]) -> int:
+    """propagate a contiguous group of objects and write their ephemerides to shared memory
+
+    :param shard: index of the first object and the packed initial states of the group
+    :type shard: Tuple[int, List[Tuple[float, ...]]]
+    :return: number of objects written
+    :rtype: int
+    """
+    first, packed = shard
+    view: "memoryview[float] | None" = _worker_view
+    if view is None:
+        raise ValueError("worker was not attached to a shared memory block")
+    width: int = len(_worker_grid) * STATE_WIDTH
+
+    for n, (utc, x, y, z, vx, vy, vz, srp_scalar, use_perturbations) in enumerate(packed):
+        state = GCRF(Epoch(utc), Vector3D(x, y, z), Vector3D(vx, vy, vz))
+        state.srp_scalar = srp_scalar
+        state.use_perturbations = bool(use_perturbations)
+        propagator = RK4(state)
+
+        i: int = (first + n) * width
+        for grid_utc in _worker_grid:
+            propagator.step_to_epoch(Epoch(grid_utc))
+            r: Vector3D = propagator.state.position
+            v: Vector3D = propagator.state.velocity
+            j: int = i + STATE_WIDTH
+            view[i:j] = array("d", (r.x, r.y, r.z, v.x, v.y, v.z))
+            i = j
+
+    return len(packed)
+
+
+def propagate_catalog(
+    states: List[GCRF],
+    epochs: List[Epoch],
+    workers: int | None = None,
+    shard_size: int | None = None,
+    chunk_size: int = 1,
+    start_method: str | None = None,
+) -> CatalogEphemeris:
+    """propagate many inertial states to a common time grid across a process pool
+
+    Each worker is initialized once with the parent's EOP records and gravity coefficients and writes its
+    ephemerides straight into a shared memory block, so only the packed initial states and a count travel
+    through the pool's pipes.
+
+    :param states: initial states of the catalog objects
+    :type states: List[GCRF]
+    :param epochs: output times in ascending order
+    :type epochs: List[Epoch]
+    :param workers: number of processes in the pool, defaults to the cpu count
+    :type workers: int | None, optional
+    :param shard_size: number of objects handed to a worker per task, defaults to an even split of four shards per
+        worker
+    :type shard_size: int | None, optional
+    :param chunk_size: number of shards sent to a worker in one dispatch, defaults to 1
+    :type chunk_size: int, optional
+    :param start_method: multiprocessing start method ("fork", "spawn", "forkserver"), defaults to the platform
+    :type start_method: str | None, optional
+    :return: ephemerides of every object at every epoch
+    :rtype: CatalogEphemeris
+    """
+    count: int = len(states)
+    grid: List[float] = [epoch.utc for epoch in epochs]
+    size: int = count * len(grid) * STATE_WIDTH
+
+    if workers is None:
+        workers = cpu_count() or 1
+    workers = max(1, min(workers, count))
+    if shard_size is None:
+        shard_size = max(1, ceil(count / (workers * 4)))
+
+    packed: List[Tuple[float, ...]] = [
+        (
+            state.epoch.utc,
+            state.position.x,
+            state.position.y,
+            state.position.z,
+            state.velocity.x,
+            state.velocity.y,
+            state.velocity.z,
+            state.srp_scalar,
+            state.use_perturbations,
+        )
+        for state in states
+    ]
+    shards: List[Tuple[int, List[Tuple[float, ...]]]] = []
+    for first in range(0, count, shard_size):
+        last: int = first + shard_size
+        shards.append((first, packed[first:last]))
+
+    values: array = array("d")
+    if size == 0:
+        return CatalogEphemeris(epochs, values, count)
+
+    context = get_context(start_method)
+
+    # EOP records are parsed lazily, so load them before the pool starts; forked workers then inherit the parsed
+    # records and they are only shipped to fresh interpreters
+    eop_records: dict[int | float, EOPRecord] | None = EOPData.get_records()
+    if context.get_start_method() == "fork":
+        eop_records = None
+
+    memory: SharedMemory = SharedMemory(create=True, size=size * FLOAT_SIZE)
+    try:
+        with context.Pool(
+            workers,
+            _initialize_worker,
+            (memory.name, grid, eop_records, Earth.C, Earth.S, Earth.DEGREE_AND_ORDER),
+        ) as pool:
+            for _ in pool.imap_unordered(_propagate_shard, shards, chunk_size):
+                pass
+        values.frombytes(_buffer(memory)[: size * FLOAT_SIZE])
+    finally:
+        memory.close()
+        memory.unlink()
+
+    return CatalogEphemeris(epochs, values, count)
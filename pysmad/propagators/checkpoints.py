@@ -0,0 +1,303 @@
+import os
+from array import array
+from bisect import bisect_left
+from math import floor
+from mmap import ACCESS_READ, mmap
+from typing import List, Sequence
+
+from pysmad.constants import DAYS_TO_SECONDS
+from pysmad.coordinates.states import GCRF
+from pysmad.math.linalg import Vector3D
+from pysmad.propagators.inertial import RK4, Encke, Kepler
+from pysmad.time import Epoch
+
+#: number of floats stored for each checkpoint (x, y, z, vx, vy, vz)
+STATE_WIDTH: int = 6
+
+#: number of bytes in a stored float
+FLOAT_SIZE: int = array("d").itemsize
+
+#: number of bytes in a stored checkpoint
+ROW_SIZE: int = STATE_WIDTH * FLOAT_SIZE
+
+#: tolerance in days (and grid nodes) used to treat two checkpoint epochs as equal
+EPSILON: float = 1e-9
+
+
+class CheckpointStore:
+
+    #: Default number of integration steps between checkpoints
+    DEFAULT_INTERVAL: int = 12
+
+    #: Default number of checkpoints held in memory
+    DEFAULT_CAPACITY: int = 1024
+
+    def __init__(
+        self, interval: int = DEFAULT_INTERVAL, capacity: int = DEFAULT_CAPACITY, spill_path: str | None = None
+    ):
+        """class used to keep states on a regular grid so propagation queries can restart near the requested epoch
+
+        Checkpoints are placed every interval integration steps from the first recorded state.  Once capacity
+        checkpoints are held in memory they are either appended to a memory-mapped spill file or, when no file is
+        given, every other checkpoint is discarded so the spacing doubles and memory stays bounded.  Spilled rows are
+        located by the offset they were written at, so a file with existing content or one shared by several stores
+        is never misread.
+
+        :param interval: number of integration steps between checkpoints, defaults to DEFAULT_INTERVAL
+        :type interval: int, optional
+        :param capacity: largest number of checkpoints held in memory, defaults to DEFAULT_CAPACITY
+        :type capacity: int, optional
+        :param spill_path: file used to hold checkpoints that no longer fit in memory, defaults to None
+        :type spill_path: str | None, optional
+        """
+        #: number of integration steps between checkpoints
+        self.interval: int = interval
+
+        #: largest number of checkpoints held in memory
+        self.capacity: int = capacity
+
+        #: file used to hold checkpoints that no longer fit in memory
+        self.spill_path: str | None = spill_path
+
+        #: utc epoch of the first checkpoint that anchors the grid
+        self.origin: float | None = None
+
+        #: grid spacing in seconds (doubles every time the store is thinned and 0 until a propagator sets it)
+        self.spacing: float = 0
+
+        #: sorted utc epochs of the stored checkpoints
+        self.epochs: List[float] = []
+
+        #: location of each checkpoint (non-negative values index memory rows and negative values index file rows)
+        self.slots: List[int] = []
+
+        #: flat buffer of the checkpoints held in memory
+        self.values: array = array("d")
+
+        #: number of rows written to the spill file
+        self.spilled: int = 0
+
+        #: size in bytes of the spill file before this store first wrote to it
+        self.spill_start: int | None = None
+
+        #: size in bytes of the spill file after this store last wrote to it
+        self.spill_end: int = 0
+
+        self._map: mmap | None = None
+
+    def __len__(self) -> int:
+        return len(self.epochs)
+
+    def clear(self) -> None:
+        """remove every checkpoint and release the spill file
+
+        The rows of this store are truncated from the spill file unless another writer has appended after them.
+        """
+        self.origin = None
+        self.spacing = 0
+        self.epochs = []
+        self.slots = []
+        self.values = array("d")
+        self.spilled = 0
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self.spill_path is not None and self.spill_start is not None:
+            if os.path.getsize(self.spill_path) == self.spill_end:
+                os.truncate(self.spill_path, self.spill_start)
+        self.spill_start = None
+        self.spill_end = 0
+
+    def record(self, state: GCRF) -> None:
+        """store a state as a checkpoint unless one already exists at the same epoch
+
+        :param state: state to be stored
+        :type state: GCRF
+        """
+        utc: float = state.epoch.utc
+        if self.origin is None:
+            self.origin = utc
+        i: int = bisect_left(self.epochs, utc)
+        if (i < len(self.epochs) and self.epochs[i] - utc < EPSILON) or (i > 0 and utc - self.epochs[i - 1] < EPSILON):
+            return
+        if len(self.values) // STATE_WIDTH >= self.capacity:
+            if self.spill_path is None:
+                self.thin()
+            else:
+                self.spill()
+            i = bisect_left(self.epochs, utc)
+        r: Vector3D = state.position
+        v: Vector3D = state.velocity
+        self.epochs.insert(i, utc)
+        self.slots.insert(i, len(self.values) // STATE_WIDTH)
+        self.values.extend((r.x, r.y, r.z, v.x, v.y, v.z))
+
+    def thin(self) -> None:
+        """discard every other checkpoint so the grid spacing doubles
+
+        Checkpoints recorded before a propagator set the grid spacing are thinned by their order instead.
+        """
+        if self.origin is None:
+            return
+        self.spacing *= 2
+        kept_epochs: List[float] = []
+        kept_slots: List[int] = []
+        values: array = array("d")
+        for i, (utc, slot) in enumerate(zip(self.epochs, self.slots)):
+            if slot >= 0:
+                if self.spacing == 0:
+                    if i % 2:
+                        continue
+                else:
+                    node: float = (utc - self.origin) * DAYS_TO_SECONDS / self.spacing
+                    if abs(node - round(node)) > EPSILON:
+                        continue
+            kept_epochs.append(utc)
+            if slot >= 0:
+                start: int = slot * STATE_WIDTH
+                end: int = start + STATE_WIDTH
+                kept_slots.append(len(values) // STATE_WIDTH)
+                values.extend(self.values[start:end])
+            else:
+                kept_slots.append(slot)
+        self.epochs = kept_epochs
+        self.slots = kept_slots
+        self.values = values
+
+    def spill(self) -> None:
+        """move the checkpoints held in memory to the end of the spill file"""
+        if self.spill_path is None:
+            raise ValueError("no spill file was given to the store")
+        with open(self.spill_path, "ab") as f:
+            size: int = f.tell()
+            if self.spill_start is None:
+                self.spill_start = size
+            # pad existing content to a whole row so every row of this store is indexed by its own offset
+            f.write(bytes(-size % ROW_SIZE))
+            first: int = f.tell() // ROW_SIZE
+            self.values.tofile(f)
+            self.spill_end = f.tell()
+        self.slots = [slot if slot < 0 else -(first + slot) - 1 for slot in self.slots]
+        self.spilled += len(self.values) // STATE_WIDTH
+        self.values = array("d")
+        if self._map is not None:
+            self._map.close()
+        with open(self.spill_path, "rb") as f:
+            self._map = mmap(f.fileno(), 0, access=ACCESS_READ)
+
+    def vector(self, index: int) -> Sequence[float]:
+        """retrieve the position and velocity components of a stored checkpoint
+
+        :param index: position of the checkpoint in the sorted epochs
+        :type index: int
+        :return: x, y, z, vx, vy, vz in km and km/s
+        :rtype: Sequence[float]
+        """
+        slot: int = self.slots[index]
+        if slot >= 0:
+            start: int = slot * STATE_WIDTH
+            end: int = start + STATE_WIDTH
+            return self.values[start:end]
+        if self._map is None:
+            raise ValueError("spilled checkpoints were released")
+        start = (-slot - 1) * ROW_SIZE
+        end = start + ROW_SIZE
+        return memoryview(self._map)[start:end].cast("d")
+
+    def nearest(self, epoch: Epoch) -> int | None:
+        """find the checkpoint closest in time to the argument epoch in either direction
+
+        :param epoch: time of interest
+        :type epoch: Epoch
+        :return: position of the checkpoint in the sorted epochs or None if the store is empty
+        :rtype: int | None
+        """
+        if not self.epochs:
+            return None
+        utc: float = epoch.utc
+        i: int = bisect_left(self.epochs, utc)
+        if i == len(self.epochs):
+            return i - 1
+        if i > 0 and utc - self.epochs[i - 1] <= self.epochs[i] - utc:
+            return i - 1
+        return i
+
+    def state(self, index: int, template: GCRF) -> GCRF:
+        """create a state from a stored checkpoint
+
+        :param index: position of the checkpoint in the sorted epochs
+        :type index: int
+        :param template: state whose force model settings are applied to the checkpoint
+        :type template: GCRF
+        :return: state at the checkpoint epoch
+        :rtype: GCRF
+        """
+        x, y, z, vx, vy, vz = self.vector(index)
+        state: GCRF = GCRF(Epoch(self.epochs[index]), Vector3D(x, y, z), Vector3D(vx, vy, vz))
+        state.match_force_model(template)
+        return state
+
+    @staticmethod
+    def restartable(propagator: RK4 | Encke | Kepler) -> bool:
+        """check that a propagator can be replaced by a new instance at a checkpoint without losing configuration
+
+        :param propagator: propagator to be checked
+        :type propagator: RK4 | Encke | Kepler
+        :return: flag set when the propagator integrates neither a state transition matrix nor a thrust
+        :rtype: bool
+        """
+        if isinstance(propagator, RK4):
+            return propagator.stm is None and propagator.m_dot == 0
+        return True
+
+    def step_to_epoch(self, propagator: RK4 | Encke | Kepler, epoch: Epoch) -> RK4 | Encke | Kepler:
+        """advance a propagator to an epoch starting from whichever of its state or the nearest checkpoint is closer
+
+        States reached on the checkpoint grid along the way are recorded.  Analytic propagators are stepped
+        directly since their cost does not depend on the elapsed time, and propagators that are not restartable are
+        always stepped from their own state.
+
+        :param propagator: propagator to be advanced
+        :type propagator: RK4 | Encke | Kepler
+        :param epoch: time of state to be calculated
+        :type epoch: Epoch
+        :return: propagator at the requested epoch (a new instance of the same type when a checkpoint was used)
+        :rtype: RK4 | Encke | Kepler
+        """
+        if isinstance(propagator, Kepler):
+            propagator.step_to_epoch(epoch)
+            return propagator
+
+        origin: float | None = self.origin
+        if origin is None or self.spacing == 0:
+            self.spacing = self.interval * propagator.MAX_STEP
+        if origin is None:
+            origin = propagator.state.epoch.utc
+            self.record(propagator.state)
+
+        index: int | None = self.nearest(epoch)
+        if (
+            index is not None
+            and self.restartable(propagator)
+            and abs(self.epochs[index] - epoch.utc) < abs(propagator.state.epoch.utc - epoch.utc)
+        ):
+            propagator = type(propagator)(self.state(index, propagator.state))
+
+        # walk the grid nodes between the start and the target so every segment matches the checkpoint spacing
+        days: float = self.spacing / DAYS_TO_SECONDS
+        position: float = (propagator.state.epoch.utc - origin) / days
+        target: float = (epoch.utc - origin) / days
+        if target > position:
+            node: int = floor(position + EPSILON) + 1
+            while node <= target + EPSILON:
+                propagator.step_to_epoch(Epoch(origin + node * days))
+                self.record(propagator.state)
+                node += 1
+        else:
+            node = -floor(-position + EPSILON) - 1
+            while node >= target - EPSILON:
+                propagator.step_to_epoch(Epoch(origin + node * days))
+                self.record(propagator.state)
+                node -= 1
+        propagator.step_to_epoch(epoch)
+        return propagator
@@ -0,0 +1,472 @@
+from math import asin, ceil, copysign, floor
+from typing import Dict, List
+
+from pysmad.bodies import Earth, GroundSite, Satellite, Sun
+from pysmad.constants import DAYS_TO_SECONDS
+from pysmad.coordinates.positions import PositionConvert
+from pysmad.coordinates.states import GCRF
+from pysmad.math.linalg import Vector3D
+from pysmad.propagators.inertial import RK4, Encke, Kepler
+from pysmad.time import Epoch
+
+
+class HermiteSegment:
+    def __init__(self, start: GCRF, end: GCRF) -> None:
+        """class used to interpolate a propagator step with a quintic that matches the position, velocity, and
+        acceleration at both ends
+
+        :param start: state at the beginning of the step
+        :type start: GCRF
+        :param end: state at the end of the step
+        :type end: GCRF
+        """
+        #: state at the beginning of the step
+        self.start: GCRF = start
+
+        #: state at the end of the step
+        self.end: GCRF = end
+
+        #: duration of the step in seconds
+        self.duration: float = (end.epoch.utc - start.epoch.utc) * DAYS_TO_SECONDS
+
+        #: position, velocity, and acceleration at both ends of the step
+        self.nodes: List[Vector3D] = [
+            start.position,
+            start.velocity,
+            start.derivative()[1],
+            end.position,
+            end.velocity,
+            end.derivative()[1],
+        ]
+
+    def state(self, t: float) -> GCRF:
+        """interpolate the state within the step
+
+        :param t: seconds past the start of the step
+        :type t: float
+        :return: interpolated state
+        :rtype: GCRF
+        """
+        h: float = self.duration
+        s: float = t / h
+        s2: float = s * s
+        s3: float = s2 * s
+        s4: float = s3 * s
+        s5: float = s4 * s
+
+        position_weights: List[float] = [
+            1 - 10 * s3 + 15 * s4 - 6 * s5,
+            (s - 6 * s3 + 8 * s4 - 3 * s5) * h,
+            (0.5 * s2 - 1.5 * s3 + 1.5 * s4 - 0.5 * s5) * h * h,
+            10 * s3 - 15 * s4 + 6 * s5,
+            (-4 * s3 + 7 * s4 - 3 * s5) * h,
+            (0.5 * s3 - s4 + 0.5 * s5) * h * h,
+        ]
+        velocity_weights: List[float] = [
+            (-30 * s2 + 60 * s3 - 30 * s4) / h,
+            1 - 18 * s2 + 32 * s3 - 15 * s4,
+            (s - 4.5 * s2 + 6 * s3 - 2.5 * s4) * h,
+            (30 * s2 - 60 * s3 + 30 * s4) / h,
+            -12 * s2 + 28 * s3 - 15 * s4,
+            (1.5 * s2 - 4 * s3 + 2.5 * s4) * h,
+        ]
+
+        position: Vector3D = Vector3D(0, 0, 0)
+        velocity: Vector3D = Vector3D(0, 0, 0)
+        for node, wr, wv in zip(self.nodes, position_weights, velocity_weights):
+            position = position.plus(node.scaled(wr))
+            velocity = velocity.plus(node.scaled(wv))
+
+        state: GCRF = GCRF(self.start.epoch.plus_days(t / DAYS_TO_SECONDS), position, velocity)
+        state.match_force_model(self.start)
+        return state
+
+
+class TargetEphemeris:
+    def __init__(self, target: Satellite, step: float = RK4.MAX_STEP) -> None:
+        """class used to solve the position of another satellite without stepping its propagator
+
+        A private propagator is created from the current state of the target and advanced on a fixed grid of steps in
+        each direction from that state.  Each step is stored as a :class:`HermiteSegment`, so the position at an epoch
+        does not depend on the order in which epochs are requested.
+
+        :param target: satellite whose position is solved
+        :type target: Satellite
+        :param step: duration of each stored step in seconds, defaults to RK4.MAX_STEP
+        :type step: float, optional
+        """
+        #: state of the target when the ephemeris was created
+        self.origin: GCRF = target.current_state()
+
+        #: duration of each stored step in seconds
+        self.step: float = step
+
+        #: propagators advanced away from the origin in the positive and negative directions
+        self.propagators: Dict[int, RK4 | Kepler] = {
+            1: Satellite.create_propagator(self.origin),
+            -1: Satellite.create_propagator(self.origin),
+        }
+
+        #: interpolated steps keyed by their number of steps from the origin
+        self.segments: Dict[int, HermiteSegment] = {}
+
+    def segment(self, index: int) -> HermiteSegment:
+        """retrieve a stored step, propagating the grid out to it on first use
+
+        :param index: number of steps between the origin and the start of the step
+        :type index: int
+        :return: interpolated step
+        :rtype: HermiteSegment
+        """
+        sign: int = 1 if index >= 0 else -1
+        while index not in self.segments:
+            propagator: RK4 | Kepler = self.propagators[sign]
+            start: GCRF = propagator.state.copy()
+            n: int = round((start.epoch.utc - self.origin.epoch.utc) * DAYS_TO_SECONDS / self.step)
+            propagator.step_to_epoch(self.origin.epoch.plus_days((n + sign) * self.step / DAYS_TO_SECONDS))
+            end: GCRF = propagator.state.copy()
+            if sign == 1:
+                self.segments[n] = HermiteSegment(start, end)
+            else:
+                self.segments[n - 1] = HermiteSegment(end, start)
+        return self.segments[index]
+
+    def position(self, epoch: Epoch) -> Vector3D:
+        """interpolate the position of the target
+
+        :param epoch: time of the position
+        :type epoch: Epoch
+        :return: GCRF position in km
+        :rtype: Vector3D
+        """
+        seconds: float = (epoch.utc - self.origin.epoch.utc) * DAYS_TO_SECONDS
+        index: int = floor(seconds / self.step)
+        return self.segment(index).state(seconds - index * self.step).position
+
+
+class EventFunction:
+
+    #: name used to label detected events
+    NAME: str = "event"
+
+    def __init__(self, direction: int = 0) -> None:
+        """base class of the switching functions whose sign changes mark events
+
+        :param direction: crossings to detect (1 == increasing, -1 == decreasing, 0 == both), defaults to 0
+        :type direction: int, optional
+        """
+        #: crossings to detect (1 == increasing, -1 == decreasing, 0 == both)
+        self.direction: int = direction
+
+    def value(self, state: GCRF) -> float:
+        """evaluate the switching function
+
+        :param state: state of the propagated object
+        :type state: GCRF
+        :return: value whose sign change marks the event
+        :rtype: float
+        """
+        raise NotImplementedError
+
+    def describe(self, increasing: bool) -> str:
+        """create a label for a crossing of the switching function
+
+        :param increasing: true if the function changes from negative to positive
+        :type increasing: bool
+        :return: event label
+        :rtype: str
+        """
+        return " ".join([self.NAME, "increasing" if increasing else "decreasing"])
+
+
+class EclipseEvent(EventFunction):
+
+    #: name used to label detected events
+    NAME: str = "eclipse"
+
+    def __init__(self, penumbra: bool = False, direction: int = 0) -> None:
+        """switching function that is negative while the earth blocks the sun
+
+        The function compares the angle between the sun and earth centers with the apparent radii of both bodies, so
+        it decreases through zero at shadow entry and increases through zero at exit.
+
+        :param penumbra: flag to switch at the first partial occultation instead of the total one, defaults to False
+        :type penumbra: bool, optional
+        :param direction: crossings to detect (1 == exit, -1 == entry, 0 == both), defaults to 0
+        :type direction: int, optional
+        """
+        super().__init__(direction)
+
+        #: flag to switch at the first partial occultation instead of the total one
+        self.penumbra: bool = penumbra
+
+    def value(self, state: GCRF) -> float:
+        sun: Vector3D = state.sun_vector()
+        earth: Vector3D = state.position.scaled(-1)
+        earth_radius: float = asin(min(1.0, Earth.RADIUS / earth.magnitude()))
+        sun_radius: float = asin(Sun.RADIUS / sun.magnitude())
+        if self.penumbra:
+            return sun.angle(earth) - earth_radius - sun_radius
+        return sun.angle(earth) - earth_radius + sun_radius
+
+    def describe(self, increasing: bool) -> str:
+        return " ".join([self.NAME, "exit" if increasing else "entry"])
+
+
+class RangeEvent(EventFunction):
+
+    #: name used to label detected events
+    NAME: str = "range"
+
+    def __init__(self, target: Satellite, threshold: float, direction: int = 0) -> None:
+        """switching function that is negative while the target is closer than a threshold
+
+        The target is solved by a :class:`TargetEphemeris` started from its state when the function is created, so
+        the target itself is never stepped.
+
+        :param target: satellite whose distance is monitored
+        :type target: Satellite
+        :param threshold: distance in km
+        :type threshold: float
+        :param direction: crossings to detect (1 == leaving, -1 == entering, 0 == both), defaults to 0
+        :type direction: int, optional
+        """
+        super().__init__(direction)
+
+        #: satellite whose distance is monitored
+        self.target: Satellite = target
+
+        #: distance in km
+        self.threshold: float = threshold
+
+        #: positions of the target solved without stepping it
+        self.ephemeris: TargetEphemeris = TargetEphemeris(target)
+
+    def value(self, state: GCRF) -> float:
+        return self.ephemeris.position(state.epoch).minus(state.position).magnitude() - self.threshold
+
+
+class SunAngleEvent(EventFunction):
+
+    #: name used to label detected events
+    NAME: str = "sun angle"
+
+    def __init__(self, target: Satellite, limit: float, direction: int = 0) -> None:
+        """switching function that is negative while the target is closer to the sun than an angular limit
+
+        The angle is measured at the propagated object between the sun and the target, matching the payload
+        exclusion used by :meth:`Satellite.detect`.  The target is solved by a :class:`TargetEphemeris` started from its
+        state when the function is created, so the target itself is never stepped.
+
+        :param target: satellite being observed
+        :type target: Satellite
+        :param limit: smallest allowed sun angle in radians
+        :type limit: float
+        :param direction: crossings to detect (1 == leaving the exclusion, -1 == entering it, 0 == both)
+        :type direction: int, optional
+        """
+        super().__init__(direction)
+
+        #: satellite being observed
+        self.target: Satellite = target
+
+        #: smallest allowed sun angle in radians
+        self.limit: float = limit
+
+        #: positions of the target solved without stepping it
+        self.ephemeris: TargetEphemeris = TargetEphemeris(target)
+
+    def value(self, state: GCRF) -> float:
+        return state.sun_vector().angle(self.ephemeris.position(state.epoch).minus(state.position)) - self.limit
+
+
+class ElevationEvent(EventFunction):
+
+    #: name used to label detected events
+    NAME: str = "elevation"
+
+    def __init__(self, site: GroundSite, minimum: float = 0, direction: int = 0) -> None:
+        """switching function that is positive while the object is above a minimum elevation at a ground site
+
+        :param site: location of the observer
+        :type site: GroundSite
+        :param minimum: elevation mask in radians, defaults to 0
+        :type minimum: float, optional
+        :param direction: crossings to detect (1 == rise, -1 == set, 0 == both), defaults to 0
+        :type direction: int, optional
+        """
+        super().__init__(direction)
+
+        #: location of the observer
+        self.site: GroundSite = site
+
+        #: elevation mask in radians
+        self.minimum: float = minimum
+
+    def value(self, state: GCRF) -> float:
+        enz: Vector3D = self.site.enz_position(PositionConvert.gcrf.to_itrf(state.position, state.epoch))
+        return asin(enz.z / enz.magnitude()) - self.minimum
+
+    def describe(self, increasing: bool) -> str:
+        return " ".join([self.NAME, "rise" if increasing else "set"])
+
+
+class ApsisEvent(EventFunction):
+
+    #: name used to label detected events
+    NAME: str = "apsis"
+
+    def value(self, state: GCRF) -> float:
+        """evaluate the radial velocity which increases through zero at periapsis and decreases through apoapsis
+
+        :param state: state of the propagated object
+        :type state: GCRF
+        :return: dot product of the position and velocity
+        :rtype: float
+        """
+        return state.position.dot(state.velocity)
+
+    def describe(self, increasing: bool) -> str:
+        return "periapsis" if increasing else "apoapsis"
+
+
+class EventRecord:
+    def __init__(self, event: EventFunction, state: GCRF, increasing: bool) -> None:
+        """class used to store a located event
+
+        :param event: switching function that changed sign
+        :type event: EventFunction
+        :param state: interpolated state at the root of the switching function
+        :type state: GCRF
+        :param increasing: true if the function changed from negative to positive
+        :type increasing: bool
+        """
+        #: switching function that changed sign
+        self.event: EventFunction = event
+
+        #: interpolated state at the root of the switching function
+        self.state: GCRF = state
+
+        #: true if the function changed from negative to positive
+        self.increasing: bool = increasing
+
+        #: label of the crossing
+        self.name: str = event.describe(increasing)
+
+    @property
+    def epoch(self) -> Epoch:
+        return self.state.epoch
+
+
+class EventDetector:
+
+    #: Default time between switching function evaluations in seconds
+    DEFAULT_STEP: float = RK4.MAX_STEP
+
+    #: Width in seconds of the bracket at which a root is accepted
+    TIME_TOLERANCE: float = 1e-3
+
+    #: Largest number of iterations used to locate a root
+    MAX_ITERATIONS: int = 60
+
+    def __init__(
+        self, propagator: RK4 | Encke | Kepler, events: List[EventFunction], step: float = DEFAULT_STEP
+    ) -> None:
+        """class used to locate the sign changes of switching functions while a propagator is advanced
+
+        The functions are evaluated once per step.  When a sign change is bracketed the root is found on a
+        quintic Hermite interpolation of the step so the integration step never has to shrink.
+
+        :param propagator: propagator to be advanced
+        :type propagator: RK4 | Encke | Kepler
+        :param events: switching functions to be monitored
+        :type events: List[EventFunction]
+        :param step: largest time between switching function evaluations in seconds, defaults to DEFAULT_STEP
+        :type step: float, optional
+        """
+        #: propagator to be advanced
+        self.propagator: RK4 | Encke | Kepler = propagator
+
+        #: switching functions to be monitored
+        self.events: List[EventFunction] = events
+
+        #: largest time between switching function evaluations in seconds
+        self.step: float = step
+
+        #: every event located so far in the order it occurred
+        self.history: List[EventRecord] = []
+
+    def step_to_epoch(self, epoch: Epoch) -> List[EventRecord]:
+        """advance the propagator to the argument epoch and locate every event along the way
+
+        :param epoch: time of state to be calculated
+        :type epoch: Epoch
+        :return: events located during this call in the order they occurred
+        :rtype: List[EventRecord]
+        """
+        dt: float = (epoch.utc - self.propagator.state.epoch.utc) * DAYS_TO_SECONDS
+        num_steps: int = ceil(abs(dt / self.step))
+        found: List[EventRecord] = []
+        start: GCRF = self.propagator.state.copy()
+        values: List[float] = [event.value(start) for event in self.events]
+        for _ in range(num_steps):
+            self.propagator.step_to_epoch(start.epoch.plus_days(dt / num_steps / DAYS_TO_SECONDS))
+            end: GCRF = self.propagator.state.copy()
+            segment: HermiteSegment = HermiteSegment(start, end)
+            step_events: List[EventRecord] = []
+            next_values: List[float] = []
+            for event, g0 in zip(self.events, values):
+                g1: float = event.value(end)
+                next_values.append(g1)
+                if g0 == 0 or copysign(1, g0) == copysign(1, g1):
+                    continue
+                increasing: bool = (g1 > g0) == (segment.duration > 0)
+                if event.direction == 1 and not increasing or event.direction == -1 and increasing:
+                    continue
+                t: float = EventDetector.locate(event, segment, g0, g1)
+                step_events.append(EventRecord(event, segment.state(t), increasing))
+            step_events.sort(key=lambda record: abs(record.epoch.utc - start.epoch.utc))
+            found.extend(step_events)
+            start = end
+            values = next_values
+        self.history.extend(found)
+        return found
+
+    @staticmethod
+    def locate(event: EventFunction, segment: HermiteSegment, g0: float, g1: float) -> float:
+        """find the root of a switching function inside a step using the Illinois variant of regula falsi
+
+        :param event: switching function that changed sign during the step
+        :type event: EventFunction
+        :param segment: dense output of the step
+        :type segment: HermiteSegment
+        :param g0: value of the function at the start of the step
+        :type g0: float
+        :param g1: value of the function at the end of the step
+        :type g1: float
+        :return: seconds past the start of the step
+        :rtype: float
+        """
+        a: float = 0
+        b: float = segment.duration
+        fa: float = g0
+        fb: float = g1
+        side: int = 0
+        for _ in range(EventDetector.MAX_ITERATIONS):
+            c: float = (a * fb - b * fa) / (fb - fa)
+            fc: float = event.value(segment.state(c))
+            if fc == 0:
+                return c
+            if copysign(1, fc) == copysign(1, fb):
+                b, fb = c, fc
+                if side == -1:
+                    fa *= 0.5
+                side = -1
+            else:
+                a, fa = c, fc
+                if side == 1:
+                    fb *= 0.5
+                side = 1
+            if abs(b - a) < EventDetector.TIME_TOLERANCE:
+                break
+        return a if abs(fa) < abs(fb) else b
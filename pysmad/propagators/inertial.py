@@ -1,9 +1,12 @@
-from math import ceil, e, log
-from typing import List
+from array import array
+from math import atan, ceil, copysign, e, fmod, log, pi, sqrt, tan
+from typing import List, Sequence, Tuple
 
+from pysmad.bodies import Earth
 from pysmad.constants import DAYS_TO_SECONDS, SEA_LEVEL_G
 from pysmad.coordinates.states import GCRF
-from pysmad.math.linalg import Vector3D
+from pysmad.math.functions import Stumpff
+from pysmad.math.linalg import Matrix3D, Matrix6D, Vector3D, Vector6D
 from pysmad.time import Epoch
 
 
@@ -27,51 +30,122 @@ class RK4:
         #: mass flow rate used to apply thrusts to propagator
         self.m_dot: float = 0
 
-        #: initial mass when using the propagator to apply thrust
+        #: mass at the start of the current step when using the propagator to apply thrust
         self.m0: float = 0
 
-        #: gcrf direction of any applied thrusts
+        #: gcrf unit vector of any applied thrusts
         self.thrust_direction: Vector3D = Vector3D(0, 0, 0)
 
         #: specific impulse used to apply thrusts
         self.isp: float = 0
 
+        #: flattened row-major state transition matrix from stm_epoch to the current epoch (None when disabled)
+        self.stm: List[float] | None = None
+
+        #: epoch at which the state transition matrix was last reset
+        self.stm_epoch: Epoch | None = None
+
+    def enable_stm(self) -> None:
+        """integrate the state transition matrix with the state starting from the identity at the current epoch"""
+        self.stm = [1.0 if i % 7 == 0 else 0.0 for i in range(36)]
+        self.stm_epoch = self.state.epoch.copy()
+
+    def transition_matrix(self) -> Matrix6D:
+        """retrieve the state transition matrix between stm_epoch and the current epoch
+
+        :return: partials of the current state with respect to the state at stm_epoch
+        :rtype: Matrix6D
+        """
+        if self.stm is None:
+            raise ValueError("state transition matrix integration is not enabled")
+        rows: List[Vector6D] = []
+        for i in range(0, 36, 6):
+            end: int = i + 6
+            rows.append(Vector6D(*self.stm[i:end]))
+        return Matrix6D(*rows)
+
+    @staticmethod
+    def stm_derivative(gradient: Matrix3D, phi: List[float]) -> List[float]:
+        """calculate the time derivative of a state transition matrix from the variational equations
+
+        :param gradient: partials of the acceleration with respect to position
+        :type gradient: Matrix3D
+        :param phi: flattened row-major state transition matrix
+        :type phi: List[float]
+        :return: flattened row-major derivative of the matrix
+        :rtype: List[float]
+        """
+        derivative: List[float] = phi[18:]
+        for g in (gradient.row1, gradient.row2, gradient.row3):
+            for j in range(6):
+                derivative.append(g.x * phi[j] + g.y * phi[j + 6] + g.z * phi[j + 12])
+        return derivative
+
+    def stage(self, epoch: Epoch, slope: List[Vector3D], dt: float) -> GCRF:
+        """create a state advanced from the current state along a slope
+
+        :param epoch: time of the advanced state
+        :type epoch: Epoch
+        :param slope: list of velocity and acceleration used to advance the state
+        :type slope: List[Vector3D]
+        :param dt: seconds to advance along the slope
+        :type dt: float
+        :return: state with the force model settings of the current state
+        :rtype: GCRF
+        """
+        # the new state holds its own copies of the vectors, so they are advanced in place
+        state: GCRF = GCRF(epoch, self.state.position, self.state.velocity)
+        state.position.iadd_scaled(slope[0], dt)
+        state.velocity.iadd_scaled(slope[1], dt)
+        state.match_force_model(self.state)
+        return state
+
     def step(self) -> None:
         """advance the propagator state by the stored time step"""
         h = self.step_size
 
-        epoch_0: Epoch = self.state.epoch.copy()
+        epoch_0: Epoch = self.state.epoch
 
         self.state.thrust = self.thrust_vector(0)
-        y: List[Vector3D] = self.state.vector_list()
-
         k1: List[Vector3D] = self.state.derivative()
 
         dsecs: float = h / 2
         ddays: float = dsecs / DAYS_TO_SECONDS
         epoch_1 = epoch_0.plus_days(ddays)
-        y1: GCRF = GCRF(epoch_1, y[0].plus(k1[0].scaled(dsecs)), y[1].plus(k1[1].scaled(dsecs)))
+        y1: GCRF = self.stage(epoch_1, k1, dsecs)
         y1.thrust = self.thrust_vector(dsecs)
         k2: List[Vector3D] = y1.derivative()
 
-        y2: GCRF = GCRF(epoch_1, y[0].plus(k2[0].scaled(dsecs)), y[1].plus(k2[1].scaled(dsecs)))
+        y2: GCRF = self.stage(epoch_1, k2, dsecs)
         y2.thrust = self.thrust_vector(dsecs)
         k3: List[Vector3D] = y2.derivative()
 
         epoch_2 = epoch_1.plus_days(ddays)
-        y3: GCRF = GCRF(epoch_2, y[0].plus(k3[0].scaled(h)), y[1].plus(k3[1].scaled(h)))
+        y3: GCRF = self.stage(epoch_2, k3, h)
         y3.thrust = self.thrust_vector(dsecs * 2)
         k4: List[Vector3D] = y3.derivative()
 
+        # accumulate the weighted slopes in place to avoid building intermediate vectors
         coeff: float = 1 / 6
-        dv: Vector3D = k1[0].plus(k2[0].scaled(2).plus(k3[0].scaled(2).plus(k4[0]))).scaled(coeff)
-        da: Vector3D = k1[1].plus(k2[1].scaled(2).plus(k3[1].scaled(2).plus(k4[1]))).scaled(coeff)
-
-        self.state = GCRF(
-            epoch_2,
-            self.state.position.plus(dv.scaled(h)),
-            self.state.velocity.plus(da.scaled(h)),
-        )
+        dv: Vector3D = k1[0].copy()
+        dv.iadd_scaled(k2[0], 2)
+        dv.iadd_scaled(k3[0], 2)
+        dv.iadd_scaled(k4[0], 1)
+        da: Vector3D = k1[1].copy()
+        da.iadd_scaled(k2[1], 2)
+        da.iadd_scaled(k3[1], 2)
+        da.iadd_scaled(k4[1], 1)
+
+        if self.stm is not None:
+            phi: List[float] = self.stm
+            p1: List[float] = RK4.stm_derivative(self.state.gravity_gradient(), phi)
+            p2: List[float] = RK4.stm_derivative(y1.gravity_gradient(), [a + b * dsecs for a, b in zip(phi, p1)])
+            p3: List[float] = RK4.stm_derivative(y2.gravity_gradient(), [a + b * dsecs for a, b in zip(phi, p2)])
+            p4: List[float] = RK4.stm_derivative(y3.gravity_gradient(), [a + b * h for a, b in zip(phi, p3)])
+            self.stm = [a + (b + 2 * c + 2 * d + f) * coeff * h for a, b, c, d, f in zip(phi, p1, p2, p3, p4)]
+
+        self.state = self.stage(epoch_2, [dv, da], h * coeff)
+        self.m0 -= self.m_dot * h
 
     def maneuver(self, gcrf_thrust: Vector3D, m_dot: float, m0: float, isp: float) -> None:
         """propagate the state using continuous thrust principles
@@ -89,7 +163,7 @@ class RK4:
         dv_duration: float = (1 / m_spec) * (
             1 - e ** (m_spec * gcrf_thrust.magnitude() / (-isp * m_spec * SEA_LEVEL_G))
         )
-        self.thrust_direction = gcrf_thrust.copy()
+        self.thrust_direction = gcrf_thrust.normalized()
         self.m0 = m0
         self.m_dot = m_dot
         self.isp = isp
@@ -129,20 +203,403 @@ class RK4:
     def thrust_vector(self, dt: float) -> Vector3D:
         """calculate the acceleration vector due to thrust
 
+        The mass is depleted linearly from the value at the start of the step so the acceleration is the thrust
+        divided by the instantaneous mass.
+
         :param dt: time step at which to calculate the thrust
         :type dt: float
         :return: thrust vector with gcrf components
         :rtype: Vector3D
         """
-        a: Vector3D = Vector3D(0, 0, 0)
-        if self.m_dot != 0:
-            if dt == 0:
-                a = self.thrust_direction.normalized().scaled(self.m_dot * self.isp * SEA_LEVEL_G / self.m0)
-            else:
-                ln = log(1 - self.m_dot * dt / self.m0)
-                mt = self.m0 - self.m_dot * dt
-                f = self.m_dot * self.isp * SEA_LEVEL_G
-                dv: Vector3D = self.thrust_direction.normalized().scaled((-f / self.m_dot) * ln)
-                a = dv.scaled((self.m_dot / mt) * (1 / (-log(1 - self.m_dot * dt / self.m0))))
-
-        return a
+        if self.m_dot == 0:
+            return Vector3D(0, 0, 0)
+        return self.thrust_direction.scaled(self.m_dot * self.isp * SEA_LEVEL_G / (self.m0 - self.m_dot * dt))
+
+
+class Kepler:
+
+    #: Nominal time to advance the propagator in seconds when no dt is given
+    DEFAULT_STEP_SIZE: float = RK4.MAX_STEP
+
+    #: Relative tolerance used to stop the universal-variable iteration
+    TOLERANCE: float = 1e-12
+
+    #: Largest number of iterations allowed when solving the universal variable
+    MAX_ITERATIONS: int = 50
+
+    #: Magnitude of alpha (1/sma) below which an orbit is treated as parabolic
+    PARABOLIC_LIMIT: float = 1e-12
+
+    def __init__(self, state: GCRF) -> None:
+        """class used to analytically propagate a two-body state with the universal-variable formulation
+
+        :param state: ECI state of the satellite to be propagated
+        :type state: GCRF
+        """
+        #: the current state of the propagator
+        self.state: GCRF = state.copy()
+
+        #: step in seconds used to advance the propagator
+        self.step_size: float = Kepler.DEFAULT_STEP_SIZE
+
+    def step(self) -> None:
+        """advance the propagator state by the stored time step"""
+        self.step_by_seconds(self.step_size)
+
+    def step_by_seconds(self, t: float) -> None:
+        """advance the propagator by a variable time
+
+        :param t: number of seconds to advance the propagator
+        :type t: float
+        """
+        if t == 0:
+            return
+        r: Vector3D = self.state.position
+        v: Vector3D = self.state.velocity
+        x, y, z, vx, vy, vz = Kepler.solve((r.x, r.y, r.z, v.x, v.y, v.z), t)
+        next_state: GCRF = GCRF(
+            self.state.epoch.plus_days(t / DAYS_TO_SECONDS), Vector3D(x, y, z), Vector3D(vx, vy, vz)
+        )
+        next_state.match_force_model(self.state)
+        self.state = next_state
+
+    def step_to_epoch(self, epoch: Epoch) -> None:
+        """jump the propagator state directly to the argument epoch
+
+        :param epoch: time of state to be calculated
+        :type epoch: Epoch
+        """
+        self.step_by_seconds((epoch.utc - self.state.epoch.utc) * DAYS_TO_SECONDS)
+
+    def maneuver(self, gcrf_thrust: Vector3D, m_dot: float, m0: float, isp: float) -> None:
+        """propagate the state using continuous thrust principles
+
+        The burn itself is integrated numerically and the analytic solution resumes once it is complete.
+
+        :param gcrf_thrust: components of the maneuver in the gcrf frame
+        :type gcrf_thrust: Vector3D
+        :param m_dot: mass flow rate
+        :type m_dot: float
+        :param m0: initial mass
+        :type m0: float
+        :param isp: specific impulse
+        :type isp: float
+        """
+        burn: RK4 = RK4(self.state)
+        burn.maneuver(gcrf_thrust, m_dot, m0, isp)
+        self.state = burn.state
+
+    @staticmethod
+    def initial_guess(r0: float, rdv: float, h: float, alpha: float, dt: float) -> float:
+        """estimate the universal variable using algorithm 8 in :ref:`vallado`
+
+        :param r0: magnitude of the initial position in km
+        :type r0: float
+        :param rdv: dot product of the initial position and velocity
+        :type rdv: float
+        :param h: magnitude of the areal velocity in km^2/s
+        :type h: float
+        :param alpha: reciprocal of the semi-major axis in 1/km
+        :type alpha: float
+        :param dt: seconds of flight
+        :type dt: float
+        :return: first estimate of the universal variable
+        :rtype: float
+        """
+        mu: float = Earth.MU
+        if alpha > Kepler.PARABOLIC_LIMIT:
+            chi: float = sqrt(mu) * dt * alpha
+        elif alpha < -Kepler.PARABOLIC_LIMIT:
+            a: float = 1 / alpha
+            sgn: float = copysign(1, dt)
+            chi = sgn * sqrt(-a) * log(-2 * mu * alpha * dt / (rdv + sgn * sqrt(-mu * a) * (1 - r0 * alpha)))
+        else:
+            p: float = h * h / mu
+            s: float = 0.5 * (pi / 2 - atan(3 * sqrt(mu / (p * p * p)) * dt))
+            t: float = tan(s)
+            w: float = atan(copysign(abs(t) ** (1 / 3), t))
+            chi = sqrt(p) * 2 / tan(2 * w)
+        return chi
+
+    @staticmethod
+    def solve(vector: Sequence[float], dt: float) -> Tuple[float, float, float, float, float, float]:
+        """calculate a two-body state after a time of flight using algorithm 8 in :ref:`vallado`
+
+        :param vector: position and velocity components x, y, z, vx, vy, vz in km and km/s
+        :type vector: Sequence[float]
+        :param dt: seconds of flight (negative values propagate backwards)
+        :type dt: float
+        :return: position and velocity components after the time of flight
+        :rtype: Tuple[float, float, float, float, float, float]
+        """
+        x, y, z, vx, vy, vz = vector
+        r0: float = sqrt(x * x + y * y + z * z)
+        v_squared: float = vx * vx + vy * vy + vz * vz
+        rdv: float = x * vx + y * vy + z * vz
+        hx: float = y * vz - z * vy
+        hy: float = z * vx - x * vz
+        hz: float = x * vy - y * vx
+        h: float = sqrt(hx * hx + hy * hy + hz * hz)
+        alpha: float = 2 / r0 - v_squared / Earth.MU
+        return Kepler._solve(x, y, z, vx, vy, vz, r0, rdv, h, alpha, dt)
+
+    @staticmethod
+    def _solve(
+        x: float,
+        y: float,
+        z: float,
+        vx: float,
+        vy: float,
+        vz: float,
+        r0: float,
+        rdv: float,
+        h: float,
+        alpha: float,
+        dt: float,
+    ) -> Tuple[float, float, float, float, float, float]:
+        """calculate a two-body state after a time of flight using invariants that have already been computed
+
+        :return: position and velocity components after the time of flight
+        :rtype: Tuple[float, float, float, float, float, float]
+        """
+        if dt == 0:
+            return x, y, z, vx, vy, vz
+
+        # whole revolutions of an ellipse do not change the state
+        if alpha > Kepler.PARABOLIC_LIMIT:
+            period: float = 2 * pi / (sqrt(Earth.MU) * alpha * sqrt(alpha))
+            if abs(dt) > period:
+                dt = fmod(dt, period)
+
+        sqrt_mu: float = sqrt(Earth.MU)
+        sigma0: float = rdv / sqrt_mu
+        target: float = sqrt_mu * dt
+        chi: float = Kepler.initial_guess(r0, rdv, h, alpha, dt)
+
+        iterations: int = 0
+        converged: bool = False
+        while not converged and iterations < Kepler.MAX_ITERATIONS:
+            chi_squared: float = chi * chi
+            psi: float = chi_squared * alpha
+            c2: float = Stumpff.c2(psi)
+            c3: float = Stumpff.c3(psi)
+            r: float = chi_squared * c2 + sigma0 * chi * (1 - psi * c3) + r0 * (1 - psi * c2)
+            delta: float = (target - chi_squared * chi * c3 - sigma0 * chi_squared * c2 - r0 * chi * (1 - psi * c3)) / r
+            chi += delta
+            iterations += 1
+            converged = abs(delta) <= Kepler.TOLERANCE * max(1.0, abs(chi))
+
+        chi_squared = chi * chi
+        psi = chi_squared * alpha
+        c2 = Stumpff.c2(psi)
+        c3 = Stumpff.c3(psi)
+        r = chi_squared * c2 + sigma0 * chi * (1 - psi * c3) + r0 * (1 - psi * c2)
+
+        f: float = 1 - chi_squared * c2 / r0
+        g: float = dt - chi_squared * chi * c3 / sqrt_mu
+        f_dot: float = sqrt_mu * chi * (psi * c3 - 1) / (r * r0)
+        g_dot: float = 1 - chi_squared * c2 / r
+
+        return (
+            f * x + g * vx,
+            f * y + g * vy,
+            f * z + g * vz,
+            f_dot * x + g_dot * vx,
+            f_dot * y + g_dot * vy,
+            f_dot * z + g_dot * vz,
+        )
+
+    @staticmethod
+    def solve_grid(states: List[GCRF], epochs: List[Epoch]) -> array:
+        """calculate the two-body states of many objects at many epochs
+
+        Invariants of each initial state are computed once and reused for every epoch so no intermediate objects
+        are created.
+
+        :param states: initial states of the objects
+        :type states: List[GCRF]
+        :param epochs: output times
+        :type epochs: List[Epoch]
+        :return: flat buffer ordered by object, then epoch, then x, y, z, vx, vy, vz
+        :rtype: array
+        """
+        values: array = array("d")
+        mu: float = Earth.MU
+        for state in states:
+            x, y, z = state.position.x, state.position.y, state.position.z
+            vx, vy, vz = state.velocity.x, state.velocity.y, state.velocity.z
+            r0: float = sqrt(x * x + y * y + z * z)
+            rdv: float = x * vx + y * vy + z * vz
+            hx: float = y * vz - z * vy
+            hy: float = z * vx - x * vz
+            hz: float = x * vy - y * vx
+            h: float = sqrt(hx * hx + hy * hy + hz * hz)
+            alpha: float = 2 / r0 - (vx * vx + vy * vy + vz * vz) / mu
+            t0: float = state.epoch.utc
+            for epoch in epochs:
+                values.extend(Kepler._solve(x, y, z, vx, vy, vz, r0, rdv, h, alpha, (epoch.utc - t0) * DAYS_TO_SECONDS))
+        return values
+
+
+class Encke:
+
+    #: Largest step to be taken by the integrator
+    MAX_STEP: float = 600
+
+    #: Ratio of the deviation to the reference radius that triggers a rectification of the reference orbit
+    RECTIFICATION_RATIO: float = 1e-4
+
+    def __init__(self, state: GCRF) -> None:
+        """class used to propagate a satellite state by integrating its deviation from an osculating two-body orbit
+
+        Only the perturbing accelerations drive the integrated deviation, so steps may be much larger than those of
+        :class:`RK4` for near-Keplerian orbits.  The reference is rectified to the current state whenever the
+        deviation exceeds :attr:`RECTIFICATION_RATIO` of the reference radius.
+
+        :param state: ECI state of the satellite to be propagated
+        :type state: GCRF
+        """
+        #: the current state of the propagator
+        self.state: GCRF = state.copy()
+
+        #: integration step to be taken when the propagator is advanced
+        self.step_size: float = Encke.MAX_STEP
+
+        #: osculating state at the last rectification that defines the two-body reference orbit
+        self.reference: GCRF = state.copy()
+
+        #: difference between the current and reference positions
+        self.position_deviation: Vector3D = Vector3D(0, 0, 0)
+
+        #: difference between the current and reference velocities
+        self.velocity_deviation: Vector3D = Vector3D(0, 0, 0)
+
+        #: number of times the reference orbit has been reset
+        self.rectifications: int = 0
+
+    def rectify(self) -> None:
+        """reset the reference orbit to the osculating orbit of the current state"""
+        self.reference = self.state.copy()
+        self.position_deviation = Vector3D(0, 0, 0)
+        self.velocity_deviation = Vector3D(0, 0, 0)
+        self.rectifications += 1
+
+    def reference_vector(self, epoch: Epoch) -> Tuple[float, float, float, float, float, float]:
+        """calculate the state of the two-body reference orbit
+
+        :param epoch: time of the reference state
+        :type epoch: Epoch
+        :return: position and velocity components x, y, z, vx, vy, vz in km and km/s
+        :rtype: Tuple[float, float, float, float, float, float]
+        """
+        r: Vector3D = self.reference.position
+        v: Vector3D = self.reference.velocity
+        dt: float = (epoch.utc - self.reference.epoch.utc) * DAYS_TO_SECONDS
+        return Kepler.solve((r.x, r.y, r.z, v.x, v.y, v.z), dt)
+
+    def deviation_derivative(
+        self, epoch: Epoch, reference: Sequence[float], dr: Vector3D, dv: Vector3D
+    ) -> List[Vector3D]:
+        """create a list with elements 0 == velocity deviation and 1 == acceleration deviation
+
+        The difference of the two-body terms uses the f(q) series from :ref:`vallado` to avoid the cancellation of
+        subtracting two nearly equal accelerations.
+
+        :param epoch: time of the deviation
+        :type epoch: Epoch
+        :param reference: reference position and velocity components at the epoch
+        :type reference: Sequence[float]
+        :param dr: position deviation
+        :type dr: Vector3D
+        :param dv: velocity deviation
+        :type dv: Vector3D
+        :return: derivative of the deviation
+        :rtype: List[Vector3D]
+        """
+        rho: Vector3D = Vector3D(reference[0], reference[1], reference[2])
+        r: Vector3D = rho.plus(dr)
+        q: float = dr.dot(dr.minus(r.scaled(2))) / r.dot(r)
+        f: float = q * (3 + 3 * q + q * q) / (1 + (1 + q) ** 1.5)
+        rho_mag: float = rho.magnitude()
+
+        actual: GCRF = GCRF(epoch, r, Vector3D(reference[3], reference[4], reference[5]).plus(dv))
+        actual.match_force_model(self.state)
+        a: Vector3D = r.scaled(-f).minus(dr).scaled(Earth.MU / (rho_mag * rho_mag * rho_mag))
+        return [dv, a.plus(actual.perturbing_acceleration())]
+
+    def step(self) -> None:
+        """advance the propagator state by the stored time step"""
+        h: float = self.step_size
+        dsecs: float = h / 2
+        ddays: float = dsecs / DAYS_TO_SECONDS
+
+        epoch_0: Epoch = self.state.epoch.copy()
+        epoch_1: Epoch = epoch_0.plus_days(ddays)
+        epoch_2: Epoch = epoch_1.plus_days(ddays)
+        dr: Vector3D = self.position_deviation
+        dv: Vector3D = self.velocity_deviation
+
+        ref_0: Tuple[float, ...] = self.reference_vector(epoch_0)
+        ref_1: Tuple[float, ...] = self.reference_vector(epoch_1)
+        ref_2: Tuple[float, ...] = self.reference_vector(epoch_2)
+
+        k1: List[Vector3D] = self.deviation_derivative(epoch_0, ref_0, dr, dv)
+        k2: List[Vector3D] = self.deviation_derivative(
+            epoch_1, ref_1, dr.plus(k1[0].scaled(dsecs)), dv.plus(k1[1].scaled(dsecs))
+        )
+        k3: List[Vector3D] = self.deviation_derivative(
+            epoch_1, ref_1, dr.plus(k2[0].scaled(dsecs)), dv.plus(k2[1].scaled(dsecs))
+        )
+        k4: List[Vector3D] = self.deviation_derivative(
+            epoch_2, ref_2, dr.plus(k3[0].scaled(h)), dv.plus(k3[1].scaled(h))
+        )
+
+        coeff: float = h / 6
+        self.position_deviation = dr.plus(k1[0].plus(k2[0].scaled(2).plus(k3[0].scaled(2).plus(k4[0]))).scaled(coeff))
+        self.velocity_deviation = dv.plus(k1[1].plus(k2[1].scaled(2).plus(k3[1].scaled(2).plus(k4[1]))).scaled(coeff))
+
+        next_state: GCRF = GCRF(
+            epoch_2,
+            Vector3D(ref_2[0], ref_2[1], ref_2[2]).plus(self.position_deviation),
+            Vector3D(ref_2[3], ref_2[4], ref_2[5]).plus(self.velocity_deviation),
+        )
+        next_state.match_force_model(self.state)
+        self.state = next_state
+
+        ref_mag: float = sqrt(ref_2[0] * ref_2[0] + ref_2[1] * ref_2[1] + ref_2[2] * ref_2[2])
+        if self.position_deviation.magnitude() > Encke.RECTIFICATION_RATIO * ref_mag:
+            self.rectify()
+
+    def step_to_epoch(self, epoch: Epoch) -> None:
+        """advance the propagator state to the argument epoch
+
+        :param epoch: time of state to be calculated
+        :type epoch: Epoch
+        """
+        dt: float = (epoch.utc - self.state.epoch.utc) * DAYS_TO_SECONDS
+        num_steps: int = ceil(abs(dt / self.MAX_STEP))
+        old_step: float = self.step_size
+        if num_steps > 0:
+            self.step_size = dt / num_steps
+        for _ in range(num_steps):
+            self.step()
+        self.step_size = old_step
+
+    def maneuver(self, gcrf_thrust: Vector3D, m_dot: float, m0: float, isp: float) -> None:
+        """propagate the state using continuous thrust principles
+
+        The burn itself is integrated numerically and the reference orbit is rectified once it is complete.
+
+        :param gcrf_thrust: components of the maneuver in the gcrf frame
+        :type gcrf_thrust: Vector3D
+        :param m_dot: mass flow rate
+        :type m_dot: float
+        :param m0: initial mass
+        :type m0: float
+        :param isp: specific impulse
+        :type isp: float
+        """
+        burn: RK4 = RK4(self.state)
+        burn.maneuver(gcrf_thrust, m_dot, m0, isp)
+        self.state = burn.state
+        self.rectify()
@@ -1,8 +1,17 @@
-from math import cos, sin, sqrt
+from array import array
+from collections import OrderedDict
+from math import atan2, cos, pi, sin, sqrt
+from typing import List, Sequence
 
 from pysmad.bodies import Earth
-from pysmad.coordinates.states import HCW
-from pysmad.math.linalg import Matrix6D, Vector6D
+from pysmad.constants import DAYS_TO_SECONDS
+from pysmad.coordinates.states import GCRF, HCW
+from pysmad.math.functions import EquationsOfMotion
+from pysmad.math.linalg import Matrix3D, Matrix6D, Vector3D, Vector6D
+from pysmad.time import Epoch
+
+#: number of floats stored for each relative state (x, y, z, vx, vy, vz)
+STATE_WIDTH: int = 6
 
 
 class Hill:
@@ -10,6 +19,9 @@ class Hill:
     #: Nominal time to advance the propagator in seconds when no dt is given
     DEFAULT_STEP_SIZE: float = 600
 
+    #: Largest number of system matrices kept for reuse
+    CACHE_SIZE: int = 128
+
     def __init__(self, state: HCW, sma: float) -> None:
         """class used to calculate the relative position of a spacecraft using Hill's equations
 
@@ -30,9 +42,44 @@ class Hill:
         #: step in seconds used to advance the propagator
         self.step_size = Hill.DEFAULT_STEP_SIZE
 
+        #: recently used system matrices keyed by their time step (least recently used first)
+        self.cache: OrderedDict[float, Matrix6D] = OrderedDict()
+
     def system_matrix(self, t: float) -> Matrix6D:
         """return the system matrix required to advance the initial state by the input t
 
+        Matrices are cached by t so a constant propagation or observation cadence only evaluates the trig once.  The
+        cached instance is returned, so it should be treated as read-only.
+
+        :param t: number of seconds between initial state and desired state
+        :type t: float
+        :return: system matrix used to advance the propagator
+        :rtype: Matrix6D
+        """
+        sys_mat: Matrix6D | None = self.cache.get(t)
+        if sys_mat is not None:
+            self.cache.move_to_end(t)
+            return sys_mat
+
+        sys_mat = self.build_system_matrix(t)
+        self.cache[t] = sys_mat
+        if len(self.cache) > Hill.CACHE_SIZE:
+            self.cache.popitem(last=False)
+        return sys_mat
+
+    def system_matrices(self, times: Sequence[float]) -> List[Matrix6D]:
+        """return the system matrices for a grid of time steps
+
+        :param times: numbers of seconds between the initial state and each desired state
+        :type times: Sequence[float]
+        :return: system matrices ordered like the times
+        :rtype: List[Matrix6D]
+        """
+        return [self.system_matrix(t) for t in times]
+
+    def build_system_matrix(self, t: float) -> Matrix6D:
+        """evaluate the system matrix without consulting the cache
+
         :param t: number of seconds between initial state and desired state
         :type t: float
         :return: system matrix used to advance the propagator
@@ -73,3 +120,244 @@ class Hill:
     def step(self) -> None:
         """advance the propagator by one time step"""
         self.step_by_seconds(self.step_size)
+
+    def propagate_grid(self, states: Sequence[float], times: Sequence[float]) -> array:
+        """advance many relative states about the same origin orbit to a grid of time steps
+
+        The in-plane and cross-track motion are decoupled and the in-track position only shifts, so each state is
+        advanced with only the nonzero coefficients of the system matrix rather than a full 6x6 product.
+
+        :param states: flat buffer of x, y, z, vx, vy, vz for each state (km and km/s)
+        :type states: Sequence[float]
+        :param times: numbers of seconds to advance every state
+        :type times: Sequence[float]
+        :return: flat buffer ordered by state, then time, then x, y, z, vx, vy, vz
+        :rtype: array
+        """
+        count: int = len(states) // STATE_WIDTH
+        matrices: List[Matrix6D] = self.system_matrices(times)
+        values: array = array("d")
+        for k in range(count):
+            j: int = k * STATE_WIDTH
+            x, y, z, vx, vy, vz = states[j], states[j + 1], states[j + 2], states[j + 3], states[j + 4], states[j + 5]
+            for m in matrices:
+                r1, r2, r3, r4, r5, r6 = m.row1, m.row2, m.row3, m.row4, m.row5, m.row6
+                values.extend(
+                    (
+                        r1.x * x + r1.vx * vx + r1.vy * vy,
+                        r2.x * x + y + r2.vx * vx + r2.vy * vy,
+                        r3.z * z + r3.vz * vz,
+                        r4.x * x + r4.vx * vx + r4.vy * vy,
+                        r5.x * x + r5.vx * vx + r5.vy * vy,
+                        r6.z * z + r6.vz * vz,
+                    )
+                )
+        return values
+
+
+class YamanakaAnkersen:
+
+    #: Nominal time to advance the propagator in seconds when no dt is given
+    DEFAULT_STEP_SIZE: float = 600
+
+    def __init__(self, state: HCW, origin: GCRF) -> None:
+        """class used to calculate the relative motion of a spacecraft about an eccentric two-body origin orbit using
+        the Yamanaka-Ankersen solution of the Tschauner-Hempel equations
+
+        The relative state uses the same radial, in-track, and cross-track axes as :class:`Hill` with rectilinear
+        coordinates and derivatives taken in the rotating frame.
+
+        :param state: relative state of the satellite to be propagated
+        :type state: HCW
+        :param origin: inertial state of the origin vehicle at the epoch of the relative state
+        :type origin: GCRF
+        """
+        #: current state of the propagator
+        self.state: HCW = HCW(origin.epoch, state.position, state.velocity)
+
+        r: float = origin.position.magnitude()
+        v: float = origin.velocity.magnitude()
+        rdv: float = origin.position.dot(origin.velocity)
+        e_vec: Vector3D = origin.position.scaled(v * v - Earth.MU / r).minus(origin.velocity.scaled(rdv))
+
+        #: semi-major axis of the origin spacecraft in km
+        self.sma: float = EquationsOfMotion.A.from_mu_r_v(Earth.MU, r, v)
+
+        #: eccentricity of the origin spacecraft
+        self.eccentricity: float = e_vec.magnitude() / Earth.MU
+
+        #: mean motion of the origin spacecraft in radians per second
+        self.n: float = EquationsOfMotion.N.from_a_mu(self.sma, Earth.MU)
+
+        #: square root of mu over the cube of the semi-parameter (the true anomaly rate at periapsis divided by rho^2)
+        self.k2: float = self.n / (1 - self.eccentricity * self.eccentricity) ** 1.5
+
+        #: mean anomaly of the origin spacecraft at the epoch of the current state in radians
+        self.mean_anomaly: float = EquationsOfMotion.MA.from_ea_e(
+            atan2(rdv / sqrt(Earth.MU * self.sma), 1 - r / self.sma), self.eccentricity
+        )
+
+        #: step in seconds used to advance the propagator
+        self.step_size: float = YamanakaAnkersen.DEFAULT_STEP_SIZE
+
+    def true_anomaly(self, t: float) -> float:
+        """calculate the true anomaly of the origin spacecraft
+
+        :param t: number of seconds past the epoch of the current state
+        :type t: float
+        :return: true anomaly in radians
+        :rtype: float
+        """
+        ma: float = (self.mean_anomaly + self.n * t) % (2 * pi)
+        return EquationsOfMotion.NU.from_e_ea(self.eccentricity, EquationsOfMotion.EA.from_ma_e(ma, self.eccentricity))
+
+    def integration_constants(self, vector: Sequence[float]) -> List[float]:
+        """solve the six constants of the Yamanaka-Ankersen solution that reproduce a state at the current epoch
+
+        :param vector: x, y, z, vx, vy, vz at the epoch of the current state (km and km/s)
+        :type vector: Sequence[float]
+        :return: four in-plane constants followed by two cross-track constants
+        :rtype: List[float]
+        """
+        e: float = self.eccentricity
+        nu: float = self.true_anomaly(0)
+        sn: float = sin(nu)
+        cs: float = cos(nu)
+        rho: float = 1 + e * cs
+        s: float = rho * sn
+        c: float = rho * cs
+        ds: float = cs + e * cos(2 * nu)
+        dc: float = -(sn + e * sin(2 * nu))
+        x, y, z, vx, vy, vz = vector
+
+        # transform to the scaled coordinates with true anomaly as the independent variable
+        k2rho: float = self.k2 * rho
+        xt: float = rho * x
+        yt: float = rho * y
+        zt: float = rho * z
+        dxt: float = -e * sn * x + vx / k2rho
+        dyt: float = -e * sn * y + vy / k2rho
+        dzt: float = -e * sn * z + vz / k2rho
+
+        in_plane: Matrix3D = Matrix3D(
+            Vector3D(s, c, 2),
+            Vector3D(ds, dc, -3 * e * s / (rho * rho)),
+            Vector3D(-2 * s, e - 2 * c, -3),
+        )
+        d: Vector3D = in_plane.inverse().multiply_vector(Vector3D(xt, dxt, dyt))
+        d4: float = yt - c * (1 + 1 / rho) * d.x + s * (1 + 1 / rho) * d.y
+        return [d.x, d.y, d.z, d4, zt * cs - dzt * sn, zt * sn + dzt * cs]
+
+    def solve(self, constants: Sequence[float], t: float) -> List[float]:
+        """evaluate the Yamanaka-Ankersen solution
+
+        :param constants: values returned by integration_constants
+        :type constants: Sequence[float]
+        :param t: number of seconds past the epoch of the current state
+        :type t: float
+        :return: x, y, z, vx, vy, vz in km and km/s
+        :rtype: List[float]
+        """
+        return self.solve_anomaly(constants, self.true_anomaly(t), self.k2 * t)
+
+    def solve_anomaly(self, constants: Sequence[float], nu: float, j: float) -> List[float]:
+        """evaluate the Yamanaka-Ankersen solution at a known true anomaly of the origin
+
+        :param constants: values returned by integration_constants
+        :type constants: Sequence[float]
+        :param nu: true anomaly of the origin in radians
+        :type nu: float
+        :param j: integral of the inverse square of rho since the current epoch (k2 times the elapsed seconds)
+        :type j: float
+        :return: x, y, z, vx, vy, vz in km and km/s
+        :rtype: List[float]
+        """
+        e: float = self.eccentricity
+        sn: float = sin(nu)
+        cs: float = cos(nu)
+        rho: float = 1 + e * cs
+        s: float = rho * sn
+        c: float = rho * cs
+        ds: float = cs + e * cos(2 * nu)
+        dc: float = -(sn + e * sin(2 * nu))
+        d1, d2, d3, d4, d5, d6 = constants
+
+        xt: float = d1 * s + d2 * c + d3 * (2 - 3 * e * s * j)
+        yt: float = (d1 * c - d2 * s) * (1 + 1 / rho) - 3 * d3 * rho * rho * j + d4
+        zt: float = d5 * cs + d6 * sn
+        dxt: float = d1 * ds + d2 * dc - 3 * e * d3 * (ds * j + s / (rho * rho))
+        dyt: float = -2 * d1 * s + d2 * (e - 2 * c) + d3 * (6 * e * s * j - 3)
+        dzt: float = -d5 * sn + d6 * cs
+
+        k2rho: float = self.k2 * rho
+        k2esn: float = self.k2 * e * sn
+        return [
+            xt / rho,
+            yt / rho,
+            zt / rho,
+            k2rho * dxt + k2esn * xt,
+            k2rho * dyt + k2esn * yt,
+            k2rho * dzt + k2esn * zt,
+        ]
+
+    def system_matrix(self, t: float) -> Matrix6D:
+        """return the system matrix required to advance the current state by the input t
+
+        :param t: number of seconds between the current state and desired state
+        :type t: float
+        :return: system matrix used to advance the propagator
+        :rtype: Matrix6D
+        """
+        nu: float = self.true_anomaly(t)
+        j: float = self.k2 * t
+        columns: List[List[float]] = []
+        for i in range(STATE_WIDTH):
+            unit: List[float] = [0.0] * STATE_WIDTH
+            unit[i] = 1.0
+            columns.append(self.solve_anomaly(self.integration_constants(unit), nu, j))
+        return Matrix6D(*[Vector6D(*[column[row] for column in columns]) for row in range(STATE_WIDTH)])
+
+    def step_by_seconds(self, t: float) -> None:
+        """advance the propagator by a variable time
+
+        :param t: number of seconds to advance the propagator
+        :type t: float
+        """
+        v: Vector6D = self.state.vector
+        x, y, z, vx, vy, vz = self.solve(self.integration_constants([v.x, v.y, v.z, v.vx, v.vy, v.vz]), t)
+        self.state = HCW(self.state.epoch.plus_days(t / DAYS_TO_SECONDS), Vector3D(x, y, z), Vector3D(vx, vy, vz))
+        self.mean_anomaly = (self.mean_anomaly + self.n * t) % (2 * pi)
+
+    def step(self) -> None:
+        """advance the propagator by one time step"""
+        self.step_by_seconds(self.step_size)
+
+    def step_to_epoch(self, epoch: Epoch) -> None:
+        """advance the propagator to the argument epoch
+
+        :param epoch: time of state to be calculated
+        :type epoch: Epoch
+        """
+        self.step_by_seconds((epoch.utc - self.state.epoch.utc) * DAYS_TO_SECONDS)
+
+    def propagate_grid(self, states: Sequence[float], times: Sequence[float]) -> array:
+        """advance many relative states about the same origin orbit to a grid of time steps
+
+        The anomaly of the origin is solved once per time and shared by every state.
+
+        :param states: flat buffer of x, y, z, vx, vy, vz for each state at the current epoch (km and km/s)
+        :type states: Sequence[float]
+        :param times: numbers of seconds past the current epoch
+        :type times: Sequence[float]
+        :return: flat buffer ordered by state, then time, then x, y, z, vx, vy, vz
+        :rtype: array
+        """
+        anomalies: List[float] = [self.true_anomaly(t) for t in times]
+        values: array = array("d")
+        for k in range(len(states) // STATE_WIDTH):
+            start: int = k * STATE_WIDTH
+            end: int = start + STATE_WIDTH
+            constants: List[float] = self.integration_constants(states[start:end])
+            for nu, t in zip(anomalies, times):
+                values.extend(self.solve_anomaly(constants, nu, self.k2 * t))
+        return values
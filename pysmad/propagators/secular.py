@@ -0,0 +1,413 @@
+from array import array
+from math import atan2, cos, pi, sin, sqrt, tan
+from typing import List, Tuple
+
+from pysmad.bodies import Earth
+from pysmad.constants import DAYS_TO_SECONDS
+from pysmad.coordinates.elements import ClassicalElements
+from pysmad.coordinates.states import IJK
+from pysmad.math.functions import EquationsOfMotion
+from pysmad.math.linalg import Vector3D
+from pysmad.time import Epoch
+
+
+class SecularJ2:
+
+    #: Largest number of corrections used when solving mean elements from osculating elements
+    MAX_ITERATIONS: int = 25
+
+    #: Largest correction (relative for the semi-major axis, absolute otherwise) of a converged mean element set
+    TOLERANCE: float = 1e-11
+
+    def __init__(self, elements: ClassicalElements, use_j3: bool = False) -> None:
+        """class used to propagate mean elements with the secular (and optionally long-period J3) effects of an oblate
+        earth
+
+        :param elements: mean elements of the orbit
+        :type elements: ClassicalElements
+        :param use_j3: flag to include the long-period eccentricity and perigee motion caused by J3, defaults to False
+        :type use_j3: bool, optional
+        """
+        #: mean elements used as the reference for every propagation
+        self.initial_elements: ClassicalElements = SecularJ2.copy_elements(elements)
+
+        #: the current mean elements of the propagator
+        self.elements: ClassicalElements = SecularJ2.copy_elements(elements)
+
+        #: flag used to include the long-period eccentricity and perigee motion caused by J3
+        self.use_j3: bool = use_j3
+
+    def step_to_epoch(self, epoch: Epoch) -> None:
+        """jump the mean elements directly to the argument epoch
+
+        The solution is always taken from the initial elements so it does not depend on the sequence of requests.
+
+        :param epoch: time of the elements to be calculated
+        :type epoch: Epoch
+        """
+        self.elements = SecularJ2.propagate(self.initial_elements, epoch, self.use_j3)
+
+    def state(self) -> IJK:
+        """calculate the osculating state of the current mean elements
+
+        :return: inertial state including the first-order J2 short-period terms
+        :rtype: IJK
+        """
+        return SecularJ2.osculating_state(self.elements)
+
+    @staticmethod
+    def copy_elements(elements: ClassicalElements) -> ClassicalElements:
+        """create a duplicate of an element set
+
+        :param elements: element set to be copied
+        :type elements: ClassicalElements
+        :return: element set with matching properties
+        :rtype: ClassicalElements
+        """
+        return ClassicalElements(
+            elements.epoch,
+            elements.semimajor_axis,
+            elements.eccentricity,
+            elements.inclination,
+            elements.raan,
+            elements.argument_of_perigee,
+            elements.mean_anomaly,
+        )
+
+    @staticmethod
+    def rates(a: float, e: float, i: float) -> Tuple[float, float, float]:
+        r"""calculate the secular J2 rates using equations 9-41 in :ref:`vallado`
+
+        .. math::
+
+           \dot{\Omega} = -\frac{3}{2}nJ_2\left(\frac{R}{p}\right)^2\cos{i}
+
+           \dot{\omega} = \frac{3}{4}nJ_2\left(\frac{R}{p}\right)^2\left(4 - 5\sin^2{i}\right)
+
+           \dot{M} = n + \frac{3}{4}nJ_2\left(\frac{R}{p}\right)^2\sqrt{1-e^2}\left(2 - 3\sin^2{i}\right)
+
+        :param a: mean semi-major axis in km
+        :type a: float
+        :param e: mean eccentricity
+        :type e: float
+        :param i: mean inclination in radians
+        :type i: float
+        :return: rates of the raan, argument of perigee, and mean anomaly in radians per second
+        :rtype: Tuple[float, float, float]
+        """
+        n: float = EquationsOfMotion.N.from_a_mu(a, Earth.MU)
+        p: float = a * (1 - e * e)
+        k: float = 0.75 * n * Earth.J2 * (Earth.RADIUS / p) * (Earth.RADIUS / p)
+        si: float = sin(i)
+        return (
+            -2 * k * cos(i),
+            k * (4 - 5 * si * si),
+            n + k * sqrt(1 - e * e) * (2 - 3 * si * si),
+        )
+
+    @staticmethod
+    def frozen_eccentricity(a: float, e: float, i: float) -> float:
+        r"""calculate the eccentricity about which J3 rotates the eccentricity vector
+
+        .. math::
+
+           e_f = -\frac{J_3}{2J_2}\frac{R}{p}\sin{i}
+
+        :param a: mean semi-major axis in km
+        :type a: float
+        :param e: mean eccentricity
+        :type e: float
+        :param i: mean inclination in radians
+        :type i: float
+        :return: eccentricity of the frozen orbit (perigee at 90 degrees)
+        :rtype: float
+        """
+        return -Earth.J3 / (2 * Earth.J2) * Earth.RADIUS / (a * (1 - e * e)) * sin(i)
+
+    @staticmethod
+    def propagate(elements: ClassicalElements, epoch: Epoch, use_j3: bool = False) -> ClassicalElements:
+        """calculate the mean elements at a new epoch
+
+        :param elements: mean elements of the orbit
+        :type elements: ClassicalElements
+        :param epoch: time of the elements to be calculated
+        :type epoch: Epoch
+        :param use_j3: flag to include the long-period motion caused by J3, defaults to False
+        :type use_j3: bool, optional
+        :return: mean elements at the argument epoch
+        :rtype: ClassicalElements
+        """
+        dt: float = (epoch.utc - elements.epoch.utc) * DAYS_TO_SECONDS
+        return ClassicalElements(
+            epoch,
+            *SecularJ2._propagate(
+                elements.semimajor_axis,
+                elements.eccentricity,
+                elements.inclination,
+                elements.raan,
+                elements.argument_of_perigee,
+                elements.mean_anomaly,
+                dt,
+                use_j3,
+            ),
+        )
+
+    @staticmethod
+    def _propagate(
+        a: float, e: float, i: float, raan: float, w: float, ma: float, dt: float, use_j3: bool
+    ) -> Tuple[float, float, float, float, float, float]:
+        """advance mean elements by a number of seconds
+
+        :return: semi-major axis, eccentricity, inclination, raan, argument of perigee, and mean anomaly
+        :rtype: Tuple[float, float, float, float, float, float]
+        """
+        raan_dot, w_dot, ma_dot = SecularJ2.rates(a, e, i)
+        if use_j3:
+            # J3 rotates the eccentricity vector about the frozen eccentricity at the J2 perigee rate
+            e_f: float = SecularJ2.frozen_eccentricity(a, e, i)
+            xi: float = e * cos(w)
+            eta: float = e * sin(w) - e_f
+            c: float = cos(w_dot * dt)
+            s: float = sin(w_dot * dt)
+            xi, eta = xi * c - eta * s, xi * s + eta * c + e_f
+            e = sqrt(xi * xi + eta * eta)
+            w_j3: float = atan2(eta, xi)
+
+            # the mean longitude keeps its secular rate so any extra perigee motion is removed from the anomaly
+            ma += w + w_dot * dt - w_j3
+            w = w_j3
+        else:
+            w += w_dot * dt
+        two_pi: float = 2 * pi
+        return a, e, i, (raan + raan_dot * dt) % two_pi, w % two_pi, (ma + ma_dot * dt) % two_pi
+
+    @staticmethod
+    def osculating_state(elements: ClassicalElements) -> IJK:
+        """calculate the osculating state of a mean element set
+
+        :param elements: mean elements of the orbit
+        :type elements: ClassicalElements
+        :return: inertial state including the first-order J2 short-period terms
+        :rtype: IJK
+        """
+        x, y, z, vx, vy, vz = SecularJ2._osculating_vector(
+            elements.semimajor_axis,
+            elements.eccentricity,
+            elements.inclination,
+            elements.raan,
+            elements.argument_of_perigee,
+            elements.mean_anomaly,
+        )
+        return IJK(elements.epoch, Vector3D(x, y, z), Vector3D(vx, vy, vz))
+
+    @staticmethod
+    def _osculating_vector(
+        a: float, e: float, i: float, raan: float, w: float, ma: float
+    ) -> Tuple[float, float, float, float, float, float]:
+        """calculate the osculating position and velocity of mean elements
+
+        The short-period terms are applied to the radius, argument of latitude, node, inclination, and radial and
+        transverse velocities (the same first-order form used by SGP4) so the solution stays defined for circular
+        and equatorial orbits.
+
+        :return: position and velocity components x, y, z, vx, vy, vz in km and km/s
+        :rtype: Tuple[float, float, float, float, float, float]
+        """
+        n: float = EquationsOfMotion.N.from_a_mu(a, Earth.MU)
+        ea: float = EquationsOfMotion.EA.from_ma_e(ma % (2 * pi), e)
+        cea: float = cos(ea)
+        sea: float = sin(ea)
+        beta: float = sqrt(1 - e * e)
+        p: float = a * beta * beta
+        r: float = a * (1 - e * cea)
+        u: float = w + atan2(beta * sea, cea - e)
+        r_dot: float = sqrt(Earth.MU * a) * e * sea / r
+        rf_dot: float = sqrt(Earth.MU * p) / r
+
+        ci: float = cos(i)
+        si: float = sin(i)
+        con41: float = 3 * ci * ci - 1
+        x1mth2: float = 1 - ci * ci
+        x7thm1: float = 7 * ci * ci - 1
+        temp1: float = 0.5 * Earth.J2 * Earth.RADIUS * Earth.RADIUS / p
+        temp2: float = temp1 / p
+        sin2u: float = sin(2 * u)
+        cos2u: float = cos(2 * u)
+
+        r_osc: float = r * (1 - 1.5 * temp2 * beta * con41) + 0.5 * temp1 * x1mth2 * cos2u
+        u_osc: float = u - 0.25 * temp2 * x7thm1 * sin2u
+        raan_osc: float = raan + 1.5 * temp2 * ci * sin2u
+        i_osc: float = i + 1.5 * temp2 * ci * si * cos2u
+        r_dot_osc: float = r_dot - n * temp1 * x1mth2 * sin2u
+        rf_dot_osc: float = rf_dot + n * temp1 * (x1mth2 * cos2u + 1.5 * con41)
+
+        su: float = sin(u_osc)
+        cu: float = cos(u_osc)
+        snod: float = sin(raan_osc)
+        cnod: float = cos(raan_osc)
+        sini: float = sin(i_osc)
+        cosi: float = cos(i_osc)
+        xmx: float = -snod * cosi
+        xmy: float = cnod * cosi
+        ux: float = xmx * su + cnod * cu
+        uy: float = xmy * su + snod * cu
+        uz: float = sini * su
+        vx: float = xmx * cu - cnod * su
+        vy: float = xmy * cu - snod * su
+        vz: float = sini * cu
+
+        return (
+            r_osc * ux,
+            r_osc * uy,
+            r_osc * uz,
+            r_dot_osc * ux + rf_dot_osc * vx,
+            r_dot_osc * uy + rf_dot_osc * vy,
+            r_dot_osc * uz + rf_dot_osc * vz,
+        )
+
+    @staticmethod
+    def to_osculating(elements: ClassicalElements) -> ClassicalElements:
+        """calculate the osculating elements of a mean element set
+
+        :param elements: mean elements of the orbit
+        :type elements: ClassicalElements
+        :return: osculating elements at the same epoch
+        :rtype: ClassicalElements
+        """
+        return ClassicalElements.from_ijk(SecularJ2.osculating_state(elements))
+
+    @staticmethod
+    def to_mean(elements: ClassicalElements) -> ClassicalElements:
+        """calculate the mean elements that reproduce an osculating element set
+
+        :param elements: osculating elements of the orbit
+        :type elements: ClassicalElements
+        :return: mean elements at the same epoch
+        :rtype: ClassicalElements
+        """
+        return SecularJ2.mean_from_state(elements.to_ijk())
+
+    @staticmethod
+    def mean_from_state(state: IJK) -> ClassicalElements:
+        """calculate the mean elements that reproduce an osculating state
+
+        The short-period terms are removed by fixed-point iteration in equinoctial elements, which avoids the
+        singularities of circular and equatorial orbits.
+
+        :param state: osculating inertial state of the orbit
+        :type state: IJK
+        :return: mean elements at the epoch of the state
+        :rtype: ClassicalElements
+        """
+        r: Vector3D = state.position
+        v: Vector3D = state.velocity
+        target: Tuple[float, ...] = SecularJ2._equinoctial_from_vector(r.x, r.y, r.z, v.x, v.y, v.z)
+        mean: List[float] = list(target)
+        iterations: int = 0
+        converged: bool = False
+        while not converged and iterations < SecularJ2.MAX_ITERATIONS:
+            trial: Tuple[float, ...] = SecularJ2._equinoctial_from_vector(
+                *SecularJ2._osculating_vector(*SecularJ2._from_equinoctial(*mean))
+            )
+            largest: float = 0
+            for n in range(6):
+                delta: float = target[n] - trial[n]
+                if n == 5:
+                    delta = (delta + pi) % (2 * pi) - pi
+                mean[n] += delta
+                largest = max(largest, abs(delta / mean[0]) if n == 0 else abs(delta))
+            iterations += 1
+            converged = largest < SecularJ2.TOLERANCE
+        return ClassicalElements(state.epoch, *SecularJ2._from_equinoctial(*mean))
+
+    @staticmethod
+    def propagate_grid(elements: List[ClassicalElements], epochs: List[Epoch], use_j3: bool = False) -> array:
+        """calculate the osculating states of many mean element sets at many epochs
+
+        :param elements: mean elements of the objects
+        :type elements: List[ClassicalElements]
+        :param epochs: output times
+        :type epochs: List[Epoch]
+        :param use_j3: flag to include the long-period motion caused by J3, defaults to False
+        :type use_j3: bool, optional
+        :return: flat buffer ordered by object, then epoch, then x, y, z, vx, vy, vz
+        :rtype: array
+        """
+        values: array = array("d")
+        for coes in elements:
+            a: float = coes.semimajor_axis
+            e: float = coes.eccentricity
+            i: float = coes.inclination
+            t0: float = coes.epoch.utc
+            for epoch in epochs:
+                values.extend(
+                    SecularJ2._osculating_vector(
+                        *SecularJ2._propagate(
+                            a,
+                            e,
+                            i,
+                            coes.raan,
+                            coes.argument_of_perigee,
+                            coes.mean_anomaly,
+                            (epoch.utc - t0) * DAYS_TO_SECONDS,
+                            use_j3,
+                        )
+                    )
+                )
+        return values
+
+    @staticmethod
+    def _to_equinoctial(a: float, e: float, i: float, raan: float, w: float, ma: float) -> Tuple[float, ...]:
+        """calculate the equinoctial elements a, h, k, p, q, and mean longitude of a classical element set"""
+        lw: float = raan + w
+        t: float = tan(i / 2)
+        return a, e * sin(lw), e * cos(lw), t * sin(raan), t * cos(raan), (lw + ma) % (2 * pi)
+
+    @staticmethod
+    def _from_equinoctial(a: float, h: float, k: float, p: float, q: float, lam: float) -> Tuple[float, ...]:
+        """calculate the classical elements a, e, i, raan, perigee argument, and mean anomaly of an equinoctial set"""
+        two_pi: float = 2 * pi
+        raan: float = atan2(p, q) % two_pi
+        lw: float = atan2(h, k)
+        i: float = 2 * atan2(sqrt(p * p + q * q), 1)
+        return a, sqrt(h * h + k * k), i, raan, (lw - raan) % two_pi, (lam - lw) % two_pi
+
+    @staticmethod
+    def _equinoctial_from_vector(
+        x: float, y: float, z: float, vx: float, vy: float, vz: float
+    ) -> Tuple[float, float, float, float, float, float]:
+        """calculate the equinoctial elements a, h, k, p, q, and mean longitude of a position and velocity"""
+        r: float = sqrt(x * x + y * y + z * z)
+        a: float = 1 / (2 / r - (vx * vx + vy * vy + vz * vz) / Earth.MU)
+
+        hx: float = y * vz - z * vy
+        hy: float = z * vx - x * vz
+        hz: float = x * vy - y * vx
+        h: float = sqrt(hx * hx + hy * hy + hz * hz)
+        p: float = hx / (h + hz)
+        q: float = -hy / (h + hz)
+
+        # equinoctial basis vectors
+        scale: float = 1 / (1 + p * p + q * q)
+        fx: float = (1 - p * p + q * q) * scale
+        fy: float = 2 * p * q * scale
+        fz: float = -2 * p * scale
+        gx: float = 2 * p * q * scale
+        gy: float = (1 + p * p - q * q) * scale
+        gz: float = 2 * q * scale
+
+        # eccentricity vector
+        ex: float = (vy * hz - vz * hy) / Earth.MU - x / r
+        ey: float = (vz * hx - vx * hz) / Earth.MU - y / r
+        ez: float = (vx * hy - vy * hx) / Earth.MU - z / r
+        k_e: float = ex * fx + ey * fy + ez * fz
+        h_e: float = ex * gx + ey * gy + ez * gz
+
+        x1: float = x * fx + y * fy + z * fz
+        y1: float = x * gx + y * gy + z * gz
+        root: float = sqrt(1 - h_e * h_e - k_e * k_e)
+        b: float = 1 / (1 + root)
+        sin_f: float = h_e + ((1 - h_e * h_e * b) * y1 - h_e * k_e * b * x1) / (a * root)
+        cos_f: float = k_e + ((1 - k_e * k_e * b) * x1 - h_e * k_e * b * y1) / (a * root)
+        lam: float = atan2(sin_f, cos_f) + h_e * cos_f - k_e * sin_f
+        return a, h_e, k_e, p, q, lam % (2 * pi)
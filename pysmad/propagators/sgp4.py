@@ -0,0 +1,1291 @@
+from array import array
+from math import atan2, cos, fmod, pi, radians, sin, sqrt
+from typing import List, Tuple
+
+from pysmad.coordinates.states import GCRF, TEME, StateConvert
+from pysmad.math.linalg import Matrix3D, Vector3D
+from pysmad.time import Epoch
+
+#: minutes in a day
+MINUTES_IN_DAY: float = 1440.0
+
+#: julian date of the 0 Jan 1950 epoch used by SGP4
+SGP4_JULIAN_DATE: float = 2433281.5
+
+#: used to wrap angles
+TWO_PI: float = 2.0 * pi
+
+
+class TwoLineElements:
+
+    #: revolutions per day to radians per minute
+    REVS_PER_DAY_TO_RADS_PER_MIN: float = TWO_PI / MINUTES_IN_DAY
+
+    def __init__(self, line1: str, line2: str, name: str | None = None) -> None:
+        """class used to parse a two-line element set
+
+        :param line1: first line of the element set
+        :type line1: str
+        :param line2: second line of the element set
+        :type line2: str
+        :param name: optional title line of the element set, defaults to None
+        :type name: str | None, optional
+        :raises ValueError: if either line is not a valid TLE line or the lines describe different objects
+        """
+        line1 = line1.rstrip()
+        line2 = line2.rstrip()
+        if not TwoLineElements.is_line_1(line1):
+            raise ValueError(" ".join(["TLE line 1 is malformed:", line1]))
+        if not TwoLineElements.is_line_2(line2):
+            raise ValueError(" ".join(["TLE line 2 is malformed:", line2]))
+        if line1[2:7] != line2[2:7]:
+            raise ValueError("object numbers in lines 1 and 2 do not match")
+
+        #: title line of the element set
+        self.name: str | None = name.strip() if name is not None else None
+
+        #: catalog number of the object (may be alpha-5)
+        self.sat_id: str = line1[2:7].strip()
+
+        #: security classification of the element set
+        self.classification: str = line1[7] or "U"
+
+        #: international designator of the object
+        self.designator: str = line1[9:17].strip()
+
+        two_digit_year: int = int(line1[18:20])
+        year: int = two_digit_year + 2000 if two_digit_year < 57 else two_digit_year + 1900
+
+        #: day of year (starting at 1.0) of the element set
+        self.day_of_year: float = float(line1[20:32])
+
+        #: 4-digit year of the element set epoch
+        self.year: int = year
+
+        #: time the element set is valid
+        self.epoch: Epoch = Epoch.from_datetime_components(year, 1, 1, 0, 0, 0).plus_days(self.day_of_year - 1)
+
+        #: first derivative of mean motion divided by two in revolutions per day squared
+        self.n_dot: float = float(line1[33:43])
+
+        #: second derivative of mean motion divided by six in revolutions per day cubed
+        self.n_ddot: float = float(line1[44] + "." + line1[45:50]) * 10 ** int(line1[50:52])
+
+        #: drag term in inverse earth radii
+        self.b_star: float = float(line1[53] + "." + line1[54:59]) * 10 ** int(line1[59:61])
+
+        #: element set number
+        self.element_number: int = int(line1[64:68])
+
+        #: inclination in radians
+        self.inclination: float = radians(float(line2[8:16]))
+
+        #: right ascension of the ascending node in radians
+        self.raan: float = radians(float(line2[17:25]))
+
+        #: eccentricity
+        self.eccentricity: float = float("0." + line2[26:33].replace(" ", "0"))
+
+        #: argument of perigee in radians
+        self.argument_of_perigee: float = radians(float(line2[34:42]))
+
+        #: mean anomaly in radians
+        self.mean_anomaly: float = radians(float(line2[43:51]))
+
+        #: Kozai mean motion in radians per minute
+        self.mean_motion: float = float(line2[52:63]) * TwoLineElements.REVS_PER_DAY_TO_RADS_PER_MIN
+
+        #: revolution number at epoch
+        self.revolution_number: int = int(line2[63:68].strip() or 0)
+
+        #: first line of the element set
+        self.line1: str = line1
+
+        #: second line of the element set
+        self.line2: str = line2
+
+    @staticmethod
+    def is_line_1(line: str) -> bool:
+        """check the fixed columns of the first line of an element set
+
+        :param line: text to be checked
+        :type line: str
+        :return: true if the text has the layout of a first line
+        :rtype: bool
+        """
+        return (
+            len(line) >= 64
+            and line.startswith("1 ")
+            and line[8] == " "
+            and line[23] == "."
+            and line[32] == " "
+            and line[34] == "."
+            and line[43] == " "
+            and line[52] == " "
+            and line[61] == " "
+            and line[63] == " "
+        )
+
+    @staticmethod
+    def is_line_2(line: str) -> bool:
+        """check the fixed columns of the second line of an element set
+
+        :param line: text to be checked
+        :type line: str
+        :return: true if the text has the layout of a second line
+        :rtype: bool
+        """
+        return (
+            len(line) >= 68
+            and line.startswith("2 ")
+            and line[7] == " "
+            and line[11] == "."
+            and line[16] == " "
+            and line[20] == "."
+            and line[25] == " "
+            and line[33] == " "
+            and line[37] == "."
+            and line[42] == " "
+            and line[46] == "."
+            and line[51] == " "
+        )
+
+    @staticmethod
+    def checksum(line: str) -> int:
+        """calculate the modulo-10 checksum of the first 68 columns of a line
+
+        :param line: line of an element set
+        :type line: str
+        :return: expected value of column 69
+        :rtype: int
+        """
+        total: int = 0
+        for c in line[:68]:
+            if c.isdigit():
+                total += int(c)
+            elif c == "-":
+                total += 1
+        return total % 10
+
+    @staticmethod
+    def from_file(path: str) -> List["TwoLineElements"]:
+        """parse every element set in a two or three line catalog file
+
+        Lines that are not part of an element set (comments and blank lines) are skipped and a line that precedes a
+        first line is used as the name of the element set.
+
+        :param path: location of the catalog
+        :type path: str
+        :return: element sets in the order they appear in the file
+        :rtype: List[TwoLineElements]
+        """
+        with open(path, "r") as f:
+            return TwoLineElements.from_lines(f.read().splitlines())
+
+    @staticmethod
+    def from_lines(lines: List[str]) -> List["TwoLineElements"]:
+        """parse every element set in a list of two or three line records
+
+        :param lines: text of the catalog split by line
+        :type lines: List[str]
+        :return: element sets in the order they appear
+        :rtype: List[TwoLineElements]
+        """
+        tles: List[TwoLineElements] = []
+        name: str | None = None
+        i: int = 0
+        while i < len(lines):
+            line: str = lines[i]
+            if line.startswith("1 ") and i + 1 < len(lines) and lines[i + 1].startswith("2 "):
+                tles.append(TwoLineElements(line, lines[i + 1], name))
+                name = None
+                i += 2
+            else:
+                name = line[2:] if line.startswith("0 ") else line
+                if not name.strip() or line.startswith("#"):
+                    name = None
+                i += 1
+        return tles
+
+
+class SGP4:
+    """class used to propagate two-line element sets with SGP4 (near earth) and SDP4 (deep space)
+
+    The theory follows the 2006 revision of Spacetrack Report #3 by Vallado, Crawford, Hujsak, and Kelso in the
+    "improved" operation mode with WGS-72 constants.  The internal coefficients keep the names used in that report
+    so the implementation can be compared line-for-line with the published code.
+    """
+
+    #: G*M of the WGS-72 earth model in km^3/s^2
+    MU: float = 398600.8
+
+    #: equatorial radius of the WGS-72 earth model in km
+    RADIUS: float = 6378.135
+
+    #: sqrt(mu) in earth radii^1.5 per minute
+    XKE: float = 60.0 / sqrt(RADIUS * RADIUS * RADIUS / MU)
+
+    #: second zonal harmonic of the WGS-72 earth model
+    J2: float = 0.001082616
+
+    #: third zonal harmonic of the WGS-72 earth model
+    J3: float = -0.00000253881
+
+    #: fourth zonal harmonic of the WGS-72 earth model
+    J4: float = -0.00000165597
+
+    #: ratio of the third and second zonal harmonics
+    J3OJ2: float = J3 / J2
+
+    #: velocity of one earth radius per minute in km/s
+    VKMPERSEC: float = RADIUS * XKE / 60.0
+
+    #: earth rotation rate in radians per minute used by the resonance terms
+    RPTIM: float = 4.37526908801129966e-3
+
+    #: messages that describe the error codes of the theory
+    ERRORS: dict[int, str] = {
+        1: "mean eccentricity is not within the range 0 <= e < 1",
+        2: "mean motion is less than zero",
+        3: "perturbed eccentricity is not within the range 0 <= e <= 1",
+        4: "semi-latus rectum is less than zero",
+        6: "the satellite has decayed",
+    }
+
+    def __init__(self, tle: TwoLineElements) -> None:
+        """class used to propagate a two-line element set
+
+        :param tle: element set to be propagated
+        :type tle: TwoLineElements
+        :raises ValueError: if the theory cannot produce a state at the element set epoch
+        """
+        #: element set used to initialize the theory
+        self.tle: TwoLineElements = tle
+
+        #: time the element set is valid
+        self.epoch: Epoch = tle.epoch.copy()
+
+        #: code of the last error raised by the theory (0 when the last solution was valid)
+        self.error: int = 0
+
+        self._initialize(tle)
+
+        #: the current state of the propagator
+        self.state: GCRF = self.gcrf_state(self.epoch)
+
+    def step_to_epoch(self, epoch: Epoch) -> None:
+        """advance the propagator state to the argument epoch
+
+        :param epoch: time of state to be calculated
+        :type epoch: Epoch
+        """
+        self.state = self.gcrf_state(epoch)
+
+    def minutes_since_epoch(self, epoch: Epoch) -> float:
+        """calculate the time since the element set epoch
+
+        :param epoch: time of interest
+        :type epoch: Epoch
+        :return: minutes past the element set epoch
+        :rtype: float
+        """
+        return (epoch.utc - self.epoch.utc) * MINUTES_IN_DAY
+
+    def teme_state(self, epoch: Epoch) -> TEME:
+        """calculate the state of the object in the frame of the theory
+
+        :param epoch: time of state to be calculated
+        :type epoch: Epoch
+        :raises ValueError: if the theory cannot produce a state at the epoch
+        :return: state in the true equator, mean equinox frame
+        :rtype: TEME
+        """
+        vector: Tuple[float, ...] = self.solve(self.minutes_since_epoch(epoch))
+        if self.error:
+            raise ValueError(" ".join([self.tle.sat_id, SGP4.ERRORS[self.error]]))
+        return TEME(epoch, Vector3D(*vector[:3]), Vector3D(*vector[3:]))
+
+    def gcrf_state(self, epoch: Epoch) -> GCRF:
+        """calculate the inertial state of the object
+
+        :param epoch: time of state to be calculated
+        :type epoch: Epoch
+        :raises ValueError: if the theory cannot produce a state at the epoch
+        :return: GCRF state
+        :rtype: GCRF
+        """
+        return StateConvert.teme.to_gcrf(self.teme_state(epoch))
+
+    @staticmethod
+    def propagate_grid(tles: List[TwoLineElements], epochs: List[Epoch]) -> array:
+        """calculate the GCRF states of many element sets at many epochs
+
+        The TEME to GCRF matrix of each epoch is computed once and shared by the whole catalog.  States that the
+        theory cannot produce (decayed or invalid element sets) are stored as nan.
+
+        :param tles: element sets of the catalog
+        :type tles: List[TwoLineElements]
+        :param epochs: output times
+        :type epochs: List[Epoch]
+        :return: flat buffer ordered by object, then epoch, then x, y, z, vx, vy, vz
+        :rtype: array
+        """
+        rows: List[Tuple[float, ...]] = []
+        for epoch in epochs:
+            m: Matrix3D = TEME.gcrf_matrix(epoch)
+            rows.append((m.row1.x, m.row1.y, m.row1.z, m.row2.x, m.row2.y, m.row2.z, m.row3.x, m.row3.y, m.row3.z))
+        nan: float = float("nan")
+        invalid: Tuple[float, ...] = (nan, nan, nan, nan, nan, nan)
+        values: array = array("d")
+        for tle in tles:
+            try:
+                propagator: SGP4 = SGP4(tle)
+            except ValueError:
+                values.extend(invalid * len(epochs))
+                continue
+            t0: float = propagator.epoch.utc
+            for epoch, (a, b, c, d, e, f, g, h, i) in zip(epochs, rows):
+                x, y, z, vx, vy, vz = propagator.solve((epoch.utc - t0) * MINUTES_IN_DAY)
+                if propagator.error:
+                    values.extend(invalid)
+                else:
+                    values.extend(
+                        (
+                            a * x + b * y + c * z,
+                            d * x + e * y + f * z,
+                            g * x + h * y + i * z,
+                            a * vx + b * vy + c * vz,
+                            d * vx + e * vy + f * vz,
+                            g * vx + h * vy + i * vz,
+                        )
+                    )
+        return values
+
+    @staticmethod
+    def gstime(jdut1: float) -> float:
+        """calculate the greenwich mean sidereal time used by the theory
+
+        :param jdut1: julian date in ut1
+        :type jdut1: float
+        :return: sidereal angle in radians
+        :rtype: float
+        """
+        tut1: float = (jdut1 - 2451545.0) / 36525.0
+        temp: float = (
+            -6.2e-6 * tut1 * tut1 * tut1
+            + 0.093104 * tut1 * tut1
+            + (876600.0 * 3600 + 8640184.812866) * tut1
+            + 67310.54841
+        )
+        temp = fmod(radians(temp) / 240.0, TWO_PI)
+        if temp < 0.0:
+            temp += TWO_PI
+        return temp
+
+    def _initialize(self, tle: TwoLineElements) -> None:
+        """calculate the coefficients of the theory (sgp4init in the report)
+
+        :param tle: element set to be propagated
+        :type tle: TwoLineElements
+        """
+        j2: float = SGP4.J2
+        x2o3: float = 2.0 / 3.0
+        temp4: float = 1.5e-12
+        # the day count passes through a julian date to reproduce the rounding of the published reference code
+        year_start: float = Epoch.mjd_to_jd(Epoch.from_datetime_components(tle.year, 1, 1, 0, 0, 0).utc)
+        epoch: float = year_start + tle.day_of_year - 1.0 - SGP4_JULIAN_DATE
+
+        self.bstar: float = tle.b_star
+        self.ecco: float = tle.eccentricity
+        self.argpo: float = tle.argument_of_perigee
+        self.inclo: float = tle.inclination
+        self.mo: float = tle.mean_anomaly
+        self.nodeo: float = tle.raan
+        self.method: str = "n"
+        self.isimp: int = 0
+        self.irez: int = 0
+        self.t: float = 0.0
+        for name in (
+            "aycof con41 cc1 cc4 cc5 d2 d3 d4 delmo eta argpdot omgcof sinmao t2cof t3cof t4cof t5cof x1mth2 "
+            "x7thm1 mdot nodedot xlcof xmcof nodecf d2201 d2211 d3210 d3222 d4410 d4422 d5220 d5232 d5421 d5433 "
+            "dedt del1 del2 del3 didt dmdt dnodt domdt e3 ee2 peo pgho pho pinco plo se2 se3 sgh2 sgh3 sgh4 sh2 "
+            "sh3 si2 si3 sl2 sl3 sl4 gsto xfact xgh2 xgh3 xgh4 xh2 xh3 xi2 xi3 xl2 xl3 xl4 xlamo zmol zmos atime "
+            "xli xni"
+        ).split():
+            setattr(self, name, 0.0)
+
+        ss: float = 78.0 / SGP4.RADIUS + 1.0
+        qzms2ttemp: float = (120.0 - 78.0) / SGP4.RADIUS
+        qzms2t: float = qzms2ttemp * qzms2ttemp * qzms2ttemp * qzms2ttemp
+
+        # initl: recover the un-Kozai mean motion and the sidereal angle at epoch
+        eccsq: float = self.ecco * self.ecco
+        omeosq: float = 1.0 - eccsq
+        rteosq: float = sqrt(omeosq)
+        cosio: float = cos(self.inclo)
+        cosio2: float = cosio * cosio
+        ak: float = (SGP4.XKE / tle.mean_motion) ** x2o3
+        d1: float = 0.75 * j2 * (3.0 * cosio2 - 1.0) / (rteosq * omeosq)
+        del_: float = d1 / (ak * ak)
+        adel: float = ak * (1.0 - del_ * del_ - del_ * (1.0 / 3.0 + 134.0 * del_ * del_ / 81.0))
+        del_ = d1 / (adel * adel)
+        self.no_unkozai: float = tle.mean_motion / (1.0 + del_)
+        ao: float = (SGP4.XKE / self.no_unkozai) ** x2o3
+        sinio: float = sin(self.inclo)
+        po: float = ao * omeosq
+        con42: float = 1.0 - 5.0 * cosio2
+        self.con41 = -con42 - cosio2 - cosio2
+        posq: float = po * po
+        rp: float = ao * (1.0 - self.ecco)
+        self.gsto = SGP4.gstime(epoch + 2433281.5)
+
+        self.isimp = 0
+        if rp < 220.0 / SGP4.RADIUS + 1.0:
+            self.isimp = 1
+        sfour: float = ss
+        qzms24: float = qzms2t
+        perige: float = (rp - 1.0) * SGP4.RADIUS
+
+        # for perigees below 156 km the values of s and qoms2t are altered
+        if perige < 156.0:
+            sfour = perige - 78.0
+            if perige < 98.0:
+                sfour = 20.0
+            qzms24temp: float = (120.0 - sfour) / SGP4.RADIUS
+            qzms24 = qzms24temp * qzms24temp * qzms24temp * qzms24temp
+            sfour = sfour / SGP4.RADIUS + 1.0
+
+        pinvsq: float = 1.0 / posq
+        tsi: float = 1.0 / (ao - sfour)
+        self.eta = ao * self.ecco * tsi
+        etasq: float = self.eta * self.eta
+        eeta: float = self.ecco * self.eta
+        psisq: float = abs(1.0 - etasq)
+        coef: float = qzms24 * tsi**4
+        coef1: float = coef / psisq**3.5
+        cc2: float = (
+            coef1
+            * self.no_unkozai
+            * (
+                ao * (1.0 + 1.5 * etasq + eeta * (4.0 + etasq))
+                + 0.375 * j2 * tsi / psisq * self.con41 * (8.0 + 3.0 * etasq * (8.0 + etasq))
+            )
+        )
+        self.cc1 = self.bstar * cc2
+        cc3: float = 0.0
+        if self.ecco > 1.0e-4:
+            cc3 = -2.0 * coef * tsi * SGP4.J3OJ2 * self.no_unkozai * sinio / self.ecco
+        self.x1mth2 = 1.0 - cosio2
+        self.cc4 = (
+            2.0
+            * self.no_unkozai
+            * coef1
+            * ao
+            * omeosq
+            * (
+                self.eta * (2.0 + 0.5 * etasq)
+                + self.ecco * (0.5 + 2.0 * etasq)
+                - j2
+                * tsi
+                / (ao * psisq)
+                * (
+                    -3.0 * self.con41 * (1.0 - 2.0 * eeta + etasq * (1.5 - 0.5 * eeta))
+                    + 0.75 * self.x1mth2 * (2.0 * etasq - eeta * (1.0 + etasq)) * cos(2.0 * self.argpo)
+                )
+            )
+        )
+        self.cc5 = 2.0 * coef1 * ao * omeosq * (1.0 + 2.75 * (etasq + eeta) + eeta * etasq)
+        cosio4: float = cosio2 * cosio2
+        temp1: float = 1.5 * j2 * pinvsq * self.no_unkozai
+        temp2: float = 0.5 * temp1 * j2 * pinvsq
+        temp3: float = -0.46875 * SGP4.J4 * pinvsq * pinvsq * self.no_unkozai
+        self.mdot = (
+            self.no_unkozai
+            + 0.5 * temp1 * rteosq * self.con41
+            + 0.0625 * temp2 * rteosq * (13.0 - 78.0 * cosio2 + 137.0 * cosio4)
+        )
+        self.argpdot = (
+            -0.5 * temp1 * con42
+            + 0.0625 * temp2 * (7.0 - 114.0 * cosio2 + 395.0 * cosio4)
+            + temp3 * (3.0 - 36.0 * cosio2 + 49.0 * cosio4)
+        )
+        xhdot1: float = -temp1 * cosio
+        self.nodedot = xhdot1 + (0.5 * temp2 * (4.0 - 19.0 * cosio2) + 2.0 * temp3 * (3.0 - 7.0 * cosio2)) * cosio
+        xpidot: float = self.argpdot + self.nodedot
+        self.omgcof = self.bstar * cc3 * cos(self.argpo)
+        self.xmcof = 0.0
+        if self.ecco > 1.0e-4:
+            self.xmcof = -x2o3 * coef * self.bstar / eeta
+        self.nodecf = 3.5 * omeosq * xhdot1 * self.cc1
+        self.t2cof = 1.5 * self.cc1
+        if abs(cosio + 1.0) > 1.5e-12:
+            self.xlcof = -0.25 * SGP4.J3OJ2 * sinio * (3.0 + 5.0 * cosio) / (1.0 + cosio)
+        else:
+            self.xlcof = -0.25 * SGP4.J3OJ2 * sinio * (3.0 + 5.0 * cosio) / temp4
+        self.aycof = -0.5 * SGP4.J3OJ2 * sinio
+        delmotemp: float = 1.0 + self.eta * cos(self.mo)
+        self.delmo = delmotemp * delmotemp * delmotemp
+        self.sinmao = sin(self.mo)
+        self.x7thm1 = 7.0 * cosio2 - 1.0
+
+        # deep space initialization for periods of 225 minutes or more
+        if TWO_PI / self.no_unkozai >= 225.0:
+            self.method = "d"
+            self.isimp = 1
+            tc: float = 0.0
+            inclm: float = self.inclo
+            ds: dict[str, float] = self._dscom(
+                epoch, self.ecco, self.argpo, tc, self.inclo, self.nodeo, self.no_unkozai
+            )
+            self.ecco, self.inclo, self.nodeo, self.argpo, self.mo = self._dpper(
+                self.t, True, self.ecco, self.inclo, self.nodeo, self.argpo, self.mo
+            )
+            self._dsinit(ds, tc, xpidot, eccsq, inclm)
+
+        # set variables if not deep space
+        if self.isimp != 1:
+            cc1sq: float = self.cc1 * self.cc1
+            self.d2 = 4.0 * ao * tsi * cc1sq
+            temp: float = self.d2 * tsi * self.cc1 / 3.0
+            self.d3 = (17.0 * ao + sfour) * temp
+            self.d4 = 0.5 * temp * ao * tsi * (221.0 * ao + 31.0 * sfour) * self.cc1
+            self.t3cof = self.d2 + 2.0 * cc1sq
+            self.t4cof = 0.25 * (3.0 * self.d3 + self.cc1 * (12.0 * self.d2 + 10.0 * cc1sq))
+            self.t5cof = 0.2 * (
+                3.0 * self.d4
+                + 12.0 * self.cc1 * self.d3
+                + 6.0 * self.d2 * self.d2
+                + 15.0 * cc1sq * (2.0 * self.d2 + cc1sq)
+            )
+
+    def _dscom(
+        self, epoch: float, ep: float, argpp: float, tc: float, inclp: float, nodep: float, np: float
+    ) -> dict[str, float]:
+        """calculate the lunar and solar terms shared by the deep space secular and periodic contributions
+
+        :return: intermediate values required by the deep space initialization
+        :rtype: dict[str, float]
+        """
+        zes: float = 0.01675
+        zel: float = 0.05490
+        c1ss: float = 2.9864797e-6
+        c1l: float = 4.7968065e-7
+        zsinis: float = 0.39785416
+        zcosis: float = 0.91744867
+        zcosgs: float = 0.1945905
+        zsings: float = -0.98088458
+
+        nm: float = np
+        em: float = ep
+        snodm: float = sin(nodep)
+        cnodm: float = cos(nodep)
+        sinomm: float = sin(argpp)
+        cosomm: float = cos(argpp)
+        sinim: float = sin(inclp)
+        cosim: float = cos(inclp)
+        emsq: float = em * em
+        betasq: float = 1.0 - emsq
+        rtemsq: float = sqrt(betasq)
+
+        # initialize lunar solar terms
+        self.peo = 0.0
+        self.pinco = 0.0
+        self.plo = 0.0
+        self.pgho = 0.0
+        self.pho = 0.0
+        day: float = epoch + 18261.5 + tc / 1440.0
+        xnodce: float = fmod(4.5236020 - 9.2422029e-4 * day, TWO_PI)
+        stem: float = sin(xnodce)
+        ctem: float = cos(xnodce)
+        zcosil: float = 0.91375164 - 0.03568096 * ctem
+        zsinil: float = sqrt(1.0 - zcosil * zcosil)
+        zsinhl: float = 0.089683511 * stem / zsinil
+        zcoshl: float = sqrt(1.0 - zsinhl * zsinhl)
+        gam: float = 5.8351514 + 0.0019443680 * day
+        zx: float = 0.39785416 * stem / zsinil
+        zy: float = zcoshl * ctem + 0.91744867 * zsinhl * stem
+        zx = atan2(zx, zy)
+        zx = gam + zx - xnodce
+        zcosgl: float = cos(zx)
+        zsingl: float = sin(zx)
+
+        # do solar terms first and lunar terms second
+        zcosg: float = zcosgs
+        zsing: float = zsings
+        zcosi: float = zcosis
+        zsini: float = zsinis
+        zcosh: float = cnodm
+        zsinh: float = snodm
+        cc: float = c1ss
+        xnoi: float = 1.0 / nm
+
+        terms: List[dict[str, float]] = []
+        for lsflg in (1, 2):
+            a1: float = zcosg * zcosh + zsing * zcosi * zsinh
+            a3: float = -zsing * zcosh + zcosg * zcosi * zsinh
+            a7: float = -zcosg * zsinh + zsing * zcosi * zcosh
+            a8: float = zsing * zsini
+            a9: float = zsing * zsinh + zcosg * zcosi * zcosh
+            a10: float = zcosg * zsini
+            a2: float = cosim * a7 + sinim * a8
+            a4: float = cosim * a9 + sinim * a10
+            a5: float = -sinim * a7 + cosim * a8
+            a6: float = -sinim * a9 + cosim * a10
+
+            x1: float = a1 * cosomm + a2 * sinomm
+            x2: float = a3 * cosomm + a4 * sinomm
+            x3: float = -a1 * sinomm + a2 * cosomm
+            x4: float = -a3 * sinomm + a4 * cosomm
+            x5: float = a5 * sinomm
+            x6: float = a6 * sinomm
+            x7: float = a5 * cosomm
+            x8: float = a6 * cosomm
+
+            z31: float = 12.0 * x1 * x1 - 3.0 * x3 * x3
+            z32: float = 24.0 * x1 * x2 - 6.0 * x3 * x4
+            z33: float = 12.0 * x2 * x2 - 3.0 * x4 * x4
+            z1: float = 3.0 * (a1 * a1 + a2 * a2) + z31 * emsq
+            z2: float = 6.0 * (a1 * a3 + a2 * a4) + z32 * emsq
+            z3: float = 3.0 * (a3 * a3 + a4 * a4) + z33 * emsq
+            z11: float = -6.0 * a1 * a5 + emsq * (-24.0 * x1 * x7 - 6.0 * x3 * x5)
+            z12: float = -6.0 * (a1 * a6 + a3 * a5) + emsq * (-24.0 * (x2 * x7 + x1 * x8) - 6.0 * (x3 * x6 + x4 * x5))
+            z13: float = -6.0 * a3 * a6 + emsq * (-24.0 * x2 * x8 - 6.0 * x4 * x6)
+            z21: float = 6.0 * a2 * a5 + emsq * (24.0 * x1 * x5 - 6.0 * x3 * x7)
+            z22: float = 6.0 * (a4 * a5 + a2 * a6) + emsq * (24.0 * (x2 * x5 + x1 * x6) - 6.0 * (x4 * x7 + x3 * x8))
+            z23: float = 6.0 * a4 * a6 + emsq * (24.0 * x2 * x6 - 6.0 * x4 * x8)
+            z1 = z1 + z1 + betasq * z31
+            z2 = z2 + z2 + betasq * z32
+            z3 = z3 + z3 + betasq * z33
+            s3: float = cc * xnoi
+            s2: float = -0.5 * s3 / rtemsq
+            s4: float = s3 * rtemsq
+            s1: float = -15.0 * em * s4
+            s5: float = x1 * x3 + x2 * x4
+            s6: float = x2 * x3 + x1 * x4
+            s7: float = x2 * x4 - x1 * x3
+
+            terms.append(
+                {
+                    "s1": s1,
+                    "s2": s2,
+                    "s3": s3,
+                    "s4": s4,
+                    "s5": s5,
+                    "s6": s6,
+                    "s7": s7,
+                    "z1": z1,
+                    "z2": z2,
+                    "z3": z3,
+                    "z11": z11,
+                    "z12": z12,
+                    "z13": z13,
+                    "z21": z21,
+                    "z22": z22,
+                    "z23": z23,
+                    "z31": z31,
+                    "z32": z32,
+                    "z33": z33,
+                }
+            )
+
+            # switch to the lunar terms
+            if lsflg == 1:
+                zcosg = zcosgl
+                zsing = zsingl
+                zcosi = zcosil
+                zsini = zsinil
+                zcosh = zcoshl * cnodm + zsinhl * snodm
+                zsinh = snodm * zcoshl - cnodm * zsinhl
+                cc = c1l
+
+        sun: dict[str, float] = terms[0]
+        moon: dict[str, float] = terms[1]
+
+        self.zmol = fmod(4.7199672 + 0.22997150 * day - gam, TWO_PI)
+        self.zmos = fmod(6.2565837 + 0.017201977 * day, TWO_PI)
+
+        # solar terms
+        self.se2 = 2.0 * sun["s1"] * sun["s6"]
+        self.se3 = 2.0 * sun["s1"] * sun["s7"]
+        self.si2 = 2.0 * sun["s2"] * sun["z12"]
+        self.si3 = 2.0 * sun["s2"] * (sun["z13"] - sun["z11"])
+        self.sl2 = -2.0 * sun["s3"] * sun["z2"]
+        self.sl3 = -2.0 * sun["s3"] * (sun["z3"] - sun["z1"])
+        self.sl4 = -2.0 * sun["s3"] * (-21.0 - 9.0 * emsq) * zes
+        self.sgh2 = 2.0 * sun["s4"] * sun["z32"]
+        self.sgh3 = 2.0 * sun["s4"] * (sun["z33"] - sun["z31"])
+        self.sgh4 = -18.0 * sun["s4"] * zes
+        self.sh2 = -2.0 * sun["s2"] * sun["z22"]
+        self.sh3 = -2.0 * sun["s2"] * (sun["z23"] - sun["z21"])
+
+        # lunar terms
+        self.ee2 = 2.0 * moon["s1"] * moon["s6"]
+        self.e3 = 2.0 * moon["s1"] * moon["s7"]
+        self.xi2 = 2.0 * moon["s2"] * moon["z12"]
+        self.xi3 = 2.0 * moon["s2"] * (moon["z13"] - moon["z11"])
+        self.xl2 = -2.0 * moon["s3"] * moon["z2"]
+        self.xl3 = -2.0 * moon["s3"] * (moon["z3"] - moon["z1"])
+        self.xl4 = -2.0 * moon["s3"] * (-21.0 - 9.0 * emsq) * zel
+        self.xgh2 = 2.0 * moon["s4"] * moon["z32"]
+        self.xgh3 = 2.0 * moon["s4"] * (moon["z33"] - moon["z31"])
+        self.xgh4 = -18.0 * moon["s4"] * zel
+        self.xh2 = -2.0 * moon["s2"] * moon["z22"]
+        self.xh3 = -2.0 * moon["s2"] * (moon["z23"] - moon["z21"])
+
+        shared: dict[str, float] = {"sinim": sinim, "cosim": cosim, "em": em, "emsq": emsq, "nm": nm}
+        shared.update(moon)
+        shared.update({"s" + key: value for key, value in sun.items()})
+        return shared
+
+    def _dpper(
+        self, t: float, init: bool, ep: float, inclp: float, nodep: float, argpp: float, mp: float
+    ) -> Tuple[float, float, float, float, float]:
+        """calculate the deep space long-period periodic contributions to the mean elements
+
+        :return: perturbed eccentricity, inclination, node, argument of perigee, and mean anomaly
+        :rtype: Tuple[float, float, float, float, float]
+        """
+        zns: float = 1.19459e-5
+        zes: float = 0.01675
+        znl: float = 1.5835218e-4
+        zel: float = 0.05490
+
+        # calculate time varying periodics
+        zm: float = self.zmos if init else self.zmos + zns * t
+        zf: float = zm + 2.0 * zes * sin(zm)
+        sinzf: float = sin(zf)
+        f2: float = 0.5 * sinzf * sinzf - 0.25
+        f3: float = -0.5 * sinzf * cos(zf)
+        ses: float = self.se2 * f2 + self.se3 * f3
+        sis: float = self.si2 * f2 + self.si3 * f3
+        sls: float = self.sl2 * f2 + self.sl3 * f3 + self.sl4 * sinzf
+        sghs: float = self.sgh2 * f2 + self.sgh3 * f3 + self.sgh4 * sinzf
+        shs: float = self.sh2 * f2 + self.sh3 * f3
+
+        zm = self.zmol if init else self.zmol + znl * t
+        zf = zm + 2.0 * zel * sin(zm)
+        sinzf = sin(zf)
+        f2 = 0.5 * sinzf * sinzf - 0.25
+        f3 = -0.5 * sinzf * cos(zf)
+        sel: float = self.ee2 * f2 + self.e3 * f3
+        sil: float = self.xi2 * f2 + self.xi3 * f3
+        sll: float = self.xl2 * f2 + self.xl3 * f3 + self.xl4 * sinzf
+        sghl: float = self.xgh2 * f2 + self.xgh3 * f3 + self.xgh4 * sinzf
+        shll: float = self.xh2 * f2 + self.xh3 * f3
+
+        pe: float = ses + sel
+        pinc: float = sis + sil
+        pl: float = sls + sll
+        pgh: float = sghs + sghl
+        ph: float = shs + shll
+
+        if not init:
+            pe = pe - self.peo
+            pinc = pinc - self.pinco
+            pl = pl - self.plo
+            pgh = pgh - self.pgho
+            ph = ph - self.pho
+            inclp = inclp + pinc
+            ep = ep + pe
+            sinip: float = sin(inclp)
+            cosip: float = cos(inclp)
+
+            # apply periodics directly above 0.2 radians and with the Lyddane modification below
+            if inclp >= 0.2:
+                ph = ph / sinip
+                pgh = pgh - cosip * ph
+                argpp = argpp + pgh
+                nodep = nodep + ph
+                mp = mp + pl
+            else:
+                sinop: float = sin(nodep)
+                cosop: float = cos(nodep)
+                alfdp: float = sinip * sinop
+                betdp: float = sinip * cosop
+                dalf: float = ph * cosop + pinc * cosip * sinop
+                dbet: float = -ph * sinop + pinc * cosip * cosop
+                alfdp = alfdp + dalf
+                betdp = betdp + dbet
+                nodep = fmod(nodep, TWO_PI)
+                xls: float = mp + argpp + pl + pgh + (cosip - pinc * sinip) * nodep
+                xnoh: float = nodep
+                nodep = atan2(alfdp, betdp)
+                if abs(xnoh - nodep) > pi:
+                    if nodep < xnoh:
+                        nodep = nodep + TWO_PI
+                    else:
+                        nodep = nodep - TWO_PI
+                mp = mp + pl
+                argpp = xls - mp - cosip * nodep
+
+        return ep, inclp, nodep, argpp, mp
+
+    def _dsinit(self, ds: dict[str, float], tc: float, xpidot: float, eccsq: float, inclm: float) -> None:
+        """calculate the deep space secular rates and the resonance terms of 12 and 24 hour orbits
+
+        :param ds: intermediate values produced by the lunar and solar terms
+        :type ds: dict[str, float]
+        :param tc: minutes since epoch of the initialization
+        :type tc: float
+        :param xpidot: rate of the longitude of perigee
+        :type xpidot: float
+        :param eccsq: eccentricity squared at epoch
+        :type eccsq: float
+        :param inclm: inclination at epoch
+        :type inclm: float
+        """
+        q22: float = 1.7891679e-6
+        q31: float = 2.1460748e-6
+        q33: float = 2.2123015e-7
+        root22: float = 1.7891679e-6
+        root44: float = 7.3636953e-9
+        root54: float = 2.1765803e-9
+        root32: float = 3.7393792e-7
+        root52: float = 1.1428639e-7
+        x2o3: float = 2.0 / 3.0
+        znl: float = 1.5835218e-4
+        zns: float = 1.19459e-5
+        rptim: float = SGP4.RPTIM
+
+        sinim: float = ds["sinim"]
+        cosim: float = ds["cosim"]
+        em: float = ds["em"]
+        emsq: float = ds["emsq"]
+        nm: float = ds["nm"]
+
+        # deep space initialization
+        self.irez = 0
+        if 0.0034906585 < nm < 0.0052359877:
+            self.irez = 1
+        if 8.26e-3 <= nm <= 9.24e-3 and em >= 0.5:
+            self.irez = 2
+
+        # solar terms
+        ses: float = ds["ss1"] * zns * ds["ss5"]
+        sis: float = ds["ss2"] * zns * (ds["sz11"] + ds["sz13"])
+        sls: float = -zns * ds["ss3"] * (ds["sz1"] + ds["sz3"] - 14.0 - 6.0 * emsq)
+        sghs: float = ds["ss4"] * zns * (ds["sz31"] + ds["sz33"] - 6.0)
+        shs: float = -zns * ds["ss2"] * (ds["sz21"] + ds["sz23"])
+        if inclm < 5.2359877e-2 or inclm > pi - 5.2359877e-2:
+            shs = 0.0
+        if sinim != 0.0:
+            shs = shs / sinim
+        sgs: float = sghs - cosim * shs
+
+        # lunar terms
+        self.dedt = ses + ds["s1"] * znl * ds["s5"]
+        self.didt = sis + ds["s2"] * znl * (ds["z11"] + ds["z13"])
+        self.dmdt = sls - znl * ds["s3"] * (ds["z1"] + ds["z3"] - 14.0 - 6.0 * emsq)
+        sghl: float = ds["s4"] * znl * (ds["z31"] + ds["z33"] - 6.0)
+        shll: float = -znl * ds["s2"] * (ds["z21"] + ds["z23"])
+        if inclm < 5.2359877e-2 or inclm > pi - 5.2359877e-2:
+            shll = 0.0
+        self.domdt = sgs + sghl
+        self.dnodt = shs
+        if sinim != 0.0:
+            self.domdt = self.domdt - cosim / sinim * shll
+            self.dnodt = self.dnodt + shll / sinim
+
+        theta: float = fmod(self.gsto + tc * rptim, TWO_PI)
+
+        # initialize the resonance terms
+        if self.irez != 0:
+            aonv: float = (nm / SGP4.XKE) ** x2o3
+
+            # geopotential resonance for 12 hour orbits
+            if self.irez == 2:
+                cosisq: float = cosim * cosim
+                em = self.ecco
+                emsq = eccsq
+                eoc: float = em * emsq
+                g201: float = -0.306 - (em - 0.64) * 0.440
+                if em <= 0.65:
+                    g211: float = 3.616 - 13.2470 * em + 16.2900 * emsq
+                    g310: float = -19.302 + 117.3900 * em - 228.4190 * emsq + 156.5910 * eoc
+                    g322: float = -18.9068 + 109.7927 * em - 214.6334 * emsq + 146.5816 * eoc
+                    g410: float = -41.122 + 242.6940 * em - 471.0940 * emsq + 313.9530 * eoc
+                    g422: float = -146.407 + 841.8800 * em - 1629.014 * emsq + 1083.4350 * eoc
+                    g520: float = -532.114 + 3017.977 * em - 5740.032 * emsq + 3708.2760 * eoc
+                else:
+                    g211 = -72.099 + 331.819 * em - 508.738 * emsq + 266.724 * eoc
+                    g310 = -346.844 + 1582.851 * em - 2415.925 * emsq + 1246.113 * eoc
+                    g322 = -342.585 + 1554.908 * em - 2366.899 * emsq + 1215.972 * eoc
+                    g410 = -1052.797 + 4758.686 * em - 7193.992 * emsq + 3651.957 * eoc
+                    g422 = -3581.690 + 16178.110 * em - 24462.770 * emsq + 12422.520 * eoc
+                    if em > 0.715:
+                        g520 = -5149.66 + 29936.92 * em - 54087.36 * emsq + 31324.56 * eoc
+                    else:
+                        g520 = 1464.74 - 4664.75 * em + 3763.64 * emsq
+                if em < 0.7:
+                    g533: float = -919.22770 + 4988.6100 * em - 9064.7700 * emsq + 5542.21 * eoc
+                    g521: float = -822.71072 + 4568.6173 * em - 8491.4146 * emsq + 5337.524 * eoc
+                    g532: float = -853.66600 + 4690.2500 * em - 8624.7700 * emsq + 5341.4 * eoc
+                else:
+                    g533 = -37995.780 + 161616.52 * em - 229838.20 * emsq + 109377.94 * eoc
+                    g521 = -51752.104 + 218913.95 * em - 309468.16 * emsq + 146349.42 * eoc
+                    g532 = -40023.880 + 170470.89 * em - 242699.48 * emsq + 115605.82 * eoc
+
+                sini2: float = sinim * sinim
+                f220: float = 0.75 * (1.0 + 2.0 * cosim + cosisq)
+                f221: float = 1.5 * sini2
+                f321: float = 1.875 * sinim * (1.0 - 2.0 * cosim - 3.0 * cosisq)
+                f322: float = -1.875 * sinim * (1.0 + 2.0 * cosim - 3.0 * cosisq)
+                f441: float = 35.0 * sini2 * f220
+                f442: float = 39.3750 * sini2 * sini2
+                f522: float = (
+                    9.84375
+                    * sinim
+                    * (sini2 * (1.0 - 2.0 * cosim - 5.0 * cosisq) + 0.33333333 * (-2.0 + 4.0 * cosim + 6.0 * cosisq))
+                )
+                f523: float = sinim * (
+                    4.92187512 * sini2 * (-2.0 - 4.0 * cosim + 10.0 * cosisq)
+                    + 6.56250012 * (1.0 + 2.0 * cosim - 3.0 * cosisq)
+                )
+                f542: float = 29.53125 * sinim * (2.0 - 8.0 * cosim + cosisq * (-12.0 + 8.0 * cosim + 10.0 * cosisq))
+                f543: float = 29.53125 * sinim * (-2.0 - 8.0 * cosim + cosisq * (12.0 + 8.0 * cosim - 10.0 * cosisq))
+                xno2: float = nm * nm
+                ainv2: float = aonv * aonv
+                temp1: float = 3.0 * xno2 * ainv2
+                temp: float = temp1 * root22
+                self.d2201 = temp * f220 * g201
+                self.d2211 = temp * f221 * g211
+                temp1 = temp1 * aonv
+                temp = temp1 * root32
+                self.d3210 = temp * f321 * g310
+                self.d3222 = temp * f322 * g322
+                temp1 = temp1 * aonv
+                temp = 2.0 * temp1 * root44
+                self.d4410 = temp * f441 * g410
+                self.d4422 = temp * f442 * g422
+                temp1 = temp1 * aonv
+                temp = temp1 * root52
+                self.d5220 = temp * f522 * g520
+                self.d5232 = temp * f523 * g532
+                temp = 2.0 * temp1 * root54
+                self.d5421 = temp * f542 * g521
+                self.d5433 = temp * f543 * g533
+                self.xlamo = fmod(self.mo + self.nodeo + self.nodeo - theta - theta, TWO_PI)
+                self.xfact = self.mdot + self.dmdt + 2.0 * (self.nodedot + self.dnodt - rptim) - self.no_unkozai
+                em = ds["em"]
+                emsq = ds["emsq"]
+
+            # synchronous resonance terms
+            if self.irez == 1:
+                g200: float = 1.0 + emsq * (-2.5 + 0.8125 * emsq)
+                g310 = 1.0 + 2.0 * emsq
+                g300: float = 1.0 + emsq * (-6.0 + 6.60937 * emsq)
+                f220 = 0.75 * (1.0 + cosim) * (1.0 + cosim)
+                f311: float = 0.9375 * sinim * sinim * (1.0 + 3.0 * cosim) - 0.75 * (1.0 + cosim)
+                f330: float = 1.0 + cosim
+                f330 = 1.875 * f330 * f330 * f330
+                self.del1 = 3.0 * nm * nm * aonv * aonv
+                self.del2 = 2.0 * self.del1 * f220 * g200 * q22
+                self.del3 = 3.0 * self.del1 * f330 * g300 * q33 * aonv
+                self.del1 = self.del1 * f311 * g310 * q31 * aonv
+                self.xlamo = fmod(self.mo + self.nodeo + self.argpo - theta, TWO_PI)
+                self.xfact = self.mdot + xpidot - rptim + self.dmdt + self.domdt + self.dnodt - self.no_unkozai
+
+            # initialize the integrator
+            self.xli = self.xlamo
+            self.xni = self.no_unkozai
+            self.atime = 0.0
+
+    def _dspace(
+        self, t: float, em: float, argpm: float, inclm: float, mm: float, nodem: float, nm: float
+    ) -> Tuple[float, float, float, float, float, float]:
+        """calculate the deep space secular effects and integrate the resonance terms
+
+        :return: eccentricity, argument of perigee, inclination, mean anomaly, node, and mean motion
+        :rtype: Tuple[float, float, float, float, float, float]
+        """
+        fasx2: float = 0.13130908
+        fasx4: float = 2.8843198
+        fasx6: float = 0.37448087
+        g22: float = 5.7686396
+        g32: float = 0.95240898
+        g44: float = 1.8014998
+        g52: float = 1.0508330
+        g54: float = 4.4108898
+        stepp: float = 720.0
+        stepn: float = -720.0
+        step2: float = 259200.0
+
+        # calculate deep space resonance effects
+        theta: float = fmod(self.gsto + t * SGP4.RPTIM, TWO_PI)
+        em = em + self.dedt * t
+        inclm = inclm + self.didt * t
+        argpm = argpm + self.domdt * t
+        nodem = nodem + self.dnodt * t
+        mm = mm + self.dmdt * t
+
+        if self.irez != 0:
+            # restart the integrator at epoch when changing direction or stepping backwards
+            if self.atime == 0.0 or t * self.atime <= 0.0 or abs(t) < abs(self.atime):
+                self.atime = 0.0
+                self.xni = self.no_unkozai
+                self.xli = self.xlamo
+
+            delt: float = stepp if t > 0.0 else stepn
+            ft: float = 0.0
+            while True:
+                if self.irez != 2:
+                    # near-synchronous resonance terms
+                    xndt: float = (
+                        self.del1 * sin(self.xli - fasx2)
+                        + self.del2 * sin(2.0 * (self.xli - fasx4))
+                        + self.del3 * sin(3.0 * (self.xli - fasx6))
+                    )
+                    xldot: float = self.xni + self.xfact
+                    xnddt: float = (
+                        self.del1 * cos(self.xli - fasx2)
+                        + 2.0 * self.del2 * cos(2.0 * (self.xli - fasx4))
+                        + 3.0 * self.del3 * cos(3.0 * (self.xli - fasx6))
+                    )
+                    xnddt = xnddt * xldot
+                else:
+                    # near-half-day resonance terms
+                    xomi: float = self.argpo + self.argpdot * self.atime
+                    x2omi: float = xomi + xomi
+                    x2li: float = self.xli + self.xli
+                    xndt = (
+                        self.d2201 * sin(x2omi + self.xli - g22)
+                        + self.d2211 * sin(self.xli - g22)
+                        + self.d3210 * sin(xomi + self.xli - g32)
+                        + self.d3222 * sin(-xomi + self.xli - g32)
+                        + self.d4410 * sin(x2omi + x2li - g44)
+                        + self.d4422 * sin(x2li - g44)
+                        + self.d5220 * sin(xomi + self.xli - g52)
+                        + self.d5232 * sin(-xomi + self.xli - g52)
+                        + self.d5421 * sin(xomi + x2li - g54)
+                        + self.d5433 * sin(-xomi + x2li - g54)
+                    )
+                    xldot = self.xni + self.xfact
+                    xnddt = (
+                        self.d2201 * cos(x2omi + self.xli - g22)
+                        + self.d2211 * cos(self.xli - g22)
+                        + self.d3210 * cos(xomi + self.xli - g32)
+                        + self.d3222 * cos(-xomi + self.xli - g32)
+                        + self.d5220 * cos(xomi + self.xli - g52)
+                        + self.d5232 * cos(-xomi + self.xli - g52)
+                        + 2.0
+                        * (
+                            self.d4410 * cos(x2omi + x2li - g44)
+                            + self.d4422 * cos(x2li - g44)
+                            + self.d5421 * cos(xomi + x2li - g54)
+                            + self.d5433 * cos(-xomi + x2li - g54)
+                        )
+                    )
+                    xnddt = xnddt * xldot
+
+                if abs(t - self.atime) < stepp:
+                    ft = t - self.atime
+                    break
+
+                self.xli = self.xli + xldot * delt + xndt * step2
+                self.xni = self.xni + xndt * delt + xnddt * step2
+                self.atime = self.atime + delt
+
+            nm = self.xni + xndt * ft + xnddt * ft * ft * 0.5
+            xl: float = self.xli + xldot * ft + xndt * ft * ft * 0.5
+            if self.irez != 1:
+                mm = xl - 2.0 * nodem + 2.0 * theta
+            else:
+                mm = xl - nodem - argpm + theta
+            nm = self.no_unkozai + nm - self.no_unkozai
+
+        return em, argpm, inclm, mm, nodem, nm
+
+    def solve(self, tsince: float) -> Tuple[float, float, float, float, float, float]:
+        """calculate the TEME state at a time relative to the element set epoch
+
+        The error attribute is set to a non-zero code from SGP4.ERRORS when the theory fails, in which case the
+        returned values are nan.
+
+        :param tsince: minutes since the element set epoch
+        :type tsince: float
+        :return: position and velocity components x, y, z, vx, vy, vz in km and km/s
+        :rtype: Tuple[float, float, float, float, float, float]
+        """
+        x2o3: float = 2.0 / 3.0
+        temp4: float = 1.5e-12
+        nan: float = float("nan")
+        self.t = tsince
+        self.error = 0
+
+        # update for secular gravity and atmospheric drag
+        xmdf: float = self.mo + self.mdot * tsince
+        argpdf: float = self.argpo + self.argpdot * tsince
+        nodedf: float = self.nodeo + self.nodedot * tsince
+        argpm: float = argpdf
+        mm: float = xmdf
+        t2: float = tsince * tsince
+        nodem: float = nodedf + self.nodecf * t2
+        tempa: float = 1.0 - self.cc1 * tsince
+        tempe: float = self.bstar * self.cc4 * tsince
+        templ: float = self.t2cof * t2
+
+        if self.isimp != 1:
+            delomg: float = self.omgcof * tsince
+            delmtemp: float = 1.0 + self.eta * cos(xmdf)
+            delm: float = self.xmcof * (delmtemp * delmtemp * delmtemp - self.delmo)
+            temp: float = delomg + delm
+            mm = xmdf + temp
+            argpm = argpdf - temp
+            t3: float = t2 * tsince
+            t4: float = t3 * tsince
+            tempa = tempa - self.d2 * t2 - self.d3 * t3 - self.d4 * t4
+            tempe = tempe + self.bstar * self.cc5 * (sin(mm) - self.sinmao)
+            templ = templ + self.t3cof * t3 + t4 * (self.t4cof + tsince * self.t5cof)
+
+        nm: float = self.no_unkozai
+        em: float = self.ecco
+        inclm: float = self.inclo
+        if self.method == "d":
+            em, argpm, inclm, mm, nodem, nm = self._dspace(tsince, em, argpm, inclm, mm, nodem, nm)
+
+        if nm <= 0.0:
+            self.error = 2
+            return nan, nan, nan, nan, nan, nan
+
+        am: float = (SGP4.XKE / nm) ** x2o3 * tempa * tempa
+        nm = SGP4.XKE / am**1.5
+        em = em - tempe
+
+        if em >= 1.0 or em < -0.001:
+            self.error = 1
+            return nan, nan, nan, nan, nan, nan
+
+        # avoid a divide by zero
+        if em < 1.0e-6:
+            em = 1.0e-6
+        mm = mm + self.no_unkozai * templ
+        xlm: float = mm + argpm + nodem
+        nodem = fmod(nodem, TWO_PI)
+        argpm = argpm % TWO_PI
+        xlm = xlm % TWO_PI
+        mm = (xlm - argpm - nodem) % TWO_PI
+
+        # compute extra mean quantities
+        sinim: float = sin(inclm)
+        cosim: float = cos(inclm)
+
+        # add lunar-solar periodics
+        ep: float = em
+        xincp: float = inclm
+        argpp: float = argpm
+        nodep: float = nodem
+        mp: float = mm
+        sinip: float = sinim
+        cosip: float = cosim
+        x1mth2: float = self.x1mth2
+        x7thm1: float = self.x7thm1
+        con41: float = self.con41
+        aycof: float = self.aycof
+        xlcof: float = self.xlcof
+        if self.method == "d":
+            ep, xincp, nodep, argpp, mp = self._dpper(tsince, False, ep, xincp, nodep, argpp, mp)
+            if xincp < 0.0:
+                xincp = -xincp
+                nodep = nodep + pi
+                argpp = argpp - pi
+            if ep < 0.0 or ep > 1.0:
+                self.error = 3
+                return nan, nan, nan, nan, nan, nan
+
+            # long period periodics
+            sinip = sin(xincp)
+            cosip = cos(xincp)
+            aycof = -0.5 * SGP4.J3OJ2 * sinip
+            if abs(cosip + 1.0) > 1.5e-12:
+                xlcof = -0.25 * SGP4.J3OJ2 * sinip * (3.0 + 5.0 * cosip) / (1.0 + cosip)
+            else:
+                xlcof = -0.25 * SGP4.J3OJ2 * sinip * (3.0 + 5.0 * cosip) / temp4
+
+        axnl: float = ep * cos(argpp)
+        temp = 1.0 / (am * (1.0 - ep * ep))
+        aynl: float = ep * sin(argpp) + temp * aycof
+        xl: float = mp + argpp + nodep + temp * xlcof * axnl
+
+        # solve kepler's equation
+        u: float = (xl - nodep) % TWO_PI
+        eo1: float = u
+        tem5: float = 9999.9
+        ktr: int = 1
+        sineo1: float = 0.0
+        coseo1: float = 0.0
+        while abs(tem5) >= 1.0e-12 and ktr <= 10:
+            sineo1 = sin(eo1)
+            coseo1 = cos(eo1)
+            tem5 = 1.0 - coseo1 * axnl - sineo1 * aynl
+            tem5 = (u - aynl * coseo1 + axnl * sineo1 - eo1) / tem5
+            if abs(tem5) >= 0.95:
+                tem5 = 0.95 if tem5 > 0.0 else -0.95
+            eo1 = eo1 + tem5
+            ktr = ktr + 1
+
+        # short period preliminary quantities
+        ecose: float = axnl * coseo1 + aynl * sineo1
+        esine: float = axnl * sineo1 - aynl * coseo1
+        el2: float = axnl * axnl + aynl * aynl
+        pl: float = am * (1.0 - el2)
+        if pl < 0.0:
+            self.error = 4
+            return nan, nan, nan, nan, nan, nan
+
+        rl: float = am * (1.0 - ecose)
+        rdotl: float = sqrt(am) * esine / rl
+        rvdotl: float = sqrt(pl) / rl
+        betal: float = sqrt(1.0 - el2)
+        temp = esine / (1.0 + betal)
+        sinu: float = am / rl * (sineo1 - aynl - axnl * temp)
+        cosu: float = am / rl * (coseo1 - axnl + aynl * temp)
+        su: float = atan2(sinu, cosu)
+        sin2u: float = (cosu + cosu) * sinu
+        cos2u: float = 1.0 - 2.0 * sinu * sinu
+        temp = 1.0 / pl
+        temp1: float = 0.5 * SGP4.J2 * temp
+        temp2: float = temp1 * temp
+
+        # update for short period periodics
+        if self.method == "d":
+            cosisq: float = cosip * cosip
+            con41 = 3.0 * cosisq - 1.0
+            x1mth2 = 1.0 - cosisq
+            x7thm1 = 7.0 * cosisq - 1.0
+
+        mrt: float = rl * (1.0 - 1.5 * temp2 * betal * con41) + 0.5 * temp1 * x1mth2 * cos2u
+        su = su - 0.25 * temp2 * x7thm1 * sin2u
+        xnode: float = nodep + 1.5 * temp2 * cosip * sin2u
+        xinc: float = xincp + 1.5 * temp2 * cosip * sinip * cos2u
+        mvt: float = rdotl - nm * temp1 * x1mth2 * sin2u / SGP4.XKE
+        rvdot: float = rvdotl + nm * temp1 * (x1mth2 * cos2u + 1.5 * con41) / SGP4.XKE
+
+        # orientation vectors
+        sinsu: float = sin(su)
+        cossu: float = cos(su)
+        snod: float = sin(xnode)
+        cnod: float = cos(xnode)
+        sini: float = sin(xinc)
+        cosi: float = cos(xinc)
+        xmx: float = -snod * cosi
+        xmy: float = cnod * cosi
+        ux: float = xmx * sinsu + cnod * cossu
+        uy: float = xmy * sinsu + snod * cossu
+        uz: float = sini * sinsu
+        vx: float = xmx * cossu - cnod * sinsu
+        vy: float = xmy * cossu - snod * sinsu
+        vz: float = sini * cossu
+
+        if mrt < 1.0:
+            self.error = 6
+
+        mr: float = mrt * SGP4.RADIUS
+        v: float = SGP4.VKMPERSEC
+        return (
+            mr * ux,
+            mr * uy,
+            mr * uz,
+            (mvt * ux + rvdot * vx) * v,
+            (mvt * uy + rvdot * vy) * v,
+            (mvt * uz + rvdot * vz) * v,
+        )
@@ -1,12 +1,24 @@
 from datetime import datetime, timedelta, timezone
-from math import floor, modf, radians, trunc
-
-from pysmad.constants import DAYS_TO_JULIAN_CENTURY, J2000_JULIAN_DATE, MJD_ZERO_JULIAN_DATE, TAI_TO_TT
+from math import floor, radians
+
+from pysmad.constants import (
+    DAYS_TO_JULIAN_CENTURY,
+    DAYS_TO_SECONDS,
+    J2000_JULIAN_DATE,
+    MJD_ZERO_JULIAN_DATE,
+    TAI_TO_TT,
+)
 from pysmad.eop import EOPData
 from pysmad.math.functions import Conversions
 
+#: calendar date of modified julian day zero
+MJD_ZERO_DATETIME: datetime = datetime(1858, 11, 17)
+
 
 class Epoch:
+
+    __slots__ = ("utc",)
+
     def __init__(self, utc_mjd: float) -> None:
         """class used to represent time
 
@@ -29,51 +41,9 @@ class Epoch:
 
     @property
     def iso_string(self) -> str:
-        jd = Epoch.mjd_to_jd(self.utc) + 0.5
-
-        jd_frac, jd_int = modf(jd)
-        jd_int = int(jd_int)
-
-        exp_a = trunc((jd_int - 1867216.25) / 36524.25)
-
-        if jd_int > 2299160:
-            exp_b = jd_int + 1 + exp_a - trunc(exp_a / 4.0)
-        else:
-            exp_b = jd_int
-
-        exp_c = exp_b + 1524
-
-        exp_d = trunc((exp_c - 122.1) / 365.25)
-
-        exp_e = trunc(365.25 * exp_d)
-
-        exp_g = trunc((exp_c - exp_e) / 30.6001)
-
-        day = exp_c - exp_e + jd_frac - trunc(30.6001 * exp_g)
-
-        if exp_g < 13.5:
-            month = exp_g - 1
-        else:
-            month = exp_g - 13
-
-        if month > 2.5:
-            year = exp_d - 4716
-        else:
-            year = exp_d - 4715
-
-        frac_days, day = modf(day)
-
-        day = int(day)
-
-        hours = frac_days * 24.0
-        hours, hour = modf(hours)
-
-        mins = hours * 60.0
-        mins, min = modf(mins)
-
-        secs = mins * 60.0
-
-        return f"{year:04d}-{month:02d}-{day:02d}T{hour:02d}:{min:02d}:{secs:02.6f}Z"
+        days: int = floor(self.utc)
+        micro: int = round((self.utc - days) * DAYS_TO_SECONDS * 1e6)
+        return (MJD_ZERO_DATETIME + timedelta(days=days, microseconds=micro)).isoformat(timespec="microseconds") + "Z"
 
     @staticmethod
     def mjd_to_jd(mjd: float) -> float:
@@ -0,0 +1,132 @@
+import os
+import tempfile
+import unittest
+from math import isnan
+from random import Random
+from typing import List
+
+from pysmad.bodies import Earth  # noqa: F401
+from pysmad.coordinates.states import LiveVector, LiveVectorSet
+from pysmad.estimation.archive import (
+    read_optical_csv,
+    read_optical_set,
+    read_vector_csv,
+    read_vector_set,
+    write_optical_csv,
+    write_optical_set,
+    write_vector_csv,
+    write_vector_set,
+)
+from pysmad.estimation.obs import ColumnarOpticalSet, LiveOpticalObservation, LiveOpticalSet
+from pysmad.estimation.vectors import ColumnarVectorSet
+
+
+class TestArchive(unittest.TestCase):
+    def setUp(self) -> None:
+        rng: Random = Random(4)
+        self.optical_set: LiveOpticalSet = LiveOpticalSet()
+        for i in range(60):
+            self.optical_set.process_observation(
+                LiveOpticalObservation(
+                    {
+                        "obTime": f"2022-12-20T{i % 24:02d}:{i:02d}:{rng.uniform(0, 59):09.6f}Z",
+                        "origObjectId": str(i % 5),
+                        "origSensorId": f"S{i % 3}",
+                        "azimuth": rng.uniform(0, 360),
+                        "elevation": rng.uniform(0, 90),
+                        "senlat": rng.uniform(-90, 90),
+                        "senlon": rng.uniform(-180, 180),
+                        "senalt": rng.uniform(0, 3),
+                        "ra": rng.uniform(0, 360),
+                        "declination": rng.uniform(-90, 90),
+                        "mag": rng.uniform(5, 15),
+                        "source": "TEST",
+                        "dataMode": "REAL",
+                    }
+                )
+            )
+        self.vector_set: LiveVectorSet = LiveVectorSet()
+        for i in range(20):
+            record: dict = {
+                "epoch": f"2022-12-20T00:{i:02d}:30.250000Z",
+                "origObjectId": str(i % 4),
+                "xpos": rng.uniform(-7000, 7000),
+                "ypos": rng.uniform(-7000, 7000),
+                "zpos": rng.uniform(-7000, 7000),
+                "xvel": rng.uniform(-7, 7),
+                "yvel": rng.uniform(-7, 7),
+                "zvel": rng.uniform(-7, 7),
+            }
+            if i % 2:
+                record["cov"] = [rng.random() for _ in range(21)]
+                record["solarRadPressCoeff"] = 1.2
+            self.vector_set.process_vector(LiveVector(record))
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self) -> None:
+        os.remove(self.path)
+
+    def assert_observations(self, expected: List[LiveOpticalObservation], actual: ColumnarOpticalSet, places: int):
+        self.assertEqual(len(actual), len(expected))
+        for original, stored in zip(expected, actual):
+            self.assertAlmostEqual(original.epoch.utc, stored.epoch.utc, 10)
+            self.assertEqual(original.sat_id, stored.sat_id)
+            self.assertEqual(original.observer_id, stored.observer_id)
+            self.assertEqual(original.source, stored.source)
+            self.assertAlmostEqual(original.right_ascension, stored.right_ascension, places)
+            self.assertAlmostEqual(original.observer_lla.longitude, stored.observer_lla.longitude, places)
+
+    def test_optical_binary(self):
+        write_optical_set(self.path, self.optical_set)
+        for copy in [False, True]:
+            stored: ColumnarOpticalSet = read_optical_set(self.path, copy)
+            self.assert_observations(self.optical_set.list, stored, 15)
+            self.assertEqual(stored.list[3].mode, "REAL")
+            self.assertEqual(len(stored.target("2")), len(self.optical_set.targets["2"]))
+        self.assertIsInstance(read_optical_set(self.path).columns["epoch"], memoryview)
+
+        extended: ColumnarOpticalSet = read_optical_set(self.path, copy=True)
+        extended.process_observation(self.optical_set.list[0])
+        self.assertEqual(len(extended), len(self.optical_set.list) + 1)
+        mapped: ColumnarOpticalSet = read_optical_set(self.path)
+        with self.assertRaises(ValueError):
+            mapped.process_observation(self.optical_set.list[0])
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "copy.bin")
+            write_optical_set(path, mapped)
+            self.assert_observations(self.optical_set.list, read_optical_set(path, copy=True), 15)
+        with self.assertRaises(ValueError):
+            read_vector_set(self.path)
+
+    def test_vector_binary(self):
+        write_vector_set(self.path, self.vector_set)
+        stored: ColumnarVectorSet = read_vector_set(self.path)
+        self.assertEqual(stored.total, self.vector_set.total)
+        for original, vector in zip(self.vector_set.list, stored):
+            self.assertEqual(original.epoch.utc, vector.epoch.utc)
+            self.assertEqual(original.position.x, vector.position.x)
+            self.assertEqual(original.velocity.z, vector.velocity.z)
+            self.assertEqual(original.covariance, vector.covariance)
+            self.assertEqual(original.srp_coefficient, vector.srp_coefficient)
+        self.assertEqual(stored.get_latest("3").position.x, self.vector_set.get_latest("3").position.x)
+
+    def test_optical_csv(self):
+        write_optical_csv(self.path, self.optical_set)
+        stored: ColumnarOpticalSet = read_optical_csv(self.path)
+        self.assert_observations(self.optical_set.list, stored, 12)
+        self.assertTrue(isnan(stored.list[0].observer_eci.x))
+
+        # files written by the row-by-row publisher have no header and read the same
+        self.optical_set.publish_set(self.path, "w")
+        self.assert_observations(self.optical_set.list, read_optical_csv(self.path), 12)
+
+    def test_vector_csv(self):
+        write_vector_csv(self.path, self.vector_set)
+        stored: ColumnarVectorSet = read_vector_csv(self.path)
+        self.assertEqual(len(stored), self.vector_set.total)
+        for original, vector in zip(self.vector_set.list, stored):
+            self.assertAlmostEqual(original.epoch.utc, vector.epoch.utc, 10)
+            self.assertEqual(original.position.y, vector.position.y)
+            self.assertEqual(original.sat_id, vector.sat_id)
+            self.assertIsNone(vector.covariance)
@@ -0,0 +1,94 @@
+import unittest
+from math import asin, atan2, degrees, pi, radians
+from typing import Dict, List
+
+from pysmad.bodies import Earth
+from pysmad.coordinates.elements import ClassicalElements
+from pysmad.coordinates.positions import LLA, PositionConvert
+from pysmad.coordinates.states import GCRF, IJK
+from pysmad.estimation.batch import BatchLeastSquares, OrbitSolution, fit_targets
+from pysmad.estimation.filtering import InertialMeasurement
+from pysmad.estimation.obs import LiveOpticalObservation, LiveOpticalSet
+from pysmad.math.linalg import Vector3D
+from pysmad.propagators.inertial import Kepler
+from pysmad.time import Epoch
+
+
+class TestBatchLeastSquares(unittest.TestCase):
+
+    EPOCH: Epoch = Epoch.from_datetime_components(2022, 12, 20, 0, 0, 0)
+    SITE: LLA = LLA(radians(20), radians(-100), 0.5)
+
+    def truth(self, offset: float) -> GCRF:
+        state: GCRF = GCRF(self.EPOCH, Vector3D(Earth.RADIUS + 9000, offset, 0), Vector3D(0, 4.2, 3.4))
+        state.use_perturbations = False
+        return state
+
+    def optical_set(self, truths: Dict[str, GCRF]) -> LiveOpticalSet:
+        optical_set: LiveOpticalSet = LiveOpticalSet()
+        for sat_id, state in truths.items():
+            propagator: Kepler = Kepler(state)
+            for i in range(24):
+                minutes: int = i * 5
+                epoch: Epoch = Epoch.from_datetime_components(2022, 12, 20, minutes // 60, minutes % 60, 0)
+                propagator.step_to_epoch(epoch)
+                site: Vector3D = PositionConvert.itrf.to_gcrf(PositionConvert.lla.to_itrf(self.SITE), epoch)
+                los: Vector3D = propagator.state.position.minus(site)
+                optical_set.process_observation(
+                    LiveOpticalObservation(
+                        {
+                            "obTime": f"2022-12-20T{minutes // 60:02d}:{minutes % 60:02d}:00.000Z",
+                            "origObjectId": sat_id,
+                            "senlat": degrees(self.SITE.latitude),
+                            "senlon": degrees(self.SITE.longitude),
+                            "senalt": self.SITE.altitude,
+                            "ra": degrees(atan2(los.y, los.x) % (2 * pi)),
+                            "declination": degrees(asin(los.z / los.magnitude())),
+                            "source": "TEST",
+                            "dataMode": "SIMULATED",
+                        }
+                    )
+                )
+        return optical_set
+
+    def seed(self, state: GCRF) -> GCRF:
+        seed: GCRF = GCRF(
+            state.epoch, state.position.plus(Vector3D(2, -1, 1)), state.velocity.plus(Vector3D(0, 1e-3, 0))
+        )
+        seed.use_perturbations = False
+        return seed
+
+    def test_solve(self):
+        truth: GCRF = self.truth(0)
+        obs: List[LiveOpticalObservation] = self.optical_set({"1": truth}).targets["1"]
+        measurements: List[InertialMeasurement] = [
+            InertialMeasurement.from_live_optical_observation(ob, BatchLeastSquares.DEFAULT_ANGULAR_ERROR) for ob in obs
+        ]
+        solution: OrbitSolution = BatchLeastSquares(self.seed(truth), list(reversed(measurements))).solve("1")
+        self.assertTrue(solution.converged)
+        self.assertLess(solution.state.position.minus(truth.position).magnitude(), 1e-3)
+        self.assertLess(solution.rms, 1e-2)
+        self.assertEqual(len(solution.residuals), 2 * len(obs))
+        self.assertGreater(solution.covariance.element(0, 0), 0)
+
+    def test_fit_targets(self):
+        truths: Dict[str, GCRF] = {"1": self.truth(0), "2": self.truth(500)}
+        optical_set: LiveOpticalSet = self.optical_set(truths)
+        seeds: Dict[str, GCRF] = {sat_id: self.seed(state) for sat_id, state in truths.items()}
+        solutions: Dict[str, OrbitSolution] = fit_targets(optical_set, seeds, workers=2)
+        self.assertEqual(set(solutions), {"1", "2"})
+        for sat_id, solution in solutions.items():
+            self.assertLess(solution.state.position.minus(truths[sat_id].position).magnitude(), 1e-3)
+            self.assertFalse(solution.state.use_perturbations)
+
+    def test_seed_from_elements(self):
+        epoch: Epoch = Epoch.from_datetime_components(2004, 4, 6, 7, 51, 28.386009)
+        r: Vector3D = Vector3D(5094.18016210, 6127.64465950, 6380.34453270)
+        v: Vector3D = Vector3D(-4.746131487, 0.785818041, 5.531931288)
+        seed: GCRF = BatchLeastSquares.seed_from_elements(ClassicalElements.from_ijk(IJK(epoch, r, v)))
+        self.assertAlmostEqual(seed.position.x, 5102.50895290, delta=0.01)
+        self.assertAlmostEqual(seed.position.y, 6123.01139910, delta=0.01)
+        self.assertAlmostEqual(seed.position.z, 6378.13693380, delta=0.01)
+        self.assertAlmostEqual(seed.velocity.x, -4.743220157, delta=1e-5)
+        self.assertAlmostEqual(seed.velocity.y, 0.790536497, delta=1e-5)
+        self.assertAlmostEqual(seed.velocity.z, 5.533755727, delta=1e-5)
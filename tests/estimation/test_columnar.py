@@ -0,0 +1,80 @@
+import unittest
+from random import Random
+from typing import List
+
+from pysmad.bodies import Earth  # noqa: F401
+from pysmad.estimation.obs import ColumnarOpticalSet, LiveOpticalObservation, LiveOpticalSet, OpticalView
+
+
+class TestColumnarOpticalSet(unittest.TestCase):
+    def setUp(self) -> None:
+        rng: Random = Random(9)
+        self.obs: List[LiveOpticalObservation] = []
+        for i in range(200):
+            seconds: int = rng.randrange(86400)
+            self.obs.append(
+                LiveOpticalObservation(
+                    {
+                        "obTime": f"2022-12-20T{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}.000Z",
+                        "origObjectId": str(rng.randrange(7)),
+                        "origSensorId": rng.choice(["A", "B", "C"]),
+                        "azimuth": rng.uniform(0, 360),
+                        "elevation": rng.uniform(0, 90),
+                        "senlat": 20.0,
+                        "senlon": -100.0,
+                        "senalt": 0.5,
+                        "ra": rng.uniform(0, 360),
+                        "declination": rng.uniform(-90, 90),
+                        "mag": rng.uniform(5, 15),
+                        "source": "TEST",
+                        "dataMode": rng.choice(["REAL", "SIMULATED"]),
+                    }
+                )
+            )
+        self.legacy: LiveOpticalSet = LiveOpticalSet()
+        self.columnar: ColumnarOpticalSet = ColumnarOpticalSet()
+        for ob in self.obs:
+            self.legacy.process_observation(ob)
+            self.columnar.process_observation(ob)
+
+    def test_round_trip(self):
+        self.assertEqual(self.columnar.total, self.legacy.total)
+        for original, stored in zip(self.obs, self.columnar):
+            self.assertEqual(original.epoch.utc, stored.epoch.utc)
+            for name in ["sat_id", "observer_id", "azimuth", "elevation", "right_ascension", "declination"]:
+                self.assertEqual(getattr(original, name), getattr(stored, name))
+            for name in ["visual_magnitude", "source", "mode", "equatorial_phase_angle"]:
+                self.assertEqual(getattr(original, name), getattr(stored, name))
+            self.assertEqual(original.observer_lla.altitude, stored.observer_lla.altitude)
+
+    def test_indexes_match_legacy(self):
+        for name in ["targets", "sensors", "sources", "modes"]:
+            legacy = getattr(self.legacy, name)
+            columnar = getattr(self.columnar, name)
+            self.assertSetEqual(set(legacy), set(columnar))
+            for key, obs in legacy.items():
+                view: OpticalView = columnar[key]
+                self.assertEqual(len(view), len(obs))
+                expected: List[float] = sorted(ob.epoch.utc for ob in obs)
+                self.assertListEqual([ob.epoch.utc for ob in view], expected)
+                self.assertListEqual(list(view.column("epoch")), expected)
+        self.assertSetEqual(set(self.columnar.get_targets()), set(self.legacy.get_targets()))
+
+    def test_slicing_and_updates(self):
+        view: OpticalView = self.columnar.target("3")
+        self.assertEqual(len(view[1:4]), 3)
+        self.assertEqual(view[1].epoch.utc, view[1:4][0].epoch.utc)
+        self.assertEqual(len(self.columnar.sensor("unknown")), 0)
+
+        self.columnar.process_observation(self.obs[0])
+        self.assertEqual(
+            len(self.columnar.target(self.obs[0].sat_id)), len(self.legacy.targets[self.obs[0].sat_id]) + 1
+        )
+
+    def test_views_cached_until_append(self):
+        targets = self.columnar.targets
+        self.assertIs(self.columnar.targets, targets)
+        self.columnar.process_observation(self.obs[0])
+        self.assertIsNot(self.columnar.targets, targets)
+        sat_id: str = self.obs[0].sat_id
+        self.assertEqual(len(self.columnar.targets[sat_id]), len(targets[sat_id]) + 1)
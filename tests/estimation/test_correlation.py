@@ -0,0 +1,85 @@
+import unittest
+from math import asin, atan2, degrees, pi, radians
+from random import Random
+from typing import List, Tuple
+
+from pysmad.bodies import Earth
+from pysmad.coordinates.positions import LLA, PositionConvert
+from pysmad.coordinates.states import GCRF
+from pysmad.estimation.correlation import CorrelationEngine
+from pysmad.estimation.obs import LiveOpticalObservation
+from pysmad.math.linalg import Vector3D
+from pysmad.propagators.catalog import CatalogEphemeris
+from pysmad.propagators.inertial import Kepler
+from pysmad.time import Epoch
+
+
+class TestCorrelationEngine(unittest.TestCase):
+
+    EPOCH: Epoch = Epoch.from_datetime_components(2022, 12, 20, 0, 0, 0)
+    SITE: LLA = LLA(radians(20), radians(-100), 0.5)
+
+    def setUp(self) -> None:
+        rng: Random = Random(11)
+        self.states: List[GCRF] = []
+        for _ in range(300):
+            r: float = Earth.RADIUS + rng.uniform(500, 36000)
+            speed: float = (Earth.MU / r) ** 0.5
+            position: Vector3D = Vector3D(rng.gauss(0, 1), rng.gauss(0, 1), rng.gauss(0, 1)).normalized().scaled(r)
+            normal: Vector3D = position.cross(Vector3D(rng.gauss(0, 1), rng.gauss(0, 1), rng.gauss(0, 1)))
+            state: GCRF = GCRF(self.EPOCH, position, normal.cross(position).normalized().scaled(speed))
+            state.use_perturbations = False
+            self.states.append(state)
+        epochs: List[Epoch] = [self.EPOCH.plus_days(i * 60 / 86400) for i in range(31)]
+        self.engine: CorrelationEngine = CorrelationEngine(
+            CatalogEphemeris.from_two_body(self.states, epochs), [f"SAT{i}" for i in range(len(self.states))]
+        )
+
+    def truth(self, epoch: Epoch) -> List[Vector3D]:
+        positions: List[Vector3D] = []
+        for state in self.states:
+            propagator: Kepler = Kepler(state)
+            propagator.step_to_epoch(epoch)
+            positions.append(propagator.state.position)
+        return positions
+
+    def test_position(self):
+        epoch: Epoch = self.EPOCH.plus_days(437 / 86400)
+        for i, position in enumerate(self.truth(epoch)[:20]):
+            self.assertLess(self.engine.position(i, epoch).minus(position).magnitude(), 1e-2)
+        with self.assertRaises(ValueError):
+            self.engine.position(0, self.EPOCH.plus_days(-1))
+
+    def test_within_distance(self):
+        epoch: Epoch = self.EPOCH.plus_days(1009 / 86400)
+        truth: List[Vector3D] = self.truth(epoch)
+        for center in truth[:10]:
+            matches: List[Tuple[str, float]] = self.engine.within_distance(center, epoch, 5000)
+            expected: List[str] = [f"SAT{i}" for i, p in enumerate(truth) if p.minus(center).magnitude() <= 5000]
+            self.assertSetEqual({sat_id for sat_id, _ in matches}, set(expected))
+            self.assertAlmostEqual(matches[0][1], 0, 2)
+
+    def test_correlate(self):
+        epoch: Epoch = self.EPOCH.plus_days(750 / 86400)
+        truth: List[Vector3D] = self.truth(epoch)
+        site: Vector3D = PositionConvert.itrf.to_gcrf(PositionConvert.lla.to_itrf(self.SITE), epoch)
+        radius: float = radians(3)
+        for k in range(10):
+            los: Vector3D = truth[k].minus(site)
+            ob: LiveOpticalObservation = LiveOpticalObservation(
+                {
+                    "obTime": "2022-12-20T00:12:30.000Z",
+                    "senlat": degrees(self.SITE.latitude),
+                    "senlon": degrees(self.SITE.longitude),
+                    "senalt": self.SITE.altitude,
+                    "ra": degrees(atan2(los.y, los.x) % (2 * pi)),
+                    "declination": degrees(asin(los.z / los.magnitude())),
+                    "source": "TEST",
+                    "dataMode": "SIMULATED",
+                }
+            )
+            matches: List[Tuple[str, float]] = self.engine.correlate(ob, radius)
+            expected: List[str] = [f"SAT{i}" for i, p in enumerate(truth) if p.minus(site).angle(los) <= radius]
+            self.assertSetEqual({sat_id for sat_id, _ in matches}, set(expected))
+            self.assertEqual(matches[0][0], f"SAT{k}")
+            self.assertLess(matches[0][1], 1e-6)
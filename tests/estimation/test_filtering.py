@@ -0,0 +1,226 @@
+import unittest
+from math import radians
+from typing import List
+
+from pysmad.bodies import Earth, GroundSite
+from pysmad.coordinates.positions import LLA, PositionConvert
+from pysmad.coordinates.states import GCRF, HCW, ITRF, StateConvert
+from pysmad.estimation.filtering import InertialKalman, InertialMeasurement, RelativeKalman, UnscentedKalman
+from pysmad.estimation.obs import GroundObservation, SpaceObservation
+from pysmad.math.linalg import Matrix3D, Matrix6D, SymmetricMatrix6D, Vector3D, Vector6D
+from pysmad.propagators.inertial import RK4, Kepler
+from pysmad.propagators.relative import Hill
+from pysmad.time import Epoch
+
+
+class TestRelativeKalman(unittest.TestCase):
+
+    EPOCH: Epoch = Epoch.from_datetime_components(2022, 12, 20, 0, 0, 0)
+    SMA: float = Earth.RADIUS + 500
+
+    def setUp(self) -> None:
+        state: HCW = HCW.from_state_vector(Vector6D(-11, 0.5, 0.2, 0, -0.001, 0))
+        self.kalman: RelativeKalman = RelativeKalman(self.EPOCH, Hill(state, self.SMA))
+        self.kalman.z = Vector3D(-10.9, 0.45, 0.25)
+        self.kalman.r = Matrix3D(Vector3D(0.01, 0.002, 0), Vector3D(0.002, 0.02, 0.001), Vector3D(0, 0.001, 0.015))
+
+    def test_update_matches_explicit_inverse(self):
+        self.kalman.predict(60)
+        p10: Matrix6D = self.kalman.p10.to_matrix()
+        h, ht, r = RelativeKalman.H, RelativeKalman.HT, self.kalman.r
+
+        # reference update that inverts the innovation covariance and multiplies full matrices
+        hph: Matrix3D = h.multiply_matrix_6by3(p10.multiply_matrix_6by3(ht))
+        k = p10.multiply_matrix_6by3(ht.multiply(hph.plus(r).inverse()))
+        m1: Matrix6D = RelativeKalman.I.minus(k.multiply_matrix3by6(h))
+        m2: Matrix6D = k.multiply_matrix3by6(r.multiply_matrix3by6(k.transpose()))
+        expected: SymmetricMatrix6D = SymmetricMatrix6D.from_matrix(
+            m1.multiply_matrix(p10.multiply_matrix(m1.transpose())).plus(m2)
+        )
+
+        self.kalman.update()
+        for a, b in zip([k.row1, k.row4, k.row6], [self.kalman.k.row1, self.kalman.k.row4, self.kalman.k.row6]):
+            self.assertAlmostEqual(a.x, b.x)
+            self.assertAlmostEqual(a.y, b.y)
+            self.assertAlmostEqual(a.z, b.z)
+        for a, b in zip(expected.values, self.kalman.p00.values):
+            self.assertAlmostEqual(a, b, 12)
+
+    def test_predict_covariance(self):
+        self.kalman.predict(60)
+        p00: Matrix6D = RelativeKalman.DEFAULT_COVARIANCE
+        f: Matrix6D = self.kalman.f
+        expected: Matrix6D = f.multiply_matrix(p00.multiply_matrix(f.transpose())).plus(RelativeKalman.DEFAULT_NOISE)
+        for a, b in zip(SymmetricMatrix6D.from_matrix(expected).values, self.kalman.p10.values):
+            self.assertAlmostEqual(a, b, 12)
+
+    def test_gain_rejects_indefinite_innovation(self):
+        self.kalman.predict(60)
+        self.kalman.r = Matrix3D(Vector3D(-1, 0, 0), Vector3D(0, 0.01, 0), Vector3D(0, 0, 0.01))
+        with self.assertRaises(ValueError):
+            self.kalman.gain()
+
+    def observations(self) -> List[SpaceObservation]:
+        target: GCRF = GCRF(self.EPOCH, Vector3D(self.SMA, 0, 0), Vector3D(0, (Earth.MU / self.SMA) ** 0.5, 0))
+        chase: GCRF = StateConvert.hcw.to_gcrf(HCW.from_state_vector(Vector6D(-11, 0, 0, 0, 0, 0)), target)
+        obs: List[SpaceObservation] = []
+        for i in range(1, 6):
+            observer: GCRF = GCRF(self.EPOCH.plus_days(i * 60 / 86400), chase.position, chase.velocity)
+            obs.append(SpaceObservation(observer, target.position.minus(chase.position), 0.01, 1e-5))
+        return obs
+
+    def test_measurement(self):
+        ob: SpaceObservation = self.observations()[0]
+        z, r = RelativeKalman.measurement(ob)
+        gcrf_ob: GCRF = GCRF(ob.epoch(), ob.observer_state.position.plus(ob.observed_direction), Vector3D(0, 0, 0))
+        expected: Vector3D = StateConvert.gcrf.to_hcw(ob.observer_state, gcrf_ob).position
+        self.assertAlmostEqual(z.x, expected.x, 9)
+        self.assertAlmostEqual(z.y, expected.y, 9)
+        self.assertAlmostEqual(z.z, expected.z, 9)
+        self.assertGreater(r.row1.x, 0)
+
+    def test_process_batch_matches_sequential(self):
+        obs: List[SpaceObservation] = self.observations()
+        sequential: RelativeKalman = RelativeKalman(self.EPOCH, Hill(self.kalman.propagator.state, self.SMA))
+        for ob in obs:
+            sequential.process(ob)
+
+        epochs, states, covariances = self.kalman.process_batch(list(reversed(obs)))
+        self.assertEqual(len(epochs), len(obs))
+        self.assertEqual(len(states), len(obs) * 6)
+        self.assertEqual(len(covariances), len(obs) * SymmetricMatrix6D.SIZE)
+        self.assertListEqual(list(epochs), [ob.epoch().utc for ob in obs])
+        x = sequential.x00
+        tail: int = -SymmetricMatrix6D.SIZE
+        for a, b in zip(states[-6:], [x.x, x.y, x.z, x.vx, x.vy, x.vz]):
+            self.assertAlmostEqual(a, b, 12)
+        for a, b in zip(covariances[tail:], sequential.p00.values):
+            self.assertAlmostEqual(a, b, 12)
+
+
+class InertialScenario:
+
+    EPOCH: Epoch = Epoch.from_datetime_components(2022, 12, 20, 0, 0, 0)
+    TRUTH: GCRF = GCRF(EPOCH, Vector3D(Earth.RADIUS + 800, 0, 0), Vector3D(0, 6.5, 3.6))
+    OBSERVER: GCRF = GCRF(EPOCH, Vector3D(Earth.RADIUS + 700, 300, 0), Vector3D(0, 6.6, 3.5))
+
+    def setUp(self) -> None:
+        self.TRUTH.use_perturbations = False
+        self.OBSERVER.use_perturbations = False
+
+    def space_measurements(self, use_range: bool) -> List[InertialMeasurement]:
+        truth: Kepler = Kepler(self.TRUTH)
+        observer: Kepler = Kepler(self.OBSERVER)
+        measurements: List[InertialMeasurement] = []
+        for i in range(1, 31):
+            epoch: Epoch = self.EPOCH.plus_days(i * 60 / 86400)
+            truth.step_to_epoch(epoch)
+            observer.step_to_epoch(epoch)
+            ob = SpaceObservation(observer.state, truth.state.position.minus(observer.state.position), 1e-3, 1e-6)
+            measurements.append(InertialMeasurement.from_space_observation(ob, use_range=use_range))
+        return measurements
+
+    def estimate(self) -> RK4:
+        seed: GCRF = GCRF(self.EPOCH, self.TRUTH.position.plus(Vector3D(0.6, -0.4, 0.3)), self.TRUTH.velocity)
+        seed.use_perturbations = False
+        return RK4(seed)
+
+
+class TestInertialKalman(InertialScenario, unittest.TestCase):
+    def test_partials(self):
+        measurement: InertialMeasurement = self.space_measurements(True)[0]
+        state: GCRF = self.estimate().state
+        values, partials = measurement.predict(state)
+        for axis in range(3):
+            offset: List[float] = [0, 0, 0]
+            offset[axis] = 1e-4
+            moved: GCRF = GCRF(state.epoch, state.position.plus(Vector3D(*offset)), state.velocity)
+            shifted, _ = measurement.predict(moved)
+            for i in range(3):
+                self.assertAlmostEqual((shifted[i] - values[i]) / 1e-4, partials[i][axis], 5)
+
+    def test_angles_and_range(self):
+        kalman: InertialKalman = InertialKalman(self.estimate())
+        for measurement in self.space_measurements(True):
+            kalman.process(measurement)
+        truth: Kepler = Kepler(self.TRUTH)
+        truth.step_to_epoch(kalman.state().epoch)
+        self.assertLess(kalman.state().position.minus(truth.state.position).magnitude(), 0.05)
+        self.assertLess(kalman.p00.diagonal().x, InertialKalman.DEFAULT_COVARIANCE.row1.x)
+
+    def test_angles_only(self):
+        kalman: InertialKalman = InertialKalman(self.estimate())
+        measurements: List[InertialMeasurement] = self.space_measurements(False)
+        truth: Kepler = Kepler(self.TRUTH)
+        truth.step_to_epoch(measurements[0].epoch)
+        kalman.predict(measurements[0].epoch)
+        start: float = kalman.state().position.minus(truth.state.position).magnitude()
+        for measurement in measurements:
+            kalman.process(measurement)
+        truth.step_to_epoch(kalman.state().epoch)
+        self.assertLess(kalman.state().position.minus(truth.state.position).magnitude(), start)
+        self.assertEqual(len(kalman.residuals), 2)
+
+    def test_ground_azimuth_elevation(self):
+        site: GroundSite = GroundSite(LLA(radians(5), radians(-30), 0))
+        truth: Kepler = Kepler(self.TRUTH)
+        epoch: Epoch = self.EPOCH.plus_days(300 / 86400)
+        truth.step_to_epoch(epoch)
+        itrf_site: ITRF = ITRF.from_fixed(epoch, site.itrf_position)
+        itrf_target: Vector3D = PositionConvert.gcrf.to_itrf(truth.state.position, epoch)
+        enz: Vector3D = site.enz_matrix.multiply_vector(itrf_target.minus(site.itrf_position))
+        ob: GroundObservation = GroundObservation(itrf_site, enz, 1e-3, 1e-6)
+        measurement: InertialMeasurement = InertialMeasurement.from_ground_observation(ob, use_range=True)
+        values, _ = measurement.predict(truth.state)
+        self.assertAlmostEqual(values[0], ob.azimuth, 7)
+        self.assertAlmostEqual(values[1], ob.elevation, 7)
+        self.assertAlmostEqual(values[2], ob.range, 4)
+
+
+class TestUnscentedKalman(InertialScenario, unittest.TestCase):
+    def test_sigma_points(self):
+        kalman: UnscentedKalman = UnscentedKalman(self.estimate().state)
+        points: List[GCRF] = kalman.sigma_points()
+        self.assertEqual(len(points), 13)
+        offset: Vector3D = points[1].position.minus(kalman.state.position)
+        self.assertAlmostEqual(offset.magnitude(), (kalman.spread * kalman.p00.element(0, 0)) ** 0.5)
+        self.assertAlmostEqual(sum(kalman.mean_weights), 1)
+
+    def test_unscented_angles_and_range(self):
+        kalman: UnscentedKalman = UnscentedKalman(self.estimate().state)
+        for measurement in self.space_measurements(True):
+            kalman.process(measurement)
+        truth: Kepler = Kepler(self.TRUTH)
+        truth.step_to_epoch(kalman.state.epoch)
+        self.assertLess(kalman.state.position.minus(truth.state.position).magnitude(), 0.05)
+        self.assertEqual(len(kalman.residuals), 3)
+
+    def test_process_pool_propagation(self):
+        state: GCRF = self.estimate().state
+        state.use_perturbations = True
+        with UnscentedKalman(state, workers=2) as kalman:
+            points: List[GCRF] = kalman.sigma_points()
+            epoch: Epoch = self.EPOCH.plus_days(120 / 86400)
+            propagated: List[List[float]] = kalman.propagate(points, epoch)
+            pool = kalman.pool
+            self.assertIsNotNone(pool)
+            kalman.propagate(points, epoch.plus_days(60 / 86400))
+            self.assertIs(kalman.pool, pool)
+        self.assertIsNone(kalman.pool)
+        for point, values in zip(points[::4], propagated[::4]):
+            propagator: RK4 = RK4(point)
+            propagator.step_to_epoch(epoch)
+            self.assertAlmostEqual(propagator.state.position.x, values[0], 9)
+            self.assertAlmostEqual(propagator.state.velocity.z, values[5], 12)
+
+    def test_in_process_propagation(self):
+        state: GCRF = self.estimate().state
+        state.use_perturbations = True
+        points: List[GCRF] = UnscentedKalman(state).sigma_points()
+        epoch: Epoch = self.EPOCH.plus_days(120 / 86400)
+        local: List[List[float]] = UnscentedKalman(state).propagate(points, epoch)
+        with UnscentedKalman(state, workers=2) as kalman:
+            pooled: List[List[float]] = kalman.propagate(points, epoch)
+        for expected, values in zip(pooled, local):
+            for a, b in zip(expected, values):
+                self.assertAlmostEqual(a, b, 12)
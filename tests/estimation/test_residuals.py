@@ -0,0 +1,80 @@
+import unittest
+from math import asin, atan2, degrees, radians
+from random import Random
+from typing import Dict, List
+
+from pysmad.bodies import Earth, Satellite
+from pysmad.coordinates.positions import ENZ, LLA, PositionConvert
+from pysmad.coordinates.states import GCRF
+from pysmad.estimation.obs import LiveOpticalObservation, LiveOpticalSet
+from pysmad.estimation.residuals import ResidualTable, compute_residuals
+from pysmad.math.linalg import Vector3D
+from pysmad.propagators.inertial import RK4
+from pysmad.time import Epoch
+
+
+class TestComputeResiduals(unittest.TestCase):
+
+    EPOCH: Epoch = Epoch.from_datetime_components(2022, 12, 20, 0, 0, 0)
+    SITES: Dict[str, LLA] = {"A": LLA(radians(20), radians(-100), 0.5), "B": LLA(radians(-30), radians(40), 1.2)}
+
+    def state(self) -> GCRF:
+        return GCRF(self.EPOCH, Vector3D(Earth.RADIUS + 9000, 0, 0), Vector3D(0, 4.2, 3.4))
+
+    def observation(self, sensor_id: str, minutes: int, position: Vector3D, bias: float) -> LiveOpticalObservation:
+        epoch: Epoch = self.EPOCH.plus_days(minutes / 1440)
+        site: LLA = self.SITES[sensor_id]
+        itrf: Vector3D = PositionConvert.gcrf.to_itrf(position, epoch)
+        enz: Vector3D = ENZ.matrix(site.longitude, site.latitude).multiply_vector(
+            itrf.minus(PositionConvert.lla.to_itrf(site))
+        )
+        return LiveOpticalObservation(
+            {
+                "obTime": f"2022-12-20T{minutes // 60:02d}:{minutes % 60:02d}:00.000Z",
+                "origObjectId": "1",
+                "origSensorId": sensor_id,
+                "azimuth": degrees(atan2(enz.x, enz.y)),
+                "elevation": degrees(asin(enz.z / enz.magnitude())) + bias,
+                "senlat": degrees(site.latitude),
+                "senlon": degrees(site.longitude),
+                "senalt": site.altitude,
+                "ra": 0,
+                "declination": 0,
+                "source": "TEST",
+                "dataMode": "SIMULATED",
+            }
+        )
+
+    def optical_set(self, bias: float) -> LiveOpticalSet:
+        propagator: RK4 = RK4(self.state())
+        obs: List[LiveOpticalObservation] = []
+        for minutes in range(0, 90, 3):
+            propagator.step_to_epoch(self.EPOCH.plus_days(minutes / 1440))
+            sensor_id: str = "A" if minutes % 2 else "B"
+            obs.append(self.observation(sensor_id, minutes, propagator.state.position, bias))
+        Random(2).shuffle(obs)
+        optical_set: LiveOpticalSet = LiveOpticalSet()
+        for ob in obs:
+            optical_set.process_observation(ob)
+        return optical_set
+
+    def test_truth(self):
+        tables: Dict[str, ResidualTable] = compute_residuals(Satellite(self.state()), self.optical_set(0))
+        self.assertSetEqual(set(tables), {"A", "B"})
+        for table in tables.values():
+            self.assertListEqual(list(table.epochs), sorted(table.epochs))
+            self.assertLess(table.rms(), 0.1)
+
+    def test_matches_get_clos(self):
+        optical_set: LiveOpticalSet = self.optical_set(0.01)
+        satellite: Satellite = Satellite(self.state())
+        tables: Dict[str, ResidualTable] = compute_residuals(satellite, optical_set)
+        self.assertEqual(sum(len(table) for table in tables.values()), optical_set.total)
+        self.assertEqual(satellite.current_state().epoch.utc, self.EPOCH.utc)
+
+        ordered: List[LiveOpticalObservation] = sorted(optical_set.list, key=lambda ob: ob.epoch.utc)
+        expected: Dict[float, float] = {ob.epoch.utc: satellite.get_clos(ob) for ob in ordered}
+        for table in tables.values():
+            for utc, residual in zip(table.epochs, table.residuals):
+                self.assertGreater(residual, 0.1)
+                self.assertAlmostEqual(residual, expected[utc], delta=0.05)
@@ -0,0 +1,103 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from typing import List
+
+from pysmad.bodies import Earth  # noqa: F401
+from pysmad.coordinates.states import LiveVectorSet
+from pysmad.estimation.obs import LiveOpticalObservation, LiveOpticalSet
+from pysmad.estimation.stream import JSONStream, load_optical_set, load_vector_set, stream_observations
+
+
+class TestJSONStream(unittest.TestCase):
+    def observation(self, i: int) -> dict:
+        return {
+            "obTime": f"2022-12-20T00:{i % 60:02d}:00.000Z",
+            "origObjectId": str(i % 3),
+            "origSensorId": "ABC" if i % 2 else "XYZ",
+            "senlat": 20.0,
+            "senlon": -100.0,
+            "senalt": 0.5,
+            "ra": 10.0 + i,
+            "declination": -5.5,
+            "source": "TEST",
+            "dataMode": "REAL" if i % 4 else "SIMULATED",
+            "note": "brackets ] and braces } inside a string",
+        }
+
+    def vector(self, i: int) -> dict:
+        return {
+            "epoch": f"2022-12-20T00:{i:02d}:00.000Z",
+            "origObjectId": str(i % 2),
+            "xpos": 7000.0 + i,
+            "ypos": 0.0,
+            "zpos": 0.0,
+            "xvel": 0.0,
+            "yvel": 7.5,
+            "zvel": 0.0,
+        }
+
+    def setUp(self) -> None:
+        self.records: List[dict] = [self.observation(i) for i in range(50)]
+
+    def test_array_matches_json_load(self):
+        text: str = json.dumps(self.records, indent=2)
+        for read_size in [7, 64, JSONStream.DEFAULT_READ_SIZE]:
+            parsed: List[dict] = list(JSONStream(io.BytesIO(text.encode()), read_size))
+            self.assertListEqual(parsed, json.loads(text))
+
+    def test_json_lines(self):
+        text: str = "\n".join(json.dumps(record) for record in self.records) + "\n"
+        self.assertListEqual(list(JSONStream(io.StringIO(text), 13)), self.records)
+
+    def test_empty(self):
+        self.assertListEqual(list(JSONStream(io.BytesIO(b" [ ] "))), [])
+        self.assertListEqual(list(JSONStream(io.BytesIO(b""))), [])
+
+    def test_malformed_record(self):
+        text: str = "\n".join(json.dumps(record) for record in self.records)
+        broken: str = text.replace('"TEST"', "TEST", 1)
+        stream: io.StringIO = io.StringIO(broken)
+        with self.assertRaises(json.JSONDecodeError):
+            list(JSONStream(stream, 64, 1024))
+        self.assertLess(stream.tell(), len(broken) // 2)
+        with self.assertRaises(json.JSONDecodeError):
+            list(JSONStream(io.StringIO(broken), 64))
+
+    def test_chunks(self):
+        sizes: List[int] = [len(chunk) for chunk in JSONStream(io.StringIO(json.dumps(self.records))).chunks(16)]
+        self.assertListEqual(sizes, [16, 16, 16, 2])
+
+    def test_filters(self):
+        stream = io.BytesIO(json.dumps(self.records).encode())
+        chunks: List[List[LiveOpticalObservation]] = list(
+            stream_observations(stream, sensors={"ABC"}, targets={"1", "2"}, modes={"REAL"}, chunk_size=4)
+        )
+        obs: List[LiveOpticalObservation] = [ob for chunk in chunks for ob in chunk]
+        expected: List[dict] = [
+            r
+            for r in self.records
+            if r["origSensorId"] == "ABC" and r["origObjectId"] != "0" and r["dataMode"] == "REAL"
+        ]
+        self.assertTrue(all(len(chunk) <= 4 for chunk in chunks))
+        self.assertListEqual(
+            [ob.right_ascension for ob in obs], [LiveOpticalObservation(r).right_ascension for r in expected]
+        )
+
+    def test_load_sets(self):
+        fd, path = tempfile.mkstemp(suffix=".json")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.records, f)
+            optical_set: LiveOpticalSet = load_optical_set(path, modes={"SIMULATED"})
+            self.assertEqual(optical_set.total, len([r for r in self.records if r["dataMode"] == "SIMULATED"]))
+            self.assertSetEqual(set(optical_set.modes), {"SIMULATED"})
+        finally:
+            os.remove(path)
+
+        text: str = "\n".join(json.dumps(self.vector(i)) for i in range(6))
+        vector_set: LiveVectorSet = load_vector_set(io.StringIO(text))
+        self.assertEqual(vector_set.total, 6)
+        self.assertEqual(vector_set.targets["1"].position.x, 7005.0)
@@ -0,0 +1,108 @@
+import unittest
+from typing import Dict, List
+
+from pysmad.bodies import Earth
+from pysmad.coordinates.states import GCRF, LiveVector
+from pysmad.estimation.vectors import VectorStore
+from pysmad.math.linalg import Vector3D
+from pysmad.propagators.inertial import RK4
+from pysmad.time import Epoch
+
+
+class TestVectorStore(unittest.TestCase):
+
+    EPOCH: Epoch = Epoch.from_datetime_components(2022, 12, 20, 0, 0, 0)
+
+    def epoch(self, minutes: float) -> Epoch:
+        return self.EPOCH.plus_days(minutes / 1440)
+
+    def vector(self, sat_id: str, minutes: int, state: GCRF) -> LiveVector:
+        return LiveVector(
+            {
+                "epoch": f"2022-12-20T{minutes // 60:02d}:{minutes % 60:02d}:00.000000Z",
+                "origObjectId": sat_id,
+                "xpos": state.position.x,
+                "ypos": state.position.y,
+                "zpos": state.position.z,
+                "xvel": state.velocity.x,
+                "yvel": state.velocity.y,
+                "zvel": state.velocity.z,
+            }
+        )
+
+    def setUp(self) -> None:
+        self.starts: Dict[str, GCRF] = {
+            "1": GCRF(self.EPOCH, Vector3D(Earth.RADIUS + 500, 0, 0), Vector3D(0, 5.5, 5.1)),
+            "2": GCRF(self.EPOCH, Vector3D(0, Earth.RADIUS + 9000, 0), Vector3D(-4.2, 0, 3.4)),
+        }
+        self.minutes: Dict[str, List[int]] = {"1": [0, 5, 10, 15, 60], "2": [20, 0, 40, 30]}
+        vectors: List[LiveVector] = []
+        for sat_id, minutes in self.minutes.items():
+            propagator: RK4 = RK4(self.starts[sat_id].copy())
+            for minute in sorted(minutes):
+                propagator.step_to_epoch(self.epoch(minute))
+                vectors.append(self.vector(sat_id, minute, propagator.state))
+        vectors.sort(key=lambda state: -state.epoch.utc)
+        self.store: VectorStore = VectorStore.from_vectors(vectors)
+
+    def truth(self, sat_id: str, minutes: float) -> GCRF:
+        propagator: RK4 = RK4(self.starts[sat_id].copy())
+        propagator.step_to_epoch(self.epoch(minutes))
+        return propagator.state
+
+    def test_history(self):
+        self.assertEqual(sorted(self.store.sat_ids()), ["1", "2"])
+        for sat_id, minutes in self.minutes.items():
+            expected: List[float] = [self.epoch(minute).utc for minute in sorted(minutes)]
+            for utc, stored in zip(expected, self.store.history(sat_id)):
+                self.assertAlmostEqual(utc, stored, 9)
+        with self.assertRaises(ValueError):
+            self.store.history("3")
+
+    def test_nearest(self):
+        self.assertAlmostEqual(self.store.nearest("1", self.epoch(7)).epoch.utc, self.epoch(5).utc, 9)
+        self.assertAlmostEqual(self.store.nearest("1", self.epoch(8)).epoch.utc, self.epoch(10).utc, 9)
+        self.assertAlmostEqual(self.store.nearest("1", self.epoch(-30)).epoch.utc, self.epoch(0).utc, 9)
+        self.assertAlmostEqual(self.store.nearest("1", self.epoch(90)).epoch.utc, self.epoch(60).utc, 9)
+        self.assertEqual(self.store.nearest("2", self.epoch(33)).sat_id, "2")
+
+    def test_bracket(self):
+        before, after = self.store.bracket("2", self.epoch(25))
+        self.assertAlmostEqual(before.epoch.utc, self.epoch(20).utc, 9)
+        self.assertAlmostEqual(after.epoch.utc, self.epoch(30).utc, 9)
+        before, after = self.store.bracket("2", self.epoch(-1))
+        self.assertIsNone(before)
+        self.assertAlmostEqual(after.epoch.utc, self.epoch(0).utc, 9)
+        before, after = self.store.bracket("2", self.epoch(41))
+        self.assertAlmostEqual(before.epoch.utc, self.epoch(40).utc, 9)
+        self.assertIsNone(after)
+
+    def test_interpolate(self):
+        truth: GCRF = self.truth("2", 25)
+        state: GCRF = self.store.state("2", self.epoch(25))
+        self.assertAlmostEqual(state.epoch.utc, truth.epoch.utc, 9)
+        self.assertAlmostEqual(state.position.minus(truth.position).magnitude(), 0, delta=0.05)
+        self.assertAlmostEqual(state.velocity.minus(truth.velocity).magnitude(), 0, delta=5e-5)
+        self.assertIsNone(self.store.interpolate("1", self.epoch(30)))
+        self.assertIsNone(self.store.interpolate("1", self.epoch(7.5), max_gap=60))
+
+    def test_propagate(self):
+        truth: GCRF = self.truth("2", 50)
+        state: GCRF = self.store.state("2", self.epoch(50))
+        self.assertAlmostEqual(state.position.minus(truth.position).magnitude(), 0, delta=0.05)
+        late: GCRF = self.store.state("2", self.epoch(70))
+        self.assertAlmostEqual(late.position.minus(self.truth("2", 70).position).magnitude(), 0, delta=0.05)
+
+    def test_snapshot(self):
+        epoch: Epoch = self.epoch(35)
+        snapshot: Dict[str, GCRF] = self.store.snapshot(epoch)
+        self.assertEqual(sorted(snapshot), ["1", "2"])
+        for sat_id, state in snapshot.items():
+            expected: GCRF = self.store.state(sat_id, epoch)
+            self.assertAlmostEqual(state.epoch.utc, epoch.utc, 9)
+            self.assertAlmostEqual(state.position.minus(expected.position).magnitude(), 0, delta=1e-6)
+        self.assertEqual(list(self.store.snapshot(epoch, ["2"])), ["2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
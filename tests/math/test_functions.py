@@ -1,7 +1,8 @@
 import unittest
+from math import cos, sinh, sqrt
 
 from pysmad.constants import SECONDS_IN_SIDEREAL_DAY
-from pysmad.math.functions import EquationsOfMotion, LegendrePolynomial
+from pysmad.math.functions import EquationsOfMotion, LegendrePolynomial, Stumpff
 from pysmad.math.linalg import Vector3D
 
 MU: float = 398600.4418
@@ -144,6 +145,24 @@ class TestRAAN(unittest.TestCase):
         self.assertAlmostEqual(EquationsOfMotion.RAAN.from_w(Vector3D(1, 1, 1)), 2.356194490192345)
 
 
+class TestStumpff(unittest.TestCase):
+    def test_c2(self):
+        self.assertAlmostEqual(EquationsOfMotion.C.c2(0), 0.5)
+        self.assertAlmostEqual(Stumpff.c2(1), 0.45969769413186023)
+        self.assertAlmostEqual(Stumpff.c2(-1), 0.5430806348152437)
+
+    def test_c3(self):
+        self.assertAlmostEqual(EquationsOfMotion.C.c3(0), 1 / 6)
+        self.assertAlmostEqual(Stumpff.c3(1), 0.15852901519210350)
+        self.assertAlmostEqual(Stumpff.c3(-1), 0.17520119364380138)
+
+    def test_series_continuity(self):
+        psi: float = Stumpff.SERIES_LIMIT
+        root: float = sqrt(psi)
+        self.assertAlmostEqual(Stumpff.c2(psi), (1 - cos(root)) / psi, 12)
+        self.assertAlmostEqual(Stumpff.c3(-psi), (sinh(root) - root) / (psi * root), 12)
+
+
 class TestLegendrePolynomial(unittest.TestCase):
     def test_p(self):
         p = LegendrePolynomial(1).p
@@ -1,7 +1,7 @@
 import unittest
 from math import radians
 
-from pysmad.math.linalg import Vector3D
+from pysmad.math.linalg import Cholesky, Matrix3D, Matrix6D, Vector3D, Vector6D
 
 
 class TestVector3D(unittest.TestCase):
@@ -55,3 +55,70 @@ class TestVector3D(unittest.TestCase):
         self.assertAlmostEqual(vec_normed.x, 0.0947027447620757)
         self.assertAlmostEqual(vec_normed.y, 0.0473513723810378)
         self.assertAlmostEqual(vec_normed.z, 0.9943788200017946)
+
+    def test_operators(self):
+        self.assertAlmostEqual((self.VEC_1 + self.VEC_2).y, 44)
+        self.assertAlmostEqual((self.VEC_1 - self.VEC_2).y, -40)
+        self.assertAlmostEqual((2 * self.VEC_1).z, 84)
+        self.assertAlmostEqual((self.VEC_1 / 2).z, 21)
+        self.assertAlmostEqual((-self.VEC_1).x, -4)
+
+    def test_in_place(self):
+        vec = self.VEC_1.copy()
+        vec.iadd_scaled(self.VEC_2, 0.5)
+        self.assertAlmostEqual(vec.y, 23)
+        vec += self.VEC_2
+        self.assertAlmostEqual(vec.y, 65)
+        vec.set_from(self.VEC_2)
+        self.assertAlmostEqual(vec.z, 2)
+        self.assertAlmostEqual(self.VEC_1.y, 2)
+
+    def test_slots(self):
+        self.assertFalse(hasattr(self.VEC_1, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.VEC_1.w = 1
+
+
+class TestMatrixOperators(unittest.TestCase):
+
+    MAT = Matrix3D(Vector3D(1, 2, 3), Vector3D(4, 5, 6), Vector3D(7, 8, 10))
+
+    def test_matmul(self):
+        vec = self.MAT @ Vector3D(1, 1, 1)
+        self.assertAlmostEqual(vec.z, 25)
+        product = self.MAT @ self.MAT.inverse()
+        for row, expected in zip([product.row1, product.row2, product.row3], [(1, 0, 0), (0, 1, 0), (0, 0, 1)]):
+            for value, truth in zip([row.x, row.y, row.z], expected):
+                self.assertAlmostEqual(value, truth)
+
+    def test_rows_are_owned(self):
+        row = Vector3D(1, 2, 3)
+        mat = Matrix3D(row, row, row)
+        row.iadd_scaled(Vector3D(1, 1, 1), 10)
+        self.assertAlmostEqual(mat.row1.x, 1)
+        mat.row2.iadd_scaled(Vector3D(1, 1, 1), 10)
+        self.assertAlmostEqual(mat.row3.x, 1)
+
+    def test_matrix6d(self):
+        identity = Matrix6D.identity()
+        vec = Vector6D(1, 2, 3, 4, 5, 6)
+        self.assertAlmostEqual((identity @ vec).vz, 6)
+        self.assertAlmostEqual((identity + identity).row4.vx, 2)
+        self.assertAlmostEqual((identity - identity).row4.vx, 0)
+        self.assertAlmostEqual((identity @ identity).row2.y, 1)
+
+
+class TestCholesky(unittest.TestCase):
+    def test_solve(self):
+        matrix = [[4, 2, 0.4], [2, 5, 1], [0.4, 1, 3]]
+        factor = Cholesky.factor(matrix)
+        for i in range(3):
+            for j in range(3):
+                self.assertAlmostEqual(sum(factor[i][k] * factor[j][k] for k in range(3)), matrix[i][j])
+        x = Cholesky.solve(factor, [1, -2, 3])
+        for row, b in zip(matrix, [1, -2, 3]):
+            self.assertAlmostEqual(sum(a * v for a, v in zip(row, x)), b)
+
+    def test_rejects_indefinite(self):
+        with self.assertRaises(ValueError):
+            Cholesky.factor([[1, 2], [2, 1]])
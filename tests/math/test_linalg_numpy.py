@@ -0,0 +1,125 @@
+import os
+import subprocess
+import sys
+import unittest
+from importlib.util import find_spec
+
+from pysmad.math import linalg
+
+HAS_NUMPY: bool = find_spec("numpy") is not None
+
+if HAS_NUMPY:
+    from pysmad.math import linalg_numpy
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+class TestNumpyBackend(unittest.TestCase):
+
+    A: list[list[float]] = [[4, 2, 42, 1, -3, 0.5], [1, 0, 2, 7, 3, 2], [0.3, 9, 1, 1, 2, 4]]
+    B: list[list[float]] = [[2, -1, 3, 6, 1, 1], [5, 5, 0.5, 2, 0, 1], [1, 2, 3, 4, 5, 6]]
+
+    @staticmethod
+    def matrix6(module, rows: list[list[float]]):
+        vectors = [module.Vector6D(*row) for row in rows + [row[::-1] for row in rows]]
+        return module.Matrix6D(*vectors)
+
+    def assert_rows_equal(self, actual, expected):
+        for name in ["row1", "row2", "row3", "row4", "row5", "row6"]:
+            if not hasattr(expected, name):
+                break
+            a = getattr(actual, name)
+            e = getattr(expected, name)
+            for component in ["x", "y", "z", "vx", "vy", "vz"]:
+                if hasattr(e, component):
+                    self.assertAlmostEqual(getattr(a, component), getattr(e, component))
+
+    def test_vector3d(self):
+        pure_1, pure_2 = linalg.Vector3D(4, 2, 42), linalg.Vector3D(4, 42, 2)
+        fast_1, fast_2 = linalg_numpy.Vector3D(4, 2, 42), linalg_numpy.Vector3D(4, 42, 2)
+        self.assertAlmostEqual(fast_1.dot(fast_2), pure_1.dot(pure_2))
+        self.assertAlmostEqual(fast_1.angle(fast_2), pure_1.angle(pure_2))
+        self.assertAlmostEqual(fast_1.magnitude(), pure_1.magnitude())
+        for fast, pure in [
+            (fast_1.cross(fast_2), pure_1.cross(pure_2)),
+            (fast_1.plus(fast_2).scaled(0.5), pure_1.plus(pure_2).scaled(0.5)),
+            (fast_1.minus(fast_2).normalized(), pure_1.minus(pure_2).normalized()),
+            (fast_1.rotation_about_axis(fast_2, 0.4), pure_1.rotation_about_axis(pure_2, 0.4)),
+        ]:
+            self.assertAlmostEqual(fast.x, pure.x)
+            self.assertAlmostEqual(fast.y, pure.y)
+            self.assertAlmostEqual(fast.z, pure.z)
+
+    def test_matrix3d(self):
+        rows: list[list[float]] = [[1, 2, 3], [0, 4, 5], [1, 0, 6]]
+        pure = linalg.Matrix3D(*[linalg.Vector3D(*row) for row in rows])
+        fast = linalg_numpy.Matrix3D(*[linalg_numpy.Vector3D(*row) for row in rows])
+        self.assertAlmostEqual(fast.determinant(), pure.determinant())
+        self.assert_rows_equal(fast.inverse(), pure.inverse())
+        self.assert_rows_equal(fast.cofactor(), pure.cofactor())
+        self.assert_rows_equal(fast.adjugate(), pure.adjugate())
+        self.assert_rows_equal(fast.transpose().plus(fast).scaled(2), pure.transpose().plus(pure).scaled(2))
+
+    def test_matrix6d(self):
+        pure = self.matrix6(linalg, self.A)
+        other_pure = self.matrix6(linalg, self.B)
+        fast = self.matrix6(linalg_numpy, self.A)
+        other_fast = self.matrix6(linalg_numpy, self.B)
+        self.assert_rows_equal(
+            fast.multiply_matrix(other_fast.transpose()), pure.multiply_matrix(other_pure.transpose())
+        )
+        self.assert_rows_equal(fast.plus(other_fast).minus(fast), pure.plus(other_pure).minus(pure))
+        self.assert_rows_equal(linalg_numpy.Matrix6D.identity(), linalg.Matrix6D.identity())
+
+        pure_3by6 = linalg.Matrix3by6(*[linalg.Vector6D(*row) for row in self.B])
+        fast_3by6 = linalg_numpy.Matrix3by6(*[linalg_numpy.Vector6D(*row) for row in self.B])
+        self.assert_rows_equal(
+            fast.multiply_matrix_6by3(fast_3by6.transpose()), pure.multiply_matrix_6by3(pure_3by6.transpose())
+        )
+        self.assert_rows_equal(
+            fast_3by6.transpose().multiply_matrix3by6(fast_3by6), pure_3by6.transpose().multiply_matrix3by6(pure_3by6)
+        )
+
+    def test_array_views(self):
+        fast = self.matrix6(linalg_numpy, self.A)
+        row = fast.row2
+        fast.array[1, 0] = 99
+        self.assertEqual(row.x, 99)
+        self.assertEqual(fast.array.shape, (6, 6))
+        self.assertTrue(fast.array.flags["C_CONTIGUOUS"])
+
+    def test_operators_and_in_place(self):
+        for module in (linalg, linalg_numpy):
+            a = module.Vector3D(1, 2, 3)
+            b = module.Vector3D(4, 5, 6)
+            c = 2 * (a + b) - b / 2
+            self.assertAlmostEqual(c.z, 15)
+            a.iadd_scaled(b, 2)
+            a -= b
+            a *= 2
+            self.assertAlmostEqual(a.y, 14)
+            a.set_from(b)
+            self.assertAlmostEqual(a.x, 4)
+            self.assertFalse(hasattr(a, "__dict__"))
+
+            m = module.Matrix3D(module.Vector3D(1, 0, 0), module.Vector3D(0, 2, 0), module.Vector3D(0, 0, 3))
+            self.assertAlmostEqual((m @ b).z, 18)
+            self.assertAlmostEqual((m @ m).row3.z, 9)
+            self.assertFalse(hasattr(m, "__dict__"))
+
+    def test_matmul_dispatch(self):
+        pure = self.matrix6(linalg, self.A)
+        fast = self.matrix6(linalg_numpy, self.A)
+        self.assert_rows_equal(fast @ fast - fast, (pure @ pure) - pure)
+        pure_vector = pure @ linalg.Vector6D(*self.B[0])
+        fast_vector = fast @ linalg_numpy.Vector6D(*self.B[0])
+        self.assertAlmostEqual(fast_vector.vz, pure_vector.vz)
+
+    def test_backend_switch(self):
+        script = "import pysmad.bodies; from pysmad.coordinates import states; print(states.Vector3D.__module__)"
+        for backend, module in [("python", "pysmad.math.linalg"), ("numpy", "pysmad.math.linalg_numpy")]:
+            env = dict(os.environ, PYSMAD_LINALG=backend)
+            output = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True)
+            self.assertEqual(output.stdout.strip(), module)
+        env = dict(os.environ, PYSMAD_LINALG="fortran")
+        output = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True)
+        self.assertIn("unknown linalg backend fortran", output.stderr)
@@ -0,0 +1,43 @@
+import pickle
+import random
+import unittest
+from statistics import mean, stdev
+from typing import List
+
+from pysmad.math.linalg import Vector3D
+from pysmad.math.noise import NoiseGenerator
+
+
+class TestNoiseGenerator(unittest.TestCase):
+
+    VEC: Vector3D = Vector3D(4000, -2000, 500)
+
+    def test_reproducible(self):
+        first: Vector3D = self.VEC.with_noise(1, 1e-4, NoiseGenerator(7))
+        second: Vector3D = self.VEC.with_noise(1, 1e-4, NoiseGenerator(7))
+        self.assertEqual(first.x, second.x)
+        self.assertEqual(first.z, second.z)
+
+        random.seed(1)
+        a: float = NoiseGenerator.from_keys(7, "sat-a", 0).gauss()
+        random.seed(2)
+        self.assertEqual(a, NoiseGenerator.from_keys(7, "sat-a", 0).gauss())
+        self.assertNotEqual(a, NoiseGenerator.from_keys(7, "sat-a", 1).gauss())
+        self.assertNotEqual(a, NoiseGenerator.from_keys(7, "sat-b", 0).gauss())
+
+    def test_distribution(self):
+        generator: NoiseGenerator = NoiseGenerator(3)
+        samples: List[float] = [generator.gauss(2, 0.5) for _ in range(20000)]
+        self.assertAlmostEqual(mean(samples), 2, 1)
+        self.assertAlmostEqual(stdev(samples), 0.5, 1)
+        uniforms: List[float] = [generator.uniform(-1, 3) for _ in range(20000)]
+        self.assertTrue(all(-1 <= u < 3 for u in uniforms))
+        self.assertAlmostEqual(mean(uniforms), 1, 1)
+
+    def test_state_round_trip(self):
+        generator: NoiseGenerator = NoiseGenerator(11)
+        generator.gauss()
+        copy: NoiseGenerator = pickle.loads(pickle.dumps(generator))
+        self.assertListEqual([generator.gauss() for _ in range(40)], [copy.gauss() for _ in range(40)])
+        generator.seed(11)
+        self.assertEqual(generator.gauss(), NoiseGenerator(11).gauss())
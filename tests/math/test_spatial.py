@@ -0,0 +1,51 @@
+import unittest
+from math import radians
+from random import Random
+from typing import List
+
+from pysmad.math.linalg import Vector3D
+from pysmad.math.spatial import KDTree, SphereGrid
+
+
+class TestKDTree(unittest.TestCase):
+    def setUp(self) -> None:
+        rng: Random = Random(3)
+        self.POINTS: List[Vector3D] = [
+            Vector3D(rng.uniform(-100, 100), rng.uniform(-100, 100), rng.uniform(-100, 100)) for _ in range(500)
+        ]
+
+    def test_query_radius(self):
+        tree: KDTree = KDTree(self.POINTS)
+        self.assertEqual(len(tree), len(self.POINTS))
+        for center in self.POINTS[:20]:
+            expected: List[int] = [i for i, p in enumerate(self.POINTS) if p.minus(center).magnitude() <= 30]
+            self.assertListEqual(sorted(tree.query_radius(center, 30)), expected)
+
+    def test_empty(self):
+        self.assertListEqual(KDTree([]).query_radius(Vector3D(0, 0, 0), 10), [])
+
+
+class TestSphereGrid(unittest.TestCase):
+    def setUp(self) -> None:
+        rng: Random = Random(5)
+        self.DIRECTIONS: List[Vector3D] = [
+            Vector3D(rng.gauss(0, 1), rng.gauss(0, 1), rng.gauss(0, 1)).scaled(rng.uniform(1, 5)) for _ in range(2000)
+        ]
+
+    def brute_force(self, center: Vector3D, radius: float) -> List[int]:
+        return [i for i, d in enumerate(self.DIRECTIONS) if d.angle(center) <= radius]
+
+    def test_query_angle(self):
+        grid: SphereGrid = SphereGrid(self.DIRECTIONS, radians(2))
+        for center in self.DIRECTIONS[:25]:
+            for radius in [radians(0.5), radians(5), radians(40)]:
+                found = grid.query_angle(center, radius)
+                self.assertListEqual(sorted(i for i, _ in found), self.brute_force(center, radius))
+                for i, angle in found:
+                    self.assertAlmostEqual(angle, self.DIRECTIONS[i].angle(center), 7)
+
+    def test_poles_and_wrap(self):
+        grid: SphereGrid = SphereGrid(self.DIRECTIONS)
+        for center in [Vector3D(0, 0, 1), Vector3D(0, 0, -1), Vector3D(1, -1e-6, 0.01), Vector3D(0.2, 0, 0.98)]:
+            found = grid.query_angle(center, radians(10))
+            self.assertListEqual(sorted(i for i, _ in found), self.brute_force(center, radians(10)))
@@ -1,6 +1,13 @@
 import unittest
+from math import exp
 
-from pysmad.planning.maneuvers import Hohmann, VisViva
+from pysmad.bodies import Satellite
+from pysmad.constants import SEA_LEVEL_G
+from pysmad.coordinates.states import GCRF, HCW, StateConvert
+from pysmad.math.linalg import Vector3D
+from pysmad.planning.maneuvers import FiniteBurn, Hohmann, ImpulsiveBurn, ManeuverPlan, VisViva
+from pysmad.propagators.inertial import RK4
+from pysmad.time import Epoch
 
 
 class TestVisViva(unittest.TestCase):
@@ -17,3 +24,84 @@ class TestHohmann(unittest.TestCase):
     def test_planner(self):
         self.assertAlmostEqual(self.PLANNER.delta_v_1, 0.0029099630629589868)
         self.assertAlmostEqual(self.PLANNER.delta_v_2, 0.0029072089766200016)
+
+
+class TestManeuverPlan(unittest.TestCase):
+
+    EPOCH: Epoch = Epoch.from_datetime_components(2022, 12, 20, 0, 1, 9.184)
+    STATE: GCRF = GCRF(EPOCH, Vector3D(42164, 0, 0), Vector3D(0, 3.075, 0))
+
+    def setUp(self) -> None:
+        self.STATE.use_perturbations = False
+
+    def test_impulsive_burns(self):
+        plan: ManeuverPlan = ManeuverPlan(1000, 0.003, 300)
+        plan.add(ImpulsiveBurn(self.EPOCH.plus_days(0.5), Vector3D(0, 0.002, 0)))
+        plan.add(ImpulsiveBurn(self.EPOCH.plus_days(0.2), Vector3D(0.001, 0, 0)))
+        self.assertLess(plan.burns[0].epoch.utc, plan.burns[1].epoch.utc)
+        self.assertAlmostEqual(plan.total_dv(), 0.003)
+
+        propagator: RK4 = RK4(self.STATE)
+        plan.execute(propagator, self.EPOCH.plus_days(1))
+
+        expected: RK4 = RK4(self.STATE)
+        for burn in plan.burns:
+            expected.step_to_epoch(burn.epoch)
+            state: GCRF = StateConvert.hcw.to_gcrf(HCW(burn.epoch, Vector3D(0, 0, 0), burn.ric_dv), expected.state)
+            state.match_force_model(expected.state)
+            expected = RK4(state)
+        expected.step_to_epoch(self.EPOCH.plus_days(1))
+        self.assertAlmostEqual(propagator.state.position.minus(expected.state.position).magnitude(), 0, 6)
+        self.assertAlmostEqual(plan.mass_at(self.EPOCH.plus_days(1)), 1000 * exp(-0.003 / (300 * SEA_LEVEL_G)))
+        self.assertEqual(plan.mass_at(self.EPOCH.plus_days(0.2)), 1000)
+        self.assertAlmostEqual(
+            plan.mass_at(self.EPOCH.plus_days(0.2 + 1 / 86400)), 1000 * exp(-0.001 / (300 * SEA_LEVEL_G))
+        )
+
+    def test_finite_burn(self):
+        plan: ManeuverPlan = ManeuverPlan(1000, 0.003, 300)
+        burn: FiniteBurn = FiniteBurn(self.EPOCH.plus_days(0.1), Vector3D(0, 0.01, 0))
+        plan.add(burn)
+        duration: float = burn.duration(1000, 0.003, 300)
+        self.assertAlmostEqual(duration, 1000 * (1 - exp(-0.01 / (300 * SEA_LEVEL_G))) / 0.003)
+
+        propagator: RK4 = RK4(self.STATE)
+        plan.execute(propagator, self.EPOCH.plus_days(0.1 + duration / 86400))
+        self.assertEqual(propagator.m_dot, 0)
+
+        coast: RK4 = RK4(self.STATE)
+        coast.step_to_epoch(propagator.state.epoch)
+        dv: Vector3D = propagator.state.velocity.minus(coast.state.velocity)
+        self.assertAlmostEqual(dv.magnitude(), 0.01, 4)
+        self.assertAlmostEqual(plan.mass_at(propagator.state.epoch), 1000 - 0.003 * duration)
+        self.assertAlmostEqual(
+            plan.mass_at(self.EPOCH.plus_days(0.1 + 0.5 * duration / 86400)), 1000 - 0.0015 * duration
+        )
+
+    def test_interrupted_finite_burn(self):
+        plan: ManeuverPlan = ManeuverPlan(1000, 0.003, 300)
+        plan.add(FiniteBurn(self.EPOCH.plus_days(0.1), Vector3D(0.002, 0.01, 0)))
+        plan.add(ImpulsiveBurn(self.EPOCH.plus_days(0.3), Vector3D(0, -0.001, 0)))
+
+        single: RK4 = RK4(self.STATE)
+        plan.execute(single, self.EPOCH.plus_days(0.5))
+
+        split: RK4 = RK4(self.STATE)
+        plan.execute(split, self.EPOCH.plus_days(0.105))
+        self.assertNotEqual(split.m_dot, 0)
+        plan.execute(split, self.EPOCH.plus_days(0.5))
+        self.assertAlmostEqual(split.state.position.minus(single.state.position).magnitude(), 0, 3)
+
+    def test_from_satellite(self):
+        sat: Satellite = Satellite(self.STATE)
+        plan: ManeuverPlan = ManeuverPlan.from_satellite(sat)
+        self.assertEqual(plan.mass, sat.total_mass())
+        self.assertEqual(plan.m_dot, sat.m_dot)
+        self.assertEqual(plan.isp, sat.isp)
+
+    def test_overlap(self):
+        plan: ManeuverPlan = ManeuverPlan(1000, 0.003, 300)
+        plan.add(FiniteBurn(self.EPOCH, Vector3D(0, 0.01, 0)))
+        plan.add(ImpulsiveBurn(self.EPOCH.plus_days(0.01), Vector3D(0, 0.01, 0)))
+        with self.assertRaises(ValueError):
+            plan.masses()
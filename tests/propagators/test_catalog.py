@@ -0,0 +1,47 @@
+import subprocess
+import sys
+import unittest
+
+from pysmad.bodies import Earth
+from pysmad.coordinates.states import GCRF
+from pysmad.math.linalg import Vector3D
+from pysmad.propagators.catalog import CatalogEphemeris, propagate_catalog
+from pysmad.propagators.inertial import RK4
+from pysmad.time import Epoch
+
+
+class TestPropagateCatalog(unittest.TestCase):
+
+    EPOCH: Epoch = Epoch.from_datetime_components(2022, 12, 20, 0, 1, 9.184)
+    STATES: list[GCRF] = [
+        GCRF(EPOCH, Vector3D(42164, 0, 0), Vector3D(0, 3.07375, 0)),
+        GCRF(EPOCH, Vector3D(0, Earth.RADIUS + 700, 0), Vector3D(-7.5, 0, 0.2)),
+        GCRF(EPOCH, Vector3D(26560, 0, 0), Vector3D(0, 2.7, 2.7)),
+    ]
+    GRID: list[Epoch] = [EPOCH.plus_days(0.005), EPOCH.plus_days(0.01)]
+
+    def test_matches_serial_propagation(self):
+        ephemeris: CatalogEphemeris = propagate_catalog(self.STATES, self.GRID, workers=2, shard_size=1)
+        for i, state in enumerate(self.STATES):
+            propagator: RK4 = RK4(state)
+            for j, epoch in enumerate(self.GRID):
+                propagator.step_to_epoch(epoch)
+                result: GCRF = ephemeris.state(i, j)
+                self.assertEqual(result.epoch.utc, epoch.utc)
+                self.assertAlmostEqual(result.position.x, propagator.state.position.x, 9)
+                self.assertAlmostEqual(result.position.y, propagator.state.position.y, 9)
+                self.assertAlmostEqual(result.position.z, propagator.state.position.z, 9)
+                self.assertAlmostEqual(result.velocity.x, propagator.state.velocity.x, 12)
+                self.assertAlmostEqual(result.velocity.y, propagator.state.velocity.y, 12)
+                self.assertAlmostEqual(result.velocity.z, propagator.state.velocity.z, 12)
+
+    def test_buffer_layout(self):
+        ephemeris: CatalogEphemeris = propagate_catalog(self.STATES, self.GRID, workers=1, chunk_size=2)
+        self.assertEqual(len(ephemeris.values), len(self.STATES) * len(self.GRID) * 6)
+        self.assertEqual(ephemeris.offset(2, 1), 30)
+        self.assertEqual(len(ephemeris.states(1)), len(self.GRID))
+
+    def test_import_order(self):
+        for module in ["pysmad.coordinates.elements", "pysmad.propagators.catalog", "pysmad.propagators.secular"]:
+            output = subprocess.run([sys.executable, "-c", f"import {module}"], capture_output=True, text=True)
+            self.assertEqual(output.returncode, 0, output.stderr)
@@ -0,0 +1,114 @@
+import os
+import tempfile
+import unittest
+
+from pysmad.bodies import Earth, Satellite
+from pysmad.coordinates.states import GCRF
+from pysmad.math.linalg import Vector3D
+from pysmad.propagators.checkpoints import STATE_WIDTH, CheckpointStore
+from pysmad.propagators.inertial import RK4
+from pysmad.time import Epoch
+
+
+class TestCheckpointStore(unittest.TestCase):
+
+    EPOCH: Epoch = Epoch.from_datetime_components(2022, 12, 20, 0, 1, 9.184)
+    STATE: GCRF = GCRF(EPOCH, Vector3D(0, Earth.RADIUS + 700, 0), Vector3D(-7.5, 0, 0.2))
+
+    def setUp(self) -> None:
+        self.STATE.use_perturbations = False
+
+    def test_backward_query_matches_forward_propagation(self):
+        store: CheckpointStore = CheckpointStore(interval=4)
+        propagator: RK4 = store.step_to_epoch(RK4(self.STATE), self.EPOCH.plus_days(1))
+        self.assertEqual(len(store), 73)
+
+        epoch: Epoch = self.EPOCH.plus_days(0.43)
+        queried: RK4 = store.step_to_epoch(propagator, epoch)
+        self.assertIsNot(queried, propagator)
+        self.assertAlmostEqual(queried.state.epoch.utc, epoch.utc, 9)
+
+        direct: RK4 = RK4(self.STATE)
+        for node in range(1, 32):
+            direct.step_to_epoch(self.EPOCH.plus_days(node * store.spacing / 86400))
+        direct.step_to_epoch(epoch)
+        self.assertAlmostEqual(queried.state.position.minus(direct.state.position).magnitude(), 0, 6)
+
+    def test_nearest(self):
+        store: CheckpointStore = CheckpointStore(interval=1)
+        store.step_to_epoch(RK4(self.STATE), self.EPOCH.plus_days(0.1))
+        step_days: float = RK4.MAX_STEP / 86400
+        self.assertEqual(store.nearest(self.EPOCH.plus_days(-1)), 0)
+        self.assertEqual(store.nearest(self.EPOCH.plus_days(step_days * 2.4)), 2)
+        self.assertEqual(store.nearest(self.EPOCH.plus_days(step_days * 2.6)), 3)
+        self.assertEqual(store.nearest(self.EPOCH.plus_days(1)), len(store) - 1)
+
+    def test_thinning_bounds_memory(self):
+        store: CheckpointStore = CheckpointStore(interval=1, capacity=8)
+        store.step_to_epoch(RK4(self.STATE), self.EPOCH.plus_days(0.2))
+        self.assertLessEqual(len(store.values) // STATE_WIDTH, 8)
+        self.assertGreater(store.spacing, RK4.MAX_STEP)
+        self.assertEqual(store.epochs[0], self.EPOCH.utc)
+
+    def test_spill(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path: str = os.path.join(folder, "checkpoints.bin")
+            store: CheckpointStore = CheckpointStore(interval=1, capacity=8, spill_path=path)
+            store.step_to_epoch(RK4(self.STATE), self.EPOCH.plus_days(0.2))
+            self.assertEqual(len(store), 58)
+            self.assertGreater(store.spilled, 0)
+            self.assertEqual(os.path.getsize(path), store.spilled * STATE_WIDTH * 8)
+
+            restart: GCRF = store.state(0, self.STATE)
+            self.assertAlmostEqual(restart.position.y, self.STATE.position.y, 12)
+            self.assertFalse(restart.use_perturbations)
+            store.clear()
+            self.assertEqual(len(store), 0)
+
+    def test_spill_ignores_existing_content(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path: str = os.path.join(folder, "checkpoints.bin")
+            with open(path, "wb") as f:
+                f.write(bytes(485))
+            first: CheckpointStore = CheckpointStore(interval=1, capacity=8, spill_path=path)
+            second: CheckpointStore = CheckpointStore(interval=1, capacity=8, spill_path=path)
+            first.step_to_epoch(RK4(self.STATE), self.EPOCH.plus_days(0.1))
+            second.step_to_epoch(RK4(self.STATE), self.EPOCH.plus_days(-0.1))
+            self.assertGreater(first.spilled, 0)
+            self.assertGreater(second.spilled, 0)
+            self.assertAlmostEqual(first.state(0, self.STATE).position.y, self.STATE.position.y, 12)
+            self.assertAlmostEqual(second.state(len(second) - 1, self.STATE).position.y, self.STATE.position.y, 12)
+
+            second.clear()
+            self.assertEqual(os.path.getsize(path), first.spill_end)
+            first.clear()
+            self.assertEqual(os.path.getsize(path), 485)
+
+    def test_record_past_capacity(self):
+        store: CheckpointStore = CheckpointStore(capacity=2)
+        for minutes in range(3):
+            store.record(self.shifted(minutes))
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.epochs[0], self.EPOCH.utc)
+
+    def shifted(self, minutes: int) -> GCRF:
+        return GCRF(self.EPOCH.plus_days(minutes / 1440), self.STATE.position, self.STATE.velocity)
+
+    def test_stm_is_not_restarted(self):
+        store: CheckpointStore = CheckpointStore(interval=1)
+        propagator: RK4 = store.step_to_epoch(RK4(self.STATE), self.EPOCH.plus_days(0.1))
+        propagator.enable_stm()
+        queried: RK4 = store.step_to_epoch(propagator, self.EPOCH.plus_days(0.01))
+        self.assertIs(queried, propagator)
+        self.assertIsNotNone(queried.stm)
+        self.assertAlmostEqual(queried.state.epoch.utc, self.EPOCH.plus_days(0.01).utc, 9)
+
+    def test_satellite_checkpoints(self):
+        sat: Satellite = Satellite(GCRF(self.EPOCH, Vector3D(42164, 0, 0), Vector3D(0, 3.07375, 0)))
+        sat.enable_checkpoints(interval=2)
+        sat.step_to_epoch(self.EPOCH.plus_days(0.1))
+        self.assertEqual(len(sat.checkpoints), 15)
+        sat.step_to_epoch(self.EPOCH.plus_days(0.02))
+        self.assertAlmostEqual(sat.current_epoch().utc, self.EPOCH.plus_days(0.02).utc, 9)
+        sat.impulsive_maneuver(Vector3D(0, 0.001, 0))
+        self.assertEqual(len(sat.checkpoints), 0)
@@ -0,0 +1,40 @@
+import unittest
+
+from pysmad.bodies import Earth
+from pysmad.coordinates.states import GCRF
+from pysmad.math.linalg import Vector3D
+from pysmad.propagators.inertial import RK4, Encke, Kepler
+from pysmad.time import Epoch
+
+
+class TestEncke(unittest.TestCase):
+
+    EPOCH: Epoch = Epoch.from_datetime_components(2022, 12, 20, 0, 1, 9.184)
+    LEO: GCRF = GCRF(EPOCH, Vector3D(0, Earth.RADIUS + 700, 0), Vector3D(-7.5, 0, 0.2))
+
+    def test_two_body_matches_kepler(self):
+        state: GCRF = self.LEO.copy()
+        state.use_perturbations = False
+        epoch: Epoch = self.EPOCH.plus_days(0.3)
+        encke: Encke = Encke(state)
+        encke.step_to_epoch(epoch)
+        analytic: Kepler = Kepler(state)
+        analytic.step_to_epoch(epoch)
+        self.assertEqual(encke.rectifications, 0)
+        self.assertAlmostEqual(encke.state.position.minus(analytic.state.position).magnitude(), 0, 3)
+        self.assertAlmostEqual(encke.state.velocity.minus(analytic.state.velocity).magnitude(), 0, 6)
+
+    def test_large_steps(self):
+        epoch: Epoch = self.EPOCH.plus_days(0.1)
+        truth: RK4 = RK4(self.LEO)
+        truth.MAX_STEP = 20
+        truth.step_to_epoch(epoch)
+        cowell: RK4 = RK4(self.LEO)
+        cowell.step_to_epoch(epoch)
+        encke: Encke = Encke(self.LEO)
+        encke.step_to_epoch(epoch)
+        encke_error: float = encke.state.position.minus(truth.state.position).magnitude()
+        self.assertGreater(encke.rectifications, 0)
+        self.assertLess(encke_error, 1)
+        self.assertLess(encke_error, cowell.state.position.minus(truth.state.position).magnitude())
+        self.assertTrue(encke.state.use_perturbations)
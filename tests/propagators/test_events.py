@@ -0,0 +1,129 @@
+import unittest
+from math import pi, sqrt
+from typing import List
+
+from pysmad.bodies import Earth, GroundSite, Satellite
+from pysmad.coordinates.positions import LLA
+from pysmad.coordinates.states import GCRF
+from pysmad.math.linalg import Vector3D
+from pysmad.propagators.events import (
+    ApsisEvent,
+    EclipseEvent,
+    ElevationEvent,
+    EventDetector,
+    EventRecord,
+    HermiteSegment,
+    RangeEvent,
+    SunAngleEvent,
+)
+from pysmad.propagators.inertial import Kepler
+from pysmad.time import Epoch
+
+
+class TestEventDetector(unittest.TestCase):
+
+    EPOCH: Epoch = Epoch.from_datetime_components(2022, 12, 20, 0, 1, 9.184)
+    STATE: GCRF = GCRF(EPOCH, Vector3D(Earth.RADIUS + 500, 0, 0), Vector3D(0, 8.2, 1.5))
+
+    def setUp(self) -> None:
+        self.STATE.use_perturbations = False
+
+    def test_apsis(self):
+        sma: float = 1 / (2 / self.STATE.position.magnitude() - self.STATE.velocity.magnitude() ** 2 / Earth.MU)
+        period: float = 2 * pi * sqrt(sma**3 / Earth.MU)
+        detector: EventDetector = EventDetector(Kepler(self.STATE), [ApsisEvent()])
+        events: List[EventRecord] = detector.step_to_epoch(self.EPOCH.plus_days(2.2 * period / 86400))
+        self.assertListEqual([event.name for event in events], ["apoapsis", "periapsis", "apoapsis", "periapsis"])
+        self.assertAlmostEqual((events[1].epoch.utc - self.EPOCH.utc) * 86400, period, 1)
+        self.assertAlmostEqual((events[0].epoch.utc - self.EPOCH.utc) * 86400, period * 0.5, 1)
+
+    def test_direction(self):
+        detector: EventDetector = EventDetector(Kepler(self.STATE), [ApsisEvent(direction=1)])
+        events: List[EventRecord] = detector.step_to_epoch(self.EPOCH.plus_days(0.5))
+        self.assertTrue(events)
+        self.assertTrue(all(event.name == "periapsis" for event in events))
+        self.assertEqual(len(detector.history), len(events))
+
+    def test_eclipse(self):
+        detector: EventDetector = EventDetector(Kepler(self.STATE), [EclipseEvent(), EclipseEvent(penumbra=True)])
+        events: List[EventRecord] = detector.step_to_epoch(self.EPOCH.plus_days(0.2))
+        names: List[str] = [event.name for event in events]
+        self.assertIn("eclipse entry", names)
+        self.assertIn("eclipse exit", names)
+        for event in events:
+            self.assertAlmostEqual(event.event.value(event.state), 0, 6)
+
+        # the penumbra is entered before and exited after the umbra
+        umbra: List[EventRecord] = [event for event in events if not event.event.penumbra]
+        penumbra: List[EventRecord] = [event for event in events if event.event.penumbra]
+        entry: int = [event.name for event in umbra].index("eclipse entry")
+        self.assertLess(penumbra[entry].epoch.utc, umbra[entry].epoch.utc)
+        self.assertGreater(penumbra[entry + 1].epoch.utc, umbra[entry + 1].epoch.utc)
+
+    def test_elevation_matches_fine_sampling(self):
+        site: GroundSite = GroundSite(LLA(0.2, 0.5, 0))
+        event: ElevationEvent = ElevationEvent(site, 0.1)
+        events: List[EventRecord] = EventDetector(Kepler(self.STATE), [event]).step_to_epoch(self.EPOCH.plus_days(1))
+        self.assertTrue(events)
+
+        propagator: Kepler = Kepler(self.STATE)
+        for record in events:
+            propagator.step_to_epoch(record.epoch.plus_days(-1 / 86400))
+            before: float = event.value(propagator.state)
+            propagator.step_to_epoch(record.epoch.plus_days(1 / 86400))
+            after: float = event.value(propagator.state)
+            self.assertEqual(after > before, record.increasing)
+            self.assertLess(before * after, 0)
+
+    def target(self) -> Satellite:
+        state: GCRF = GCRF(self.EPOCH, Vector3D(Earth.RADIUS + 510, 5, 0), Vector3D(0, 8.19, 1.52))
+        state.use_perturbations = False
+        return Satellite(state)
+
+    def assert_target_unchanged(self, target: Satellite, start: GCRF):
+        self.assertEqual(target.current_epoch().utc, start.epoch.utc)
+        self.assertEqual(target.position().minus(start.position).magnitude(), 0)
+        self.assertEqual(target.velocity().minus(start.velocity).magnitude(), 0)
+
+    def test_range(self):
+        target: Satellite = self.target()
+        start: GCRF = target.current_state()
+        truth: Kepler = Kepler(start)
+        end: Epoch = self.EPOCH.plus_days(0.1)
+        roots: List[float] = []
+        for step in [EventDetector.DEFAULT_STEP, 70]:
+            event: RangeEvent = RangeEvent(target, 100)
+            events: List[EventRecord] = EventDetector(Kepler(self.STATE), [event], step).step_to_epoch(end)
+            self.assertTrue(events)
+            self.assertEqual(events[0].name, "range increasing")
+            truth.step_to_epoch(events[0].epoch)
+            self.assertAlmostEqual(truth.state.position.minus(events[0].state.position).magnitude(), 100, 3)
+            roots.append(events[0].epoch.utc)
+            self.assert_target_unchanged(target, start)
+        self.assertAlmostEqual(roots[0] * 86400, roots[1] * 86400, delta=EventDetector.TIME_TOLERANCE)
+
+    def test_sun_angle(self):
+        target: Satellite = self.target()
+        start: GCRF = target.current_state()
+        event: SunAngleEvent = SunAngleEvent(target, pi / 2)
+        events: List[EventRecord] = EventDetector(Kepler(self.STATE), [event]).step_to_epoch(self.EPOCH.plus_days(0.2))
+        self.assertTrue(events)
+        self.assert_target_unchanged(target, start)
+
+        truth: Kepler = Kepler(start)
+        for record in events:
+            truth.step_to_epoch(record.epoch)
+            line_of_sight: Vector3D = truth.state.position.minus(record.state.position)
+            self.assertAlmostEqual(record.state.sun_vector().angle(line_of_sight), pi / 2, 5)
+            self.assertAlmostEqual(event.value(record.state), 0, 6)
+
+    def test_hermite_segment(self):
+        start: Kepler = Kepler(self.STATE)
+        end: Kepler = Kepler(self.STATE)
+        end.step_to_epoch(self.EPOCH.plus_days(300 / 86400))
+        segment: HermiteSegment = HermiteSegment(start.state, end.state)
+        start.step_to_epoch(self.EPOCH.plus_days(120 / 86400))
+        state: GCRF = segment.state(120)
+        self.assertAlmostEqual(state.epoch.utc, start.state.epoch.utc, 9)
+        self.assertLess(state.position.minus(start.state.position).magnitude(), 5e-3)
+        self.assertLess(state.velocity.minus(start.state.velocity).magnitude(), 5e-5)
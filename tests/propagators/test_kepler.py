@@ -0,0 +1,69 @@
+import unittest
+
+from pysmad.bodies import Earth
+from pysmad.coordinates.states import GCRF
+from pysmad.math.linalg import Vector3D
+from pysmad.propagators.catalog import CatalogEphemeris
+from pysmad.propagators.inertial import RK4, Kepler
+from pysmad.time import Epoch
+
+
+class TestKepler(unittest.TestCase):
+
+    EPOCH: Epoch = Epoch.from_datetime_components(2022, 12, 20, 0, 1, 9.184)
+    STATES: list[GCRF] = [
+        GCRF(EPOCH, Vector3D(42164, 0, 0), Vector3D(0, 3.07375, 0)),
+        GCRF(EPOCH, Vector3D(0, Earth.RADIUS + 700, 0), Vector3D(-7.5, 0, 0.2)),
+        GCRF(EPOCH, Vector3D(7000, 0, 0), Vector3D(0, 9.5, 3)),
+        GCRF(EPOCH, Vector3D(7000, 0, 0), Vector3D(0, 4, 10)),
+    ]
+
+    def setUp(self) -> None:
+        for state in self.STATES:
+            state.use_perturbations = False
+
+    def test_matches_two_body_integration(self):
+        epoch: Epoch = self.EPOCH.plus_days(0.05)
+        for state in self.STATES:
+            numerical: RK4 = RK4(state)
+            numerical.MAX_STEP = 10
+            numerical.step_to_epoch(epoch)
+            analytic: Kepler = Kepler(state)
+            analytic.step_to_epoch(epoch)
+            self.assertAlmostEqual(analytic.state.epoch.utc, epoch.utc)
+            self.assertAlmostEqual(analytic.state.position.x, numerical.state.position.x, 3)
+            self.assertAlmostEqual(analytic.state.position.y, numerical.state.position.y, 3)
+            self.assertAlmostEqual(analytic.state.position.z, numerical.state.position.z, 3)
+            self.assertAlmostEqual(analytic.state.velocity.x, numerical.state.velocity.x, 6)
+            self.assertAlmostEqual(analytic.state.velocity.y, numerical.state.velocity.y, 6)
+            self.assertAlmostEqual(analytic.state.velocity.z, numerical.state.velocity.z, 6)
+
+    def test_round_trip(self):
+        for state in self.STATES:
+            forward = Kepler.solve(
+                (state.position.x, state.position.y, state.position.z, state.velocity.x, state.velocity.y, 0), 86400.5
+            )
+            back = Kepler.solve(forward, -86400.5)
+            self.assertAlmostEqual(back[0], state.position.x, 6)
+            self.assertAlmostEqual(back[1], state.position.y, 6)
+            self.assertAlmostEqual(back[4], state.velocity.y, 9)
+
+    def test_keeps_force_model(self):
+        state: GCRF = self.STATES[1].copy()
+        state.srp_scalar = 0.1
+        propagator: Kepler = Kepler(state)
+        propagator.step()
+        self.assertEqual(propagator.state.srp_scalar, 0.1)
+        self.assertFalse(propagator.state.use_perturbations)
+
+    def test_solve_grid(self):
+        grid: list[Epoch] = [self.EPOCH.plus_days(-0.01), self.EPOCH, self.EPOCH.plus_days(3.2)]
+        ephemeris: CatalogEphemeris = CatalogEphemeris.from_two_body(self.STATES, grid)
+        self.assertEqual(len(ephemeris.values), len(self.STATES) * len(grid) * 6)
+        for i, state in enumerate(self.STATES):
+            propagator: Kepler = Kepler(state)
+            for j, epoch in enumerate(grid):
+                propagator.step_to_epoch(epoch)
+                result: GCRF = ephemeris.state(i, j)
+                self.assertAlmostEqual(result.position.x, propagator.state.position.x, 6)
+                self.assertAlmostEqual(result.velocity.z, propagator.state.velocity.z, 9)
@@ -0,0 +1,116 @@
+import unittest
+from array import array
+
+from pysmad.bodies import Earth
+from pysmad.coordinates.states import GCRF, HCW
+from pysmad.math.linalg import Matrix3D, Matrix6D, Vector3D, Vector6D
+from pysmad.propagators.inertial import Kepler
+from pysmad.propagators.relative import STATE_WIDTH, Hill, YamanakaAnkersen
+from pysmad.time import Epoch
+
+
+class TestHill(unittest.TestCase):
+
+    EPOCH: Epoch = Epoch.from_datetime_components(2022, 12, 20, 0, 1, 9.184)
+    SMA: float = Earth.RADIUS + 35786
+
+    def test_system_matrix_cache(self):
+        hill: Hill = Hill(HCW(self.EPOCH, Vector3D(1, 2, 3), Vector3D(0.001, 0, 0)), self.SMA)
+        first: Matrix6D = hill.system_matrix(600)
+        self.assertIs(hill.system_matrix(600), first)
+        self.assertEqual(first.row2.vy, hill.build_system_matrix(600).row2.vy)
+
+        for t in range(Hill.CACHE_SIZE):
+            hill.system_matrix(t + 1000)
+        self.assertEqual(len(hill.cache), Hill.CACHE_SIZE)
+        self.assertNotIn(600, hill.cache)
+
+    def test_propagate_grid(self):
+        states: array = array("d", [1, 2, 3, 0.001, -0.002, 0.0005, -4, 0.5, 0, 0, 0.003, -0.001])
+        times: list[float] = [0, 300, 3600, 86400]
+        hill: Hill = Hill(HCW(self.EPOCH, Vector3D(0, 0, 0), Vector3D(0, 0, 0)), self.SMA)
+        values: array = hill.propagate_grid(states, times)
+        self.assertEqual(len(values), 2 * len(times) * STATE_WIDTH)
+
+        for k in range(2):
+            start: int = k * STATE_WIDTH
+            end: int = start + STATE_WIDTH
+            state: HCW = HCW.from_state_vector(Vector6D(*states[start:end]))
+            for j, t in enumerate(hill.system_matrices(times)):
+                expected: Vector6D = t.multiply_vector(state.vector)
+                i: int = (k * len(times) + j) * STATE_WIDTH
+                self.assertAlmostEqual(values[i], expected.x)
+                self.assertAlmostEqual(values[i + 1], expected.y)
+                self.assertAlmostEqual(values[i + 2], expected.z)
+                self.assertAlmostEqual(values[i + 3], expected.vx)
+                self.assertAlmostEqual(values[i + 4], expected.vy)
+                self.assertAlmostEqual(values[i + 5], expected.vz)
+
+
+class TestYamanakaAnkersen(unittest.TestCase):
+
+    EPOCH: Epoch = Epoch.from_datetime_components(2022, 12, 20, 0, 1, 9.184)
+    ORIGIN: GCRF = GCRF(EPOCH, Vector3D(7000, 1000, 300), Vector3D(-1.0, 9.0, 1.5))
+
+    def setUp(self) -> None:
+        self.ORIGIN.use_perturbations = False
+
+    @staticmethod
+    def relative_state(origin: GCRF, state: GCRF) -> HCW:
+        frame: Matrix3D = HCW.frame_matrix(origin)
+        r: Vector3D = frame.multiply_vector(state.position.minus(origin.position))
+        v: Vector3D = frame.multiply_vector(state.velocity.minus(origin.velocity))
+        w: float = origin.position.cross(origin.velocity).magnitude() / origin.position.magnitude() ** 2
+        return HCW(origin.epoch, r, Vector3D(v.x + w * r.y, v.y - w * r.x, v.z))
+
+    def test_matches_two_body_difference(self):
+        frame: Matrix3D = HCW.frame_matrix(self.ORIGIN).transpose()
+        deputy: GCRF = GCRF(
+            self.EPOCH,
+            self.ORIGIN.position.plus(frame.multiply_vector(Vector3D(0.5, -1, 0.3))),
+            self.ORIGIN.velocity.plus(frame.multiply_vector(Vector3D(0.0002, 0.0001, -0.0003))),
+        )
+        deputy.use_perturbations = False
+        propagator: YamanakaAnkersen = YamanakaAnkersen(self.relative_state(self.ORIGIN, deputy), self.ORIGIN)
+        self.assertAlmostEqual(propagator.eccentricity, 0.4969977338638489)
+
+        origin: Kepler = Kepler(self.ORIGIN)
+        target: Kepler = Kepler(deputy)
+        epoch: Epoch = self.EPOCH.plus_days(3600 / 86400)
+        origin.step_to_epoch(epoch)
+        target.step_to_epoch(epoch)
+        propagator.step_to_epoch(epoch)
+        expected: HCW = self.relative_state(origin.state, target.state)
+        self.assertAlmostEqual(propagator.state.epoch.utc, epoch.utc)
+        self.assertLess(propagator.state.position.minus(expected.position).magnitude(), 1e-3)
+        self.assertLess(propagator.state.velocity.minus(expected.velocity).magnitude(), 1e-6)
+
+    def test_circular_origin_matches_hill(self):
+        r: float = Earth.RADIUS + 35786
+        origin: GCRF = GCRF(self.EPOCH, Vector3D(r, 0, 0), Vector3D(0, (Earth.MU / r) ** 0.5, 0))
+        state: HCW = HCW(self.EPOCH, Vector3D(1, 2, 3), Vector3D(0.001, 0, 0))
+        hill: Matrix6D = Hill(state, r).system_matrix(5000)
+        ya: Matrix6D = YamanakaAnkersen(state, origin).system_matrix(5000)
+        for hill_row, ya_row in zip(
+            [hill.row1, hill.row2, hill.row3, hill.row4, hill.row5, hill.row6],
+            [ya.row1, ya.row2, ya.row3, ya.row4, ya.row5, ya.row6],
+        ):
+            difference: Vector6D = hill_row.minus(ya_row)
+            self.assertAlmostEqual(difference.dot(difference), 0, 9)
+
+    def test_propagate_grid(self):
+        state: HCW = HCW(self.EPOCH, Vector3D(1, 2, 3), Vector3D(0.001, 0, 0))
+        propagator: YamanakaAnkersen = YamanakaAnkersen(state, self.ORIGIN)
+        states: array = array("d", [1, 2, 3, 0.001, 0, 0, -4, 0.5, 0, 0, 0.003, -0.001])
+        times: list[float] = [0, 300, 3600, 86400]
+        values: array = propagator.propagate_grid(states, times)
+        self.assertEqual(len(values), 2 * len(times) * STATE_WIDTH)
+
+        for j, t in enumerate(times):
+            expected: Vector6D = propagator.system_matrix(t).multiply_vector(Vector6D(*states[6:12]))
+            i: int = (len(times) + j) * STATE_WIDTH
+            self.assertAlmostEqual(values[i], expected.x)
+            self.assertAlmostEqual(values[i + 1], expected.y)
+            self.assertAlmostEqual(values[i + 5], expected.vz)
+        self.assertAlmostEqual(values[0], 1)
+        self.assertAlmostEqual(values[4], 0)
@@ -0,0 +1,50 @@
+import unittest
+from math import degrees, radians
+
+from pysmad.constants import DAYS_TO_SECONDS
+from pysmad.coordinates.elements import ClassicalElements
+from pysmad.coordinates.states import IJK
+from pysmad.propagators.catalog import CatalogEphemeris
+from pysmad.propagators.secular import SecularJ2
+from pysmad.time import Epoch
+
+
+class TestSecularJ2(unittest.TestCase):
+
+    EPOCH: Epoch = Epoch.from_datetime_components(2022, 12, 20, 0, 1, 9.184)
+    LEO: ClassicalElements = ClassicalElements(EPOCH, 7000, 0.001, radians(98), radians(30), radians(10), radians(40))
+    GEO: ClassicalElements = ClassicalElements(EPOCH, 42164, 0, 0, 0, 0, 0)
+
+    def test_sun_synchronous_rate(self):
+        raan_dot, _, _ = SecularJ2.rates(7078.137, 0, radians(98.19))
+        self.assertAlmostEqual(degrees(raan_dot) * DAYS_TO_SECONDS, 0.9856, 3)
+
+    def test_mean_osculating_round_trip(self):
+        for mean in [self.LEO, self.GEO]:
+            result: ClassicalElements = SecularJ2.mean_from_state(SecularJ2.osculating_state(mean))
+            self.assertAlmostEqual(result.semimajor_axis, mean.semimajor_axis, 8)
+            self.assertAlmostEqual(result.eccentricity, mean.eccentricity, 12)
+            self.assertAlmostEqual(result.inclination, mean.inclination, 12)
+
+    def test_to_mean_removes_short_period_terms(self):
+        osculating: ClassicalElements = SecularJ2.to_osculating(self.LEO)
+        self.assertGreater(abs(osculating.semimajor_axis - self.LEO.semimajor_axis), 1)
+        self.assertAlmostEqual(SecularJ2.to_mean(osculating).semimajor_axis, self.LEO.semimajor_axis, 6)
+
+    def test_frozen_orbit(self):
+        e_f: float = SecularJ2.frozen_eccentricity(7000, 0.001, radians(98))
+        frozen: ClassicalElements = ClassicalElements(self.EPOCH, 7000, e_f, radians(98), 0, radians(90), 0)
+        result: ClassicalElements = SecularJ2.propagate(frozen, self.EPOCH.plus_days(30), True)
+        self.assertAlmostEqual(result.eccentricity, e_f, 6)
+        self.assertAlmostEqual(result.argument_of_perigee, radians(90), 2)
+
+    def test_propagate_grid(self):
+        grid: list[Epoch] = [self.EPOCH, self.EPOCH.plus_days(1.5), self.EPOCH.plus_days(30)]
+        ephemeris: CatalogEphemeris = CatalogEphemeris.from_mean_elements([self.LEO, self.GEO], grid, True)
+        for i, coes in enumerate([self.LEO, self.GEO]):
+            propagator: SecularJ2 = SecularJ2(coes, True)
+            for j, epoch in enumerate(grid):
+                propagator.step_to_epoch(epoch)
+                state: IJK = propagator.state()
+                self.assertAlmostEqual(ephemeris.state(i, j).position.x, state.position.x, 6)
+                self.assertAlmostEqual(ephemeris.state(i, j).velocity.z, state.velocity.z, 9)
@@ -0,0 +1,95 @@
+import unittest
+from math import isnan
+from typing import List, Tuple
+
+from pysmad.bodies import Earth
+from pysmad.coordinates.states import GCRF, TEME, StateConvert
+from pysmad.math.linalg import Vector3D
+from pysmad.propagators.catalog import CatalogEphemeris
+from pysmad.propagators.sgp4 import SGP4, TwoLineElements
+from pysmad.time import Epoch
+
+#: published element sets with start, stop, and step minutes appended to the second line
+TLES: List[TwoLineElements] = TwoLineElements.from_file("resources/SGP4-VER.TLE")
+
+
+def published_output() -> List[Tuple[str, List[List[float]]]]:
+    blocks: List[Tuple[str, List[List[float]]]] = []
+    with open("resources/tcppver.out", "r") as f:
+        for line in f:
+            fields: List[str] = line.split()
+            if fields and fields[-1] == "xx":
+                blocks.append((fields[0], []))
+            elif fields:
+                blocks[-1][1].append([float(field) for field in fields[:7]])
+    return blocks
+
+
+class TestTwoLineElements(unittest.TestCase):
+    def test_fields(self):
+        tle: TwoLineElements = TLES[0]
+        self.assertEqual(tle.sat_id, "00005")
+        self.assertEqual(tle.designator, "58002B")
+        self.assertAlmostEqual(tle.epoch.utc, 51722.78495062, 8)
+        self.assertAlmostEqual(tle.b_star, 0.28098e-4, 12)
+        self.assertAlmostEqual(tle.eccentricity, 0.1859667, 12)
+        self.assertEqual(tle.revolution_number, 41366)
+
+    def test_checksum(self):
+        tle: TwoLineElements = TLES[0]
+        self.assertEqual(TwoLineElements.checksum(tle.line1), int(tle.line1[68]))
+
+    def test_malformed(self):
+        with self.assertRaises(ValueError):
+            TwoLineElements(TLES[0].line1, TLES[1].line2)
+        with self.assertRaises(ValueError):
+            TwoLineElements(TLES[0].line1[:40], TLES[0].line2)
+
+
+class TestSGP4(unittest.TestCase):
+    def test_verification_cases(self):
+        errors: List[int] = []
+        blocks: List[Tuple[str, List[List[float]]]] = published_output()
+        self.assertEqual(len(blocks), len(TLES))
+        for tle, (sat_id, rows) in zip(TLES, blocks):
+            self.assertEqual(tle.sat_id.lstrip("0"), sat_id)
+            try:
+                propagator: SGP4 = SGP4(tle)
+            except ValueError:
+                errors.append(-1)
+                continue
+            for row in rows:
+                values: Tuple[float, ...] = propagator.solve(row[0])
+                for actual, expected in zip(values, row[1:]):
+                    self.assertAlmostEqual(actual, expected, delta=2e-7)
+            start, stop, step = (float(field) for field in tle.line2[69:].split())
+            last: float = rows[-1][0]
+            if last < stop:
+                propagator.solve(last + step if last + step <= stop else stop)
+                errors.append(propagator.error)
+        self.assertEqual(errors, [1, 1, 6, 6, 4, -1, 6])
+
+    def test_teme_to_gcrf(self):
+        epoch: Epoch = Epoch.from_datetime_components(2004, 4, 6, 7, 51, 28.386009)
+        r: Vector3D = Vector3D(5094.18016210, 6127.64465950, 6380.34453270)
+        v: Vector3D = Vector3D(-4.746131487, 0.785818041, 5.531931288)
+        state: GCRF = StateConvert.teme.to_gcrf(TEME(epoch, r, v))
+        self.assertAlmostEqual(state.position.x, 5102.50895290, delta=0.01)
+        self.assertAlmostEqual(state.position.y, 6123.01139910, delta=0.01)
+        self.assertAlmostEqual(state.position.z, 6378.13693380, delta=0.01)
+        self.assertAlmostEqual(state.velocity.x, -4.743220157, delta=1e-5)
+        self.assertAlmostEqual(state.velocity.y, 0.790536497, delta=1e-5)
+        self.assertAlmostEqual(state.velocity.z, 5.533755727, delta=1e-5)
+
+    def test_catalog_grid(self):
+        tles: List[TwoLineElements] = [TLES[2], TLES[-3], TLES[4]]
+        epochs: List[Epoch] = [TLES[2].epoch.plus_days(0.5 * i) for i in range(3)]
+        ephemeris: CatalogEphemeris = CatalogEphemeris.from_tles(tles, epochs)
+        propagator: SGP4 = SGP4(tles[0])
+        for i, epoch in enumerate(epochs):
+            propagator.step_to_epoch(epoch)
+            state: GCRF = ephemeris.state(0, i)
+            self.assertAlmostEqual(state.position.minus(propagator.state.position).magnitude(), 0, 9)
+            self.assertAlmostEqual(state.velocity.minus(propagator.state.velocity).magnitude(), 0, 12)
+        self.assertTrue(isnan(ephemeris.values[ephemeris.offset(1, 0)]))
+        self.assertGreater(ephemeris.state(2, 2).position.magnitude(), Earth.RADIUS)
@@ -0,0 +1,84 @@
+import unittest
+from typing import List
+
+from pysmad.bodies import Earth
+from pysmad.coordinates.states import GCRF
+from pysmad.math.linalg import Matrix3D, Matrix6D, Vector3D
+from pysmad.propagators.inertial import RK4
+from pysmad.time import Epoch
+
+
+class TestStateTransitionMatrix(unittest.TestCase):
+
+    EPOCH: Epoch = Epoch.from_datetime_components(2022, 12, 20, 0, 1, 9.184)
+    POSITION: Vector3D = Vector3D(Earth.RADIUS + 500, 1000, 2000)
+    VELOCITY: Vector3D = Vector3D(-1.5, 6.5, 3.5)
+
+    @staticmethod
+    def acceleration(position: Vector3D) -> Vector3D:
+        r: float = position.magnitude()
+        k: float = -1.5 * Earth.J2 * Earth.MU * Earth.RADIUS * Earth.RADIUS / r**5
+        z2: float = 5 * position.z * position.z / (r * r)
+        j2: Vector3D = Vector3D(k * position.x * (1 - z2), k * position.y * (1 - z2), k * position.z * (3 - z2))
+        return position.scaled(-Earth.MU / r**3).plus(j2)
+
+    def test_gravity_gradient(self):
+        state: GCRF = GCRF(self.EPOCH, self.POSITION, self.VELOCITY)
+        gradient: Matrix3D = state.gravity_gradient()
+        step: float = 1e-3
+        for column, offset in enumerate([Vector3D(step, 0, 0), Vector3D(0, step, 0), Vector3D(0, 0, step)]):
+            plus: Vector3D = self.acceleration(self.POSITION.plus(offset))
+            minus: Vector3D = self.acceleration(self.POSITION.minus(offset))
+            expected: Vector3D = plus.minus(minus).scaled(0.5 / step)
+            actual: Vector3D = [gradient.column_1(), gradient.column_2(), gradient.column_3()][column]
+            self.assertAlmostEqual(actual.minus(expected).magnitude() / expected.magnitude(), 0, 6)
+
+        state.use_perturbations = False
+        two_body: Matrix3D = state.gravity_gradient()
+        self.assertAlmostEqual(two_body.row1.x + two_body.row2.y + two_body.row3.z, 0, 15)
+
+    def test_two_body_matches_finite_differences(self):
+        state: GCRF = GCRF(self.EPOCH, self.POSITION, self.VELOCITY)
+        state.use_perturbations = False
+        epoch: Epoch = self.EPOCH.plus_days(1 / 24)
+
+        propagator: RK4 = RK4(state)
+        propagator.enable_stm()
+        propagator.step_to_epoch(epoch)
+        phi: Matrix6D = propagator.transition_matrix()
+        rows: List[List[float]] = [
+            [row.x, row.y, row.z, row.vx, row.vy, row.vz]
+            for row in [phi.row1, phi.row2, phi.row3, phi.row4, phi.row5, phi.row6]
+        ]
+
+        steps: List[float] = [1e-3, 1e-3, 1e-3, 1e-6, 1e-6, 1e-6]
+        for column, step in enumerate(steps):
+            deltas: List[float] = [0.0] * 6
+            deltas[column] = step
+            finals: List[List[float]] = []
+            for sign in (1, -1):
+                perturbed: GCRF = GCRF(
+                    self.EPOCH,
+                    self.POSITION.plus(Vector3D(*deltas[:3]).scaled(sign)),
+                    self.VELOCITY.plus(Vector3D(*deltas[3:]).scaled(sign)),
+                )
+                perturbed.use_perturbations = False
+                reference: RK4 = RK4(perturbed)
+                reference.step_to_epoch(epoch)
+                r: Vector3D = reference.state.position
+                v: Vector3D = reference.state.velocity
+                finals.append([r.x, r.y, r.z, v.x, v.y, v.z])
+            for row in range(6):
+                expected: float = (finals[0][row] - finals[1][row]) / (2 * step)
+                self.assertAlmostEqual(rows[row][column], expected, 4)
+
+    def test_disabled(self):
+        propagator: RK4 = RK4(GCRF(self.EPOCH, self.POSITION, self.VELOCITY))
+        with self.assertRaises(ValueError):
+            propagator.transition_matrix()
+        propagator.enable_stm()
+        identity: Matrix6D = propagator.transition_matrix()
+        self.assertEqual(identity.row1.x, 1)
+        self.assertEqual(identity.row6.vz, 1)
+        self.assertEqual(identity.row1.y, 0)
+        self.assertAlmostEqual(propagator.stm_epoch.utc, self.EPOCH.utc)